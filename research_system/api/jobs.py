@@ -0,0 +1,371 @@
+"""Background research jobs for the API.
+
+Each job runs ``Orchestrator.run()`` in its own spawned process, so a
+long research run never blocks the server's event loop and can be cancelled
+by terminating the process. At most ``JOB_WORKERS`` jobs run at once and at
+most ``JOB_QUEUE_SIZE`` more wait; beyond that ``submit`` raises
+``CapacityError`` (admission control by worker capacity). Jobs still running
+after ``WALL_TIMEOUT_SEC`` are killed.
+
+Workers stream progress back over a multiprocessing queue: the log records
+of ``research_system`` loggers at ``JOB_PROGRESS_LEVEL`` and above become job
+events, which the API exposes as server-sent events. Job records live in the
+memory of the serving process and are dropped ``JOB_RETENTION_SEC`` after
+they finish.
+"""
+
+from __future__ import annotations
+import logging
+import multiprocessing
+import os
+import queue
+import threading
+import time
+import uuid
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+JOB_QUEUE_SIZE = int(os.getenv("JOB_QUEUE_SIZE", "8"))
+JOB_TIMEOUT_SEC = float(os.getenv("WALL_TIMEOUT_SEC", "1800"))
+JOB_RETENTION_SEC = float(os.getenv("JOB_RETENTION_SEC", "3600"))
+JOB_MAX_EVENTS = int(os.getenv("JOB_MAX_EVENTS", "1000"))
+JOB_PROGRESS_LEVEL = os.getenv("JOB_PROGRESS_LEVEL", "INFO")
+
+_EXIT_GRACE_SEC = 1.0
+
+QUEUED, RUNNING, COMPLETED, FAILED, CANCELLED = "queued", "running", "completed", "failed", "cancelled"
+TERMINAL = frozenset({COMPLETED, FAILED, CANCELLED})
+
+
+class CapacityError(RuntimeError):
+    """Raised when every worker is busy and the wait queue is full."""
+
+
+@dataclass
+class Job:
+    id: str
+    request: Dict[str, Any]
+    output_dir: str
+    status: str = QUEUED
+    created: float = field(default_factory=time.time)
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    error: Optional[str] = None
+    deliverables: List[str] = field(default_factory=list)
+    summary: Dict[str, Any] = field(default_factory=dict)
+    events: Deque[Dict[str, Any]] = field(default_factory=lambda: deque(maxlen=JOB_MAX_EVENTS))
+    next_seq: int = 0
+    # Events are appended by the dispatcher thread while SSE streams read them
+    _events_lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @property
+    def done(self) -> bool:
+        return self.status in TERMINAL
+
+    def add_event(self, kind: str, data: Dict[str, Any]) -> None:
+        with self._events_lock:
+            self.next_seq += 1
+            self.events.append({"seq": self.next_seq, "event": kind, "time": time.time(), "data": data})
+
+    def events_since(self, seq: int = 0) -> List[Dict[str, Any]]:
+        with self._events_lock:
+            events = list(self.events)
+        return [e for e in events if e["seq"] > seq]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "id": self.id,
+            "status": self.status,
+            "topic": self.request.get("topic"),
+            "created": self.created,
+            "started": self.started,
+            "finished": self.finished,
+            "error": self.error,
+            "output_dir": self.output_dir,
+            "deliverables": list(self.deliverables),
+            "summary": dict(self.summary),
+            "last_event": self.next_seq,
+        }
+
+
+# -- worker process ---------------------------------------------------------
+
+def collect_deliverables(output_dir: Path) -> Dict[str, Any]:
+    """Deliverable file names and a small summary of a finished run."""
+    deliverables, summary = [], {}
+    for file in sorted(output_dir.iterdir()) if output_dir.exists() else []:
+        if file.is_file():
+            deliverables.append(file.name)
+            if file.suffix == '.jsonl':
+                # Count evidence cards
+                with open(file) as f:
+                    summary['evidence_count'] = sum(1 for _ in f)
+            elif file.suffix == '.md':
+                summary[file.stem + '_size'] = file.stat().st_size
+    return {"deliverables": deliverables, "summary": summary}
+
+
+def run_research(request: Dict[str, Any], output_dir: str) -> Dict[str, Any]:
+    """Run one research job to completion (in the worker process)."""
+    from research_system.net import cassette
+    from research_system.orchestrator import Orchestrator, OrchestratorSettings
+
+    settings = OrchestratorSettings(
+        topic=request["topic"],
+        depth=request.get("depth", "standard"),
+        output_dir=Path(output_dir),
+        max_cost_usd=request.get("max_cost", 2.50),
+        strict=request.get("strict", False),
+    )
+    cassette.install_from_env()
+    try:
+        Orchestrator(settings).run()
+    finally:
+        # Worker processes skip atexit, so a recording cassette is saved here
+        cassette.uninstall()
+    return collect_deliverables(Path(output_dir))
+
+
+class _ProgressHandler(logging.Handler):
+    """Forwards log records to the parent as ``progress`` events."""
+
+    def __init__(self, job_id: str, events):
+        super().__init__()
+        self.job_id, self.events = job_id, events
+
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.events.put((self.job_id, "progress", {
+                "logger": record.name, "level": record.levelname, "message": record.getMessage()[:1000],
+            }))
+        except Exception:
+            pass
+
+
+def _job_main(runner: Callable[[Dict[str, Any], str], Dict[str, Any]], job_id: str,
+              request: Dict[str, Any], output_dir: str, events) -> None:
+    handler = _ProgressHandler(job_id, events)
+    handler.setLevel(JOB_PROGRESS_LEVEL)
+    root = logging.getLogger("research_system")
+    root.addHandler(handler)
+    root.setLevel(min(root.getEffectiveLevel(), handler.level))
+    try:
+        result = runner(request, output_dir)
+        events.put((job_id, COMPLETED, result or {}))
+    except BaseException as e:
+        events.put((job_id, FAILED, {"error": f"{type(e).__name__}: {e}"}))
+    finally:
+        root.removeHandler(handler)
+
+
+# -- manager ----------------------------------------------------------------
+
+class JobManager:
+    """Bounded pool of job processes with a FIFO wait queue.
+
+    Args:
+        workers: Jobs running at once (``JOB_WORKERS``).
+        max_queued: Jobs allowed to wait for a worker (``JOB_QUEUE_SIZE``).
+        runner: ``runner(request, output_dir) -> {"deliverables", "summary"}``,
+            called in the worker process; must be importable (picklable).
+        timeout: Seconds before a running job is killed (``WALL_TIMEOUT_SEC``).
+        output_root: Directory job output directories are created under.
+    """
+
+    def __init__(self, workers: int = JOB_WORKERS, max_queued: int = JOB_QUEUE_SIZE,
+                 runner: Callable[[Dict[str, Any], str], Dict[str, Any]] = run_research,
+                 timeout: float = JOB_TIMEOUT_SEC, output_root: str = "outputs",
+                 retention: float = JOB_RETENTION_SEC):
+        self.workers, self.max_queued = max(1, workers), max(0, max_queued)
+        self.runner, self.timeout, self.retention = runner, timeout, retention
+        self.output_root = output_root
+        self._ctx = multiprocessing.get_context("spawn")
+        self._events = self._ctx.Queue()
+        self._jobs: Dict[str, Job] = {}
+        self._pending: Deque[str] = deque()
+        self._procs: Dict[str, Any] = {}
+        self._exited: Dict[str, float] = {}
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._loop, name="job-dispatcher", daemon=True)
+        self._thread.start()
+
+    # public API ------------------------------------------------------------
+
+    def capacity(self) -> Dict[str, int]:
+        with self._lock:
+            running, queued = len(self._procs), len(self._pending)
+        return {"workers": self.workers, "running": running, "queued": queued,
+                "max_queued": self.max_queued,
+                "available": max(0, self.workers + self.max_queued - running - queued)}
+
+    def submit(self, request: Dict[str, Any]) -> Job:
+        """Queue a job; raises ``CapacityError`` when workers and queue are full."""
+        topic = str(request.get("topic", "job"))
+        job_id = uuid.uuid4().hex
+        output_dir = str(Path(self.output_root) / f"api_{topic.replace(' ', '_')[:80]}_{job_id[:8]}")
+        with self._lock:
+            self._expire()
+            if len(self._procs) + len(self._pending) >= self.workers + self.max_queued:
+                raise CapacityError(f"all {self.workers} workers busy and {len(self._pending)} jobs queued")
+            job = Job(id=job_id, request=dict(request), output_dir=output_dir)
+            job.add_event(QUEUED, {"position": len(self._pending) + 1})
+            self._jobs[job_id] = job
+            self._pending.append(job_id)
+            self._dispatch()
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list(self) -> List[Job]:
+        with self._lock:
+            return list(self._jobs.values())
+
+    def cancel(self, job_id: str) -> bool:
+        """Cancel a queued or running job; False if unknown or already finished."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or job.done:
+                return False
+            if job_id in self._pending:
+                self._pending.remove(job_id)
+            proc = self._procs.pop(job_id, None)
+            self._exited.pop(job_id, None)
+            self._finish(job, CANCELLED, error="cancelled")
+            self._dispatch()
+        if proc is not None:
+            _terminate(proc)
+        return True
+
+    def wait(self, job_id: str, timeout: Optional[float] = None) -> Optional[Job]:
+        """Block until a job finishes (tests / synchronous callers)."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            job = self.get(job_id)
+            if job is None or job.done:
+                return job
+            if deadline is not None and time.monotonic() >= deadline:
+                return job
+            time.sleep(0.05)
+
+    def shutdown(self, cancel: bool = True) -> None:
+        if cancel:
+            for job in self.list():
+                self.cancel(job.id)
+        self._stop.set()
+        self._thread.join(timeout=5)
+
+    # internals -------------------------------------------------------------
+
+    def _finish(self, job: Job, status: str, error: Optional[str] = None,
+                result: Optional[Dict[str, Any]] = None) -> None:
+        job.status, job.finished, job.error = status, time.time(), error
+        if result:
+            job.deliverables = list(result.get("deliverables") or [])
+            job.summary = dict(result.get("summary") or {})
+        data: Dict[str, Any] = {"status": status}
+        if error:
+            data["error"] = error
+        if job.deliverables:
+            data["deliverables"] = job.deliverables
+        job.add_event(status, data)
+
+    def _dispatch(self) -> None:
+        while self._pending and len(self._procs) < self.workers:
+            job = self._jobs[self._pending.popleft()]
+            proc = self._ctx.Process(target=_job_main, name=f"job-{job.id[:8]}", daemon=True,
+                                     args=(self.runner, job.id, job.request, job.output_dir, self._events))
+            proc.start()
+            self._procs[job.id] = proc
+            job.status, job.started = RUNNING, time.time()
+            job.add_event(RUNNING, {"pid": proc.pid})
+
+    def _expire(self) -> None:
+        cutoff = time.time() - self.retention
+        for job_id in [j.id for j in self._jobs.values() if j.done and (j.finished or 0) < cutoff]:
+            del self._jobs[job_id]
+
+    def _drain(self, wait: float) -> None:
+        try:
+            item = self._events.get(timeout=wait)
+        except queue.Empty:
+            return
+        while True:
+            job_id, kind, data = item
+            with self._lock:
+                job = self._jobs.get(job_id)
+                if job is not None and not job.done:
+                    if kind == "progress":
+                        job.add_event("progress", data)
+                    elif kind in (COMPLETED, FAILED):
+                        self._procs.pop(job_id, None)
+                        self._exited.pop(job_id, None)
+                        self._finish(job, kind, error=data.get("error"), result=data)
+            try:
+                item = self._events.get_nowait()
+            except queue.Empty:
+                return
+
+    def _reap(self) -> None:
+        now, to_kill = time.monotonic(), []
+        with self._lock:
+            for job_id, proc in list(self._procs.items()):
+                job = self._jobs[job_id]
+                if proc.is_alive():
+                    if self.timeout and job.started and time.time() - job.started > self.timeout:
+                        del self._procs[job_id]
+                        to_kill.append(proc)
+                        self._finish(job, FAILED, error=f"timed out after {self.timeout:.0f}s")
+                    continue
+                # Exited without a result so far; its last event may still be in the pipe
+                if now - self._exited.setdefault(job_id, now) > _EXIT_GRACE_SEC:
+                    del self._procs[job_id]
+                    self._exited.pop(job_id, None)
+                    self._finish(job, FAILED, error=f"worker exited with code {proc.exitcode} without a result")
+            self._dispatch()
+        for proc in to_kill:
+            _terminate(proc)
+
+    def _loop(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self._drain(0.2)
+                self._reap()
+            except Exception as e:
+                logger.warning(f"Job dispatcher error: {e}")
+
+
+def _terminate(proc, grace: float = 5.0) -> None:
+    proc.terminate()
+    proc.join(timeout=grace)
+    if proc.is_alive():
+        proc.kill()
+        proc.join(timeout=1)
+
+
+_manager: Optional[JobManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_manager() -> JobManager:
+    """Process-wide job manager, created on first use."""
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            _manager = JobManager()
+        return _manager
+
+
+def shutdown_manager() -> None:
+    global _manager
+    with _manager_lock:
+        if _manager is not None:
+            _manager.shutdown()
+            _manager = None
@@ -1,18 +1,18 @@
-from fastapi import FastAPI, Depends, HTTPException, status, Request
+from fastapi import FastAPI, Depends, HTTPException, status, Request, Header
 from pydantic import BaseModel, Field
-from starlette.responses import PlainTextResponse
-from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
-import signal, asyncio, contextlib
+from starlette.responses import PlainTextResponse, StreamingResponse, FileResponse
+from prometheus_client import generate_latest, CONTENT_TYPE_LATEST, Gauge
+import signal, asyncio, contextlib, json
 import redis
 import os
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
 from slowapi.errors import RateLimitExceeded
 from .limiting import limiter
 from .security import require_api_key
+from .jobs import CapacityError, Job, get_manager, shutdown_manager, COMPLETED
 from ..config import Settings
-from ..orchestrator import Orchestrator, OrchestratorSettings
 
 app = FastAPI(title="Research System API", version="v1")
 app.state.limiter = limiter
@@ -72,8 +72,15 @@ def live():
     return "live"
 
 # ====== Prometheus metrics ======
+JOBS_RUNNING = Gauge("research_jobs_running", "Research jobs currently running")
+JOBS_QUEUED = Gauge("research_jobs_queued", "Research jobs waiting for a worker")
+
 @app.get("/metrics")
 def metrics():
+    if _jobs_started:
+        cap = get_manager().capacity()
+        JOBS_RUNNING.set(cap["running"])
+        JOBS_QUEUED.set(cap["queued"])
     data = generate_latest()  # default REGISTRY
     return PlainTextResponse(data, media_type=CONTENT_TYPE_LATEST)
 
@@ -96,8 +103,9 @@ async def _startup():
 @app.on_event("shutdown")
 async def _shutdown():
     with contextlib.suppress(Exception):
-        # drain pools / flush spans here when those are enabled
-        pass
+        # cancel running jobs; flush spans here when those are enabled
+        if _jobs_started:
+            shutdown_manager()
 
 # Request/Response models
 class RunRequest(BaseModel):
@@ -113,53 +121,124 @@ class RunResponse(BaseModel):
     summary: Dict[str, Any]
     output_dir: str
 
-# Main research endpoint
+class JobResponse(BaseModel):
+    id: str
+    status: str
+    topic: Optional[str]
+    created: float
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    error: Optional[str] = None
+    output_dir: str
+    deliverables: List[str]
+    summary: Dict[str, Any]
+    last_event: int
+
+# ====== Research jobs ======
+# Jobs run in worker processes (see jobs.py); the event loop only polls them.
+_jobs_started = False
+JOB_POLL_SEC = float(os.getenv("JOB_POLL_SEC", "0.5"))
+
+def _manager():
+    global _jobs_started
+    _jobs_started = True
+    return get_manager()
+
+def _submit(run_req: RunRequest) -> Job:
+    """Admit a job if a worker or queue slot is free, else 503 with Retry-After."""
+    try:
+        return _manager().submit(run_req.model_dump())
+    except CapacityError as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=f"Research capacity exhausted: {e}",
+            headers={"Retry-After": "30"},
+        )
+
+def _job_or_404(job_id: str) -> Job:
+    job = _manager().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Unknown job")
+    return job
+
+@app.post("/v1/jobs", response_model=JobResponse, status_code=status.HTTP_202_ACCEPTED,
+          dependencies=[Depends(require_api_key)])
+@limiter.limit("10/minute")
+async def submit_job(request: Request, run_req: RunRequest):
+    """Queue a research job and return its id immediately"""
+    return _submit(run_req).to_dict()
+
+@app.get("/v1/jobs", dependencies=[Depends(require_api_key)])
+def list_jobs():
+    """Known jobs and current worker capacity"""
+    manager = _manager()
+    return {"capacity": manager.capacity(), "jobs": [job.to_dict() for job in manager.list()]}
+
+@app.get("/v1/jobs/{job_id}", response_model=JobResponse, dependencies=[Depends(require_api_key)])
+def get_job(job_id: str):
+    """Status, deliverables and summary of a job"""
+    return _job_or_404(job_id).to_dict()
+
+@app.delete("/v1/jobs/{job_id}", response_model=JobResponse, dependencies=[Depends(require_api_key)])
+def cancel_job(job_id: str):
+    """Cancel a queued or running job"""
+    job = _job_or_404(job_id)
+    if not _manager().cancel(job_id) and not job.done:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Job cannot be cancelled")
+    return job.to_dict()
+
+@app.get("/v1/jobs/{job_id}/artifacts/{name}", dependencies=[Depends(require_api_key)])
+def get_artifact(job_id: str, name: str):
+    """Download one deliverable of a completed job"""
+    job = _job_or_404(job_id)
+    if name not in job.deliverables:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Unknown artifact")
+    return FileResponse(Path(job.output_dir) / name, filename=name)
+
+@app.get("/v1/jobs/{job_id}/events", dependencies=[Depends(require_api_key)])
+async def job_events(job_id: str, last_event_id: Optional[str] = Header(default=None)):
+    """Server-sent events: queued/running/progress and a final completed/failed/cancelled"""
+    job = _job_or_404(job_id)
+    seen = int(last_event_id) if (last_event_id or "").isdigit() else 0
+
+    async def stream():
+        nonlocal seen
+        while True:
+            for event in job.events_since(seen):
+                seen = event["seq"]
+                payload = json.dumps({"time": event["time"], **event["data"]})
+                yield f"id: {event['seq']}\nevent: {event['event']}\ndata: {payload}\n\n"
+            if job.done and not job.events_since(seen):
+                return
+            await asyncio.sleep(JOB_POLL_SEC)
+
+    return StreamingResponse(stream(), media_type="text/event-stream",
+                             headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"})
+
+# Main research endpoint (synchronous contract, served by the job pool)
 @app.post("/v1/run", response_model=RunResponse, dependencies=[Depends(require_api_key)])
 @limiter.limit("10/minute")
 async def run_job(request: Request, run_req: RunRequest):
     """Execute a research job and return results"""
+    job = _submit(run_req)
+    # Wait without blocking the event loop; a dropped client cancels the job
     try:
-        # Create unique output directory
-        output_dir = Path(f"outputs/api_{run_req.topic.replace(' ', '_')}_{os.urandom(4).hex()}")
-        
-        # Configure orchestrator
-        settings = OrchestratorSettings(
-            topic=run_req.topic,
-            depth=run_req.depth,
-            output_dir=output_dir,
-            max_cost_usd=run_req.max_cost,
-            strict=run_req.strict
-        )
-        
-        # Run orchestrator
-        orchestrator = Orchestrator(settings)
-        orchestrator.run()
-        
-        # Collect deliverables
-        deliverables = []
-        summary = {}
-        
-        for file in output_dir.iterdir():
-            if file.is_file():
-                deliverables.append(file.name)
-                if file.suffix == '.jsonl':
-                    # Count evidence cards
-                    with open(file) as f:
-                        summary['evidence_count'] = sum(1 for _ in f)
-                elif file.suffix == '.md':
-                    # Get file size
-                    summary[file.stem + '_size'] = file.stat().st_size
-        
-        return RunResponse(
-            status="completed",
-            topic=run_req.topic,
-            deliverables=deliverables,
-            summary=summary,
-            output_dir=str(output_dir)
-        )
-        
-    except Exception as e:
+        while not job.done:
+            await asyncio.sleep(JOB_POLL_SEC)
+    except asyncio.CancelledError:
+        _manager().cancel(job.id)
+        raise
+    
+    if job.status != COMPLETED:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Research job failed: {str(e)}"
-        )
\ No newline at end of file
+            detail=f"Research job failed: {job.error}"
+        )
+    
+    return RunResponse(
+        status="completed",
+        topic=run_req.topic,
+        deliverables=job.deliverables,
+        summary=job.summary,
+        output_dir=job.output_dir
+    )
@@ -8,6 +8,14 @@ from .enhanced import (
     _provider_policy,
     parallel_provider_search,
     collect_from_free_apis,
+    search_targets,
+)
+from .scheduler import (
+    CollectionScheduler,
+    SearchJob,
+    PRIORITY_HIGH,
+    PRIORITY_NORMAL,
+    PRIORITY_LOW,
 )
 
 __all__ = [
@@ -15,4 +23,10 @@ __all__ = [
     "_provider_policy",
     "parallel_provider_search",
     "collect_from_free_apis",
+    "search_targets",
+    "CollectionScheduler",
+    "SearchJob",
+    "PRIORITY_HIGH",
+    "PRIORITY_NORMAL",
+    "PRIORITY_LOW",
 ]
\ No newline at end of file
@@ -9,6 +9,7 @@ from research_system.config.settings import Settings
 from research_system.tools.registry import Registry
 from research_system.tools.search_models import SearchRequest, SearchHit
 from research_system.monitoring_metrics import SEARCH_REQUESTS, SEARCH_ERRORS, SEARCH_LATENCY
+from .search_cache import cached_search
 from research_system.providers.registry import PROVIDERS
 from research_system.tools.domain_norm import canonical_domain
 from research_system.models import EvidenceCard
@@ -18,6 +19,7 @@ import logging
 import uuid
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import traceback
 
 logger = logging.getLogger(__name__)
@@ -46,25 +48,30 @@ def _provider_policy(query: str, providers: List[str]) -> List[str]:
         normalized.append("nps")
     return normalized
 
+SEARCH_TOOLS = {
+    "tavily": "search_tavily",
+    "brave": "search_brave",
+    "serper": "search_serper",
+    "serpapi": "search_serpapi",
+    "nps": "search_nps"
+}
+
+def search_targets(query: str) -> List[tuple]:
+    """(provider, tool_name) pairs that a web search for ``query`` should hit."""
+    providers = Settings().enabled_providers()
+    # Apply provider policy to filter out irrelevant providers
+    normalized = _provider_policy(query, providers)
+    return [(p, SEARCH_TOOLS[p]) for p in normalized if p in SEARCH_TOOLS]
+
 async def parallel_provider_search(registry: Registry, query: str, count: int, freshness: Optional[str], region: Optional[str]):
     """Search across web search providers in parallel."""
-    s = Settings()
-    providers = s.enabled_providers()
-    tool_map = {
-        "tavily": "search_tavily",
-        "brave": "search_brave",
-        "serper": "search_serper",
-        "serpapi": "search_serpapi",
-        "nps": "search_nps"
-    }
     req = SearchRequest(query=query, count=count, freshness_window=freshness, region=region)
-    # Apply provider policy to filter out irrelevant providers
-    normalized = _provider_policy(query, providers)
-    valid_providers = [p for p in normalized if p in tool_map]
-    tasks = [_exec(asyncio.get_running_loop(), registry, tool_map[p], req) for p in valid_providers]
+    targets = search_targets(query)
+    loop = asyncio.get_running_loop()
+    tasks = [cached_search(p, req, partial(_exec, loop, registry, tool, req)) for p, tool in targets]
     results = await asyncio.gather(*tasks, return_exceptions=True)
     per_provider: Dict[str, List[SearchHit]] = {}
-    for p, res in zip(valid_providers, results):
+    for (p, _), res in zip(targets, results):
         per_provider[p] = [] if isinstance(res, Exception) else res
         # Do NOT backfill; failures remain empty by design
     return per_provider
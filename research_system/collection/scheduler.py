@@ -0,0 +1,255 @@
+"""Run-scoped scheduler for web search queries.
+
+The orchestrator used to call ``asyncio.run(parallel_provider_search(...))``
+once per anchor, expanded, diversity, backfill and AREX query, creating and
+tearing down an event loop each time and running the phases strictly one
+after another. ``CollectionScheduler`` keeps one event loop alive for the
+whole run (in a background thread, so the synchronous orchestrator can keep
+its structure) and accepts batches of ``SearchJob``s:
+
+* every independent query of a batch, and every provider within a query,
+  runs concurrently; batches submitted before earlier ones finish overlap;
+* calls are bounded by a global and a per-provider concurrency limit and
+  wait on the provider's token bucket (``providers.http.POLICY``) if any;
+* calls go through ``search_cache.cached_search``, so repeated queries are
+  answered from the search cache without taking a slot or a token;
+* each call's timeout is capped by the global ``time_budget.Budget``;
+  nothing starts once the budget is spent, and low-priority jobs are
+  skipped or cancelled once less than ``SCHED_LOW_PRIORITY_RESERVE_SEC``
+  remains.
+
+Results keep the ``{provider: [SearchHit, ...]}`` shape of
+``parallel_provider_search``.
+"""
+
+from __future__ import annotations
+import asyncio
+import logging
+import os
+import threading
+from collections import Counter, defaultdict
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Dict, List, Optional, Sequence
+
+from research_system.tools.registry import Registry
+from research_system.tools.search_models import SearchRequest, SearchHit
+from .enhanced import _exec, search_targets
+from .search_cache import cached_search
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+PRIORITY_LOW = 2
+
+STATUS_PENDING = "pending"
+STATUS_OK = "ok"
+STATUS_FAILED = "failed"
+STATUS_SKIPPED = "skipped"
+STATUS_CANCELLED = "cancelled"
+
+GLOBAL_LIMIT = int(os.getenv("SEARCH_CONCURRENCY", "8"))
+PER_PROVIDER_LIMIT = int(os.getenv("SEARCH_PER_PROVIDER", "2"))
+LOW_PRIORITY_RESERVE = float(os.getenv("SCHED_LOW_PRIORITY_RESERVE_SEC", "120"))
+PROVIDER_TIMEOUT = float(os.getenv("PROVIDER_TIMEOUT_SEC", "20"))
+_WATCH_INTERVAL = 1.0
+
+
+@dataclass
+class SearchJob:
+    """One web search query fanned out to every enabled search provider."""
+    query: str
+    count: int
+    freshness: Optional[str] = None
+    region: Optional[str] = "US"
+    priority: int = PRIORITY_NORMAL
+    phase: str = "search"
+    results: Dict[str, List[SearchHit]] = field(default_factory=dict)
+    status: str = STATUS_PENDING
+    error: Optional[str] = None
+
+    @property
+    def hit_count(self) -> int:
+        return sum(len(h) for h in self.results.values())
+
+
+class CollectionScheduler:
+    """One event loop per run that executes search jobs concurrently.
+
+    Args:
+        registry: Tool registry holding the ``search_*`` tools.
+        global_limit: Concurrent provider calls across all jobs.
+        per_provider_limit: Concurrent calls per provider.
+        low_priority_reserve: Seconds of budget kept for higher-priority work.
+        provider_timeout: Per-call timeout before the budget cap.
+    """
+
+    def __init__(self, registry: Registry, global_limit: Optional[int] = None,
+                 per_provider_limit: Optional[int] = None,
+                 low_priority_reserve: Optional[float] = None,
+                 provider_timeout: Optional[float] = None):
+        self.registry = registry
+        self.global_limit = max(1, global_limit or GLOBAL_LIMIT)
+        self.per_provider_limit = max(1, per_provider_limit or PER_PROVIDER_LIMIT)
+        self.low_priority_reserve = (LOW_PRIORITY_RESERVE if low_priority_reserve is None
+                                     else low_priority_reserve)
+        self.provider_timeout = provider_timeout or PROVIDER_TIMEOUT
+        self.stats: Counter = Counter()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._low_tasks: set = set()
+
+    # -- lifecycle ---------------------------------------------------------
+
+    def __enter__(self) -> "CollectionScheduler":
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def start(self) -> None:
+        """Start the run's event loop (idempotent)."""
+        with self._lock:
+            if self._loop is not None:
+                return
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self._loop.run_forever,
+                                            name="collection-scheduler", daemon=True)
+            self._thread.start()
+            asyncio.run_coroutine_threadsafe(self._setup(), self._loop).result()
+
+    def close(self) -> None:
+        """Cancel outstanding jobs and stop the loop."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+
+        async def _shutdown():
+            self._watcher.cancel()
+            tasks = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+            for t in tasks:
+                t.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        try:
+            asyncio.run_coroutine_threadsafe(_shutdown(), loop).result(timeout=10)
+        except Exception as e:
+            logger.debug(f"Scheduler shutdown: {e}")
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout=10)
+        loop.close()
+        if self.stats:
+            logger.info(f"Collection scheduler: {dict(self.stats)}")
+
+    async def _setup(self) -> None:
+        self._global_sem = asyncio.Semaphore(self.global_limit)
+        self._provider_sems: Dict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(self.per_provider_limit)
+        )
+        self._watcher = asyncio.create_task(self._watch_budget())
+
+    # -- submission --------------------------------------------------------
+
+    def submit(self, jobs: Sequence[SearchJob]) -> List[Future]:
+        """Schedule jobs without waiting; each future resolves to its job."""
+        self.start()
+        return [asyncio.run_coroutine_threadsafe(self._run_job(job), self._loop) for job in jobs]
+
+    def run(self, jobs: Sequence[SearchJob]) -> List[SearchJob]:
+        """Run jobs concurrently and wait for all of them."""
+        return self.wait(self.submit(jobs))
+
+    @staticmethod
+    def wait(futures: Sequence[Future]) -> List[SearchJob]:
+        """Wait for submitted jobs, in submission order."""
+        return [f.result() for f in futures]
+
+    def search(self, query: str, count: int, freshness: Optional[str] = None,
+               region: Optional[str] = "US", priority: int = PRIORITY_NORMAL,
+               phase: str = "search") -> Dict[str, List[SearchHit]]:
+        """Run a single query; same result shape as ``parallel_provider_search``."""
+        job = SearchJob(query=query, count=count, freshness=freshness, region=region,
+                        priority=priority, phase=phase)
+        return self.run([job])[0].results
+
+    # -- execution ---------------------------------------------------------
+
+    def _skip_reason(self, job: SearchJob) -> Optional[str]:
+        from research_system.time_budget import get_global_budget
+        budget = get_global_budget()
+        if budget is None:
+            return None
+        if budget.is_expired():
+            return "time budget exhausted"
+        if job.priority >= PRIORITY_LOW and budget.remaining() < self.low_priority_reserve:
+            return "time budget reserved for higher-priority work"
+        return None
+
+    async def _run_job(self, job: SearchJob) -> SearchJob:
+        reason = self._skip_reason(job)
+        if reason:
+            job.status, job.error = STATUS_SKIPPED, reason
+            self.stats[(job.phase, job.status)] += 1
+            return job
+
+        task = asyncio.current_task()
+        if job.priority >= PRIORITY_LOW:
+            self._low_tasks.add(task)
+        req = SearchRequest(query=job.query, count=job.count,
+                            freshness_window=job.freshness, region=job.region)
+        targets = search_targets(job.query)
+        try:
+            results = await asyncio.gather(
+                *(self._call(provider, tool, req) for provider, tool in targets),
+                return_exceptions=True,
+            )
+            # Failures stay empty by design, as in parallel_provider_search
+            job.results = {p: ([] if isinstance(r, BaseException) else r)
+                           for (p, _), r in zip(targets, results)}
+            job.status = STATUS_OK
+        except asyncio.CancelledError:
+            job.results, job.status, job.error = {}, STATUS_CANCELLED, "cancelled"
+        except Exception as e:
+            job.results, job.status, job.error = {}, STATUS_FAILED, str(e)[:200]
+        finally:
+            self._low_tasks.discard(task)
+        self.stats[(job.phase, job.status)] += 1
+        return job
+
+    async def _call(self, provider: str, tool: str, req: SearchRequest) -> List[SearchHit]:
+        # Cached and coalesced queries never take a concurrency slot or a token
+        return await cached_search(provider, req, partial(self._fetch, provider, tool, req))
+
+    async def _fetch(self, provider: str, tool: str, req: SearchRequest) -> List[SearchHit]:
+        from research_system.providers.http import _bucket_for
+        from research_system.time_budget import get_global_budget
+
+        async with self._global_sem, self._provider_sems[provider]:
+            bucket = _bucket_for(provider)
+            if bucket:
+                await bucket.aacquire()
+            budget = get_global_budget()
+            if budget is not None and budget.is_expired():
+                raise TimeoutError("time budget exhausted")
+            timeout = budget.get_timeout(self.provider_timeout) if budget else self.provider_timeout
+            return await asyncio.wait_for(_exec(None, self.registry, tool, req), timeout=timeout)
+
+    async def _watch_budget(self) -> None:
+        """Cancel running low-priority jobs once the budget runs short."""
+        from research_system.time_budget import get_global_budget
+        while True:
+            await asyncio.sleep(_WATCH_INTERVAL)
+            budget = get_global_budget()
+            if budget is None or not self._low_tasks:
+                continue
+            if budget.remaining() < self.low_priority_reserve:
+                logger.info(f"Budget low ({budget.remaining():.0f}s left), "
+                            f"cancelling {len(self._low_tasks)} low-priority searches")
+                for task in list(self._low_tasks):
+                    task.cancel()
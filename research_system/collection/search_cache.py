@@ -0,0 +1,255 @@
+"""Persistent cache of paid web search results with in-flight coalescing.
+
+Anchor, expanded, backfill and AREX phases, later runs and other API workers
+often send the same query to Tavily, Brave, Serper and SerpAPI within
+minutes. ``cached_search`` puts a cache in front of those calls, keyed by
+``(provider, normalized query, count, freshness, region)``
+(``data.cache.CacheKeyBuilder.search_results``):
+
+* a SQLite tier under ``SEARCH_CACHE_DIR`` shared by every process on the
+  host, and an optional Redis tier (``SEARCH_CACHE_REDIS_URL``, or the
+  process's ``data.cache`` manager) shared across hosts;
+* entries live ``SEARCH_CACHE_TTL_HOURS``, overridable per provider with
+  ``SEARCH_CACHE_TTL_HOURS_<PROVIDER>``; empty result lists and errors are
+  never cached, since search tools return ``[]`` for open circuits;
+* concurrent identical lookups in one process share a single upstream call
+  (singleflight), whichever event loop they run on.
+
+Lookups are exported as ``search_cache_lookups_total{provider,outcome}`` and
+``search_cache_hit_ratio{provider}``. Disable with ``ENABLE_SEARCH_CACHE=false``.
+"""
+
+from __future__ import annotations
+import asyncio
+import concurrent.futures
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import weakref
+from collections import Counter
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Awaitable, Callable, Dict, Iterator, List, Optional
+
+from research_system.monitoring_metrics import SEARCH_CACHE_HIT_RATIO, SEARCH_CACHE_LOOKUPS
+from research_system.tools.search_models import SearchHit, SearchRequest
+
+logger = logging.getLogger(__name__)
+
+SEARCH_CACHE_DIR = "./.search_cache"
+PAID_PROVIDERS = ("tavily", "brave", "serper", "serpapi")
+DEFAULT_TTL_HOURS = 24.0
+
+_lookups: Counter = Counter()
+_hits: Counter = Counter()
+_inflight: Dict[str, concurrent.futures.Future] = {}
+_inflight_lock = threading.Lock()
+_redis_managers: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def enabled() -> bool:
+    return os.getenv("ENABLE_SEARCH_CACHE", "true").lower() == "true"
+
+
+def provider_ttl(provider: str) -> float:
+    """Seconds a provider's results stay valid."""
+    hours = os.getenv(f"SEARCH_CACHE_TTL_HOURS_{provider.upper()}",
+                      os.getenv("SEARCH_CACHE_TTL_HOURS", str(DEFAULT_TTL_HOURS)))
+    return float(hours) * 3600
+
+
+def normalize_query(query: str) -> str:
+    return " ".join((query or "").lower().split())
+
+
+def cache_key(provider: str, req: SearchRequest) -> str:
+    from research_system.data.cache import CacheKeyBuilder
+    return CacheKeyBuilder.search_results(normalize_query(req.query), provider, count=req.count,
+                                          freshness=req.freshness_window, region=req.region)
+
+
+class SearchResultCache:
+    """SQLite tier of the search cache.
+
+    Args:
+        root: Cache directory (``SEARCH_CACHE_DIR``).
+    """
+
+    def __init__(self, root: str):
+        self.path = os.path.join(root, "search.sqlite")
+        os.makedirs(root, exist_ok=True)
+        self._local = threading.local()
+        with self._transaction() as db:
+            db.execute("CREATE TABLE IF NOT EXISTS results "
+                       "(key TEXT PRIMARY KEY, provider TEXT NOT NULL, hits TEXT NOT NULL, "
+                       "fetched REAL NOT NULL)")
+
+    def _db(self) -> sqlite3.Connection:
+        # Connections must not cross a fork, so they are keyed by pid too
+        db = getattr(self._local, "db", None)
+        if db is None or self._local.pid != os.getpid():
+            db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            self._local.db, self._local.pid = db, os.getpid()
+        return db
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        db = self._db()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            yield db
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        db.execute("COMMIT")
+
+    def get(self, key: str, ttl: float) -> Optional[List[dict]]:
+        """Cached hits younger than ``ttl`` seconds, else None."""
+        row = self._db().execute("SELECT hits, fetched FROM results WHERE key = ?", (key,)).fetchone()
+        if row is None or time.time() - row[1] >= ttl:
+            return None
+        return json.loads(row[0])
+
+    def put(self, key: str, provider: str, hits: List[dict]) -> None:
+        with self._transaction() as db:
+            db.execute("INSERT OR REPLACE INTO results (key, provider, hits, fetched) "
+                       "VALUES (?, ?, ?, ?)", (key, provider, json.dumps(hits), time.time()))
+
+    def purge(self) -> int:
+        """Delete rows older than their provider's TTL; returns how many were removed."""
+        now = time.time()
+        removed = 0
+        with self._transaction() as db:
+            for (provider,) in db.execute("SELECT DISTINCT provider FROM results").fetchall():
+                removed += db.execute("DELETE FROM results WHERE provider = ? AND fetched < ?",
+                                      (provider, now - provider_ttl(provider))).rowcount
+        return removed
+
+    def stats(self) -> Dict[str, int]:
+        """Row counts per provider."""
+        rows = self._db().execute("SELECT provider, COUNT(*) FROM results GROUP BY provider").fetchall()
+        return dict(rows)
+
+
+@lru_cache(maxsize=None)
+def _cache_for(cache_dir: str) -> SearchResultCache:
+    return SearchResultCache(cache_dir)
+
+
+def search_cache() -> SearchResultCache:
+    """Shared search cache for the current ``SEARCH_CACHE_DIR``."""
+    return _cache_for(os.path.abspath(os.environ.get("SEARCH_CACHE_DIR", SEARCH_CACHE_DIR)))
+
+
+def _redis():
+    """``data.cache.CacheManager`` usable on the running loop, or None."""
+    try:
+        from research_system.data.cache import CacheManager, get_cache_manager
+    except ImportError:
+        return None
+    manager = get_cache_manager()
+    if manager is not None and manager.redis_client is not None:
+        return manager
+    url = os.getenv("SEARCH_CACHE_REDIS_URL")
+    if not url:
+        return None
+    # Async Redis clients are bound to the loop that created them
+    loop = asyncio.get_running_loop()
+    manager = _redis_managers.get(loop)
+    if manager is None:
+        manager = _redis_managers[loop] = CacheManager({"redis_url": url})
+    return manager if manager.redis_client is not None else None
+
+
+def _record(provider: str, outcome: str) -> None:
+    SEARCH_CACHE_LOOKUPS.labels(provider=provider, outcome=outcome).inc()
+    _lookups[provider] += 1
+    if outcome != "miss":
+        _hits[provider] += 1
+    SEARCH_CACHE_HIT_RATIO.labels(provider=provider).set(_hits[provider] / _lookups[provider])
+
+
+def hit_stats() -> Dict[str, Dict[str, float]]:
+    """Lookups, hits and hit ratio per provider in this process."""
+    return {p: {"lookups": n, "hits": _hits[p], "hit_ratio": _hits[p] / n} for p, n in _lookups.items()}
+
+
+async def _lookup(provider: str, key: str) -> Optional[List[SearchHit]]:
+    ttl = provider_ttl(provider)
+    try:
+        cached = search_cache().get(key, ttl)
+    except sqlite3.Error as e:
+        logger.debug(f"Search cache read failed: {e}")
+        cached = None
+    if cached is not None:
+        _record(provider, "disk")
+        return [SearchHit(**h) for h in cached]
+
+    redis = _redis()
+    cached = await redis.get(key) if redis is not None else None
+    if cached is not None:
+        _record(provider, "redis")
+        try:
+            search_cache().put(key, provider, cached)
+        except sqlite3.Error as e:
+            logger.debug(f"Search cache write failed: {e}")
+        return [SearchHit(**h) for h in cached]
+    return None
+
+
+async def _store(provider: str, key: str, hits: List[SearchHit]) -> None:
+    payload = [h.model_dump() for h in hits]
+    try:
+        search_cache().put(key, provider, payload)
+    except sqlite3.Error as e:
+        logger.debug(f"Search cache write failed: {e}")
+    redis = _redis()
+    if redis is not None:
+        await redis.set(key, payload, ttl=int(provider_ttl(provider)))
+
+
+async def cached_search(provider: str, req: SearchRequest,
+                        fetch: Callable[[], Awaitable[List[SearchHit]]]) -> List[SearchHit]:
+    """Results of ``fetch()`` for ``req``, served from or stored in the cache."""
+    if provider not in PAID_PROVIDERS or not enabled():
+        return await fetch()
+    key = cache_key(provider, req)
+    hits = await _lookup(provider, key)
+    if hits is not None:
+        return hits
+
+    with _inflight_lock:
+        flight = _inflight.get(key)
+        leader = flight is None
+        if leader:
+            flight = _inflight[key] = concurrent.futures.Future()
+    if not leader:
+        _record(provider, "coalesced")
+        # Shielded: cancelling one follower must not cancel the shared flight
+        hits = await asyncio.shield(asyncio.wrap_future(flight))
+        return [h.model_copy() for h in hits]
+
+    _record(provider, "miss")
+    try:
+        try:
+            hits = await fetch()
+        except BaseException as e:
+            if not flight.done():
+                # Followers see a failed search, not their own cancellation
+                flight.set_exception(RuntimeError(f"{provider} search failed: {e!r}")
+                                     if isinstance(e, asyncio.CancelledError) else e)
+            raise
+        if not flight.done():
+            flight.set_result(hits)
+        if hits:
+            await _store(provider, key, hits)
+    finally:
+        # Stays in flight until stored, so a late lookup finds it in one place or the other
+        with _inflight_lock:
+            if _inflight.get(key) is flight:
+                del _inflight[key]
+    return hits
@@ -3,6 +3,8 @@
 import httpx
 from typing import Dict, Any, Optional
 
+from research_system.tools.doi_service import core_work
+
 
 def core_by_doi(doi: str) -> Dict[str, Any]:
     """
@@ -15,20 +17,7 @@ def core_by_doi(doi: str) -> Dict[str, Any]:
         Dictionary with paper metadata
     """
     try:
-        r = httpx.get(
-            "https://api.core.ac.uk/v3/search/works",
-            params={"q": f"doi:{doi}", "limit": 1},
-            timeout=20,
-            headers={"Accept": "application/json"}
-        )
-        
-        if r.status_code != 200:
-            return {}
-            
-        data = r.json()
-        hits = data.get("results", [])
-        return hits[0] if hits else {}
-        
+        return core_work(doi, timeout=20) or {}
     except Exception:
         return {}
 
@@ -3,6 +3,8 @@
 import httpx
 from typing import Dict, Any, Optional
 
+from research_system.tools.doi_service import s2_paper
+
 
 def s2_by_doi(doi: str) -> Dict[str, Any]:
     """
@@ -15,17 +17,7 @@ def s2_by_doi(doi: str) -> Dict[str, Any]:
         Dictionary with title, abstract, year, venue, openAccessPdf
     """
     try:
-        r = httpx.get(
-            f"https://api.semanticscholar.org/graph/v1/paper/DOI:{doi}",
-            params={"fields": "title,abstract,year,venue,openAccessPdf"},
-            timeout=20
-        )
-        
-        if r.status_code != 200:
-            return {}
-            
-        return r.json()
-        
+        return s2_paper(doi, timeout=20) or {}
     except Exception:
         return {}
 
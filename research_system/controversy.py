@@ -1,30 +1,79 @@
 """
 Controversy detection and claim clustering for research evidence
+
+Clustering only scores candidate pairs: each claim is MinHashed over
+character shingles and an LSH index proposes near-duplicates, which are then
+checked with the exact ``SequenceMatcher`` ratio. Small collections (and
+hosts without ``datasketch``) compare every pair. Per-card text features
+(normalized claim, contradiction keyword hits, first number) are extracted
+once with precompiled regexes and reused for every pair.
 """
 
-from typing import List, Dict, Tuple, Set
+from typing import Dict, List, Optional, Set, Tuple
 from collections import defaultdict
 import hashlib
 import re
 from difflib import SequenceMatcher
 
 from .models import EvidenceCard
+from .evidence.features import text_features
+
+# Contradiction patterns: a card matching one side disputes a card matching the other
+_CONTRADICTORY_PATTERNS = [
+    (re.compile(a), re.compile(b)) for a, b in [
+        (r'\bnot\b.*\btrue\b', r'\btrue\b'),
+        (r'\bfalse\b', r'\btrue\b'),
+        (r'\bincreases?\b', r'\bdecreases?\b'),
+        (r'\brises?\b', r'\bfalls?\b'),
+        (r'\bproven\b', r'\bdisproven\b'),
+        (r'\beffective\b', r'\bineffective\b'),
+        (r'\bsafe\b', r'\bunsafe\b|dangerous\b'),
+        (r'\bcauses?\b', r'\bdoes not cause\b'),
+        (r'\bconfirms?\b', r'\bdenies?\b|refutes?\b'),
+    ]
+]
+_NUMBER_RE = re.compile(r'\b\d+(?:\.\d+)?%?\b')
+
+# Below this many cards an all-pairs scan is cheaper than building the index
+LSH_MIN_CARDS = 64
+_SHINGLE = 4
+_NUM_PERM = 128
+
+
+class _CardFeatures:
+    """Text features of one claim and supporting text, extracted once per detector run."""
+
+    __slots__ = ("norm_claim", "left", "right", "number")
+
+    def __init__(self, claim: str, supporting_text: str, norm_claim: str):
+        self.norm_claim = norm_claim
+        text = (claim + " " + supporting_text).lower()
+        self.left = 0
+        self.right = 0
+        for bit, (pattern1, pattern2) in enumerate(_CONTRADICTORY_PATTERNS):
+            if pattern1.search(text):
+                self.left |= 1 << bit
+            if pattern2.search(text):
+                self.right |= 1 << bit
+        match = _NUMBER_RE.search(text)
+        self.number: Optional[str] = match.group(0) if match else None
 
 
 class ControversyDetector:
     """Detects and analyzes controversies in evidence collections"""
     
-    def __init__(self, similarity_threshold: float = 0.7):
+    def __init__(self, similarity_threshold: float = 0.7, lsh_threshold: float = 0.2):
         self.similarity_threshold = similarity_threshold
+        self.lsh_threshold = lsh_threshold
         self.claim_clusters: Dict[str, List[EvidenceCard]] = defaultdict(list)
         self.controversy_scores: Dict[str, float] = {}
+        # Keyed on content, so a mutated or recycled card never gets stale features
+        self._features: Dict[Tuple[str, str], _CardFeatures] = {}
     
     def normalize_claim(self, claim: str) -> str:
         """Normalize claim text for clustering"""
         # Remove extra whitespace, lowercase, remove punctuation
-        normalized = re.sub(r'[^\w\s]', '', claim.lower())
-        normalized = ' '.join(normalized.split())
-        return normalized
+        return text_features(claim).claim_norm
     
     def generate_claim_id(self, claim: str) -> str:
         """Generate a deterministic claim ID from normalized text"""
@@ -32,48 +81,40 @@ class ControversyDetector:
         # Use first 8 chars of hash for readability
         return hashlib.md5(normalized.encode()).hexdigest()[:8]
     
+    def _card_features(self, card: EvidenceCard) -> _CardFeatures:
+        key = (card.claim, card.supporting_text)
+        features = self._features.get(key)
+        if features is None:
+            features = _CardFeatures(card.claim, card.supporting_text, self.normalize_claim(card.claim))
+            self._features[key] = features
+        return features
+    
+    def _normalized_similar(self, norm1: str, norm2: str) -> bool:
+        matcher = SequenceMatcher(None, norm1, norm2)
+        # Cheap upper bounds first; ratio() only when they cannot rule it out
+        return (matcher.real_quick_ratio() >= self.similarity_threshold and
+                matcher.quick_ratio() >= self.similarity_threshold and
+                matcher.ratio() >= self.similarity_threshold)
+    
     def claims_similar(self, claim1: str, claim2: str) -> bool:
         """Check if two claims are similar enough to cluster"""
-        norm1 = self.normalize_claim(claim1)
-        norm2 = self.normalize_claim(claim2)
-        
-        # Use sequence matcher for fuzzy matching
-        similarity = SequenceMatcher(None, norm1, norm2).ratio()
-        return similarity >= self.similarity_threshold
+        return self._normalized_similar(self.normalize_claim(claim1), self.normalize_claim(claim2))
     
     def detect_contradiction(self, card1: EvidenceCard, card2: EvidenceCard) -> bool:
         """Detect if two evidence cards contradict each other"""
-        # Check for opposing keywords
-        text1 = (card1.claim + " " + card1.supporting_text).lower()
-        text2 = (card2.claim + " " + card2.supporting_text).lower()
+        f1 = self._card_features(card1)
+        f2 = self._card_features(card2)
         
-        # Contradiction patterns
-        contradictory_patterns = [
-            (r'\bnot\b.*\btrue\b', r'\btrue\b'),
-            (r'\bfalse\b', r'\btrue\b'),
-            (r'\bincreases?\b', r'\bdecreases?\b'),
-            (r'\brises?\b', r'\bfalls?\b'),
-            (r'\bproven\b', r'\bdisproven\b'),
-            (r'\beffective\b', r'\bineffective\b'),
-            (r'\bsafe\b', r'\bunsafe\b|dangerous\b'),
-            (r'\bcauses?\b', r'\bdoes not cause\b'),
-            (r'\bconfirms?\b', r'\bdenies?\b|refutes?\b'),
-        ]
-        
-        for pattern1, pattern2 in contradictory_patterns:
-            if ((re.search(pattern1, text1) and re.search(pattern2, text2)) or
-                (re.search(pattern2, text1) and re.search(pattern1, text2))):
-                return True
+        # Opposing keywords on either side
+        if (f1.left & f2.right) or (f1.right & f2.left):
+            return True
         
         # Check for explicit numerical contradictions
-        numbers1 = re.findall(r'\b\d+(?:\.\d+)?%?\b', text1)
-        numbers2 = re.findall(r'\b\d+(?:\.\d+)?%?\b', text2)
-        
-        if numbers1 and numbers2 and self.claims_similar(card1.claim, card2.claim):
+        if f1.number and f2.number and self._normalized_similar(f1.norm_claim, f2.norm_claim):
             # If claims are about the same thing but have very different numbers
             try:
-                val1 = float(numbers1[0].rstrip('%'))
-                val2 = float(numbers2[0].rstrip('%'))
+                val1 = float(f1.number.rstrip('%'))
+                val2 = float(f2.number.rstrip('%'))
                 # Consider contradictory if values differ by more than 50%
                 if abs(val1 - val2) / max(val1, val2) > 0.5:
                     return True
@@ -82,10 +123,38 @@ class ControversyDetector:
         
         return False
     
+    def _candidate_pairs(self, claims: List[str]) -> Optional[Dict[int, Set[int]]]:
+        """Map each index to later indices that may be similar (None: compare all)."""
+        if len(claims) < LSH_MIN_CARDS:
+            return None
+        try:
+            from datasketch import MinHash, MinHashLSH
+        except ImportError:
+            return None
+        
+        lsh = MinHashLSH(threshold=self.lsh_threshold, num_perm=_NUM_PERM)
+        hashes = []
+        for i, claim in enumerate(claims):
+            shingles = {claim[k:k + _SHINGLE] for k in range(max(1, len(claim) - _SHINGLE + 1))}
+            m = MinHash(num_perm=_NUM_PERM)
+            m.update_batch([sh.encode("utf-8") for sh in shingles])
+            lsh.insert(i, m)
+            hashes.append(m)
+        
+        candidates: Dict[int, Set[int]] = {}
+        for i, m in enumerate(hashes):
+            # LSH buckets are loose; the MinHash estimate drops most false positives
+            candidates[i] = {j for j in lsh.query(m)
+                             if j > i and m.jaccard(hashes[j]) >= self.lsh_threshold}
+        return candidates
+    
     def cluster_claims(self, cards: List[EvidenceCard]) -> Dict[str, List[EvidenceCard]]:
         """Cluster evidence cards by similar claims"""
+        self._features = {}
         clusters = defaultdict(list)
         assigned = set()
+        claims = [self._card_features(card).norm_claim for card in cards]
+        candidates = self._candidate_pairs(claims)
         
         for i, card in enumerate(cards):
             if i in assigned:
@@ -96,10 +165,11 @@ class ControversyDetector:
             cluster = [card]
             assigned.add(i)
             
-            # Find similar claims
-            for j, other in enumerate(cards[i+1:], i+1):
-                if j not in assigned and self.claims_similar(card.claim, other.claim):
-                    cluster.append(other)
+            # Find similar claims among the candidates
+            others = range(i + 1, len(cards)) if candidates is None else sorted(candidates[i])
+            for j in others:
+                if j not in assigned and self._normalized_similar(claims[i], claims[j]):
+                    cluster.append(cards[j])
                     assigned.add(j)
             
             # Assign claim_id to all cards in cluster
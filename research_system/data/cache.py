@@ -270,10 +270,15 @@ class CacheKeyBuilder:
         return f"research:evidence:{evidence_id}"
     
     @staticmethod
-    def search_results(query: str, provider: str) -> str:
+    def search_results(query: str, provider: str, count: Optional[int] = None,
+                       freshness: Optional[str] = None, region: Optional[str] = None) -> str:
         """Build cache key for search results"""
         import hashlib
-        query_hash = hashlib.md5(query.encode()).hexdigest()
+        if count is None and freshness is None and region is None:
+            query_hash = hashlib.md5(query.encode()).hexdigest()
+        else:
+            params_str = json.dumps([query, count, freshness, region])
+            query_hash = hashlib.md5(params_str.encode()).hexdigest()
         return f"search:{provider}:{query_hash}"
     
     @staticmethod
@@ -0,0 +1,383 @@
+"""Concurrent, bounded page fetching for the ENRICH stage.
+
+Every card URL is canonicalized and downloaded at most once, with a global
+concurrency limit and a per-host limit. The fetched body is then shared by
+excerpting, quote selection, date extraction and PDF handling instead of
+each extractor downloading the page again. Every card gets a fetch outcome
+(ok, timeout, blocked, paywall, error, skipped) so a run can report where
+enrichment time went.
+
+Requests carry the same per-domain headers as ``tools.fetch`` (including
+the contact User-Agent SEC requires). With ``ENABLE_HTTP_CACHE=true`` pages
+go through the shared ETag/Last-Modified cache in ``tools.cache``, and a
+403/404 from stats.oecd.org is retried on its mirror, as ``fetch_html`` does.
+With ``ENABLE_POLITENESS=true`` robots.txt and the per-host throttle are
+checked before each request, so disallowed pages are never downloaded.
+"""
+
+from __future__ import annotations
+import asyncio
+import logging
+import os
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+from research_system.monitoring_metrics import ENRICH_FETCHES, ENRICH_FETCH_LATENCY
+from research_system.tools.url_norm import canonicalize_url
+
+logger = logging.getLogger(__name__)
+
+OUTCOME_OK = "ok"
+OUTCOME_TIMEOUT = "timeout"
+OUTCOME_BLOCKED = "blocked"
+OUTCOME_PAYWALL = "paywall"
+OUTCOME_ERROR = "error"
+OUTCOME_SKIPPED = "skipped"
+
+GLOBAL_LIMIT = int(os.getenv("ENRICH_CONCURRENCY", "16"))
+PER_HOST_LIMIT = int(os.getenv("ENRICH_PER_HOST", "2"))
+FETCH_TIMEOUT = float(os.getenv("ENRICH_FETCH_TIMEOUT", "20"))
+MAX_HTML_MB = float(os.getenv("ENRICH_MAX_HTML_MB", "5"))
+MAX_PDF_MB = float(os.getenv("MAX_PDF_MB", "12"))
+
+_BLOCKED_STATUS = {401, 403, 451}
+_PAYWALL_STATUS = {402}
+_PAYWALL_REDIRECTS = ("statista.com/sso", "statista.com/login", "/login?", "/subscribe?")
+
+
+@dataclass
+class FetchedPage:
+    """A single downloaded page, shared by every card that points at it."""
+    url: str
+    final_url: str = ""
+    status: int = 0
+    content_type: str = ""
+    body: bytes = b""
+    outcome: str = OUTCOME_ERROR
+    elapsed: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def is_pdf(self) -> bool:
+        return "pdf" in self.content_type or self.final_url.lower().endswith(".pdf") \
+            or self.body[:5] == b"%PDF-"
+
+    @property
+    def is_html(self) -> bool:
+        return "html" in self.content_type or (not self.content_type and not self.is_pdf)
+
+    @property
+    def text(self) -> str:
+        return _decode(self.body, self.content_type) if self.body else ""
+
+
+@dataclass
+class EnrichmentReport:
+    """Per-card fetch outcomes and timing for one ENRICH pass."""
+    outcomes: List[Dict[str, Any]] = field(default_factory=list)
+    unique_urls: int = 0
+    wall_seconds: float = 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        by_outcome = Counter(o["outcome"] for o in self.outcomes)
+        seconds_by_outcome: Dict[str, float] = defaultdict(float)
+        for o in self.outcomes:
+            seconds_by_outcome[o["outcome"]] += o.get("elapsed", 0.0)
+        return {
+            "cards": len(self.outcomes),
+            "unique_urls": self.unique_urls,
+            "wall_seconds": round(self.wall_seconds, 3),
+            "by_outcome": dict(by_outcome),
+            "fetch_seconds_by_outcome": {k: round(v, 3) for k, v in seconds_by_outcome.items()},
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"summary": self.summary(), "cards": self.outcomes}
+
+
+def _http_cache_enabled() -> bool:
+    return os.getenv("ENABLE_HTTP_CACHE", "false").lower() == "true"
+
+
+def _politeness_enabled() -> bool:
+    return os.getenv("ENABLE_POLITENESS", "false").lower() == "true"
+
+
+def _decode(body: bytes, content_type: str) -> str:
+    """Decode a body with the Content-Type charset, falling back to UTF-8."""
+    charset = ""
+    for param in content_type.split(";")[1:]:
+        key, _, value = param.partition("=")
+        if key.strip().lower() == "charset":
+            charset = value.strip().strip("\"'")
+    try:
+        return body.decode(charset or "utf-8", errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
+
+
+def _mirror_url(url: str, status: int) -> Optional[str]:
+    """Alternate URL to try after a 403/404, if the host has a known mirror."""
+    if status in (403, 404) and "stats.oecd.org" in url:
+        return url.replace("stats.oecd.org", "stats-nxd.oecd.org")
+    return None
+
+
+def _classify(status: int, final_url: str, body: bytes, headers: httpx.Headers) -> str:
+    """Map an HTTP response onto an enrichment outcome."""
+    if status in _BLOCKED_STATUS:
+        return OUTCOME_BLOCKED
+    if status in _PAYWALL_STATUS or any(p in final_url for p in _PAYWALL_REDIRECTS):
+        return OUTCOME_PAYWALL
+    if not (200 <= status < 300):
+        return OUTCOME_ERROR
+    # Cloudflare interstitials come back as 200/503 with a challenge body
+    if (headers.get("server", "") or "").lower().startswith("cloudflare"):
+        head = _decode(body[:4096], headers.get("content-type", "") or "").lower()
+        if "just a moment" in head or "cf-chl" in head or "checking your browser" in head:
+            return OUTCOME_BLOCKED
+    return OUTCOME_OK
+
+
+class EnrichmentFetcher:
+    """Bounded concurrent fetcher: one download per canonical URL."""
+
+    def __init__(self,
+                 global_limit: int = GLOBAL_LIMIT,
+                 per_host_limit: int = PER_HOST_LIMIT,
+                 timeout: float = FETCH_TIMEOUT,
+                 transport: Optional[httpx.AsyncBaseTransport] = None):
+        self.global_limit = max(1, global_limit)
+        self.per_host_limit = max(1, per_host_limit)
+        self.timeout = timeout
+        self._transport = transport
+
+    async def fetch_all(self, urls: Iterable[str]) -> Dict[str, FetchedPage]:
+        """Fetch every distinct URL once; keys are the canonical URLs."""
+        from research_system.net.circuit import CIRCUIT
+        from research_system.time_budget import get_global_budget
+        from research_system.tools.politeness import allowed, host_throttle
+
+        unique = list(dict.fromkeys(u for u in urls if u))
+        if not unique:
+            return {}
+
+        global_sem = asyncio.Semaphore(self.global_limit)
+        host_sems: Dict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(self.per_host_limit)
+        )
+        budget = get_global_budget()
+        limits = httpx.Limits(max_connections=self.global_limit,
+                              max_keepalive_connections=self.global_limit)
+
+        async def one(client: httpx.AsyncClient, url: str) -> FetchedPage:
+            page = FetchedPage(url=url, final_url=url)
+            host = (urlparse(url).netloc or "").lower()
+            if not host:
+                page.outcome, page.error = OUTCOME_SKIPPED, "no host"
+                return page
+            if not CIRCUIT.allow(host):
+                page.outcome, page.error = OUTCOME_SKIPPED, "circuit open"
+                return page
+            if budget is not None and budget.is_expired():
+                page.outcome, page.error = OUTCOME_SKIPPED, "time budget exhausted"
+                return page
+            polite = _politeness_enabled()
+            # robots.txt is read with blocking urllib, so keep it off the loop
+            if polite and not await asyncio.to_thread(allowed, url):
+                page.outcome, page.error = OUTCOME_BLOCKED, "disallowed by robots.txt"
+                return page
+            timeout = budget.get_timeout(self.timeout) if budget else self.timeout
+            async with global_sem, host_sems[host]:
+                if polite:
+                    await host_throttle(url)
+                start = time.perf_counter()
+                try:
+                    page = await asyncio.wait_for(self._get(client, url), timeout=timeout)
+                    mirror = _mirror_url(url, page.status)
+                    if mirror:
+                        logger.info(f"Trying mirror: {mirror}")
+                        alt = await asyncio.wait_for(self._get(client, mirror), timeout=timeout)
+                        if alt.outcome == OUTCOME_OK:
+                            alt.url, page = url, alt
+                except (asyncio.TimeoutError, httpx.TimeoutException):
+                    page.outcome, page.error = OUTCOME_TIMEOUT, f"timeout after {timeout:.1f}s"
+                except Exception as e:
+                    page.outcome, page.error = OUTCOME_ERROR, str(e)[:200]
+                page.elapsed = time.perf_counter() - start
+            if page.outcome == OUTCOME_OK:
+                CIRCUIT.ok(host, page.elapsed)
+            elif page.outcome in (OUTCOME_TIMEOUT, OUTCOME_ERROR):
+                CIRCUIT.fail(host, page.elapsed)
+            ENRICH_FETCHES.labels(outcome=page.outcome).inc()
+            ENRICH_FETCH_LATENCY.labels(outcome=page.outcome).observe(page.elapsed)
+            return page
+
+        async with httpx.AsyncClient(follow_redirects=True,
+                                     timeout=httpx.Timeout(self.timeout, connect=5.0),
+                                     limits=limits, transport=self._transport) as client:
+            pages = await asyncio.gather(*(one(client, u) for u in unique))
+        return dict(zip(unique, pages))
+
+    async def _get(self, client: httpx.AsyncClient, url: str) -> FetchedPage:
+        """Stream one response, capping the body size by content type."""
+        from research_system.tools.fetch import _get_headers
+
+        if _http_cache_enabled():
+            return await asyncio.to_thread(self._get_cached, url)
+        async with client.stream("GET", url, headers=_get_headers(url)) as r:
+            ct = (r.headers.get("content-type") or "").lower()
+            cap_mb = MAX_PDF_MB if "pdf" in ct or url.lower().endswith(".pdf") else MAX_HTML_MB
+            budget = int(cap_mb * 1024 * 1024)
+            buf = bytearray()
+            async for chunk in r.aiter_bytes():
+                buf.extend(chunk)
+                if len(buf) > budget:
+                    raise ValueError(f"body exceeded cap {cap_mb}MB")
+            body = bytes(buf)
+            final_url = str(r.url)
+            return FetchedPage(
+                url=url,
+                final_url=final_url,
+                status=r.status_code,
+                content_type=ct,
+                body=body,
+                outcome=_classify(r.status_code, final_url, body, r.headers),
+            )
+
+    def _get_cached(self, url: str) -> FetchedPage:
+        """Fetch through the conditional-request HTTP cache (ENABLE_HTTP_CACHE)."""
+        from research_system.tools.cache import get_binary
+        from research_system.tools.fetch import _get_headers
+
+        status, headers, body = get_binary(url, headers=_get_headers(url), timeout=self.timeout)
+        headers = httpx.Headers(headers)
+        ct = (headers.get("content-type") or "").lower()
+        cap_mb = MAX_PDF_MB if "pdf" in ct or url.lower().endswith(".pdf") else MAX_HTML_MB
+        if len(body) > cap_mb * 1024 * 1024:
+            raise ValueError(f"body exceeded cap {cap_mb}MB")
+        final_url = headers.get("location", url)
+        return FetchedPage(url=url, final_url=final_url, status=status, content_type=ct, body=body,
+                           outcome=_classify(status, final_url, body, headers))
+
+
+def _run(coro):
+    """Run a coroutine from sync code, even if a loop is already running."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    import concurrent.futures
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+def _apply_page(card: Any, page: FetchedPage, extract: bool) -> None:
+    """Update a card from its shared page body (excerpt, title, date, quotes)."""
+    from research_system.tools.fetch_simple import excerpt_from_html
+    from research_system.tools.fetch import extract_article, pdf_article
+
+    url = card.url or card.source_url or ""
+    meta: Dict[str, Any] = {}
+    if page.outcome in (OUTCOME_BLOCKED, OUTCOME_PAYWALL):
+        card.reachability = 0.0
+        if not extract:
+            return
+        # Gated pages still get the DOI / meta-PDF / mirror fallback
+        from research_system.tools.paywall_resolver import resolve as resolve_paywall
+        try:
+            meta = resolve_paywall(url, page.text or None, page.content_type) or {}
+        except Exception as e:
+            logger.debug(f"Paywall resolver failed for {url}: {e}")
+        if not meta:
+            return
+        excerpt = None
+    elif page.outcome != OUTCOME_OK:
+        return
+    elif page.is_pdf:
+        if extract:
+            try:
+                meta = pdf_article(url, page.body)
+            except Exception as e:
+                logger.debug(f"PDF extraction failed for {url}: {e}")
+        excerpt = " ".join((meta.get("text") or "").split())[:800] or None
+    elif page.is_html:
+        html = page.text
+        excerpt = excerpt_from_html(html, max_chars=800)
+        if extract:
+            meta = extract_article(url, html=html)
+    else:
+        return
+
+    if excerpt and len(excerpt) > len(card.supporting_text or ""):
+        card.supporting_text = excerpt
+        # Also update snippet if it's still the placeholder
+        if card.snippet and "Content from" in card.snippet:
+            card.snippet = excerpt[:200]
+    if meta.get("title"):
+        card.source_title = meta["title"]
+    if not getattr(card, "date", None) and meta.get("date"):
+        d = meta["date"]
+        card.date = d.isoformat() if hasattr(d, "isoformat") else str(d)
+    quotes = meta.get("quotes") or []
+    if quotes:
+        card.quote_span = quotes[0]  # deterministic, sentence-level
+    card.reachability = 1.0
+
+
+def enrich_cards(cards: List[Any],
+                 extract: bool = True,
+                 fetcher: Optional[EnrichmentFetcher] = None) -> EnrichmentReport:
+    """Fetch every card's page once, concurrently, and enrich cards in place.
+
+    Args:
+        cards: Evidence cards to enrich
+        extract: Also run article extraction (title/date/quotes); mirrors ENABLE_EXTRACT
+        fetcher: Optional fetcher (limits/transport), mainly for tests
+
+    Returns:
+        EnrichmentReport with one outcome row per card
+    """
+    fetcher = fetcher or EnrichmentFetcher()
+    report = EnrichmentReport()
+    start = time.perf_counter()
+
+    card_keys: List[Optional[str]] = []
+    for c in cards:
+        url = c.url or c.source_url or ""
+        card_keys.append(canonicalize_url(url) if url else None)
+
+    pages = _run(fetcher.fetch_all(k for k in card_keys if k))
+    report.unique_urls = len(pages)
+
+    for c, key in zip(cards, card_keys):
+        page = pages.get(key) if key else None
+        if page is None:
+            page = FetchedPage(url=key or "", outcome=OUTCOME_SKIPPED, error="no url")
+        try:
+            _apply_page(c, page, extract)
+        except Exception as e:
+            logger.debug(f"Enrichment failed for {key}: {e}")
+        outcome = {
+            "card_id": c.id,
+            "url": key or "",
+            "outcome": page.outcome,
+            "status": page.status,
+            "content_type": page.content_type.split(";")[0],
+            "bytes": len(page.body),
+            "elapsed": round(page.elapsed, 3),
+        }
+        if page.error:
+            outcome["error"] = page.error
+        report.outcomes.append(outcome)
+        c.metadata = {**(c.metadata or {}), "fetch_outcome": page.outcome}
+
+    report.wall_seconds = time.perf_counter() - start
+    logger.info(f"Enrichment fetched {report.unique_urls} unique URLs for {len(cards)} cards "
+                f"in {report.wall_seconds:.1f}s: {report.summary()['by_outcome']}")
+    return report
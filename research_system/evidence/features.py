@@ -0,0 +1,122 @@
+"""Derived text features of evidence cards, computed once per distinct text.
+
+Several stages re-derive the same things from a card's text: triangulation,
+contradiction detection and AREX all parse its structured claim; the
+contradiction filter, numeric bullets and key numbers all scan it for
+numbers; paraphrase clustering, controversy detection and the aggregates
+normalize it. ``text_features`` returns one ``TextFeatures`` per distinct text
+(memoized by content hash, shared by every stage of every run in the
+process) whose attributes are computed on first access and then reused.
+
+Attributes call the same functions the stages used before, so results are
+unchanged; treat returned values as read-only since they are shared.
+``FEATURE_CACHE_SIZE`` bounds the number of texts kept (LRU).
+"""
+
+from __future__ import annotations
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict
+from functools import cached_property
+from typing import Any, Dict, Optional, Tuple
+
+FEATURE_CACHE_SIZE = int(os.getenv("FEATURE_CACHE_SIZE", "50000"))
+
+_PUNCT_RE = re.compile(r'[^\w\s]')
+
+
+def content_hash(text: str) -> str:
+    """Hex digest identifying ``text`` in the feature cache."""
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).hexdigest()
+
+
+def best_text(card: Any) -> str:
+    """The text claim-level stages analyse: quote span, else claim, snippet, title."""
+    return (getattr(card, "quote_span", None) or getattr(card, "claim", "") or
+            getattr(card, "snippet", "") or getattr(card, "source_title", "") or "")
+
+
+class TextFeatures:
+    """Lazily computed features of one text."""
+
+    def __init__(self, text: str, digest: str):
+        self.text = text
+        self.digest = digest
+
+    @cached_property
+    def claim_norm(self) -> str:
+        """Lowercased, punctuation-free, whitespace-collapsed text (controversy clustering)."""
+        return " ".join(_PUNCT_RE.sub('', self.text.lower()).split())
+
+    @cached_property
+    def para_norm(self) -> str:
+        """Text with years, periods and numbers replaced by tokens (paraphrase clustering)."""
+        from research_system.triangulation.paraphrase_cluster import _norm_for_para
+        return _norm_for_para(self.text)
+
+    @cached_property
+    def claim_key(self) -> Optional[str]:
+        """``tools.claims.canonical_claim_key`` of the text."""
+        from research_system.tools.claims import canonical_claim_key
+        return canonical_claim_key(self.text)
+
+    @cached_property
+    def struct_claim(self):
+        """``StructuredClaim`` (entity, metric, period, value, unit) of the text."""
+        from research_system.tools.claim_struct import extract_struct_claim
+        return extract_struct_claim(self.text)
+
+    @cached_property
+    def struct_key(self) -> Optional[str]:
+        from research_system.tools.claim_struct import struct_key
+        return struct_key(self.struct_claim)
+
+    @cached_property
+    def numbers(self) -> Tuple[Dict[str, Any], ...]:
+        """Values, ranges, units and currencies (``text.numbers.extract_numbers``)."""
+        from research_system.text.numbers import extract_numbers
+        return tuple(extract_numbers(self.text))
+
+    @cached_property
+    def numeric_values(self) -> Tuple[float, ...]:
+        """Plain values with multipliers applied (contradiction filter)."""
+        from research_system.triangulation.contradiction_filter import _extract_numbers
+        return tuple(_extract_numbers(self.text))
+
+    @cached_property
+    def number_tokens(self) -> Tuple[Tuple[int, float, str], ...]:
+        """(offset, value, unit) of each numeric token (key numbers)."""
+        from research_system.report.key_numbers import _NUM_PAT, _canonicalize_unit
+        return tuple((m.start(), *_canonicalize_unit(m.group("raw")))
+                     for m in _NUM_PAT.finditer(self.text))
+
+
+_cache: "OrderedDict[str, TextFeatures]" = OrderedDict()
+_lock = threading.Lock()
+
+
+def text_features(text: Optional[str]) -> TextFeatures:
+    """Shared ``TextFeatures`` of ``text`` (None is treated as "")."""
+    text = text or ""
+    digest = content_hash(text)
+    with _lock:
+        features = _cache.get(digest)
+        if features is not None:
+            _cache.move_to_end(digest)
+            return features
+        features = _cache[digest] = TextFeatures(text, digest)
+        if len(_cache) > FEATURE_CACHE_SIZE:
+            _cache.popitem(last=False)
+    return features
+
+
+def card_features(card: Any) -> TextFeatures:
+    """Features of the card's ``best_text``."""
+    return text_features(best_text(card))
+
+
+def clear_cache() -> None:
+    with _lock:
+        _cache.clear()
@@ -0,0 +1,213 @@
+"""Synthetic evidence corpora for scaling tests and benchmarks.
+
+``generate_corpus`` builds ``EvidenceCard`` lists of any size (1k to 100k+)
+that look like collected search evidence: statistical facts about an
+entity, metric and period, stated by many domains in different words. The
+mix is controlled by ``CorpusSpec``:
+
+* ``paraphrase_rate``: cards restating an earlier fact with another template,
+  synonyms and number formatting (what paraphrase clustering should join);
+* ``syndication_rate``: near-verbatim copies of an earlier card on another
+  domain (what near-duplicate detection should catch);
+* ``conflict_rate``: restatements whose value disagrees by 40-200% (what
+  contradiction and controversy detection should flag);
+* ``domain_concentration``: share of cards from the single largest domain;
+  ``primary_share`` go to official statistics domains and the rest spread
+  over a long tail of ``n_domains``.
+
+Fact popularity is Zipf-like too, so cluster sizes range from singletons to
+hundreds of cards. Output is deterministic for a given spec (``seed``).
+"""
+
+from __future__ import annotations
+import random
+from dataclasses import dataclass, field
+from itertools import accumulate
+from typing import Dict, List
+
+from research_system.models import EvidenceCard
+
+ENTITIES = [
+    "Global", "Europe", "Asia Pacific", "North America", "Middle East", "Africa",
+    "United States", "China", "Germany", "France", "Japan", "India", "Brazil",
+    "Mexico", "Canada", "Australia", "Spain", "Italy", "United Kingdom", "Saudi Arabia",
+]
+# (metric phrase, unit, typical value range)
+METRICS = [
+    ("international tourist arrivals", "million", (20.0, 1500.0)),
+    ("hotel occupancy rate", "%", (40.0, 90.0)),
+    ("tourism receipts", "billion", (5.0, 1800.0)),
+    ("GDP growth", "%", (-5.0, 9.0)),
+    ("unemployment rate", "%", (2.0, 15.0)),
+    ("inflation", "%", (0.5, 12.0)),
+    ("airline passenger traffic", "million", (10.0, 4500.0)),
+    ("tourism employment", "million", (0.5, 80.0)),
+]
+PRIMARY_DOMAINS = ["unwto.org", "oecd.org", "worldbank.org", "imf.org", "iata.org", "wttc.org",
+                   "ec.europa.eu", "bls.gov", "census.gov", "ons.gov.uk"]
+PROVIDERS = ["tavily", "brave", "serper", "serpapi", "openalex", "worldbank", "oecd"]
+
+_TEMPLATES = [
+    "{entity} {metric} {rose} {change}% to {value} in {period}, according to {source}.",
+    "In {period}, {metric} in {entity} reached {value}, a {rise} of {change}%.",
+    "{source} reports that {entity} recorded {value} in {metric} during {period}.",
+    "{metric_cap} for {entity} stood at {value} in {period} ({change}% year on year).",
+    "Figures for {period} show {entity} {metric} at {value}, {rose} {change}% from a year earlier.",
+    "{entity}'s {metric} was {value} in {period}, {source} data show.",
+]
+_ROSE = ["rose", "grew", "increased", "climbed", "jumped"]
+_RISE = ["rise", "gain", "jump"]
+_SYNDICATION_TAGS = ["", " (Reuters)", " - AP", " | Bloomberg", " Read more.", " Source: wire reports."]
+_WORDS = ["market", "outlook", "recovery", "travel", "demand", "report", "data", "trend",
+          "analysis", "forecast", "sector", "economy"]
+
+
+@dataclass
+class CorpusSpec:
+    """Size and composition of a synthetic corpus."""
+    n_cards: int = 1000
+    paraphrase_rate: float = 0.35
+    syndication_rate: float = 0.10
+    conflict_rate: float = 0.05
+    domain_concentration: float = 0.10
+    n_domains: int = 500
+    primary_share: float = 0.15
+    seed: int = 0
+
+
+@dataclass
+class SyntheticCorpus:
+    """Cards plus ground truth: the fact each card states and how it was made."""
+    spec: CorpusSpec
+    cards: List[EvidenceCard] = field(default_factory=list)
+    fact_ids: List[int] = field(default_factory=list)
+    kinds: List[str] = field(default_factory=list)  # original, paraphrase, syndicated, conflict
+
+
+@dataclass
+class _Fact:
+    entity: str
+    metric: str
+    unit: str
+    period: str
+    value: float
+    change: float
+
+
+def _format_value(value: float, unit: str, rng: random.Random) -> str:
+    if unit == "%":
+        return f"{value:.1f}%"
+    if unit == "billion":
+        return rng.choice([f"${value:.1f} billion", f"US${value:.0f}bn", f"{value:.1f} billion dollars"])
+    return rng.choice([f"{value:.1f} million", f"{value:.0f}m", f"{value * 1e6:,.0f}"])
+
+
+def _sentence(fact: _Fact, rng: random.Random, value: float, source: str) -> str:
+    template = rng.choice(_TEMPLATES)
+    return template.format(
+        entity=fact.entity, metric=fact.metric, metric_cap=fact.metric[0].upper() + fact.metric[1:],
+        rose=rng.choice(_ROSE), rise=rng.choice(_RISE), change=f"{fact.change:.1f}",
+        value=_format_value(value, fact.unit, rng),
+        period=fact.period, source=source,
+    )
+
+
+class _Domains:
+    """Domain sampler: one dominant domain, primary sources and a long tail."""
+
+    def __init__(self, spec: CorpusSpec, rng: random.Random):
+        self.rng = rng
+        self.concentration = spec.domain_concentration
+        self.primary_share = spec.primary_share
+        self.tail = [f"{rng.choice(_WORDS)}{rng.choice(_WORDS)}{i}.com" for i in range(max(2, spec.n_domains))]
+        self.top = self.tail.pop(0)
+        self.cum_weights = list(accumulate((rank + 1) ** -0.5 for rank in range(len(self.tail))))
+
+    def pick(self, exclude: str = "") -> str:
+        while True:
+            r = self.rng.random()
+            if r < self.concentration:
+                domain = self.top
+            elif r < self.concentration + self.primary_share:
+                domain = self.rng.choice(PRIMARY_DOMAINS)
+            else:
+                domain = self.rng.choices(self.tail, cum_weights=self.cum_weights)[0]
+            if domain != exclude:
+                return domain
+
+
+def _new_fact(rng: random.Random) -> _Fact:
+    metric, unit, (lo, hi) = rng.choice(METRICS)
+    year = rng.randint(2015, 2025)
+    period = str(year) if rng.random() < 0.7 else f"Q{rng.randint(1, 4)} {year}"
+    return _Fact(rng.choice(ENTITIES), metric, unit, period, round(rng.uniform(lo, hi), 1),
+                 round(rng.uniform(0.5, 25.0), 1))
+
+
+def _card(i: int, text: str, domain: str, fact: _Fact, rng: random.Random) -> EvidenceCard:
+    slug = "-".join(fact.metric.split()[:3])
+    primary = domain in PRIMARY_DOMAINS
+    return EvidenceCard(
+        url=f"https://{domain}/{fact.period.replace(' ', '-').lower()}/{slug}-{i}",
+        title=f"{fact.entity} {fact.metric} {fact.period}",
+        snippet=text,
+        claim=text,
+        supporting_text=f"{text} {rng.choice(_WORDS).capitalize()} {rng.choice(_WORDS)} "
+                        f"figures were published by {domain}.",
+        source_domain=domain,
+        provider=rng.choice(PROVIDERS),
+        credibility_score=round(rng.uniform(0.8, 0.95) if primary else rng.uniform(0.3, 0.8), 3),
+        relevance_score=round(rng.uniform(0.4, 1.0), 3),
+        is_primary_source=primary,
+        date=f"{fact.period[-4:]}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+    )
+
+
+def generate_corpus(spec: CorpusSpec = CorpusSpec()) -> SyntheticCorpus:
+    """Build a deterministic synthetic corpus for ``spec``."""
+    rng = random.Random(spec.seed)
+    domains = _Domains(spec, rng)
+    corpus = SyntheticCorpus(spec=spec)
+    facts: List[_Fact] = []
+    texts: List[str] = []
+    by_fact: Dict[int, List[int]] = {}  # Card indices stating each fact, for syndication
+
+    for i in range(spec.n_cards):
+        r = rng.random()
+        if not facts or r >= spec.paraphrase_rate + spec.syndication_rate + spec.conflict_rate:
+            kind, fact_id = "original", len(facts)
+            facts.append(_new_fact(rng))
+        else:
+            # Half the restatements follow a Zipf-like popularity, half are uniform
+            if rng.random() < 0.5:
+                fact_id = min(int((rng.paretovariate(1.0) - 1) * 10), len(facts) - 1)
+            else:
+                fact_id = rng.randrange(len(facts))
+            if r < spec.paraphrase_rate:
+                kind = "paraphrase"
+            elif r < spec.paraphrase_rate + spec.syndication_rate:
+                kind = "syndicated"
+            else:
+                kind = "conflict"
+        fact = facts[fact_id]
+
+        if kind == "syndicated":
+            origin = rng.choice(by_fact[fact_id][-5:])
+            if corpus.kinds[origin] == "conflict":
+                kind = "paraphrase"  # Syndicate only the consensus value
+            else:
+                domain = domains.pick(exclude=corpus.cards[origin].source_domain)
+                text = texts[origin] + rng.choice(_SYNDICATION_TAGS)
+        if kind != "syndicated":
+            value = fact.value
+            if kind == "conflict":
+                value = round(value * rng.uniform(1.4, 3.0), 1)
+            domain = domains.pick()
+            text = _sentence(fact, rng, value, domain)
+
+        corpus.cards.append(_card(i, text, domain, fact, rng))
+        corpus.fact_ids.append(fact_id)
+        corpus.kinds.append(kind)
+        texts.append(text)
+        by_fact.setdefault(fact_id, []).append(i)
+    return corpus
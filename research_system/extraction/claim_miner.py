@@ -5,7 +5,7 @@ for triangulation and validation.
 """
 
 import re
-import tldextract
+from research_system.tools.domain_parse import registered_domain
 from typing import List, Optional
 from .claims import Claim, ClaimKey
 
@@ -65,7 +65,7 @@ def mine_claims(text: str, url: str, geo_hint: Optional[str] = None, is_primary:
     
     # Extract domain for source attribution
     try:
-        domain = tldextract.extract(url).registered_domain
+        domain = registered_domain(url)
     except Exception:
         domain = None
     
@@ -0,0 +1,381 @@
+"""Page-level PDF access shared by text, layout and table extraction.
+
+``PdfDocument`` wraps one PDF (bytes, a file such as a download spool entry,
+or a stream) and opens it at most once per backend: PyMuPDF for text, layout
+blocks and tables, pdfplumber only when PyMuPDF is missing. Page text is
+cached by content hash in ``PDF_CACHE_DIR/pages.sqlite``, so asking for more
+pages later (deeper quote search) only parses the pages not seen before.
+
+Long documents are parsed in parallel: when at least
+``PDF_PARALLEL_MIN_PAGES`` uncached pages are requested, contiguous page
+ranges are extracted across a process pool of ``PDF_WORKERS`` workers.
+This module stays free of package-level imports so the workers start fast.
+
+Disable the text cache with ``ENABLE_PDF_TEXT_CACHE=false``.
+"""
+
+from __future__ import annotations
+import hashlib
+import io
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+PDF_CACHE_DIR = "./.pdf_cache"
+PDF_WORKERS = int(os.getenv("PDF_WORKERS", str(min(4, os.cpu_count() or 1))))
+PARALLEL_MIN_PAGES = int(os.getenv("PDF_PARALLEL_MIN_PAGES", "24"))
+_HASH_NAME = re.compile(r"^[0-9a-f]{64}$")
+_READ_CHUNK = 1024 * 1024
+
+Source = Union[bytes, bytearray, str, Path, io.BytesIO, "PdfDocument"]
+
+
+def enabled() -> bool:
+    return os.getenv("ENABLE_PDF_TEXT_CACHE", "true").lower() == "true"
+
+
+def cache_dir() -> Path:
+    return Path(os.environ.get("PDF_CACHE_DIR", PDF_CACHE_DIR))
+
+
+# -- parsed page text cache ---------------------------------------------------
+
+class PageTextCache:
+    """Page texts and page counts of parsed PDFs, keyed by content SHA-256.
+
+    Args:
+        root: Cache directory (``PDF_CACHE_DIR``).
+        ttl: Seconds entries are reused (``PDF_TEXT_CACHE_TTL_DAYS``).
+    """
+
+    def __init__(self, root: str, ttl: Optional[float] = None):
+        self.ttl = ttl if ttl is not None else float(os.getenv("PDF_TEXT_CACHE_TTL_DAYS", "30")) * 86400
+        Path(root).mkdir(parents=True, exist_ok=True)
+        self.path = str(Path(root) / "pages.sqlite")
+        self._local = threading.local()
+        db = self._db()
+        db.execute("CREATE TABLE IF NOT EXISTS documents (digest TEXT PRIMARY KEY, "
+                   "page_count INTEGER NOT NULL, title TEXT, created REAL NOT NULL)")
+        db.execute("CREATE TABLE IF NOT EXISTS pages (digest TEXT NOT NULL, page INTEGER NOT NULL, "
+                   "text TEXT NOT NULL, PRIMARY KEY (digest, page))")
+
+    def _db(self) -> sqlite3.Connection:
+        db = getattr(self._local, "db", None)
+        if db is None or self._local.pid != os.getpid():
+            db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            self._local.db, self._local.pid = db, os.getpid()
+        return db
+
+    def document(self, digest: str) -> Optional[Tuple[int, Optional[str]]]:
+        """Cached ``(page_count, title)`` of a document, if fresh."""
+        row = self._db().execute("SELECT page_count, title, created FROM documents WHERE digest = ?",
+                                 (digest,)).fetchone()
+        if row is None or time.time() - row[2] > self.ttl:
+            return None
+        return row[0], row[1]
+
+    def pages(self, digest: str, start: int, stop: int) -> Dict[int, str]:
+        """Cached texts of pages ``start <= page < stop`` (0-based)."""
+        rows = self._db().execute("SELECT page, text FROM pages WHERE digest = ? AND page >= ? AND page < ?",
+                                  (digest, start, stop)).fetchall()
+        return dict(rows)
+
+    def put(self, digest: str, page_count: int, title: Optional[str], texts: Dict[int, str]) -> None:
+        db = self._db()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            db.execute("INSERT OR REPLACE INTO documents (digest, page_count, title, created) "
+                       "VALUES (?, ?, ?, ?)", (digest, page_count, title, time.time()))
+            db.executemany("INSERT OR REPLACE INTO pages (digest, page, text) VALUES (?, ?, ?)",
+                           [(digest, page, text) for page, text in texts.items()])
+            db.execute("COMMIT")
+        except Exception:
+            db.execute("ROLLBACK")
+            raise
+
+    def purge(self) -> int:
+        """Drop expired documents and their pages; returns documents removed."""
+        db = self._db()
+        cutoff = time.time() - self.ttl
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            db.execute("DELETE FROM pages WHERE digest IN (SELECT digest FROM documents WHERE created < ?)",
+                       (cutoff,))
+            removed = db.execute("DELETE FROM documents WHERE created < ?", (cutoff,)).rowcount
+            db.execute("COMMIT")
+        except Exception:
+            db.execute("ROLLBACK")
+            raise
+        return removed
+
+
+@lru_cache(maxsize=None)
+def _cache_for(root: str) -> PageTextCache:
+    return PageTextCache(root)
+
+
+def page_cache() -> Optional[PageTextCache]:
+    """Shared page text cache for the current ``PDF_CACHE_DIR`` (None if disabled)."""
+    if not enabled():
+        return None
+    try:
+        return _cache_for(os.path.abspath(cache_dir()))
+    except Exception as e:
+        logger.warning(f"PDF text cache unavailable: {e}")
+        return None
+
+
+# -- parallel page extraction -------------------------------------------------
+
+def _extract_range(source: Union[str, bytes], start: int, stop: int) -> List[str]:
+    """Text of pages ``start..stop-1``; runs in a pool worker."""
+    import fitz
+    doc = fitz.open(source) if isinstance(source, str) else fitz.open(stream=source, filetype="pdf")
+    try:
+        return [doc[i].get_text("text") for i in range(start, stop)]
+    finally:
+        doc.close()
+
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _executor() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            import multiprocessing
+            # spawn: forking a threaded process is unsafe, and the workers only need this module
+            _pool = ProcessPoolExecutor(max_workers=PDF_WORKERS,
+                                        mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+
+def shutdown_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=False, cancel_futures=True)
+            _pool = None
+
+
+def _runs(pages: List[int], parts: int) -> List[Tuple[int, int]]:
+    """Contiguous ``(start, stop)`` ranges of sorted pages, each about 1/``parts`` of them."""
+    runs: List[List[int]] = []
+    for page in pages:
+        if runs and runs[-1][1] == page:
+            runs[-1][1] = page + 1
+        else:
+            runs.append([page, page + 1])
+    size = max(1, -(-len(pages) // parts))
+    out = []
+    for start, stop in runs:
+        for s in range(start, stop, size):
+            out.append((s, min(stop, s + size)))
+    return out
+
+
+# -- documents ----------------------------------------------------------------
+
+def _fitz_finds_tables() -> bool:
+    """PyMuPDF >= 1.23 detects tables itself, so pdfplumber need not reopen the file."""
+    import fitz
+    return hasattr(fitz.Page, "find_tables")
+
+
+class PdfDocument:
+    """One PDF, opened lazily and at most once per backend.
+
+    Args:
+        source: PDF bytes, a path (spool entries named ``<sha256>.pdf`` skip
+            rehashing) or a ``BytesIO``.
+    """
+
+    def __init__(self, source: Source):
+        self.path: Optional[Path] = None
+        self._data: Optional[bytes] = None
+        if isinstance(source, (str, Path)):
+            self.path = Path(source)
+        elif isinstance(source, io.BytesIO):
+            self._data = source.getvalue()
+        else:
+            self._data = bytes(source)
+        self._digest: Optional[str] = None
+        self._fitz = None
+        self._plumber = None
+        self._meta: Optional[Tuple[int, Optional[str]]] = None
+        self.backend: Optional[str] = None
+
+    def __enter__(self) -> "PdfDocument":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def close(self) -> None:
+        for handle in (self._fitz, self._plumber):
+            if handle is not None:
+                try:
+                    handle.close()
+                except Exception:
+                    pass
+        self._fitz = self._plumber = None
+
+    @property
+    def data(self) -> bytes:
+        if self._data is None:
+            self._data = self.path.read_bytes()
+        return self._data
+
+    @property
+    def digest(self) -> str:
+        """SHA-256 of the content."""
+        if self._digest is None:
+            if self.path is not None and _HASH_NAME.match(self.path.stem):
+                self._digest = self.path.stem
+            elif self.path is not None and self._data is None:
+                h = hashlib.sha256()
+                with open(self.path, "rb") as f:
+                    for chunk in iter(lambda: f.read(_READ_CHUNK), b""):
+                        h.update(chunk)
+                self._digest = h.hexdigest()
+            else:
+                self._digest = hashlib.sha256(self.data).hexdigest()
+        return self._digest
+
+    def _open(self):
+        """PyMuPDF document, else pdfplumber's; raises if neither can parse it."""
+        if self._fitz is not None or self._plumber is not None:
+            return self._fitz or self._plumber
+        errors = []
+        try:
+            import fitz  # PyMuPDF
+            if self.path is not None and self._data is None:
+                self._fitz = fitz.open(str(self.path))
+            else:
+                self._fitz = fitz.open(stream=self.data, filetype="pdf")
+            self.backend = "fitz"
+            return self._fitz
+        except Exception as e:
+            errors.append(f"fitz: {e}")
+        try:
+            import pdfplumber
+            self._plumber = pdfplumber.open(str(self.path) if self.path is not None and self._data is None
+                                            else io.BytesIO(self.data))
+            self.backend = "pdfplumber"
+            return self._plumber
+        except Exception as e:
+            errors.append(f"pdfplumber: {e}")
+        raise ValueError("; ".join(errors))
+
+    def _read_meta(self) -> Tuple[int, Optional[str]]:
+        handle = self._open()
+        if self._fitz is not None:
+            title = (handle.metadata or {}).get("title") or None
+            return handle.page_count, title
+        title = (handle.metadata or {}).get("Title")
+        return len(handle.pages), title if title and isinstance(title, str) else None
+
+    def _ensure_meta(self, cache: Optional[PageTextCache]) -> Tuple[int, Optional[str]]:
+        if self._meta is None:
+            self._meta = (cache.document(self.digest) if cache else None) or self._read_meta()
+        return self._meta
+
+    @property
+    def page_count(self) -> int:
+        return self._ensure_meta(page_cache())[0]
+
+    @property
+    def title(self) -> Optional[str]:
+        return self._ensure_meta(page_cache())[1]
+
+    def _parse_pages(self, pages: List[int]) -> Dict[int, str]:
+        if not pages:
+            return {}
+        self._open()
+        if (self._fitz is not None and PDF_WORKERS > 1 and len(pages) >= PARALLEL_MIN_PAGES):
+            try:
+                source = str(self.path) if self.path is not None and self._data is None else self.data
+                ranges = _runs(pages, PDF_WORKERS)
+                futures = [(start, _executor().submit(_extract_range, source, start, stop))
+                           for start, stop in ranges]
+                out: Dict[int, str] = {}
+                for start, future in futures:
+                    for offset, text in enumerate(future.result()):
+                        out[start + offset] = text
+                return out
+            except Exception as e:
+                logger.debug(f"Parallel PDF extraction failed, parsing serially: {e}")
+        if self._fitz is not None:
+            return {i: self._fitz[i].get_text("text") for i in pages}
+        return {i: self._plumber.pages[i].extract_text() or "" for i in pages}
+
+    def page_texts(self, start: int = 0, stop: Optional[int] = None) -> List[str]:
+        """Texts of pages ``start..stop-1`` (0-based, clipped to the page count)."""
+        cache = page_cache()
+        count, title = self._ensure_meta(cache)
+        stop = count if stop is None else min(stop, count)
+        if start >= stop:
+            return []
+        texts = cache.pages(self.digest, start, stop) if cache else {}
+        missing = [i for i in range(start, stop) if i not in texts]
+        parsed = self._parse_pages(missing)
+        texts.update(parsed)
+        if cache is not None and (parsed or cache.document(self.digest) is None):
+            try:
+                cache.put(self.digest, count, title, parsed)
+            except Exception as e:
+                logger.debug(f"Failed to cache PDF page text: {e}")
+        return [texts[i] for i in range(start, stop)]
+
+    def blocks(self, max_pages: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Text blocks with bounding boxes (PyMuPDF only; [] otherwise)."""
+        self._open()
+        if self._fitz is None:
+            return []
+        out = []
+        stop = min(self._fitz.page_count, max_pages) if max_pages else self._fitz.page_count
+        for page_num in range(stop):
+            for block in self._fitz[page_num].get_text("blocks"):
+                if block[6] == 0:  # Text block (not image)
+                    out.append({"page": page_num + 1, "bbox": block[:4], "text": block[4], "type": "text"})
+        return out
+
+    def iter_tables(self, max_pages: Optional[int] = None) -> Iterator[Tuple[int, int, List[List[Any]]]]:
+        """``(page_number, table_index, rows)`` for each table, page by page."""
+        self._open()
+        if self._fitz is not None and _fitz_finds_tables():
+            count = self._fitz.page_count
+            for page_num in range(min(count, max_pages) if max_pages else count):
+                try:
+                    found = self._fitz[page_num].find_tables()
+                except Exception as e:
+                    logger.debug(f"Table detection failed on page {page_num + 1}: {e}")
+                    continue
+                for index, table in enumerate(found.tables):
+                    yield page_num + 1, index, table.extract()
+            return
+        if self._plumber is None:
+            import pdfplumber
+            self._plumber = pdfplumber.open(str(self.path) if self.path is not None and self._data is None
+                                            else io.BytesIO(self.data))
+        pages = self._plumber.pages
+        for page in pages[:max_pages] if max_pages else pages:
+            for index, table in enumerate(page.extract_tables() or []):
+                yield page.page_number, index, table
+
+
+def open_document(source: Source) -> PdfDocument:
+    """``source`` itself if it already is a ``PdfDocument``, else a new one."""
+    return source if isinstance(source, PdfDocument) else PdfDocument(source)
@@ -0,0 +1,193 @@
+"""On-disk caches that keep intent classification off the models.
+
+Everything lives under ``INTENT_CACHE_DIR`` and is keyed by a signature of
+the labels file (``INTENT_LABELS_FILE``), so editing labels.yaml invalidates
+it:
+
+* ``embeddings-<model>-<signature>.npz``: label and example embeddings of the
+  semantic classifier, so ``semantic.init`` does not re-embed them;
+* ``results.sqlite``: query -> intent decisions made by the model stages
+  (semantic, linear, NLI), memoized in memory as well and kept for
+  ``INTENT_CACHE_TTL_DAYS``. Their key also covers the settings that change
+  a decision (``_RESULT_SETTINGS``: stage toggles, model names, thresholds).
+
+Disable with ``ENABLE_INTENT_CACHE=false``.
+"""
+
+from __future__ import annotations
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+INTENT_CACHE_DIR = "./.intent_cache"
+DEFAULT_LABELS_FILE = "research_system/intent/labels.yaml"
+_MEMO_SIZE = 4096
+# Settings that change which stage decides a query, or what it decides
+_RESULT_SETTINGS = (
+    "INTENT_USE_LINEAR", "INTENT_EMBED_MODEL", "INTENT_NLI_MODEL",
+    "INTENT_LINEAR_MIN_PROB", "INTENT_LINEAR_AMBIGUOUS_PROB", "INTENT_MIN_SCORE",
+    "INTENT_NLI_MIN_SCORE",
+)
+_WS_RE = re.compile(r"\s+")
+
+
+def enabled() -> bool:
+    return os.getenv("ENABLE_INTENT_CACHE", "true").lower() == "true"
+
+
+def labels_path() -> str:
+    return os.getenv("INTENT_LABELS_FILE", DEFAULT_LABELS_FILE)
+
+
+def labels_signature(path: Optional[str] = None) -> str:
+    """Short content hash of the labels file ("builtin" if it cannot be read)."""
+    try:
+        data = Path(path or labels_path()).read_bytes()
+    except OSError:
+        return "builtin"
+    return hashlib.sha256(data).hexdigest()[:16]
+
+
+def result_signature() -> str:
+    """Signature of labels.yaml plus the classifier settings, for cached decisions."""
+    settings = "|".join(f"{name}={os.getenv(name, '')}" for name in _RESULT_SETTINGS)
+    digest = hashlib.sha256(settings.encode()).hexdigest()[:8]
+    return f"{labels_signature()}-{digest}"
+
+
+def normalize_query(query: str) -> str:
+    return _WS_RE.sub(" ", (query or "").lower()).strip()
+
+
+def _safe(name: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", name)
+
+
+def _cache_dir() -> Path:
+    return Path(os.environ.get("INTENT_CACHE_DIR", INTENT_CACHE_DIR))
+
+
+# -- label/example embeddings ---------------------------------------------
+
+def _embeddings_path(model_name: str, signature: str) -> Path:
+    return _cache_dir() / f"embeddings-{_safe(model_name)}-{signature}.npz"
+
+
+def load_embeddings(model_name: str, signature: str
+                    ) -> Optional[Tuple[np.ndarray, Dict[str, Optional[np.ndarray]]]]:
+    """Cached ``(label_embeddings, {label: example_embeddings})`` or None."""
+    if not enabled():
+        return None
+    path = _embeddings_path(model_name, signature)
+    if not path.exists():
+        return None
+    try:
+        with np.load(path) as data:
+            labels = data["__labels__"]
+            examples = {k[3:]: data[k] for k in data.files if k.startswith("ex_")}
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable intent embedding cache {path}: {e}")
+        return None
+    return labels, examples
+
+
+def save_embeddings(model_name: str, signature: str, labels: np.ndarray,
+                    examples: Dict[str, Optional[np.ndarray]]) -> None:
+    """Persist label and example embeddings (labels without examples are omitted)."""
+    if not enabled():
+        return
+    path = _embeddings_path(model_name, signature)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        arrays = {f"ex_{k}": v for k, v in examples.items() if v is not None}
+        tmp = path.with_suffix(f".{os.getpid()}.tmp.npz")
+        np.savez(tmp, __labels__=labels, **arrays)
+        os.replace(tmp, path)
+    except Exception as e:
+        logger.warning(f"Failed to write intent embedding cache {path}: {e}")
+
+
+# -- query results ----------------------------------------------------------
+
+class ResultCache:
+    """Persistent query -> (intent, stage) cache with an in-memory memo.
+
+    Args:
+        root: Cache directory (``INTENT_CACHE_DIR``).
+        ttl: Seconds a decision is reused (``INTENT_CACHE_TTL_DAYS``).
+    """
+
+    def __init__(self, root: str, ttl: Optional[float] = None):
+        self.ttl = ttl if ttl is not None else float(os.getenv("INTENT_CACHE_TTL_DAYS", "30")) * 86400
+        Path(root).mkdir(parents=True, exist_ok=True)
+        self.path = str(Path(root) / "results.sqlite")
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._memo: "OrderedDict[Tuple[str, str], Tuple[str, str]]" = OrderedDict()
+        self._db().execute("CREATE TABLE IF NOT EXISTS results "
+                           "(signature TEXT NOT NULL, query TEXT NOT NULL, intent TEXT NOT NULL, "
+                           "stage TEXT NOT NULL, created REAL NOT NULL, "
+                           "PRIMARY KEY (signature, query))")
+
+    def _db(self) -> sqlite3.Connection:
+        db = getattr(self._local, "db", None)
+        if db is None or self._local.pid != os.getpid():
+            db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            self._local.db, self._local.pid = db, os.getpid()
+        return db
+
+    def _remember(self, key: Tuple[str, str], value: Tuple[str, str]) -> None:
+        with self._lock:
+            self._memo[key] = value
+            self._memo.move_to_end(key)
+            while len(self._memo) > _MEMO_SIZE:
+                self._memo.popitem(last=False)
+
+    def get(self, signature: str, query: str) -> Optional[Tuple[str, str]]:
+        """Cached ``(intent, stage)`` for a query, if any."""
+        key = (signature, normalize_query(query))
+        with self._lock:
+            hit = self._memo.get(key)
+        if hit is not None:
+            return hit
+        row = self._db().execute("SELECT intent, stage, created FROM results "
+                                 "WHERE signature = ? AND query = ?", key).fetchone()
+        if row is None or time.time() - row[2] > self.ttl:
+            return None
+        self._remember(key, (row[0], row[1]))
+        return row[0], row[1]
+
+    def put(self, signature: str, query: str, intent: str, stage: str) -> None:
+        key = (signature, normalize_query(query))
+        self._remember(key, (intent, stage))
+        self._db().execute("INSERT OR REPLACE INTO results (signature, query, intent, stage, created) "
+                           "VALUES (?, ?, ?, ?, ?)", (*key, intent, stage, time.time()))
+
+
+@lru_cache(maxsize=None)
+def _results_for(root: str) -> ResultCache:
+    return ResultCache(root)
+
+
+def result_cache() -> Optional[ResultCache]:
+    """Shared result cache for the current ``INTENT_CACHE_DIR`` (None if disabled)."""
+    if not enabled():
+        return None
+    try:
+        return _results_for(os.path.abspath(_cache_dir()))
+    except Exception as e:
+        logger.warning(f"Intent result cache unavailable: {e}")
+        return None
@@ -4,6 +4,7 @@ from enum import Enum
 import re
 import os
 import logging
+import threading
 from typing import Tuple, List, Optional
 
 logger = logging.getLogger(__name__)
@@ -27,6 +28,10 @@ class Intent(Enum):
     GENERIC = "generic"
 
 
+# Set when a model stage raised during the current classification, so a
+# decision made around a transient failure is not cached
+_stage_errors = threading.local()
+
 # Intent detection rules (order matters - more specific first)
 _RULES: List[Tuple[Intent, str]] = [
     # Company filings (SEC-like) - check early
@@ -108,6 +113,7 @@ def _classify_semantic(query: str, min_confidence: float = 0.6) -> Optional[Inte
             
     except Exception as e:
         logger.debug(f"Semantic classification unavailable: {e}")
+        _stage_errors.failed = True
         return None
 
 
@@ -140,18 +146,55 @@ def _classify_nli(query: str, min_confidence: float = 0.5) -> Optional[Intent]:
             
     except Exception as e:
         logger.debug(f"NLI classification unavailable: {e}")
+        _stage_errors.failed = True
         return None
 
 
+def _classify_linear(query: str) -> Tuple[Optional[Intent], float]:
+    """
+    Stage A2: Linear classifier trained from labels.yaml (INTENT_USE_LINEAR).
+    
+    Args:
+        query: The search query to classify
+        
+    Returns:
+        (Intent or None, probability of the top label); (None, 0.0) if disabled
+    """
+    try:
+        from . import linear
+        if not linear.enabled():
+            return None, 0.0
+        label, prob, _ = linear.predict(query)
+        if label == "generic":
+            return None, prob
+        return Intent(label), prob
+    except Exception as e:
+        logger.debug(f"Linear classification unavailable: {e}")
+        _stage_errors.failed = True
+        return None, 0.0
+
+
+def _model_stages_available() -> bool:
+    """Whether any model-backed stage could have run (results worth caching)."""
+    from . import semantic, nli_fallback, linear
+    return (semantic._MODEL is not None or nli_fallback._NLI_PIPELINE is not None
+            or linear.enabled())
+
+
 def classify(query: str, use_hybrid: bool = None) -> Intent:
     """
     Classify the intent of a research query using hybrid approach.
     
     Pipeline:
     1. Rule-based patterns (fast, high precision)
-    2. Semantic similarity (if rules don't match)
-    3. Zero-shot NLI (if semantic is low confidence)
-    4. Generic fallback
+    2. Cached decision of the model stages for the same query, labels.yaml
+       and classifier settings
+    3. Linear classifier, if enabled and confident (INTENT_LINEAR_MIN_PROB)
+    4. Semantic similarity (if rules don't match)
+    5. Linear classifier's lean, unless the query is ambiguous
+       (top probability below INTENT_LINEAR_AMBIGUOUS_PROB)
+    6. Zero-shot NLI (only for ambiguous queries)
+    7. Generic fallback
     
     Args:
         query: The search query to classify
@@ -183,21 +226,53 @@ def classify(query: str, use_hybrid: bool = None) -> Intent:
         logger.info(f"Query '{query[:50]}...' classified as GENERIC (rules failed, hybrid disabled)")
         return Intent.GENERIC
     
+    from . import cache as intent_cache
+    results = intent_cache.result_cache()
+    signature = intent_cache.result_signature()
+    cached = results.get(signature, query) if results else None
+    if cached is not None:
+        logger.info(f"Query '{query[:50]}...' classified as {cached[0]} (cached {cached[1]})")
+        return Intent(cached[0])
+    
+    _stage_errors.failed = False
+    intent, stage = _classify_models(query)
+    if (results is not None and not _stage_errors.failed
+            and (stage != "fallback" or _model_stages_available())):
+        try:
+            results.put(signature, query, intent.value, stage)
+        except Exception as e:
+            logger.debug(f"Failed to cache intent for '{query[:50]}': {e}")
+    return intent
+
+
+def _classify_models(query: str) -> Tuple[Intent, str]:
+    """Model-backed stages of ``classify``; returns the intent and deciding stage."""
+    # Stage A2: A confident linear prediction avoids loading any model
+    linear_intent, linear_prob = _classify_linear(query)
+    if linear_intent is not None and linear_prob >= float(os.getenv("INTENT_LINEAR_MIN_PROB", "0.6")):
+        logger.info(f"Query '{query[:50]}...' classified as {linear_intent.value} (linear)")
+        return linear_intent, "linear"
+    
     # Stage B: Try semantic classification
     intent = _classify_semantic(query)
     if intent is not None:
         logger.info(f"Query '{query[:50]}...' classified as {intent.value} (semantic)")
-        return intent
+        return intent, "semantic"
+    
+    # Only truly ambiguous queries go on to the NLI model
+    if linear_intent is not None and linear_prob >= float(os.getenv("INTENT_LINEAR_AMBIGUOUS_PROB", "0.35")):
+        logger.info(f"Query '{query[:50]}...' classified as {linear_intent.value} (linear)")
+        return linear_intent, "linear"
     
     # Stage C: Try NLI classification
     intent = _classify_nli(query)
     if intent is not None:
         logger.info(f"Query '{query[:50]}...' classified as {intent.value} (NLI)")
-        return intent
+        return intent, "nli"
     
     # Stage D: Default fallback
     logger.info(f"Query '{query[:50]}...' classified as GENERIC (all stages failed)")
-    return Intent.GENERIC
+    return Intent.GENERIC, "fallback"
 
 
 def detect_geographic_ambiguity(query: str) -> Optional[List[str]]:
@@ -0,0 +1,92 @@
+"""Linear intent classifier trained from the labels.yaml examples.
+
+A TF-IDF (word and character n-gram) logistic regression fitted on each
+label's examples and the phrases of its description. It needs no
+transformer model, trains in milliseconds on first use, and gives
+calibrated-enough probabilities for ``classifier.classify`` to answer
+confident queries itself and only hand truly ambiguous ones to the NLI
+model. Enabled with ``INTENT_USE_LINEAR=true``.
+"""
+
+import logging
+import os
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+import yaml
+
+from .cache import labels_path, labels_signature
+
+logger = logging.getLogger(__name__)
+
+_PHRASE_SPLIT = re.compile(r"[,.;]\s*")
+
+
+def enabled() -> bool:
+    return os.getenv("INTENT_USE_LINEAR", "false").lower() == "true"
+
+
+def _training_set(labels: Dict[str, str], examples: Dict[str, List[str]]
+                  ) -> Tuple[List[str], List[str]]:
+    texts, targets = [], []
+    for label, description in labels.items():
+        samples = list(examples.get(label) or [])
+        samples += [p for p in _PHRASE_SPLIT.split(description or "") if len(p) > 3]
+        texts += samples
+        targets += [label] * len(samples)
+    return texts, targets
+
+
+class LinearIntentModel:
+    """TF-IDF + logistic regression over the labels file."""
+
+    def __init__(self, labels: Dict[str, str], examples: Dict[str, List[str]]):
+        from sklearn.linear_model import LogisticRegression
+        from sklearn.pipeline import make_pipeline, make_union
+        from sklearn.feature_extraction.text import TfidfVectorizer
+
+        texts, targets = _training_set(labels, examples)
+        if len(set(targets)) < 2:
+            raise ValueError("need at least two labels with examples")
+        features = make_union(
+            TfidfVectorizer(analyzer="word", ngram_range=(1, 2), sublinear_tf=True, lowercase=True),
+            TfidfVectorizer(analyzer="char_wb", ngram_range=(2, 4), sublinear_tf=True, lowercase=True),
+        )
+        self.pipeline = make_pipeline(features, LogisticRegression(C=10.0, max_iter=2000))
+        self.pipeline.fit(texts, targets)
+        self.classes = [str(c) for c in self.pipeline.classes_]
+
+    def score(self, query: str) -> List[Tuple[str, float]]:
+        """(label, probability) pairs, highest first."""
+        probs = self.pipeline.predict_proba([query])[0]
+        return sorted(zip(self.classes, probs.tolist()), key=lambda x: x[1], reverse=True)
+
+
+@lru_cache(maxsize=4)
+def _model_for(path: str, signature: str) -> Optional[LinearIntentModel]:
+    try:
+        with open(path, "r") as f:
+            y = yaml.safe_load(f) or {}
+        model = LinearIntentModel(y.get("labels", {}), y.get("examples", {}))
+        logger.info(f"Trained linear intent classifier on {path} ({signature})")
+        return model
+    except Exception as e:
+        logger.warning(f"Linear intent classifier unavailable: {e}")
+        return None
+
+
+def get_model(path: Optional[str] = None) -> Optional[LinearIntentModel]:
+    """Model for the current labels file, retrained when its content changes."""
+    path = path or labels_path()
+    return _model_for(path, labels_signature(path))
+
+
+def predict(query: str) -> Tuple[str, float, List[Tuple[str, float]]]:
+    """Top label, its probability and the full ranking ("generic", 0.0, []) if unavailable."""
+    model = get_model()
+    if model is None:
+        return "generic", 0.0, []
+    ranked = model.score(query)
+    label, prob = ranked[0]
+    return label, prob, ranked
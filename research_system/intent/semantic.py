@@ -1,4 +1,9 @@
-"""Semantic intent classification using SentenceTransformers."""
+"""Semantic intent classification using SentenceTransformers.
+
+Label and example embeddings are persisted per model and labels.yaml
+signature (see ``intent.cache``), so workers after the first skip
+re-embedding them at ``init``.
+"""
 
 from typing import Dict, List, Tuple, Optional
 import os
@@ -6,6 +11,8 @@ import yaml
 import numpy as np
 import logging
 
+from . import cache as intent_cache
+
 logger = logging.getLogger(__name__)
 
 # Lazy imports to avoid loading models until needed
@@ -14,6 +21,7 @@ _LBL_EMB = None
 _EX_EMB = None
 _LABELS: Dict[str, str] = {}
 _EXAMPLES: Dict[str, List[str]] = {}
+_EMBED_ERRORS = 0
 
 
 def _load_labels(path: str) -> None:
@@ -50,25 +58,32 @@ def _embed_texts(texts: List[str]) -> np.ndarray:
         return np.array([])
     
     try:
-        from sentence_transformers import SentenceTransformer
-        
-        # Import here to match existing pattern in codebase
         if not hasattr(_embed_texts, '_warned'):
-            logger.debug(f"Encoding {len(texts)} texts with SentenceTransformer")
+            logger.debug(f"Encoding {len(texts)} texts with the shared embedding service")
             _embed_texts._warned = True
             
-        emb = _MODEL.encode(texts, normalize_embeddings=True, show_progress_bar=False)
+        emb = _MODEL.encode(texts, normalize=True)
         return emb if isinstance(emb, np.ndarray) else np.asarray(emb)
     except Exception as e:
+        global _EMBED_ERRORS
+        _EMBED_ERRORS += 1
         logger.error(f"Failed to embed texts: {e}")
         # Return random embeddings as fallback
         return np.random.randn(len(texts), 384) if texts else np.array([])
 
 
-def _prep_embeddings() -> None:
-    """Prepare embeddings for labels and examples."""
+def _prep_embeddings(signature: Optional[str] = None) -> None:
+    """Prepare embeddings for labels and examples, from the disk cache if possible."""
     global _LBL_EMB, _EX_EMB
     
+    model_name = getattr(_MODEL, "model_name", "default")
+    cached = intent_cache.load_embeddings(model_name, signature) if signature else None
+    if cached is not None and len(cached[0]) == len(_LABELS):
+        _LBL_EMB, _EX_EMB = cached
+        logger.info(f"Loaded cached embeddings for {len(_LABELS)} labels")
+        return
+    
+    errors = _EMBED_ERRORS
     try:
         # Embed label descriptions
         label_texts = [f"{k}: {_LABELS[k]}" for k in _LABELS.keys()]
@@ -83,6 +98,9 @@ def _prep_embeddings() -> None:
                 _EX_EMB[k] = None
                 
         logger.info(f"Prepared embeddings for {len(_LABELS)} labels")
+        # Never persist the random stand-ins of a failed encode
+        if signature and _EMBED_ERRORS == errors:
+            intent_cache.save_embeddings(model_name, signature, _LBL_EMB, _EX_EMB)
     except Exception as e:
         logger.error(f"Failed to prepare embeddings: {e}")
         # Provide fallback embeddings
@@ -109,18 +127,20 @@ def init(
     if model_name is None:
         model_name = os.getenv("INTENT_EMBED_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
     if labels_path is None:
-        labels_path = os.getenv("INTENT_LABELS_FILE", "research_system/intent/labels.yaml")
+        labels_path = intent_cache.labels_path()
     
     try:
         # Try to import and load the model
-        from sentence_transformers import SentenceTransformer
+        from research_system.triangulation.embeddings import get_service
         
         logger.info(f"Initializing semantic classifier with model: {model_name}")
-        _MODEL = SentenceTransformer(model_name)
+        _MODEL = get_service(model_name)
+        _MODEL.model  # Load now so a missing backend disables classification here
         
         # Load labels and prepare embeddings
         _load_labels(labels_path)
-        _prep_embeddings()
+        signature = intent_cache.labels_signature(labels_path) if _EXAMPLES else None
+        _prep_embeddings(signature)
         
     except ImportError:
         logger.warning("SentenceTransformers not available, semantic classification disabled")
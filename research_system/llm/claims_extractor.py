@@ -442,19 +442,16 @@ def merge_similar_claims(
 ) -> List[AtomicClaim]:
     """Merge similar claims into canonical forms"""
     try:
-        from sentence_transformers import SentenceTransformer
+        from research_system.triangulation.embeddings import encode
         from sklearn.metrics.pairwise import cosine_similarity
         import numpy as np
         
         if not claims:
             return claims
         
-        # Load model
-        model = SentenceTransformer('all-MiniLM-L6-v2')
-        
-        # Encode all claims
+        # Encode all claims through the shared embedding service
         texts = [c.normalized_text for c in claims]
-        embeddings = model.encode(texts)
+        embeddings = encode(texts, normalize=False)
         
         # Calculate similarity matrix
         sim_matrix = cosine_similarity(embeddings)
@@ -21,6 +21,9 @@ def main():
     set_global_seeds(os.environ.get("RA_GLOBAL_SEED", "20230817"))
     
     _init_logging()
+    # Record or replay outbound HTTP when HTTP_CASSETTE_MODE is set
+    from research_system.net.cassette import install_from_env
+    install_from_env()
     p = argparse.ArgumentParser(prog="research-system", description="Research & Citations")
     p.add_argument("--topic", required=True, help="Research topic (required)")
     p.add_argument("--depth", choices=["rapid","standard","deep"], default="standard")
@@ -45,6 +48,12 @@ def main():
     # Create subdirectory path
     base_output_dir = Path(args.output_dir)
     run_output_dir = base_output_dir / f"{topic_slug}_{timestamp}"
+    if args.resume:
+        # Continue the newest unfinished run of this topic instead of a fresh directory
+        from research_system.utils.checkpoint import latest_unfinished_run
+        previous = latest_unfinished_run(base_output_dir, topic_slug)
+        if previous is not None:
+            run_output_dir = previous
     
     # Ensure base directory exists
     base_output_dir.mkdir(parents=True, exist_ok=True)
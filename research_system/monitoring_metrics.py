@@ -1,5 +1,14 @@
-from prometheus_client import Counter, Histogram
+from prometheus_client import Counter, Gauge, Histogram
 
 SEARCH_REQUESTS = Counter("search_requests_total", "Search requests", ["provider"])
 SEARCH_ERRORS   = Counter("search_errors_total",   "Search errors",   ["provider"])
-SEARCH_LATENCY  = Histogram("search_request_seconds", "Search latency", ["provider"])
\ No newline at end of file
+SEARCH_LATENCY  = Histogram("search_request_seconds", "Search latency", ["provider"])
+SEARCH_CACHE_LOOKUPS   = Counter("search_cache_lookups_total", "Search result cache lookups (disk, redis, coalesced or miss)", ["provider", "outcome"])
+SEARCH_CACHE_HIT_RATIO = Gauge("search_cache_hit_ratio", "Share of search lookups served without a new upstream call", ["provider"])
+ENRICH_FETCHES        = Counter("enrich_fetch_total",   "Enrichment page fetches", ["outcome"])
+ENRICH_FETCH_LATENCY  = Histogram("enrich_fetch_seconds", "Enrichment fetch latency", ["outcome"])
+
+HTTP_POOL_REQUESTS    = Counter("http_pool_requests_total", "Pooled provider HTTP requests", ["client", "connection"])
+HTTP_POOL_WAIT        = Histogram("http_pool_wait_seconds", "Wait for a per-host pool slot", ["client"])
+HTTP_POOL_OPEN        = Gauge("http_pool_open_connections", "Open pooled HTTP connections", ["client"])
+HTTP_POOL_REUSE_RATIO = Gauge("http_pool_reuse_ratio", "Share of requests on a reused connection", ["client"])
@@ -0,0 +1,333 @@
+"""Record and replay outbound HTTP exchanges for offline, reproducible runs.
+
+With ``HTTP_CASSETTE_MODE=record`` every request that providers, search
+tools, page fetches and PDF downloads send through ``httpx`` (sync and
+async transports) or ``requests`` is performed as usual and its response is
+stored in the cassette at ``HTTP_CASSETTE``. With ``HTTP_CASSETTE_MODE=replay``
+the same requests are answered from the cassette without touching the
+network; a request that was never recorded fails like an unreachable host.
+
+The cassette is one zip archive: ``index.json`` maps a request key to the
+responses seen for it (status, a few headers, body digest, elapsed time) and
+bodies are stored once per digest under ``bodies/``. Request keys are the
+method, the URL with sorted query parameters and a digest of the request
+body; credentials (``api_key``, ``token``, ...) are dropped from both, and
+request headers are never stored. Repeated requests replay their recorded
+responses in order, then keep returning the last one.
+
+Replayed responses wait ``HTTP_REPLAY_LATENCY_MS`` plus
+``HTTP_REPLAY_LATENCY_SCALE`` times the recorded elapsed time (both 0 by
+default), so benchmarks can model provider latency or exclude it.
+"""
+
+from __future__ import annotations
+import asyncio
+import atexit
+import hashlib
+import io
+import json
+import logging
+import os
+import threading
+import time
+import zipfile
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import httpx
+
+from .ratelimit import _file_lock
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+MODES = ("off", "record", "replay")
+
+# Never part of a request key or stored anywhere
+SECRET_PARAMS = frozenset({
+    "api_key", "apikey", "api-key", "key", "token", "access_token", "auth",
+    "app_id", "app_key", "client_secret", "password",
+})
+# Response headers worth replaying; bodies are stored decoded, so encoding and
+# length headers are dropped
+KEEP_HEADERS = frozenset({
+    "content-type", "location", "retry-after", "etag", "last-modified", "content-disposition",
+})
+
+
+def _scrub_body(body: bytes) -> bytes:
+    try:
+        data = json.loads(body)
+    except (ValueError, UnicodeDecodeError):
+        return body
+    if isinstance(data, dict):
+        data = {k: v for k, v in data.items() if k.lower() not in SECRET_PARAMS}
+    return json.dumps(data, sort_keys=True).encode("utf-8")
+
+
+def request_key(method: str, url: str, body: Optional[bytes] = None) -> str:
+    """Stable, credential-free key of a request."""
+    parts = urlsplit(url)
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                   if k.lower() not in SECRET_PARAMS)
+    key = f"{method.upper()} {parts.scheme}://{parts.netloc.lower()}{parts.path or '/'}"
+    if query:
+        key += "?" + urlencode(query)
+    if body:
+        key += " body:" + hashlib.sha1(_scrub_body(body)).hexdigest()[:16]
+    return key
+
+
+def _kept_headers(headers) -> List[Tuple[str, str]]:
+    return [(k.lower(), v) for k, v in headers.items() if k.lower() in KEEP_HEADERS]
+
+
+@dataclass
+class Recorded:
+    status: int
+    headers: List[Tuple[str, str]]
+    body: bytes
+    elapsed: float
+
+
+class Cassette:
+    """Recorded exchanges of one archive.
+
+    Args:
+        path: The zip archive (created on first ``save`` when recording).
+        latency_ms: Fixed delay added to every replayed response.
+        latency_scale: Fraction of the recorded elapsed time added on replay.
+    """
+
+    def __init__(self, path: str, latency_ms: float = 0.0, latency_scale: float = 0.0):
+        self.path = Path(path)
+        self.latency_ms = latency_ms
+        self.latency_scale = latency_scale
+        self.stats: Counter = Counter()
+        self._lock = threading.Lock()
+        self._entries: Dict[str, List[dict]] = defaultdict(list)
+        self._bodies: Dict[str, bytes] = {}
+        self._new: Dict[str, List[dict]] = defaultdict(list)
+        self._cursor: Counter = Counter()
+        if self.path.exists():
+            entries, self._bodies = self._read()
+            self._entries.update(entries)
+
+    def _read(self) -> Tuple[Dict[str, List[dict]], Dict[str, bytes]]:
+        with zipfile.ZipFile(self.path) as zf:
+            index = json.loads(zf.read("index.json"))
+            if index.get("version") != FORMAT_VERSION:
+                raise ValueError(f"Unsupported cassette version in {self.path}")
+            bodies = {name.split("/", 1)[1]: zf.read(name)
+                      for name in zf.namelist() if name.startswith("bodies/")}
+        return index["entries"], bodies
+
+    def __len__(self) -> int:
+        return sum(len(v) for v in self._entries.values())
+
+    def record(self, key: str, status: int, headers: List[Tuple[str, str]],
+               body: bytes, elapsed: float) -> None:
+        digest = hashlib.sha1(body).hexdigest()
+        entry = {"status": status, "headers": headers, "body": digest, "elapsed": round(elapsed, 4)}
+        with self._lock:
+            self._bodies[digest] = body
+            self._entries[key].append(entry)
+            self._new[key].append(entry)
+            self.stats["recorded"] += 1
+
+    def replay(self, key: str) -> Optional[Recorded]:
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries:
+                self.stats["misses"] += 1
+                return None
+            entry = entries[min(self._cursor[key], len(entries) - 1)]
+            self._cursor[key] += 1
+            self.stats["hits"] += 1
+        return Recorded(entry["status"], [tuple(h) for h in entry["headers"]],
+                        self._bodies.get(entry["body"], b""), entry["elapsed"])
+
+    def delay(self, recorded: Recorded) -> float:
+        """Seconds to wait before serving ``recorded``."""
+        return self.latency_ms / 1000 + self.latency_scale * recorded.elapsed
+
+    def save(self) -> None:
+        """Write recorded exchanges, merged with what other processes saved."""
+        with self._lock:
+            if not self._new:
+                return
+            new, self._new = self._new, defaultdict(list)
+            bodies = dict(self._bodies)
+        with _file_lock(self.path.with_name(self.path.name + ".lock")):
+            entries: Dict[str, List[dict]] = defaultdict(list)
+            if self.path.exists():
+                on_disk, disk_bodies = self._read()
+                entries.update(on_disk)
+                bodies.update(disk_bodies)
+            for key, recorded in new.items():
+                entries[key].extend(recorded)
+            used = {e["body"] for recorded in entries.values() for e in recorded}
+            buf = io.BytesIO()
+            with zipfile.ZipFile(buf, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+                zf.writestr("index.json", json.dumps({"version": FORMAT_VERSION, "entries": entries}))
+                for digest in sorted(used):
+                    zf.writestr(f"bodies/{digest}", bodies.get(digest, b""))
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(self.path.name + f".{os.getpid()}.tmp")
+            tmp.write_bytes(buf.getvalue())
+            os.replace(tmp, self.path)
+        logger.info(f"Cassette {self.path}: saved {sum(len(v) for v in new.values())} exchanges")
+
+
+# -- transport hooks --------------------------------------------------------
+
+_active: Optional[Cassette] = None
+_mode = "off"
+_originals: Dict[str, object] = {}
+
+
+def _offline_error(key: str) -> str:
+    return f"No recorded response for {key} (HTTP_CASSETTE_MODE=replay)"
+
+
+def _httpx_response(recorded: Recorded, request: httpx.Request) -> httpx.Response:
+    return httpx.Response(recorded.status, headers=recorded.headers, content=recorded.body,
+                          request=request)
+
+
+def _handle_request(transport, request: httpx.Request) -> httpx.Response:
+    cassette = _active
+    key = request_key(request.method, str(request.url), request.read())
+    if _mode == "replay":
+        recorded = cassette.replay(key)
+        if recorded is None:
+            raise httpx.ConnectError(_offline_error(key), request=request)
+        if cassette.delay(recorded):
+            time.sleep(cassette.delay(recorded))
+        return _httpx_response(recorded, request)
+
+    start = time.perf_counter()
+    response = _originals["httpx"](transport, request)
+    try:
+        body = response.read()
+    finally:
+        response.close()
+    recorded = Recorded(response.status_code, _kept_headers(response.headers), body,
+                        time.perf_counter() - start)
+    cassette.record(key, recorded.status, recorded.headers, body, recorded.elapsed)
+    return _httpx_response(recorded, request)
+
+
+async def _handle_async_request(transport, request: httpx.Request) -> httpx.Response:
+    cassette = _active
+    key = request_key(request.method, str(request.url), await request.aread())
+    if _mode == "replay":
+        recorded = cassette.replay(key)
+        if recorded is None:
+            raise httpx.ConnectError(_offline_error(key), request=request)
+        if cassette.delay(recorded):
+            await asyncio.sleep(cassette.delay(recorded))
+        return _httpx_response(recorded, request)
+
+    start = time.perf_counter()
+    response = await _originals["httpx_async"](transport, request)
+    try:
+        body = await response.aread()
+    finally:
+        await response.aclose()
+    recorded = Recorded(response.status_code, _kept_headers(response.headers), body,
+                        time.perf_counter() - start)
+    cassette.record(key, recorded.status, recorded.headers, body, recorded.elapsed)
+    return _httpx_response(recorded, request)
+
+
+def _requests_send(adapter, request, **kwargs):
+    import requests
+    from requests.structures import CaseInsensitiveDict
+    from requests.utils import get_encoding_from_headers
+
+    cassette = _active
+    body = request.body.encode("utf-8") if isinstance(request.body, str) else request.body
+    key = request_key(request.method, request.url, body)
+    if _mode == "replay":
+        recorded = cassette.replay(key)
+        if recorded is None:
+            raise requests.exceptions.ConnectionError(_offline_error(key), request=request)
+        if cassette.delay(recorded):
+            time.sleep(cassette.delay(recorded))
+        response = requests.Response()
+        response.status_code = recorded.status
+        response.headers = CaseInsensitiveDict(dict(recorded.headers))
+        response._content = recorded.body
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url, response.request, response.connection = request.url, request, adapter
+        return response
+
+    start = time.perf_counter()
+    response = _originals["requests"](adapter, request, **kwargs)
+    cassette.record(key, response.status_code, _kept_headers(response.headers),
+                    response.content, time.perf_counter() - start)
+    return response
+
+
+def install(mode: str, path: str, latency_ms: float = 0.0,
+            latency_scale: float = 0.0) -> Optional[Cassette]:
+    """Route outbound HTTP through a cassette (``mode`` is record or replay)."""
+    global _active, _mode
+    if mode not in MODES:
+        raise ValueError(f"HTTP cassette mode must be one of {MODES}, not {mode!r}")
+    uninstall()
+    if mode == "off":
+        return None
+    if mode == "replay" and not Path(path).exists():
+        raise FileNotFoundError(f"Cassette {path} does not exist; record it first")
+
+    _active, _mode = Cassette(path, latency_ms, latency_scale), mode
+    _originals["httpx"] = httpx.HTTPTransport.handle_request
+    _originals["httpx_async"] = httpx.AsyncHTTPTransport.handle_async_request
+    httpx.HTTPTransport.handle_request = _handle_request
+    httpx.AsyncHTTPTransport.handle_async_request = _handle_async_request
+    try:
+        from requests.adapters import HTTPAdapter
+        _originals["requests"] = HTTPAdapter.send
+        HTTPAdapter.send = _requests_send
+    except ImportError:
+        pass
+    logger.info(f"HTTP cassette {mode}: {path} ({len(_active)} recorded exchanges)")
+    return _active
+
+
+def uninstall() -> None:
+    """Restore the real transports, saving a cassette that was recording."""
+    global _active, _mode
+    if _active is not None and _mode == "record":
+        _active.save()
+    if "httpx" in _originals:
+        httpx.HTTPTransport.handle_request = _originals.pop("httpx")
+        httpx.AsyncHTTPTransport.handle_async_request = _originals.pop("httpx_async")
+    if "requests" in _originals:
+        from requests.adapters import HTTPAdapter
+        HTTPAdapter.send = _originals.pop("requests")
+    _active, _mode = None, "off"
+
+
+def active() -> Optional[Cassette]:
+    return _active
+
+
+def install_from_env() -> Optional[Cassette]:
+    """Install the cassette configured by ``HTTP_CASSETTE_MODE``/``HTTP_CASSETTE``."""
+    mode = os.getenv("HTTP_CASSETTE_MODE", "off").lower()
+    if mode == "off":
+        return None
+    cassette = install(
+        mode, os.getenv("HTTP_CASSETTE", "./cassettes/run.zip"),
+        latency_ms=float(os.getenv("HTTP_REPLAY_LATENCY_MS", "0")),
+        latency_scale=float(os.getenv("HTTP_REPLAY_LATENCY_SCALE", "0")),
+    )
+    if mode == "record":
+        atexit.register(uninstall)
+    return cassette
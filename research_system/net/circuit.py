@@ -1,19 +1,24 @@
-"""Circuit breaker for domain failures to prevent repeat stalls."""
+"""Circuit breaker for domain failures to prevent repeat stalls.
+
+State lives in the shared provider health registry (``host:<host>``
+records), so a host that tripped in one worker is skipped by the others.
+"""
 import os
-import time
-import collections
-from typing import Dict, Any
+from typing import Optional
+
+from .provider_health import get_registry
 
 
 class Circuit:
     """Circuit breaker pattern for HTTP failures per domain."""
     
-    def __init__(self, fail_thresh: int = None, cooldown: int = None):
+    def __init__(self, fail_thresh: int = None, cooldown: int = None, namespace: str = "host"):
         """Initialize circuit breaker.
         
         Args:
             fail_thresh: Number of failures before opening circuit
             cooldown: Seconds to wait before closing circuit
+            namespace: Prefix of this breaker's health registry keys
         """
         # Read from environment if not provided
         if fail_thresh is None:
@@ -21,12 +26,12 @@ class Circuit:
         if cooldown is None:
             cooldown = int(os.getenv("HTTP_CB_RESET", "900"))
             
-        self.state: Dict[str, Dict[str, Any]] = collections.defaultdict(
-            lambda: {'f': 0, 'until': 0}
-        )
-        self.t = time.time
         self.th = fail_thresh
         self.cd = cooldown
+        self.namespace = namespace
+    
+    def _key(self, host: str) -> str:
+        return f"{self.namespace}:{host}"
     
     def allow(self, host: str) -> bool:
         """Check if requests to host are allowed.
@@ -37,28 +42,26 @@ class Circuit:
         Returns:
             True if circuit is closed (requests allowed)
         """
-        s = self.state[host]
-        return self.t() >= s['until']
+        return get_registry().allow(self._key(host))
     
-    def fail(self, host: str) -> None:
+    def fail(self, host: str, latency: Optional[float] = None) -> None:
         """Record a failure for host.
         
         Args:
             host: Domain/host that failed
+            latency: Seconds the failed request took, if known
         """
-        s = self.state[host]
-        s['f'] += 1
-        # Open circuit if threshold reached
-        if s['f'] >= self.th:
-            s['until'] = self.t() + self.cd
+        # Opens the circuit once the threshold is reached
+        get_registry().record_failure(self._key(host), self.th, self.cd, latency=latency)
     
-    def ok(self, host: str) -> None:
+    def ok(self, host: str, latency: Optional[float] = None) -> None:
         """Record a success for host, resetting failures.
         
         Args:
             host: Domain/host that succeeded
+            latency: Seconds the request took, if known
         """
-        self.state[host] = {'f': 0, 'until': 0}
+        get_registry().record_success(self._key(host), latency)
     
     def is_open(self, host: str) -> bool:
         """Check if circuit is currently open for host.
@@ -77,8 +80,11 @@ class Circuit:
         Args:
             host: Domain/host to reset
         """
-        if host in self.state:
-            del self.state[host]
+        get_registry().reset(self._key(host))
+    
+    def clear(self) -> None:
+        """Reset the circuits of every host."""
+        get_registry().reset(prefix=f"{self.namespace}:")
 
 
 # Global circuit breaker instance
@@ -1,11 +1,18 @@
-"""PDF fetch module with size limits, timeouts, and streaming."""
+"""PDF fetch module with size limits, timeouts, and streaming.
+
+Downloads stream straight into a disk spool (``PDF_CACHE_DIR/spool``), one
+``<sha256>.pdf`` file per distinct content, so PDFs never accumulate in
+memory. The spool is bounded to ``PDF_SPOOL_MB``; the least recently used
+files are evicted first.
+"""
 from __future__ import annotations
 import httpx
 import os
 import time
 import random
 import logging
-from typing import Optional, Set, Dict
+from pathlib import Path
+from typing import Iterable, Optional, Set, Dict, Tuple
 from urllib.parse import urlparse, urlunparse
 import hashlib
 
@@ -17,8 +24,103 @@ CHUNK = 64 * 1024
 TIMEOUT = httpx.Timeout(connect=6.0, read=15.0, write=10.0, pool=10.0)
 RETRIES = int(os.getenv("PDF_RETRIES", "2"))
 
+PDF_CACHE_DIR = "./.pdf_cache"
+SPOOL_MB = float(os.getenv("PDF_SPOOL_MB", "512"))
+
+
+class PdfSpool:
+    """Size-bounded on-disk store of PDFs keyed by content hash.
+
+    Behaves like a ``{content_hash: bytes}`` mapping, but also hands out file
+    paths so callers can parse a document without loading it into memory.
+
+    Args:
+        root: Spool directory (default ``PDF_CACHE_DIR/spool``, read per call).
+        max_mb: Total size kept before evicting least recently used files.
+    """
+
+    def __init__(self, root: Optional[str] = None, max_mb: Optional[float] = None):
+        self._root = root
+        self.max_bytes = int((max_mb if max_mb is not None else SPOOL_MB) * 1024 * 1024)
+
+    @property
+    def root(self) -> Path:
+        if self._root:
+            return Path(self._root)
+        return Path(os.environ.get("PDF_CACHE_DIR", PDF_CACHE_DIR)) / "spool"
+
+    def path(self, content_hash: str) -> Path:
+        return self.root / f"{content_hash}.pdf"
+
+    def get_path(self, content_hash: str) -> Optional[Path]:
+        """Path of a spooled PDF (marked as recently used), or None."""
+        path = self.path(content_hash)
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+        return path
+
+    def __contains__(self, content_hash: str) -> bool:
+        return self.path(content_hash).exists()
+
+    def __getitem__(self, content_hash: str) -> bytes:
+        path = self.get_path(content_hash)
+        if path is None:
+            raise KeyError(content_hash)
+        return path.read_bytes()
+
+    def __setitem__(self, content_hash: str, content: bytes) -> None:
+        self.write_stream([content])
+
+    def write_stream(self, chunks: Iterable[bytes], budget: Optional[int] = None) -> Tuple[str, Path]:
+        """Spool streamed content; returns ``(sha256, path)``.
+
+        Raises:
+            ValueError: If more than ``budget`` bytes arrive.
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.root / f".{os.getpid()}-{time.monotonic_ns()}.part"
+        digest, size = hashlib.sha256(), 0
+        try:
+            with open(tmp, "wb") as f:
+                for chunk in chunks:
+                    if not chunk:
+                        break
+                    size += len(chunk)
+                    if budget is not None and size > budget:
+                        raise ValueError(f"PDF exceeded cap {MAX_PDF_MB}MB")
+                    digest.update(chunk)
+                    f.write(chunk)
+            content_hash = digest.hexdigest()
+            path = self.path(content_hash)
+            os.replace(tmp, path)
+        finally:
+            tmp.unlink(missing_ok=True)
+        self._evict(keep=path)
+        return content_hash, path
+
+    def _evict(self, keep: Optional[Path] = None) -> None:
+        try:
+            files = [(p.stat(), p) for p in self.root.glob("*.pdf")]
+        except OSError:
+            return
+        total = sum(st.st_size for st, _ in files)
+        for st, p in sorted(files, key=lambda x: x[0].st_mtime):
+            if total <= self.max_bytes:
+                break
+            if p == keep:
+                continue
+            p.unlink(missing_ok=True)
+            total -= st.st_size
+
+    def clear(self) -> None:
+        for p in self.root.glob("*.pdf"):
+            p.unlink(missing_ok=True)
+
+
 # Track downloaded URLs by content hash to prevent redundant downloads
-_seen_downloads: Dict[str, bytes] = {}  # URL hash -> content
+_seen_downloads = PdfSpool()  # content hash -> spooled content
 _url_to_hash: Dict[str, str] = {}  # Canonical URL -> content hash
 
 def _canonicalize_url(url: str) -> str:
@@ -40,30 +142,31 @@ def _too_large(content_length: int) -> bool:
     return content_length and content_length > MAX_PDF_MB * 1024 * 1024
 
 
-def download_pdf(client: httpx.Client, url: str) -> bytes:
-    """Download PDF with size limits, streaming, and retries.
+def download_pdf_path(client: httpx.Client, url: str) -> Path:
+    """Download a PDF into the spool with size limits, streaming, and retries.
     
-    Prevents redundant downloads in the same session by caching.
+    Prevents redundant downloads by reusing the spooled file for URLs (and
+    redirect targets) seen before.
     
     Args:
         client: httpx client instance
         url: URL to download PDF from
         
     Returns:
-        PDF content as bytes
+        Path of the spooled PDF
         
     Raises:
         ValueError: If PDF exceeds size limit
         httpx.HTTPError: If download fails after retries
     """
-    # Check if already downloaded in this session by URL
+    # Check if already downloaded by URL
     canonical_url = _canonicalize_url(url)
     if canonical_url in _url_to_hash:
         content_hash = _url_to_hash[canonical_url]
-        if content_hash in _seen_downloads:
-            import logging
-            logging.getLogger(__name__).info(f"Returning cached PDF for {url} (hash: {content_hash[:8]}...)")
-            return _seen_downloads[content_hash]
+        path = _seen_downloads.get_path(content_hash)
+        if path is not None:
+            logger.info(f"Returning cached PDF for {url} (hash: {content_hash[:8]}...)")
+            return path
     # 1) HEAD gate
     try:
         h = client.head(url, timeout=TIMEOUT, follow_redirects=True)
@@ -74,7 +177,7 @@ def download_pdf(client: httpx.Client, url: str) -> bytes:
         # HEAD might be blocked; continue with GET but enforce stream cap
         pass
 
-    # 2) Stream with cap + retry
+    # 2) Stream to the spool with cap + retry
     delay = 0.0
     for attempt in range(RETRIES + 1):
         if delay:
@@ -83,29 +186,25 @@ def download_pdf(client: httpx.Client, url: str) -> bytes:
         try:
             with client.stream("GET", url, timeout=TIMEOUT, follow_redirects=True) as r:
                 r.raise_for_status()
-                buf, size, budget = bytearray(), 0, int(MAX_PDF_MB * 1024 * 1024)
-                for chunk in r.iter_bytes(CHUNK):
-                    if not chunk:
-                        break
-                    size += len(chunk)
-                    if size > budget:
-                        raise ValueError(f"PDF exceeded cap {MAX_PDF_MB}MB")
-                    buf.extend(chunk)
-                result = bytes(buf)
-                # Cache by content hash to catch duplicate content at different URLs
-                content_hash = _content_hash(result)
-                _seen_downloads[content_hash] = result
+                # Spool by content hash to catch duplicate content at different URLs
+                content_hash, path = _seen_downloads.write_stream(
+                    r.iter_bytes(CHUNK), budget=int(MAX_PDF_MB * 1024 * 1024))
                 _url_to_hash[canonical_url] = content_hash
                 # Also cache the final redirected URL if different
                 if hasattr(r, 'url') and str(r.url) != url:
                     redirected_canonical = _canonicalize_url(str(r.url))
                     _url_to_hash[redirected_canonical] = content_hash
                     logger.debug(f"Cached PDF: {url} -> {str(r.url)[:50]}... (hash: {content_hash[:8]}...)")
-                return result
+                return path
         except Exception as e:
             if attempt == 0:
                 delay = 0.35
             elif attempt >= RETRIES:
                 raise
             else:
-                continue
\ No newline at end of file
+                continue
+
+
+def download_pdf(client: httpx.Client, url: str) -> bytes:
+    """``download_pdf_path``, returning the PDF content as bytes."""
+    return download_pdf_path(client, url).read_bytes()
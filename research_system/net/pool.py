@@ -0,0 +1,290 @@
+"""Process-wide pooled HTTP transport shared by providers.
+
+One keep-alive ``httpx.Client`` per process (and one ``httpx.AsyncClient`` per
+event loop, closed when the loop shuts down) replaces the per-request clients providers used to open, so TCP
+and TLS setup is paid once per host instead of once per call. HTTP/2 is
+negotiated when the optional ``h2`` package is installed and the server
+offers it. A per-host slot limit sits in front of the shared pool so one slow
+provider cannot take every connection.
+
+Pool statistics (connection reuse, open connections, slot wait time) are
+exported through ``monitoring_metrics`` and available via ``pool_stats()``.
+"""
+
+from __future__ import annotations
+import asyncio
+import logging
+import os
+import threading
+import time
+import weakref
+from collections import defaultdict
+from typing import Any, Dict, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+from research_system.monitoring_metrics import (
+    HTTP_POOL_REQUESTS,
+    HTTP_POOL_WAIT,
+    HTTP_POOL_OPEN,
+    HTTP_POOL_REUSE_RATIO,
+)
+
+logger = logging.getLogger(__name__)
+
+try:
+    import h2  # noqa: F401
+    HAS_HTTP2 = True
+except ImportError:
+    HAS_HTTP2 = False
+
+MAX_CONNECTIONS = int(os.getenv("HTTP_POOL_MAX_CONNECTIONS", "100"))
+MAX_KEEPALIVE = int(os.getenv("HTTP_POOL_MAX_KEEPALIVE", "40"))
+KEEPALIVE_EXPIRY = float(os.getenv("HTTP_POOL_KEEPALIVE_EXPIRY", "30"))
+PER_HOST_CONNECTIONS = int(os.getenv("HTTP_POOL_PER_HOST", "8"))
+ENABLE_HTTP2 = HAS_HTTP2 and os.getenv("HTTP_POOL_HTTP2", "true").lower() == "true"
+
+DEFAULT_TIMEOUT = httpx.Timeout(10.0, connect=5.0, read=7.0)
+
+
+def _limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=MAX_CONNECTIONS,
+        max_keepalive_connections=MAX_KEEPALIVE,
+        keepalive_expiry=KEEPALIVE_EXPIRY,
+    )
+
+
+def _host(url: str) -> str:
+    try:
+        return (urlparse(str(url)).netloc or "").lower()
+    except Exception:
+        return ""
+
+
+def _open_connections(client: Any) -> int:
+    """Count live connections in an httpx client's httpcore pool."""
+    try:
+        return len(client._transport._pool.connections)
+    except AttributeError:
+        return 0
+
+
+class PoolStats:
+    """Thread-safe counters for one pooled client."""
+
+    def __init__(self, label: str):
+        self.label = label
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.new_connections = 0
+        self.wait_seconds = 0.0
+        self.open_connections = 0
+
+    def record(self, new_connection: bool, wait: float, open_connections: int) -> None:
+        with self._lock:
+            self.requests += 1
+            self.new_connections += int(new_connection)
+            self.wait_seconds += wait
+            self.open_connections = open_connections
+            ratio = self.reuse_ratio
+        HTTP_POOL_REQUESTS.labels(client=self.label,
+                                  connection="new" if new_connection else "reused").inc()
+        HTTP_POOL_WAIT.labels(client=self.label).observe(wait)
+        HTTP_POOL_OPEN.labels(client=self.label).set(open_connections)
+        HTTP_POOL_REUSE_RATIO.labels(client=self.label).set(ratio)
+
+    @property
+    def reuse_ratio(self) -> float:
+        if not self.requests:
+            return 0.0
+        return (self.requests - self.new_connections) / self.requests
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "new_connections": self.new_connections,
+                "reused": self.requests - self.new_connections,
+                "reuse_ratio": round(self.reuse_ratio, 4),
+                "open_connections": self.open_connections,
+                "wait_seconds": round(self.wait_seconds, 4),
+            }
+
+
+class PooledClient:
+    """Shared sync client with keep-alive, optional HTTP/2 and per-host slots."""
+
+    def __init__(self, per_host: int = PER_HOST_CONNECTIONS,
+                 transport: Optional[httpx.BaseTransport] = None):
+        self._client = httpx.Client(
+            http2=ENABLE_HTTP2,
+            limits=_limits(),
+            timeout=DEFAULT_TIMEOUT,
+            transport=transport,
+        )
+        self._per_host = max(1, per_host)
+        self._slots: Dict[str, threading.BoundedSemaphore] = {}
+        self._slots_lock = threading.Lock()
+        self.stats = PoolStats("sync")
+
+    def _slot(self, host: str) -> threading.BoundedSemaphore:
+        with self._slots_lock:
+            slot = self._slots.get(host)
+            if slot is None:
+                slot = self._slots[host] = threading.BoundedSemaphore(self._per_host)
+            return slot
+
+    def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request through the shared pool (body is fully read)."""
+        new_conn = []
+
+        def trace(name: str, info: Dict[str, Any]) -> None:
+            if name.endswith("connect_tcp.started"):
+                new_conn.append(True)
+
+        extensions = {**(kwargs.pop("extensions", None) or {}), "trace": trace}
+        slot = self._slot(_host(url))
+        t0 = time.perf_counter()
+        slot.acquire()
+        wait = time.perf_counter() - t0
+        try:
+            return self._client.request(method, url, extensions=extensions, **kwargs)
+        finally:
+            slot.release()
+            self.stats.record(bool(new_conn), wait, _open_connections(self._client))
+
+    def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        return self.request("POST", url, **kwargs)
+
+    def close(self) -> None:
+        self._client.close()
+
+
+class AsyncPooledClient:
+    """Async counterpart of PooledClient, bound to a single event loop."""
+
+    def __init__(self, per_host: int = PER_HOST_CONNECTIONS,
+                 transport: Optional[httpx.AsyncBaseTransport] = None):
+        self._client = httpx.AsyncClient(
+            http2=ENABLE_HTTP2,
+            limits=_limits(),
+            timeout=DEFAULT_TIMEOUT,
+            transport=transport,
+        )
+        self._per_host = max(1, per_host)
+        self._slots: Dict[str, asyncio.Semaphore] = defaultdict(
+            lambda: asyncio.Semaphore(self._per_host)
+        )
+        self.stats = PoolStats("async")
+        self._closer = None  # Set by get_async_client for loop-owned clients
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Send a request through the shared pool (body is fully read)."""
+        new_conn = []
+
+        async def trace(name: str, info: Dict[str, Any]) -> None:
+            if name.endswith("connect_tcp.started"):
+                new_conn.append(True)
+
+        extensions = {**(kwargs.pop("extensions", None) or {}), "trace": trace}
+        slot = self._slots[_host(url)]
+        t0 = time.perf_counter()
+        await slot.acquire()
+        wait = time.perf_counter() - t0
+        try:
+            return await self._client.request(method, url, extensions=extensions, **kwargs)
+        finally:
+            slot.release()
+            self.stats.record(bool(new_conn), wait, _open_connections(self._client))
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("GET", url, **kwargs)
+
+    async def post(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request("POST", url, **kwargs)
+
+    async def aclose(self) -> None:
+        await self._client.aclose()
+
+
+# Process-wide instances; recreated after fork so children never share sockets
+_lock = threading.Lock()
+_sync_client: Optional[PooledClient] = None
+_owner_pid: Optional[int] = None
+_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncPooledClient]" = \
+    weakref.WeakKeyDictionary()
+
+
+def _check_fork() -> None:
+    global _sync_client, _owner_pid, _async_clients
+    pid = os.getpid()
+    if _owner_pid != pid:
+        _sync_client = None
+        _async_clients = weakref.WeakKeyDictionary()
+        _owner_pid = pid
+
+
+def get_client() -> PooledClient:
+    """Return the process-wide pooled sync client."""
+    global _sync_client
+    with _lock:
+        _check_fork()
+        if _sync_client is None:
+            _sync_client = PooledClient()
+            logger.debug(f"Created pooled HTTP client (http2={ENABLE_HTTP2})")
+        return _sync_client
+
+
+async def _close_on_shutdown(client: AsyncPooledClient):
+    """Suspended until the loop finalizes async generators, then closes ``client``."""
+    try:
+        yield
+    finally:
+        await client.aclose()
+
+
+def get_async_client() -> AsyncPooledClient:
+    """Return the pooled async client for the running event loop.
+
+    The client is closed by ``loop.shutdown_asyncgens()``, which
+    ``asyncio.run`` calls before closing the loop.
+    """
+    loop = asyncio.get_running_loop()
+    with _lock:
+        _check_fork()
+        client = _async_clients.get(loop)
+        if client is None:
+            client = _async_clients[loop] = AsyncPooledClient()
+            # The loop tracks async generators weakly; the client holds the strong reference
+            client._closer = _close_on_shutdown(client)
+            asyncio.ensure_future(client._closer.__anext__())
+        return client
+
+
+def close_clients() -> None:
+    """Close the shared sync client (async clients close when their loop shuts down)."""
+    global _sync_client
+    with _lock:
+        if _sync_client is not None:
+            _sync_client.close()
+            _sync_client = None
+
+
+def pool_stats() -> Dict[str, Any]:
+    """Snapshot of pool statistics for the sync and async clients."""
+    with _lock:
+        sync = _sync_client.stats.snapshot() if _sync_client else PoolStats("sync").snapshot()
+        async_clients = list(_async_clients.values())
+    agg = PoolStats("async")
+    for c in async_clients:
+        snap = c.stats.snapshot()
+        agg.requests += snap["requests"]
+        agg.new_connections += snap["new_connections"]
+        agg.wait_seconds += snap["wait_seconds"]
+        agg.open_connections += snap["open_connections"]
+    return {"http2": ENABLE_HTTP2, "sync": sync, "async": agg.snapshot()}
@@ -1,26 +1,19 @@
-"""Provider-level circuit breaker to prevent API exhaustion."""
+"""Provider-level circuit breaker to prevent API exhaustion.
+
+Provider state is kept in the shared health registry
+(``net.provider_health``, ``provider:<name>`` records), so trips and 429
+backoffs are seen by every process and survive restarts.
+"""
 
 import os
 import time
 import logging
 import random
 from typing import Dict, Optional, Tuple
-from collections import defaultdict
-from dataclasses import dataclass, field
-
-logger = logging.getLogger(__name__)
 
+from .provider_health import Health, get_registry
 
-@dataclass
-class ProviderState:
-    """State for a single provider."""
-    consecutive_failures: int = 0
-    last_failure_time: float = 0
-    circuit_open_until: float = 0
-    total_attempts: int = 0
-    total_failures: int = 0
-    last_429_time: float = 0
-    backoff_until: float = 0
+logger = logging.getLogger(__name__)
 
 
 class ProviderCircuitBreaker:
@@ -31,7 +24,8 @@ class ProviderCircuitBreaker:
         failure_threshold: int = 3,
         cooldown_seconds: int = 600,  # 10 minutes
         max_backoff_seconds: int = 300,  # 5 minutes
-        initial_backoff_seconds: int = 5
+        initial_backoff_seconds: int = 5,
+        namespace: str = "provider"
     ):
         """
         Initialize provider circuit breaker.
@@ -41,15 +35,21 @@ class ProviderCircuitBreaker:
             cooldown_seconds: Time to keep circuit open
             max_backoff_seconds: Maximum backoff duration
             initial_backoff_seconds: Initial backoff duration
+            namespace: Prefix of this breaker's health registry keys
         """
         # Read from environment with defaults
         self.failure_threshold = int(os.getenv("PROVIDER_CB_THRESHOLD", str(failure_threshold)))
         self.cooldown_seconds = int(os.getenv("PROVIDER_CB_COOLDOWN", str(cooldown_seconds)))
         self.max_backoff = int(os.getenv("PROVIDER_MAX_BACKOFF", str(max_backoff_seconds)))
         self.initial_backoff = int(os.getenv("PROVIDER_INITIAL_BACKOFF", str(initial_backoff_seconds)))
-        
-        # Provider states
-        self.states: Dict[str, ProviderState] = defaultdict(ProviderState)
+        self.namespace = namespace
+    
+    def _key(self, provider: str) -> str:
+        return f"{self.namespace}:{provider}"
+    
+    def state(self, provider: str) -> Health:
+        """Current shared health record of a provider."""
+        return get_registry().get(self._key(provider))
         
     def is_available(self, provider: str) -> Tuple[bool, Optional[str]]:
         """
@@ -61,12 +61,12 @@ class ProviderCircuitBreaker:
         Returns:
             Tuple of (is_available, reason_if_not)
         """
-        state = self.states[provider]
+        state = self.state(provider)
         now = time.time()
         
         # Check if circuit is open
-        if now < state.circuit_open_until:
-            remaining = int(state.circuit_open_until - now)
+        if now < state.open_until:
+            remaining = int(state.open_until - now)
             return False, f"Circuit open for {remaining}s after {state.consecutive_failures} failures"
         
         # Check if in backoff
@@ -76,62 +76,68 @@ class ProviderCircuitBreaker:
         
         return True, None
     
-    def record_success(self, provider: str):
-        """Record successful API call."""
-        state = self.states[provider]
-        state.consecutive_failures = 0
-        state.total_attempts += 1
-        # Clear backoff on success
-        state.backoff_until = 0
+    def record_success(self, provider: str, latency: Optional[float] = None):
+        """Record successful API call (and its latency in seconds, if known)."""
+        # Clears failures and backoff
+        get_registry().record_success(self._key(provider), latency)
         logger.debug(f"Provider {provider} success recorded")
     
-    def record_failure(self, provider: str, status_code: Optional[int] = None):
+    def record_failure(self, provider: str, status_code: Optional[int] = None,
+                       latency: Optional[float] = None):
         """
         Record failed API call.
         
         Args:
             provider: Provider name
             status_code: HTTP status code if available
+            latency: Seconds the failed call took, if known
         """
-        state = self.states[provider]
-        now = time.time()
-        
-        state.consecutive_failures += 1
-        state.total_attempts += 1
-        state.total_failures += 1
-        state.last_failure_time = now
+        opened = {}
         
-        # Handle rate limiting (429) with exponential backoff
-        if status_code == 429:
-            state.last_429_time = now
-            # Calculate exponential backoff with jitter
-            backoff_multiplier = min(2 ** (state.consecutive_failures - 1), 32)
-            backoff_seconds = min(
-                self.initial_backoff * backoff_multiplier,
-                self.max_backoff
-            )
-            # Add jitter (±20%)
-            jitter = random.uniform(0.8, 1.2)
-            backoff_seconds = int(backoff_seconds * jitter)
+        def fail(state: Health):
+            now = time.time()
+            state.consecutive_failures += 1
+            state.total_attempts += 1
+            state.total_failures += 1
+            state.last_failure = now
+            if latency is not None:
+                state.observe(latency)
             
-            state.backoff_until = now + backoff_seconds
+            # Handle rate limiting (429) with exponential backoff
+            if status_code == 429:
+                state.last_429 = now
+                # Calculate exponential backoff with jitter
+                backoff_multiplier = min(2 ** (state.consecutive_failures - 1), 32)
+                backoff_seconds = min(
+                    self.initial_backoff * backoff_multiplier,
+                    self.max_backoff
+                )
+                # Add jitter (±20%)
+                jitter = random.uniform(0.8, 1.2)
+                opened["backoff"] = int(backoff_seconds * jitter)
+                state.backoff_until = now + opened["backoff"]
+            
+            # Open circuit if threshold reached
+            if state.consecutive_failures >= self.failure_threshold:
+                state.open_until = now + self.cooldown_seconds
+                opened["failures"] = state.consecutive_failures
+        
+        get_registry().update(self._key(provider), fail)
+        if "backoff" in opened:
             logger.warning(
                 f"Provider {provider} rate limited (429), "
-                f"backing off for {backoff_seconds}s"
+                f"backing off for {opened['backoff']}s"
             )
-        
-        # Open circuit if threshold reached
-        if state.consecutive_failures >= self.failure_threshold:
-            state.circuit_open_until = now + self.cooldown_seconds
+        if "failures" in opened:
             logger.error(
                 f"Provider {provider} circuit opened after "
-                f"{state.consecutive_failures} consecutive failures, "
+                f"{opened['failures']} consecutive failures, "
                 f"cooling down for {self.cooldown_seconds}s"
             )
     
     def get_health_stats(self, provider: str) -> Dict:
         """Get health statistics for a provider."""
-        state = self.states[provider]
+        state = self.state(provider)
         now = time.time()
         
         return {
@@ -143,11 +149,12 @@ class ProviderCircuitBreaker:
             "failure_rate": (
                 state.total_failures / max(1, state.total_attempts)
             ),
-            "circuit_open": now < state.circuit_open_until,
+            "circuit_open": now < state.open_until,
             "in_backoff": now < state.backoff_until,
+            "latency_ewma": state.latency_ewma,
             "last_failure": (
-                f"{int(now - state.last_failure_time)}s ago"
-                if state.last_failure_time > 0
+                f"{int(now - state.last_failure)}s ago"
+                if state.last_failure > 0
                 else "Never"
             )
         }
@@ -155,10 +162,10 @@ class ProviderCircuitBreaker:
     def reset(self, provider: Optional[str] = None):
         """Reset circuit breaker state."""
         if provider:
-            self.states[provider] = ProviderState()
+            get_registry().reset(self._key(provider))
             logger.info(f"Reset circuit breaker for {provider}")
         else:
-            self.states.clear()
+            get_registry().reset(prefix=f"{self.namespace}:")
             logger.info("Reset all circuit breakers")
     
     def get_available_providers(self, providers: list) -> list:
@@ -0,0 +1,406 @@
+"""Provider and host health shared by every process.
+
+One registry holds the health record of each endpoint the system talks to:
+consecutive and total failures, when its circuit is open until, when a 429
+backoff ends, and an EWMA of its latency. Every breaker reads and writes it:
+
+* ``net.circuit.Circuit`` (per fetched host, ``host:<name>``);
+* ``net.provider_circuit.ProviderCircuitBreaker`` (``provider:<name>``);
+* the OECD / IMF catalog breakers (``catalog:oecd``, ``catalog:imf``);
+* the Tavily, Serper and SerpAPI rate-limit circuits (``search:<name>``);
+* ``providers.http.http_json_with_policy`` latencies (``provider:<name>``).
+
+Records live in a SQLite file in ``PROVIDER_HEALTH_DIR`` (WAL mode, one
+read-modify-write transaction per update), so API workers and CLI runs on a
+host learn from each other's timeouts and a restarted process does not
+hammer a provider that tripped a minute ago. ``PROVIDER_HEALTH_BACKEND=redis``
+shares them between hosts through Redis (``PROVIDER_HEALTH_REDIS_URL`` /
+``REDIS_URL``); ``local`` keeps them in-process. A failing shared store
+degrades to in-process records instead of blocking requests.
+"""
+
+from __future__ import annotations
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, fields
+from functools import lru_cache
+from collections.abc import Mapping
+from typing import Callable, Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    import redis
+    HAS_REDIS = True
+except ImportError:
+    HAS_REDIS = False
+
+PROVIDER_HEALTH_DIR = "./.provider_health"
+EWMA_ALPHA = float(os.getenv("PROVIDER_HEALTH_EWMA_ALPHA", "0.2"))
+# Records untouched for this long are dropped by ``prune``
+RETENTION = float(os.getenv("PROVIDER_HEALTH_RETENTION_HOURS", "168")) * 3600
+
+
+@dataclass
+class Health:
+    """Health record of one provider or host."""
+    consecutive_failures: int = 0
+    total_attempts: int = 0
+    total_failures: int = 0
+    last_failure: float = 0.0
+    last_429: float = 0.0
+    open_until: float = 0.0
+    backoff_until: float = 0.0
+    latency_ewma: Optional[float] = None
+    updated: float = 0.0
+
+    @classmethod
+    def from_dict(cls, data: Optional[dict]) -> "Health":
+        names = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in (data or {}).items() if k in names})
+
+    def is_open(self, now: Optional[float] = None) -> bool:
+        return (now or time.time()) < self.open_until
+
+    def in_backoff(self, now: Optional[float] = None) -> bool:
+        return (now or time.time()) < self.backoff_until
+
+    def blocked_until(self) -> float:
+        return max(self.open_until, self.backoff_until)
+
+    def observe(self, latency: float, alpha: float = EWMA_ALPHA) -> None:
+        if self.latency_ewma is None:
+            self.latency_ewma = float(latency)
+        else:
+            self.latency_ewma += alpha * (float(latency) - self.latency_ewma)
+
+
+# ---------------------------------------------------------------------------
+# Storage backends
+# ---------------------------------------------------------------------------
+
+class LocalStore:
+    """In-process records."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._data: Dict[str, dict] = {}
+
+    def get(self, key: str) -> Health:
+        with self._lock:
+            return Health.from_dict(self._data.get(key))
+
+    def update(self, key: str, fn: Callable[[Health], None]) -> Health:
+        with self._lock:
+            health = Health.from_dict(self._data.get(key))
+            fn(health)
+            health.updated = time.time()
+            self._data[key] = asdict(health)
+            return health
+
+    def items(self, prefix: str = "") -> Dict[str, Health]:
+        with self._lock:
+            return {k: Health.from_dict(v) for k, v in self._data.items() if k.startswith(prefix)}
+
+    def delete(self, prefix: str = "", exact: bool = False) -> None:
+        with self._lock:
+            for key in [k for k in self._data if (k == prefix if exact else k.startswith(prefix))]:
+                del self._data[key]
+
+    def prune(self, before: float) -> int:
+        with self._lock:
+            stale = [k for k, v in self._data.items() if v.get("updated", 0) < before]
+            for key in stale:
+                del self._data[key]
+            return len(stale)
+
+
+class SqliteStore:
+    """Records in ``<root>/health.sqlite``, shared by every local process.
+
+    Args:
+        root: Directory of the database (``PROVIDER_HEALTH_DIR``).
+    """
+
+    def __init__(self, root: str):
+        self.path = os.path.join(root, "health.sqlite")
+        os.makedirs(root, exist_ok=True)
+        self._local = threading.local()
+        with self._transaction() as db:
+            db.execute("CREATE TABLE IF NOT EXISTS health "
+                       "(key TEXT PRIMARY KEY, data TEXT NOT NULL, updated REAL NOT NULL)")
+
+    def _db(self) -> sqlite3.Connection:
+        # Connections must not cross a fork, so they are keyed by pid too
+        db = getattr(self._local, "db", None)
+        if db is None or self._local.pid != os.getpid():
+            db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")
+            self._local.db, self._local.pid = db, os.getpid()
+        return db
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        db = self._db()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            yield db
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        db.execute("COMMIT")
+
+    def get(self, key: str) -> Health:
+        row = self._db().execute("SELECT data FROM health WHERE key = ?", (key,)).fetchone()
+        return Health.from_dict(json.loads(row[0]) if row else None)
+
+    def update(self, key: str, fn: Callable[[Health], None]) -> Health:
+        with self._transaction() as db:
+            row = db.execute("SELECT data FROM health WHERE key = ?", (key,)).fetchone()
+            health = Health.from_dict(json.loads(row[0]) if row else None)
+            fn(health)
+            health.updated = time.time()
+            db.execute("INSERT OR REPLACE INTO health (key, data, updated) VALUES (?, ?, ?)",
+                       (key, json.dumps(asdict(health)), health.updated))
+        return health
+
+    def items(self, prefix: str = "") -> Dict[str, Health]:
+        rows = self._db().execute("SELECT key, data FROM health WHERE substr(key, 1, ?) = ?",
+                                  (len(prefix), prefix)).fetchall()
+        return {key: Health.from_dict(json.loads(data)) for key, data in rows}
+
+    def delete(self, prefix: str = "", exact: bool = False) -> None:
+        with self._transaction() as db:
+            if exact:
+                db.execute("DELETE FROM health WHERE key = ?", (prefix,))
+            else:
+                db.execute("DELETE FROM health WHERE substr(key, 1, ?) = ?", (len(prefix), prefix))
+
+    def prune(self, before: float) -> int:
+        with self._transaction() as db:
+            return db.execute("DELETE FROM health WHERE updated < ?", (before,)).rowcount
+
+
+class RedisStore:
+    """Records as JSON strings in Redis, updated with optimistic transactions."""
+
+    PREFIX = "provider_health:"
+
+    def __init__(self, url: str, ttl: float = RETENTION):
+        self.client = redis.Redis.from_url(url, socket_timeout=2)
+        self.client.ping()
+        self.ttl = int(ttl)
+
+    def get(self, key: str) -> Health:
+        raw = self.client.get(self.PREFIX + key)
+        return Health.from_dict(json.loads(raw) if raw else None)
+
+    def update(self, key: str, fn: Callable[[Health], None]) -> Health:
+        rkey = self.PREFIX + key
+        result = {}
+
+        def txn(pipe):
+            raw = pipe.get(rkey)
+            health = Health.from_dict(json.loads(raw) if raw else None)
+            fn(health)
+            health.updated = time.time()
+            pipe.multi()
+            pipe.set(rkey, json.dumps(asdict(health)), ex=self.ttl)
+            result["health"] = health
+
+        self.client.transaction(txn, rkey)
+        return result["health"]
+
+    def items(self, prefix: str = "") -> Dict[str, Health]:
+        out = {}
+        for rkey in self.client.scan_iter(match=f"{self.PREFIX}{prefix}*"):
+            raw = self.client.get(rkey)
+            if raw:
+                key = rkey.decode() if isinstance(rkey, bytes) else rkey
+                out[key[len(self.PREFIX):]] = Health.from_dict(json.loads(raw))
+        return out
+
+    def delete(self, prefix: str = "", exact: bool = False) -> None:
+        if exact:
+            self.client.delete(self.PREFIX + prefix)
+            return
+        keys = list(self.client.scan_iter(match=f"{self.PREFIX}{prefix}*"))
+        if keys:
+            self.client.delete(*keys)
+
+    def prune(self, before: float) -> int:
+        return 0  # keys expire on their own
+
+
+# ---------------------------------------------------------------------------
+# Registry
+# ---------------------------------------------------------------------------
+
+class HealthRegistry:
+    """Breaker operations over a health store.
+
+    Every mutation is one atomic read-modify-write of the record, so
+    concurrent processes never lose each other's failures.
+    """
+
+    def __init__(self, store=None):
+        self.store = store if store is not None else LocalStore()
+
+    def _call(self, op: str, *args):
+        try:
+            return getattr(self.store, op)(*args)
+        except Exception as e:
+            if isinstance(self.store, LocalStore):
+                raise
+            # A broken shared store must not stop requests; degrade to local
+            logger.warning(f"Provider health store failed ({e}); using in-process records")
+            self.store = LocalStore()
+            return getattr(self.store, op)(*args)
+
+    def get(self, key: str) -> Health:
+        return self._call("get", key)
+
+    def update(self, key: str, fn: Callable[[Health], None]) -> Health:
+        """Apply ``fn`` to the record of ``key`` atomically and return the result."""
+        return self._call("update", key, fn)
+
+    def allow(self, key: str) -> bool:
+        """False while ``key``'s circuit is open or it is backing off."""
+        return time.time() >= self.get(key).blocked_until()
+
+    def record_success(self, key: str, latency: Optional[float] = None) -> Health:
+        """Clear failures, circuit and backoff; fold ``latency`` into the EWMA."""
+        def fn(h: Health):
+            h.consecutive_failures = 0
+            h.total_attempts += 1
+            h.open_until = h.backoff_until = 0.0
+            if latency is not None:
+                h.observe(latency)
+        return self.update(key, fn)
+
+    def record_failure(self, key: str, threshold: Optional[int] = None,
+                       cooldown: float = 0.0, status: Optional[int] = None,
+                       latency: Optional[float] = None) -> Health:
+        """Count a failure; open the circuit for ``cooldown`` at ``threshold`` failures."""
+        def fn(h: Health):
+            now = time.time()
+            h.consecutive_failures += 1
+            h.total_attempts += 1
+            h.total_failures += 1
+            h.last_failure = now
+            if status == 429:
+                h.last_429 = now
+            if latency is not None:
+                h.observe(latency)
+            if threshold is not None and h.consecutive_failures >= threshold:
+                h.open_until = max(h.open_until, now + cooldown)
+        return self.update(key, fn)
+
+    def trip(self, key: str, seconds: float, status: Optional[int] = None) -> Health:
+        """Open ``key``'s circuit for ``seconds`` regardless of its failure count."""
+        def fn(h: Health):
+            now = time.time()
+            h.consecutive_failures += 1
+            h.total_attempts += 1
+            h.total_failures += 1
+            h.last_failure = now
+            if status == 429:
+                h.last_429 = now
+            h.open_until = max(h.open_until, now + seconds)
+        return self.update(key, fn)
+
+    def observe_latency(self, key: str, latency: float) -> Health:
+        return self.update(key, lambda h: h.observe(latency))
+
+    def reset(self, key: Optional[str] = None, prefix: str = "") -> None:
+        """Forget ``key``, or every record starting with ``prefix``."""
+        if key is not None:
+            self._call("delete", key, True)
+        else:
+            self._call("delete", prefix, False)
+
+    def snapshot(self, prefix: str = "") -> Dict[str, Health]:
+        return self._call("items", prefix)
+
+    def prune(self, max_age: float = RETENTION) -> int:
+        """Drop records not updated for ``max_age`` seconds."""
+        return self._call("prune", time.time() - max_age)
+
+
+@lru_cache(maxsize=None)
+def _registry_for(backend: str, location: str) -> HealthRegistry:
+    if backend == "redis":
+        if HAS_REDIS and location:
+            try:
+                return HealthRegistry(RedisStore(location))
+            except Exception as e:
+                logger.warning(f"Redis provider health store unavailable ({e}); using local records")
+        else:
+            logger.warning("PROVIDER_HEALTH_BACKEND=redis needs the redis package and a REDIS_URL")
+        return HealthRegistry(LocalStore())
+    if backend == "sqlite":
+        try:
+            return HealthRegistry(SqliteStore(location))
+        except Exception as e:
+            logger.warning(f"Provider health database unavailable ({e}); using local records")
+    return HealthRegistry(LocalStore())
+
+
+def get_registry() -> HealthRegistry:
+    """Shared registry for the current ``PROVIDER_HEALTH_BACKEND`` / ``PROVIDER_HEALTH_DIR``."""
+    backend = os.environ.get("PROVIDER_HEALTH_BACKEND", "sqlite").lower()
+    if backend == "redis":
+        location = os.environ.get("PROVIDER_HEALTH_REDIS_URL", os.environ.get("REDIS_URL", ""))
+    elif backend == "sqlite":
+        location = os.path.abspath(os.environ.get("PROVIDER_HEALTH_DIR", PROVIDER_HEALTH_DIR))
+    else:
+        backend, location = "local", ""
+    return _registry_for(backend, location)
+
+
+class CircuitStateView(Mapping):
+    """Live ``{"is_open", "last_failure", "consecutive_failures"}`` view of one
+    record, the shape of the old per-module ``_circuit_state`` dicts.
+
+    Assigning ``is_open = True`` opens the circuit for ``cooldown`` seconds
+    from the last failure; the other two fields are written through as is.
+    """
+
+    def __init__(self, key: str, cooldown: float = 0.0):
+        self.key = key
+        self.cooldown = cooldown
+
+    def _state(self) -> dict:
+        health = get_registry().get(self.key)
+        return {"is_open": health.is_open(),
+                "last_failure": health.last_failure,
+                "consecutive_failures": health.consecutive_failures}
+
+    def __getitem__(self, name: str):
+        return self._state()[name]
+
+    def __setitem__(self, name: str, value) -> None:
+        if name not in ("is_open", "last_failure", "consecutive_failures"):
+            raise KeyError(name)
+
+        def fn(h: Health):
+            if name == "is_open":
+                h.open_until = (h.last_failure or time.time()) + self.cooldown if value else 0.0
+            else:
+                setattr(h, name, value)
+        get_registry().update(self.key, fn)
+
+    def __iter__(self):
+        return iter(self._state())
+
+    def __len__(self) -> int:
+        return 3
+
+    def __repr__(self) -> str:
+        return f"CircuitStateView({self.key!r}, {self._state()})"
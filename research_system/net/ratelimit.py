@@ -0,0 +1,345 @@
+"""Token-bucket rate limiting and persistent daily quotas for providers.
+
+Each provider gets a token bucket refilled at its policy rate. A caller
+*reserves* a token under a short lock and then waits outside it, so threads
+never sleep while holding shared state and coroutines wait with
+``asyncio.sleep`` instead of blocking the event loop. Reservations are
+handed out in order, which keeps concurrent callers fair.
+
+Buckets live in-process by default. With ``RATE_LIMIT_BACKEND=file`` the
+bucket state is kept in a lock-protected JSON file so several worker
+processes on one host share a single quota; ``RATE_LIMIT_BACKEND=redis``
+does the same through Redis (``RATE_LIMIT_REDIS_URL``/``REDIS_URL``).
+
+Daily request counts are flushed to the state directory (or Redis) so a
+provider's ``daily`` limit still holds after a restart. Days are UTC days.
+"""
+
+from __future__ import annotations
+import asyncio
+import atexit
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+try:
+    import fcntl
+    HAS_FCNTL = True
+except ImportError:  # Windows: fall back to process-local locking
+    HAS_FCNTL = False
+
+try:
+    import redis
+    HAS_REDIS = True
+except ImportError:
+    HAS_REDIS = False
+
+RATE_LIMIT_BACKEND = os.getenv("RATE_LIMIT_BACKEND", "local").lower()
+RATE_LIMIT_STATE_DIR = os.getenv("RATE_LIMIT_STATE_DIR", "./.ratelimit")
+RATE_LIMIT_REDIS_URL = os.getenv("RATE_LIMIT_REDIS_URL", os.getenv("REDIS_URL", ""))
+DAILY_FLUSH_SECONDS = float(os.getenv("RATE_LIMIT_DAILY_FLUSH", "5"))
+PERSIST_DAILY = os.getenv("RATE_LIMIT_PERSIST_DAILY", "true").lower() == "true"
+
+
+class DailyLimitExceeded(Exception):
+    """Raised when a provider's daily request quota is used up."""
+
+
+def _day_start(now: float) -> float:
+    return now - (now % 86400)
+
+
+@contextmanager
+def _file_lock(path: Path) -> Iterator[None]:
+    """Exclusive cross-process lock on ``path`` (no-op without fcntl)."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a+") as fh:
+        if HAS_FCNTL:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if HAS_FCNTL:
+                fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+
+
+def _read_json(path: Path) -> Dict:
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_json(path: Path, data: Dict) -> None:
+    tmp = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(data))
+    os.replace(tmp, path)
+
+
+# ---------------------------------------------------------------------------
+# Bucket storage backends
+# ---------------------------------------------------------------------------
+
+class LocalBackend:
+    """In-process bucket state."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._state: Dict[str, list] = {}
+
+    def reserve(self, key: str, rate: float, capacity: float, now: float) -> float:
+        with self._lock:
+            tokens, ts = self._state.get(key, (capacity, now))
+            tokens = min(capacity, tokens + max(0.0, now - ts) * rate) - 1.0
+            self._state[key] = [tokens, now]
+        return -tokens / rate if tokens < 0 else 0.0
+
+
+class FileBackend:
+    """Bucket state shared by every process using the same state directory."""
+
+    def __init__(self, state_dir: str):
+        self.path = Path(state_dir) / "buckets.json"
+        self.lock_path = Path(state_dir) / "buckets.lock"
+        self._lock = threading.Lock()
+
+    def reserve(self, key: str, rate: float, capacity: float, now: float) -> float:
+        with self._lock, _file_lock(self.lock_path):
+            state = _read_json(self.path)
+            tokens, ts = state.get(key, (capacity, now))
+            tokens = min(capacity, tokens + max(0.0, now - ts) * rate) - 1.0
+            state[key] = [tokens, now]
+            _write_json(self.path, state)
+        return -tokens / rate if tokens < 0 else 0.0
+
+
+_REDIS_RESERVE = """
+local s = redis.call('HMGET', KEYS[1], 'tokens', 'ts')
+local rate = tonumber(ARGV[1])
+local cap = tonumber(ARGV[2])
+local now = tonumber(ARGV[3])
+local tokens = tonumber(s[1]) or cap
+local ts = tonumber(s[2]) or now
+tokens = math.min(cap, tokens + math.max(0, now - ts) * rate) - 1
+redis.call('HSET', KEYS[1], 'tokens', tokens, 'ts', now)
+redis.call('EXPIRE', KEYS[1], math.ceil(cap / rate) + 60)
+return tostring(tokens)
+"""
+
+
+class RedisBackend:
+    """Bucket state in Redis, updated atomically by a Lua script."""
+
+    def __init__(self, url: str):
+        self.client = redis.Redis.from_url(url, socket_timeout=2)
+        self.client.ping()
+        self._reserve = self.client.register_script(_REDIS_RESERVE)
+
+    def reserve(self, key: str, rate: float, capacity: float, now: float) -> float:
+        tokens = float(self._reserve(keys=[f"ratelimit:bucket:{key}"],
+                                     args=[rate, capacity, now]))
+        return -tokens / rate if tokens < 0 else 0.0
+
+    def add_daily(self, provider: str, day: float, delta: int) -> int:
+        key = f"ratelimit:daily:{provider}:{int(day)}"
+        pipe = self.client.pipeline()
+        pipe.incrby(key, delta)
+        pipe.expire(key, 2 * 86400)
+        return int(pipe.execute()[0])
+
+
+def _make_backend(kind: str, state_dir: str):
+    if kind == "redis":
+        if HAS_REDIS and RATE_LIMIT_REDIS_URL:
+            try:
+                return RedisBackend(RATE_LIMIT_REDIS_URL)
+            except Exception as e:
+                logger.warning(f"Redis rate-limit backend unavailable ({e}); using local buckets")
+        else:
+            logger.warning("RATE_LIMIT_BACKEND=redis needs the redis package and a REDIS_URL")
+        return LocalBackend()
+    if kind == "file":
+        return FileBackend(state_dir)
+    return LocalBackend()
+
+
+# ---------------------------------------------------------------------------
+# Token bucket
+# ---------------------------------------------------------------------------
+
+class TokenBucket:
+    """Rate limiter for one provider.
+
+    Args:
+        key: Provider name (bucket identity in shared backends).
+        rate: Tokens added per second.
+        capacity: Maximum burst size.
+        backend: Storage backend; defaults to in-process state.
+    """
+
+    def __init__(self, key: str, rate: float, capacity: float = 1.0, backend=None):
+        if rate <= 0:
+            raise ValueError(f"rate must be positive for {key}")
+        self.key = key
+        self.rate = float(rate)
+        self.capacity = max(1.0, float(capacity))
+        self.backend = backend or LocalBackend()
+
+    def reserve(self) -> float:
+        """Take a token and return how long the caller must wait before using it."""
+        try:
+            return self.backend.reserve(self.key, self.rate, self.capacity, time.time())
+        except Exception as e:
+            # A broken shared backend must not stop requests; degrade to local
+            logger.warning(f"Rate-limit backend failed for {self.key} ({e}); using local bucket")
+            self.backend = LocalBackend()
+            return self.backend.reserve(self.key, self.rate, self.capacity, time.time())
+
+    def acquire(self) -> float:
+        """Block the calling thread until a token is available."""
+        wait = self.reserve()
+        if wait > 0:
+            logger.debug(f"Rate limiting {self.key}: waiting {wait:.2f}s")
+            time.sleep(wait)
+        return wait
+
+    async def aacquire(self) -> float:
+        """Wait for a token without blocking the event loop."""
+        wait = self.reserve()
+        if wait > 0:
+            logger.debug(f"Rate limiting {self.key}: waiting {wait:.2f}s")
+            await asyncio.sleep(wait)
+        return wait
+
+
+# ---------------------------------------------------------------------------
+# Daily quotas
+# ---------------------------------------------------------------------------
+
+class DailyQuota:
+    """Per-provider daily request counters that survive restarts.
+
+    ``counts`` and ``window_start`` are the live in-process view. Increments
+    accumulate as a pending delta that is periodically added to the shared
+    store (state-dir JSON file or Redis), so concurrent processes sum their
+    usage and a restarted process picks up where the day left off.
+    """
+
+    def __init__(self, state_dir: Optional[str] = None, backend=None,
+                 persist: bool = PERSIST_DAILY):
+        self.counts: Dict[str, int] = defaultdict(int)
+        self.window_start: Dict[str, float] = defaultdict(float)
+        self._pending: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+        self._last_flush = time.time()
+        self.persist = persist
+        self.configure(state_dir or RATE_LIMIT_STATE_DIR, backend)
+
+    def configure(self, state_dir: str, backend=None) -> None:
+        """Point the quota at a different store (clears live counters)."""
+        with self._lock:
+            self.path = Path(state_dir) / "daily.json"
+            self.lock_path = Path(state_dir) / "daily.lock"
+            self.backend = backend if isinstance(backend, RedisBackend) else None
+            self.counts.clear()
+            self.window_start.clear()
+            self._pending.clear()
+
+    def consume(self, provider: str, limit: int) -> int:
+        """Count one request against ``provider``'s daily ``limit``.
+
+        Returns:
+            The provider's count for today including this request.
+
+        Raises:
+            DailyLimitExceeded: If the limit is already reached.
+        """
+        now = time.time()
+        day = _day_start(now)
+        with self._lock:
+            if self.window_start[provider] != day:
+                if self._pending[provider] and self.window_start[provider]:
+                    self._sync(provider, self.window_start[provider])
+                self.counts[provider] = 0
+                self._pending[provider] = 0
+                self.window_start[provider] = day
+                self._sync(provider, day)  # adopt today's total from the store
+            if self.counts[provider] >= limit:
+                raise DailyLimitExceeded(f"Daily limit reached for {provider}: {limit} requests")
+            self.counts[provider] += 1
+            self._pending[provider] += 1
+            if now - self._last_flush >= DAILY_FLUSH_SECONDS:
+                self._flush_locked()
+            return self.counts[provider]
+
+    def flush(self) -> None:
+        """Write pending increments to the shared store."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        self._last_flush = time.time()
+        for provider in [p for p, n in self._pending.items() if n]:
+            self._sync(provider, self.window_start[provider])
+
+    def _sync(self, provider: str, day: float) -> None:
+        """Add the pending delta to the store and adopt the combined total."""
+        if not self.persist:
+            return
+        delta = self._pending.get(provider, 0)
+        try:
+            if self.backend is not None:
+                total = self.backend.add_daily(provider, day, delta)
+            else:
+                with _file_lock(self.lock_path):
+                    state = _read_json(self.path)
+                    entry = state.get(provider) or {}
+                    if entry.get("day", 0) > day:
+                        total = delta  # stale window; another process moved on
+                    else:
+                        total = (entry.get("count", 0) if entry.get("day") == day else 0) + delta
+                        state[provider] = {"day": day, "count": total}
+                        _write_json(self.path, state)
+        except Exception as e:
+            logger.debug(f"Daily quota sync failed for {provider}: {e}")
+            return
+        self._pending[provider] = 0
+        self.counts[provider] = max(self.counts[provider], total)
+
+
+# ---------------------------------------------------------------------------
+# Registry
+# ---------------------------------------------------------------------------
+
+_registry_lock = threading.Lock()
+_buckets: Dict[str, TokenBucket] = {}
+_backend = _make_backend(RATE_LIMIT_BACKEND, RATE_LIMIT_STATE_DIR)
+daily_quota = DailyQuota(backend=_backend)
+atexit.register(daily_quota.flush)
+
+
+def get_bucket(key: str, rate: float, capacity: float = 1.0) -> TokenBucket:
+    """Return the shared bucket for ``key``, creating it on first use."""
+    with _registry_lock:
+        bucket = _buckets.get(key)
+        if bucket is None or bucket.rate != rate or bucket.capacity != max(1.0, capacity):
+            bucket = _buckets[key] = TokenBucket(key, rate, capacity, backend=_backend)
+        return bucket
+
+
+def configure(backend: Optional[str] = None, state_dir: Optional[str] = None) -> None:
+    """Switch rate-limit storage at runtime (mainly for workers and tests)."""
+    global _backend
+    state_dir = state_dir or RATE_LIMIT_STATE_DIR
+    with _registry_lock:
+        _backend = _make_backend((backend or RATE_LIMIT_BACKEND).lower(), state_dir)
+        _buckets.clear()
+    daily_quota.configure(state_dir, _backend)
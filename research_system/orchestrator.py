@@ -19,9 +19,13 @@ from research_system.models import EvidenceCard, RelatedTopic
 from research_system.utils.datetime_safe import safe_format_dt, format_duration
 from research_system.utils.deterministic import set_global_seeds, ensure_deterministic_environment
 from research_system.tools.evidence_io import write_jsonl
+from research_system.tools.warehouse import EvidenceWarehouse, warehouse_enabled
 from research_system.tools.registry import get_registry as registry
 from research_system.tools.search_registry import register_search_tools
-from research_system.collection import parallel_provider_search, collect_from_free_apis
+from research_system.collection import (
+    collect_from_free_apis, CollectionScheduler, SearchJob,
+    PRIORITY_HIGH, PRIORITY_NORMAL, PRIORITY_LOW,
+)
 from research_system.routing.provider_router import choose_providers
 from research_system.config.settings import Settings, settings
 from research_system.intent.classifier import classify, Intent, get_confidence_threshold
@@ -44,6 +48,7 @@ from research_system.policy import POLICIES
 from research_system.scoring import recompute_confidence
 from research_system.tools.claim_struct import extract_struct_claim, struct_key, struct_claims_match
 from research_system.tools.canonical_key import canonical_claim_key
+from research_system.evidence.features import best_text, text_features
 from research_system.tools.contradictions import find_numeric_conflicts
 from research_system.tools.arex import build_arex_batch, select_uncorroborated_keys
 from research_system.tools.observability import generate_triangulation_breakdown, generate_strict_failure_details
@@ -67,6 +72,7 @@ from research_system.strict.adaptive_guard import (
 
 # v8.13.0 imports for scholarly-grade improvements
 from research_system.utils.file_ops import run_transaction, atomic_write_text, atomic_write_json
+from research_system.utils import checkpoint
 # Create a config wrapper to replace deprecated config_v2
 class _QualityConfig:
     def __init__(self):
@@ -168,6 +174,19 @@ class Orchestrator:
         self.provider_errors = 0
         self.provider_attempts = 0
         
+        # Run-scoped search scheduler (one event loop for all query phases)
+        self.scheduler: Optional[CollectionScheduler] = None
+        
+        # Whether this run's cards are in the evidence warehouse
+        self.warehouse_appended = False
+        
+        # Stage bookkeeping (set in run())
+        self.run_state = None
+        self.checkpoints: Optional[checkpoint.StageCheckpoints] = None
+        # Wall/CPU time and peak RSS per finished stage
+        self.stage_profile: List[Dict] = []
+        self._stage_mark: Optional[Tuple[float, float]] = None
+        
         # Initialize timing attributes (will be properly set in run())
         import time
         self.start_time = time.time()
@@ -178,18 +197,19 @@ class Orchestrator:
         from research_system.selection.domain_balance import is_primary_source
         return is_primary_source(domain, intent=self.context.get("intent", "generic"))
     
+    def _get_scheduler(self) -> CollectionScheduler:
+        """The run's search scheduler, started on first use."""
+        if self.scheduler is None:
+            self.scheduler = CollectionScheduler(registry())
+        return self.scheduler
+    
     def _collect_from_providers(self, providers: List[str], query: str) -> List:
         """Helper method for v8.13.0 stats pipeline to collect from specific providers."""
         try:
             # Use existing collection infrastructure
-            results = asyncio.run(
-                parallel_provider_search(
-                    registry, 
-                    query=query, 
-                    count=5,
-                    freshness=Settings().FRESHNESS_WINDOW, 
-                    region="US"
-                )
+            results = self._get_scheduler().search(
+                query, count=5, freshness=Settings().FRESHNESS_WINDOW,
+                priority=PRIORITY_HIGH, phase="stats"
             )
             
             # Filter to requested providers
@@ -349,25 +369,46 @@ class Orchestrator:
         """Resolve DOI URLs to publisher landing pages to prevent doi.org domination.
         
         v8.25.0: Critical for proper domain distribution in triangulation.
+        All doi.org URLs are resolved in one batch (cached DOI metadata first,
+        concurrent redirect following for the rest).
         """
         from urllib.parse import urlparse
-        from research_system.tools.doi import resolve_doi
+        from research_system.tools.doi_service import DoiService
+        
+        doi_urls = [c.url for c in cards
+                    if getattr(c, "url", None)
+                    and (urlparse(c.url).hostname or "").lower().endswith("doi.org")]
+        if not doi_urls:
+            return
+        try:
+            landing = DoiService().landing_urls(doi_urls)
+        except Exception as e:
+            logger.warning(f"DOI resolution failed: {e}")
+            return
         
         changed = 0
         for c in cards:
-            if not getattr(c, "url", None):
-                continue
-            host = (urlparse(c.url).hostname or "").lower()
-            if host.endswith("doi.org"):
-                dest = resolve_doi(c.url)
-                if dest:
-                    c.url = dest
-                    c.source_domain = (urlparse(dest).hostname or c.source_domain)
-                    changed += 1
+            dest = landing.get(getattr(c, "url", None) or "")
+            if dest:
+                c.url = dest
+                c.source_domain = (urlparse(dest).hostname or c.source_domain)
+                changed += 1
         
         if changed:
             logger.info(f"Resolved {changed} DOI URLs to publisher landing pages")
     
+    def _prefetch_dois(self, cards: List[EvidenceCard]) -> None:
+        """Resolve the metadata of every DOI seen in the run through bulk endpoints."""
+        from research_system.tools.doi_service import DoiService, collect_dois
+        
+        dois = collect_dois(cards)
+        if not dois:
+            return
+        try:
+            DoiService().prefetch(dois)
+        except Exception as e:
+            logger.debug(f"DOI prefetch failed: {e}")
+    
     def _bool_env(self, name: str, default: bool) -> bool:
         """Parse boolean environment variable."""
         val = os.getenv(name)
@@ -408,11 +449,13 @@ class Orchestrator:
             return result
         
         # final cards are the most useful; always write
-        write_jsonl(str(evdir / "final_cards.jsonl"), to_dict_list(final_cards))
+        # (final cards are usually a subset of all cards: encode each card once)
+        encoded = {}
+        write_jsonl(str(evdir / "final_cards.jsonl"), to_dict_list(final_cards), encoded=encoded)
         
         # if available, also write the full working set
         if all_cards is not None:
-            write_jsonl(str(evdir / "all_cards.jsonl"), to_dict_list(all_cards))
+            write_jsonl(str(evdir / "all_cards.jsonl"), to_dict_list(all_cards), encoded=encoded)
         
         # flat source appendix (domain, title, url, quote)
         with open(evdir / "sources.csv", "w", newline="", encoding="utf-8") as f:
@@ -862,12 +905,20 @@ Maximum cost: ${self.s.max_cost_usd:.2f}
         import json
         from research_system.tools.evidence_io import read_jsonl
         
-        # Read evidence cards
-        cards = read_jsonl(str(evidence_path))
-        
-        # Use aggregates for rich analysis
-        quality_data = source_quality(cards)
-        triangulation_data = triangulate_claims(cards)
+        warehouse_data = self._warehouse_quality()
+        if warehouse_data is not None:
+            # This run's cards are already in the warehouse: aggregate there
+            quality_data, n_cards, avg_credibility, avg_relevance = warehouse_data
+        else:
+            # Read evidence cards
+            cards = read_jsonl(str(evidence_path))
+            
+            # Use aggregates for rich analysis
+            quality_data = source_quality(cards)
+            triangulation_data = triangulate_claims(cards)
+            n_cards = len(cards)
+            avg_credibility = sum(c.credibility_score for c in cards)/max(n_cards,1)
+            avg_relevance = sum(c.relevance_score for c in cards)/max(n_cards,1)
         
         # Build enhanced table with triangulation
         lines = ["# Source Quality Assessment Table", "", 
@@ -894,25 +945,54 @@ Maximum cost: ${self.s.max_cost_usd:.2f}
         para_clusters = tri_data.get("paraphrase_clusters", [])
         from research_system.tools.aggregates import triangulation_rate_from_clusters
         # FIX: Pass total card count to get correct triangulation rate
-        triangulation_rate = triangulation_rate_from_clusters(para_clusters, total_cards=len(cards))
+        triangulation_rate = triangulation_rate_from_clusters(para_clusters, total_cards=n_cards)
         
         # Count triangulated vs single-source cards
         triangulated_cards = sum(len(c.get("indices", [])) for c in para_clusters if len(c.get("indices", [])) >= 2)
-        single_source_cards = len(cards) - triangulated_cards
+        single_source_cards = n_cards - triangulated_cards
         
         lines.extend(["", "## Triangulation Analysis",
-                     f"- Total evidence cards: {len(cards)}",
+                     f"- Total evidence cards: {n_cards}",
                      f"- Triangulation rate: {triangulation_rate:.1%} (cards in multi-source clusters)",
                      f"- Triangulated cards: {triangulated_cards}",
                      f"- Single-source cards: {single_source_cards}",
                      "", "## Summary Statistics",
                      f"- Total unique domains: {len(quality_data)}",
-                     f"- Total evidence cards: {len(cards)}",
-                     f"- Average credibility: {sum(c.credibility_score for c in cards)/max(len(cards),1):.2f}",
-                     f"- Average relevance: {sum(c.relevance_score for c in cards)/max(len(cards),1):.2f}"])
+                     f"- Total evidence cards: {n_cards}",
+                     f"- Average credibility: {avg_credibility:.2f}",
+                     f"- Average relevance: {avg_relevance:.2f}"])
         
         return "\n".join(lines)
     
+    def _warehouse_run_id(self) -> str:
+        return self.s.output_dir.name
+    
+    def _append_to_warehouse(self, cards: List[EvidenceCard]) -> None:
+        """Append this run's written cards to the cross-run evidence warehouse."""
+        if not warehouse_enabled():
+            return
+        try:
+            EvidenceWarehouse().append_run(self._warehouse_run_id(), cards,
+                                           intent=self.context.get("intent", "generic"))
+            self.warehouse_appended = True
+        except Exception as e:
+            logger.warning(f"Evidence warehouse append failed: {e}")
+    
+    def _warehouse_quality(self) -> Optional[Tuple[List[Dict], int, float, float]]:
+        """Source quality rows and card totals for this run from the warehouse, if appended."""
+        if not self.warehouse_appended:
+            return None
+        try:
+            wh = EvidenceWarehouse()
+            totals = wh.query(
+                "SELECT COUNT(*) AS n, AVG(credibility_score) AS cred, AVG(relevance_score) AS rel "
+                "FROM cards WHERE run_id = ?", [self._warehouse_run_id()])[0]
+            return (wh.source_quality(self._warehouse_run_id()), totals["n"],
+                    totals["cred"] or 0.0, totals["rel"] or 0.0)
+        except Exception as e:
+            logger.warning(f"Evidence warehouse query failed, using JSONL: {e}")
+            return None
+    
     def _generate_acceptance_guardrails(self, cards: List[EvidenceCard] = None) -> str:
         """Generate acceptance criteria with actual validation checks"""
         guardrails = "# Acceptance Guardrails\n\n"
@@ -1447,18 +1527,109 @@ Full evidence corpus available in `evidence_cards.jsonl`. Top sources by credibi
         
         return checklist
 
+    def _open_checkpoints(self, settings: Settings) -> Tuple[Tuple[str, ...], Dict]:
+        """Set up stage checkpoints; returns (finished stages, state to resume from)."""
+        if not checkpoint.enabled():
+            return (), {}
+        key = checkpoint.settings_hash(
+            topic=self.s.topic, depth=self.s.depth, strict=self.s.strict,
+            providers=sorted(settings.enabled_providers()),
+        )
+        self.checkpoints = checkpoint.StageCheckpoints(self.s.output_dir, key)
+        if not self.s.resume:
+            self.checkpoints.clear()
+            return (), {}
+        
+        done, state = self.checkpoints.resume_point()
+        if self.run_state is not None:
+            self.run_state.stages = list(done)
+        if not done:
+            logger.info("No usable stage checkpoints; starting from scratch")
+            return (), {}
+        self._restore_run_state(state.get("_run", {}))
+        logger.info(f"Resuming after stage {done[-1]} ({len(state.get('cards', []))} cards)")
+        return done, state
+    
+    def _run_state_snapshot(self) -> Dict:
+        """Instance state later stages read, saved with every checkpoint."""
+        return {
+            "context": dict(self.context),
+            "provider_errors": self.provider_errors,
+            "provider_attempts": self.provider_attempts,
+            "discipline": getattr(self, "discipline", None),
+            "policy": getattr(self, "policy", None),
+        }
+    
+    def _restore_run_state(self, saved: Dict) -> None:
+        self.context.update(saved.get("context", {}))
+        self.provider_errors = saved.get("provider_errors", self.provider_errors)
+        self.provider_attempts = saved.get("provider_attempts", self.provider_attempts)
+        for attr in ("discipline", "policy"):
+            if saved.get(attr) is not None:
+                setattr(self, attr, saved[attr])
+    
+    def _profile_stage(self, stage: str) -> None:
+        """Wall time, CPU time and peak RSS of the stage that just finished."""
+        import time
+        wall, cpu = time.perf_counter(), time.process_time()
+        start_wall, start_cpu = self._stage_mark or (wall, cpu)
+        self._stage_mark = (wall, cpu)
+        entry = {"stage": stage, "wall_s": round(wall - start_wall, 3), "cpu_s": round(cpu - start_cpu, 3)}
+        try:
+            import resource
+            entry["peak_rss_mb"] = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+        except ImportError:  # Windows
+            pass
+        self.stage_profile.append(entry)
+        logger.info(f"Stage {stage}: {entry}")
+    
+    def _write_stage_profile(self) -> None:
+        """stage_profile.json with per-stage costs and cache hit rates (STAGE_PROFILE=true)."""
+        from research_system.collection.search_cache import hit_stats
+        from research_system.net.cassette import active as active_cassette
+        from research_system.triangulation import embeddings
+        
+        caches = {"search": hit_stats()}
+        embedding_stats = embeddings.service_stats()
+        if embedding_stats:
+            caches["embeddings"] = embedding_stats
+        cassette = active_cassette()
+        if cassette is not None:
+            caches["http_cassette"] = dict(cassette.stats)
+        atomic_write_json(str(self.s.output_dir / "stage_profile.json"),
+                          {"stages": self.stage_profile, "caches": caches})
+    
+    def _checkpoint(self, stage: str, **state) -> None:
+        """Record ``stage`` as finished and save what the following stages need."""
+        self._profile_stage(stage)
+        if self.checkpoints is not None:
+            state["_run"] = self._run_state_snapshot()
+            if not self.checkpoints.save(stage, state):
+                return
+        if self.run_state is not None:
+            self.run_state.stage_done(stage)
+    
     def run(self):
         """Main orchestrator run method with v8.13.0 transaction support."""
         
         # Wrap entire run in transaction for atomic writes
-        with run_transaction(str(self.s.output_dir)):
-            self._run_internal()
+        try:
+            with run_transaction(str(self.s.output_dir), resume=self.s.resume) as run_state:
+                self.run_state = run_state
+                self._run_internal()
+        finally:
+            if self.scheduler is not None:
+                self.scheduler.close()
+                self.scheduler = None
+            if self.stage_profile and self._bool_env("STAGE_PROFILE", False):
+                self._write_stage_profile()
     
     def _run_internal(self):
         """Internal run method wrapped by transaction."""
         settings = Settings()  # validated at CLI
         import time
         self.start_time = time.time()  # Make it an instance variable for later access
+        self._stage_mark = (time.perf_counter(), time.process_time())
         
         # Set global time budget (default 1800 seconds / 30 minutes)
         total_seconds = getattr(self.s, 'timeout', 1800)
@@ -1466,6 +1637,12 @@ Full evidence corpus available in `evidence_cards.jsonl`. Top sources by credibi
         budget = set_global_budget(total_seconds)
         logger.info(f"Set global time budget: {total_seconds}s")
         
+        # Stage checkpoints: --resume continues after the last finished stage
+        done, resumed = self._open_checkpoints(settings)
+        if "report" in done:
+            logger.info("Every stage finished in an earlier attempt; nothing to resume")
+            return
+        
         # Classify intent
         intent = classify(self.s.topic)
         self.context["intent"] = intent.value
@@ -1515,749 +1692,743 @@ Full evidence corpus available in `evidence_cards.jsonl`. Top sources by credibi
         self._write("source_strategy.md", self._generate_source_strategy())
         self._write("acceptance_guardrails.md", self._generate_acceptance_guardrails())
 
+        # Helpers shared by several stages (a resumed run may skip the stage
+        # that used to import them first)
+        from collections import Counter
+        import math
+        from research_system.enrich.ensure_quotes import ensure_quotes_for_primaries
+        from research_system.triangulation.paraphrase_cluster import cluster_paraphrases
+        from research_system.triangulation.compute import compute_structured_triangles, union_rate
+        from research_system.metrics_compute import primary_share_in_triangulated as primary_share_in_union
+        from research_system.triangulation.post import sanitize_paraphrase_clusters, structured_triangles
+        
+        # State produced by the stages a resumed run skips
+        cards: List[EvidenceCard] = resumed.get("cards", [])
+        para_clusters = resumed.get("para_clusters", [])
+        structured_matches = resumed.get("structured_matches", [])
+        tri_union = resumed.get("tri_union", 0.0)
+        primary_share = resumed.get("primary_share", 0.0)
+        pack_domains = resumed.get("pack_domains", set())
+        pack_patterns = resumed.get("pack_patterns", [])
+        contradictions = resumed.get("contradictions", [])
+        
         # COLLECT (parallel, per-provider preserved)
-        # Build discipline-aware anchors first
-        all_results = {}
-        anchors, discipline, policy = build_anchors(self.s.topic)
-        self.discipline, self.policy = discipline, policy
-        
-        # Use intent-based provider selection
-        intent_providers = expand_providers_for_intent(intent)
-        logger.info(f"Intent {intent.value} selected providers: {intent_providers[:10]}")
-        
-        # Also use router for additional context
-        decision = choose_providers(self.s.topic)
-        logger.info(f"Routing: categories={decision.categories}, providers={decision.providers[:10]}")
-        
-        # Merge providers: intent-based first, then router's unique additions
-        merged_providers = intent_providers + [p for p in decision.providers if p not in intent_providers]
-        # Create new decision object with updated providers (can't modify frozen dataclass)
-        from dataclasses import replace
-        decision = replace(decision, providers=merged_providers[:20])  # Limit total
-        
-        enabled = settings.enabled_providers()
-        # Filter providers by topic relevance to prevent off-topic noise
-        filtered_providers = self._filter_providers_by_topic(enabled, self.s.topic)
-        selected_providers = [p for p in decision.providers if p in filtered_providers]
-        
-        # ===== v8.13.0 STATS PIPELINE INTEGRATION =====
-        # For stats intent, use specialized pipeline instead of general collection
-        if intent.value == "stats":
-            logger.info("v8.13.0 Using specialized stats pipeline")
-            try:
-                primary_cards, context_cards = run_stats_pipeline(
-                    query=self.s.topic,
-                    all_providers=selected_providers,
-                    collect_function=self._collect_from_providers
-                )
-                
-                # Prioritize stats sources
-                primary_cards = prioritize_stats_sources(primary_cards)
-                
-                # Stats-specific processing overrides normal collection
-                stats_cards = primary_cards + context_cards
-                logger.info(f"v8.13.0 Stats pipeline: {len(primary_cards)} primary, {len(context_cards)} context cards")
-                
-                # Skip normal collection for stats - we have specialized cards
-                all_results = {"stats_pipeline": []}  # Dummy for compatibility
-                
-            except Exception as e:
-                logger.warning(f"v8.13.0 Stats pipeline failed, falling back to normal collection: {e}")
-                # Continue with normal collection if stats pipeline fails
+        if "collect" not in done:
+            # Build discipline-aware anchors first
+            all_results = {}
+            anchors, discipline, policy = build_anchors(self.s.topic)
+            self.discipline, self.policy = discipline, policy
         
-        if anchors and self.s.depth in ["standard", "deep"]:
-            # Run discipline-aware anchor queries
-            for anchor_query in anchors[:6]:
-                self.provider_attempts += 1
-                try:
-                    anchor_results = asyncio.run(
-                        parallel_provider_search(registry, query=anchor_query, count=3,
-                                               freshness=settings.FRESHNESS_WINDOW, region="US")
-                    )
-                    # Merge results by provider
-                    for provider, hits in anchor_results.items():
-                        if provider not in all_results:
-                            all_results[provider] = []
-                        all_results[provider].extend(hits)
-                except Exception as e:
-                    self.provider_errors += 1
-                    logger.warning(f"Anchor query failed: {e}")
+            # Use intent-based provider selection
+            intent_providers = expand_providers_for_intent(intent)
+            logger.info(f"Intent {intent.value} selected providers: {intent_providers[:10]}")
         
-        # Run expanded queries based on intent
-        results_count = self.depth_to_count.get(self.s.depth, 8)
-        all_provider_results = {}
+            # Also use router for additional context
+            decision = choose_providers(self.s.topic)
+            logger.info(f"Routing: categories={decision.categories}, providers={decision.providers[:10]}")
         
-        # Execute each expanded query
-        for query in expanded_queries[:3]:  # Limit to first 3 queries
-            self.provider_attempts += 1
-            try:
-                query_results = asyncio.run(
-                    parallel_provider_search(registry, query=query, count=results_count,
-                                             freshness=settings.FRESHNESS_WINDOW if self.context["intent"] in ["news", "policy"] else None,
-                                             region="US")
-                )
-                # Merge results per provider
-                for provider, hits in query_results.items():
-                    if provider not in all_provider_results:
-                        all_provider_results[provider] = []
-                    all_provider_results[provider].extend(hits)
-                logger.info(f"Expanded query '{query}' returned {sum(len(h) for h in query_results.values())} results")
-            except Exception as e:
-                self.provider_errors += 1
-                logger.warning(f"Expanded query '{query}' failed: {e}")
+            # Merge providers: intent-based first, then router's unique additions
+            merged_providers = intent_providers + [p for p in decision.providers if p not in intent_providers]
+            # Create new decision object with updated providers (can't modify frozen dataclass)
+            from dataclasses import replace
+            decision = replace(decision, providers=merged_providers[:20])  # Limit total
         
-        # Use merged results instead of single query results
-        main_results = all_provider_results
+            enabled = settings.enabled_providers()
+            # Filter providers by topic relevance to prevent off-topic noise
+            filtered_providers = self._filter_providers_by_topic(enabled, self.s.topic)
+            selected_providers = [p for p in decision.providers if p in filtered_providers]
         
-        # Merge main results
-        for provider, hits in main_results.items():
-            if provider not in all_results:
-                all_results[provider] = []
-            all_results[provider].extend(hits)
+            # ===== v8.13.0 STATS PIPELINE INTEGRATION =====
+            # For stats intent, use specialized pipeline instead of general collection
+            if intent.value == "stats":
+                logger.info("v8.13.0 Using specialized stats pipeline")
+                try:
+                    primary_cards, context_cards = run_stats_pipeline(
+                        query=self.s.topic,
+                        all_providers=selected_providers,
+                        collect_function=self._collect_from_providers
+                    )
+                
+                    # Prioritize stats sources
+                    primary_cards = prioritize_stats_sources(primary_cards)
+                
+                    # Stats-specific processing overrides normal collection
+                    stats_cards = primary_cards + context_cards
+                    logger.info(f"v8.13.0 Stats pipeline: {len(primary_cards)} primary, {len(context_cards)} context cards")
+                
+                    # Skip normal collection for stats - we have specialized cards
+                    all_results = {"stats_pipeline": []}  # Dummy for compatibility
+                
+                except Exception as e:
+                    logger.warning(f"v8.13.0 Stats pipeline failed, falling back to normal collection: {e}")
+                    # Continue with normal collection if stats pipeline fails
+        
+            # Anchor and expanded queries are independent: submit them together and
+            # let them run while the free APIs are collected below
+            anchor_jobs = []
+            if anchors and self.s.depth in ["standard", "deep"]:
+                # Run discipline-aware anchor queries
+                anchor_jobs = [
+                    SearchJob(query=anchor_query, count=3, freshness=settings.FRESHNESS_WINDOW,
+                              priority=PRIORITY_HIGH, phase="anchor")
+                    for anchor_query in anchors[:6]
+                ]
         
-        per_provider = all_results
+            # Run expanded queries based on intent
+            results_count = self.depth_to_count.get(self.s.depth, 8)
+            expanded_jobs = [
+                SearchJob(query=query, count=results_count,
+                          freshness=settings.FRESHNESS_WINDOW if self.context["intent"] in ["news", "policy"] else None,
+                          priority=PRIORITY_HIGH, phase="expanded")
+                for query in expanded_queries[:3]  # Limit to first 3 queries
+            ]
+            self.provider_attempts += len(anchor_jobs) + len(expanded_jobs)
+            search_futures = self._get_scheduler().submit(anchor_jobs + expanded_jobs)
         
-        # v8.26.1: Enhanced collection including paid providers when needed
-        # ADD FREE API PROVIDERS AND WEB SEARCH
-        if getattr(settings, 'ENABLE_FREE_APIS', True):
-            logger.info(f"Collecting from APIs for topic: {self.s.topic}")
+            # v8.26.1: Enhanced collection including paid providers when needed
+            # ADD FREE API PROVIDERS AND WEB SEARCH
+            if getattr(settings, 'ENABLE_FREE_APIS', True):
+                logger.info(f"Collecting from APIs for topic: {self.s.topic}")
             
-            # Use intent-based provider selection
-            intent_providers = expand_providers_for_intent(intent)
+                # Use intent-based provider selection
+                intent_providers = expand_providers_for_intent(intent)
             
-            # Use router to select appropriate providers
-            decision = choose_providers(self.s.topic)
-            logger.info(f"Router selected providers: {decision.providers[:10]} for categories: {decision.categories}")
+                # Use router to select appropriate providers
+                decision = choose_providers(self.s.topic)
+                logger.info(f"Router selected providers: {decision.providers[:10]} for categories: {decision.categories}")
             
-            # Merge with intent providers
-            merged_providers = intent_providers + [p for p in decision.providers if p not in intent_providers]
+                # Merge with intent providers
+                merged_providers = intent_providers + [p for p in decision.providers if p not in intent_providers]
             
-            # v8.26.1: For trends queries, ensure web search providers are prioritized
-            query_lower = self.s.topic.lower()
-            is_trends_query = any(word in query_lower for word in ['trend', 'trends', 'latest', 'recent', 'outlook', 'forecast', 'current'])
+                # v8.26.1: For trends queries, ensure web search providers are prioritized
+                query_lower = self.s.topic.lower()
+                is_trends_query = any(word in query_lower for word in ['trend', 'trends', 'latest', 'recent', 'outlook', 'forecast', 'current'])
             
-            if is_trends_query and intent in [Intent.TRAVEL, Intent.MACRO_TRENDS]:
-                # Prioritize web search providers for trends queries
-                web_search_providers = ['search_tavily', 'search_brave', 'search_serper', 'tavily', 'brave', 'serper']
-                available_web_search = [p for p in web_search_providers if p in selected_providers]
+                if is_trends_query and intent in [Intent.TRAVEL, Intent.MACRO_TRENDS]:
+                    # Prioritize web search providers for trends queries
+                    web_search_providers = ['search_tavily', 'search_brave', 'search_serper', 'tavily', 'brave', 'serper']
+                    available_web_search = [p for p in web_search_providers if p in selected_providers]
                 
-                if available_web_search:
-                    logger.info(f"Trends query detected - adding web search providers: {available_web_search}")
-                    # Put web search providers first for trends
-                    merged_providers = available_web_search + [p for p in merged_providers if p not in available_web_search]
-                else:
-                    logger.warning("Trends query but no web search providers available - results may be limited")
+                    if available_web_search:
+                        logger.info(f"Trends query detected - adding web search providers: {available_web_search}")
+                        # Put web search providers first for trends
+                        merged_providers = available_web_search + [p for p in merged_providers if p not in available_web_search]
+                    else:
+                        logger.warning("Trends query but no web search providers available - results may be limited")
             
-            # Create new decision object with updated providers
-            from dataclasses import replace
-            decision = replace(decision, providers=merged_providers[:15])  # Limit for APIs
+                # Create new decision object with updated providers
+                from dataclasses import replace
+                decision = replace(decision, providers=merged_providers[:15])  # Limit for APIs
             
-            # Collect from free APIs
-            free_api_cards = collect_from_free_apis(
-                self.s.topic,
-                providers=decision.providers[:10],  # Limit to top 10 to avoid too many requests
-                settings=settings
-            )
+                # Collect from free APIs
+                free_api_cards = collect_from_free_apis(
+                    self.s.topic,
+                    providers=decision.providers[:10],  # Limit to top 10 to avoid too many requests
+                    settings=settings
+                )
             
-            logger.info(f"Collected {len(free_api_cards)} cards from free APIs")
+                logger.info(f"Collected {len(free_api_cards)} cards from free APIs")
             
-            # v8.26.1: If we have web search providers and got few results, try web search
-            if len(free_api_cards) < 5 and available_web_search:
-                logger.info("Low results from free APIs, attempting web search")
-                try:
-                    # Use parallel_provider_search for web search
-                    web_results = asyncio.run(
-                        parallel_provider_search(
-                            registry,
-                            query=self.s.topic,
-                            count=10,
-                            freshness=settings.FRESHNESS_WINDOW,
-                            region="US"
+                # v8.26.1: If we have web search providers and got few results, try web search
+                if len(free_api_cards) < 5 and available_web_search:
+                    logger.info("Low results from free APIs, attempting web search")
+                    try:
+                        web_results = self._get_scheduler().search(
+                            self.s.topic, count=10, freshness=settings.FRESHNESS_WINDOW,
+                            priority=PRIORITY_NORMAL, phase="web"
                         )
-                    )
                     
-                    # Convert web search results to cards
-                    for provider, hits in web_results.items():
-                        if provider in available_web_search:
-                            for hit in hits[:5]:  # Limit per provider
-                                card = EvidenceCard.from_search_hit(hit)
-                                free_api_cards.append(card)
+                        # Convert web search results to cards
+                        for provider, hits in web_results.items():
+                            if provider in available_web_search:
+                                for hit in hits[:5]:  # Limit per provider
+                                    card = EvidenceCard.from_search_hit(hit)
+                                    free_api_cards.append(card)
                     
-                    logger.info(f"Added {len(free_api_cards) - len(free_api_cards)} cards from web search")
-                except Exception as e:
-                    logger.warning(f"Web search failed: {e}")
+                        logger.info(f"Added {len(free_api_cards) - len(free_api_cards)} cards from web search")
+                    except Exception as e:
+                        logger.warning(f"Web search failed: {e}")
             
-            # These will be added to cards list below
-        else:
-            free_api_cards = []
+                # These will be added to cards list below
+            else:
+                free_api_cards = []
 
-        # TRANSFORM to EvidenceCard (stamp search_provider)
-        cards: List[EvidenceCard] = []
+            # Merge anchor results, then expanded results, by provider
+            all_provider_results = {}
+            for job in self._get_scheduler().wait(search_futures):
+                if job.status != "ok":
+                    self.provider_errors += 1
+                    logger.warning(f"{job.phase.capitalize()} query '{job.query}' {job.status}: {job.error}")
+                    continue
+                target = all_results if job.phase == "anchor" else all_provider_results
+                for provider, hits in job.results.items():
+                    target.setdefault(provider, []).extend(hits)
+                if job.phase == "expanded":
+                    logger.info(f"Expanded query '{job.query}' returned {job.hit_count} results")
         
-        # v8.13.0: Use stats cards if available from specialized pipeline
-        if 'stats_cards' in locals() and stats_cards:
-            logger.info(f"v8.13.0 Using {len(stats_cards)} cards from stats pipeline")
-            cards.extend(stats_cards)
-        else:
-            # Normal collection path
-            # Add free API cards first (they're already EvidenceCard objects)
-            cards.extend(free_api_cards)
-        
-        # Then add web search results
-        for provider, hits in per_provider.items():
-            for h in hits:
-                # Calculate scoring based on source attributes and discipline
-                domain = domain_of(h.url)
+            for provider, hits in all_provider_results.items():
+                all_results.setdefault(provider, []).extend(hits)
+        
+            per_provider = all_results
+
+            # TRANSFORM to EvidenceCard (stamp search_provider)
+            cards: List[EvidenceCard] = []
+        
+            # v8.13.0: Use stats cards if available from specialized pipeline
+            if 'stats_cards' in locals() and stats_cards:
+                logger.info(f"v8.13.0 Using {len(stats_cards)} cards from stats pipeline")
+                cards.extend(stats_cards)
+            else:
+                # Normal collection path
+                # Add free API cards first (they're already EvidenceCard objects)
+                cards.extend(free_api_cards)
+        
+            # Then add web search results
+            for provider, hits in per_provider.items():
+                for h in hits:
+                    # Calculate scoring based on source attributes and discipline
+                    domain = domain_of(h.url)
                 
-                # Filter out banned domains
-                from research_system.collect.filter import allowed_domain
-                if not allowed_domain(domain):
-                    logger.debug(f"Skipping banned domain: {domain}")
-                    continue
+                    # Filter out banned domains
+                    from research_system.collect.filter import allowed_domain
+                    if not allowed_domain(domain):
+                        logger.debug(f"Skipping banned domain: {domain}")
+                        continue
                 
-                pol = getattr(self, "policy", POLICIES[route_topic(self.s.topic)])
-                is_primary = domain in pol.domain_priors
+                    pol = getattr(self, "policy", POLICIES[route_topic(self.s.topic)])
+                    is_primary = domain in pol.domain_priors
                 
-                # Score based on domain trust and discipline priors
-                credibility = pol.domain_priors.get(domain, 0.5)
+                    # Score based on domain trust and discipline priors
+                    credibility = pol.domain_priors.get(domain, 0.5)
                 
-                # Simple relevance scoring based on query match in title/snippet
-                text = (h.title + " " + (h.snippet or "")).lower()
-                query_terms = self.s.topic.lower().split()
-                matches = sum(1 for term in query_terms if term in text)
-                relevance = min(1.0, matches / max(len(query_terms), 1))
+                    # Simple relevance scoring based on query match in title/snippet
+                    text = (h.title + " " + (h.snippet or "")).lower()
+                    query_terms = self.s.topic.lower().split()
+                    matches = sum(1 for term in query_terms if term in text)
+                    relevance = min(1.0, matches / max(len(query_terms), 1))
                 
-                # Extract author if available
-                author = None
-                if hasattr(h, 'author'):
-                    author = h.author
-                elif hasattr(h, 'metadata') and isinstance(h.metadata, dict):
-                    author = h.metadata.get('author')
+                    # Extract author if available
+                    author = None
+                    if hasattr(h, 'author'):
+                        author = h.author
+                    elif hasattr(h, 'metadata') and isinstance(h.metadata, dict):
+                        author = h.metadata.get('author')
                 
-                # Ensure snippet is non-empty
-                snippet_text = h.snippet or f"Content from {h.title[:200] if h.title else 'source'}"
+                    # Ensure snippet is non-empty
+                    snippet_text = h.snippet or f"Content from {h.title[:200] if h.title else 'source'}"
                 
-                cards.append(EvidenceCard(
-                    # All required blueprint fields
-                    id=str(uuid.uuid4()),
-                    title=h.title,
-                    url=h.url,
-                    snippet=snippet_text,
-                    provider=provider,  # Critical: stamp the provider
-                    date=h.date,  # Pass through if available
-                    publication_date=getattr(h, 'publication_date', None) or h.date,  # Try both fields
+                    cards.append(EvidenceCard(
+                        # All required blueprint fields
+                        id=str(uuid.uuid4()),
+                        title=h.title,
+                        url=h.url,
+                        snippet=snippet_text,
+                        provider=provider,  # Critical: stamp the provider
+                        date=h.date,  # Pass through if available
+                        publication_date=getattr(h, 'publication_date', None) or h.date,  # Try both fields
                     
-                    # Legacy fields for compatibility
-                    source_title=h.title,
-                    source_url=h.url,
-                    source_domain=canonical_domain(domain),
-                    claim=h.title,
-                    supporting_text=snippet_text,
-                    search_provider=provider,
+                        # Legacy fields for compatibility
+                        source_title=h.title,
+                        source_url=h.url,
+                        source_domain=canonical_domain(domain),
+                        claim=h.title,
+                        supporting_text=snippet_text,
+                        search_provider=provider,
                     
-                    # Scoring fields
-                    credibility_score=credibility,
-                    relevance_score=relevance,
-                    confidence=credibility * relevance,
-                    is_primary_source=is_primary,
+                        # Scoring fields
+                        credibility_score=credibility,
+                        relevance_score=relevance,
+                        confidence=credibility * relevance,
+                        is_primary_source=is_primary,
                     
-                    # Metadata
-                    subtopic_name="Research Findings",
-                    collected_at=datetime.now(timezone.utc).isoformat(),
-                    author=author
-                ))
+                        # Metadata
+                        subtopic_name="Research Findings",
+                        collected_at=datetime.now(timezone.utc).isoformat(),
+                        author=author
+                    ))
+            
+            self._checkpoint("collect", cards=cards)
 
         # ENRICH: Extract metadata + sentences + snapshot (optional)
-        logger.info(f"Enriching {len(cards)} cards with ENABLE_EXTRACT={getattr(settings, 'ENABLE_EXTRACT', True)}")
+        if "enrich" not in done:
+            logger.info(f"Enriching {len(cards)} cards with ENABLE_EXTRACT={getattr(settings, 'ENABLE_EXTRACT', True)}")
         
-        # Light HTML enrichment first (fast, safe)
-        from research_system.tools.fetch_simple import fetch_excerpt
-        for c in cards:
-            url = c.url or c.source_url or ""
-            if url:
-                excerpt = fetch_excerpt(url, max_chars=800)
-                if excerpt and len(excerpt) > len(c.supporting_text or ""):
-                    c.supporting_text = excerpt
-                    # Also update snippet if it's still the placeholder
-                    if c.snippet and "Content from" in c.snippet:
-                        c.snippet = excerpt[:200]
-        
-        # v8.24.0: Re-evaluate primary status with card context for authoritative orgs
-        for c in cards:
-            if not c.is_primary_source:  # Only upgrade, never downgrade
-                domain = c.source_domain or canonical_domain(c.url or "")
-                if domain:
-                    # Check with card context now that we have enriched content
-                    if is_primary_domain_enhanced(domain, c):
-                        c.is_primary_source = True
-                        logger.debug(f"v8.24.0: Upgraded {domain} to primary based on numeric content")
-        
-        # Import quote rescue for primary sources
-        from research_system.enrich.ensure_quotes import ensure_quotes_for_primaries
-        for c in cards:
-            if getattr(settings, "ENABLE_EXTRACT", True):
-                url = c.url or c.source_url or ""
-                logger.debug(f"Extracting article from: {url}")
-                meta = extract_article(url)
-                if meta.get("title"):
-                    c.source_title = meta["title"]
-                if not getattr(c, "date", None) and meta.get("date"):
-                    c.date = meta["date"]
-                quotes = meta.get("quotes") or []
-                if quotes:
-                    c.quote_span = quotes[0]  # deterministic, sentence-level
-                    logger.debug(f"Set quote_span: {c.quote_span[:50]}...")
-                # Mark paywalled/unreachable
-                if not meta and any(h in (c.url or "") for h in ["e-unwto.org","statista.com"]):
-                    c.reachability = 0.0
-                else:
-                    c.reachability = 1.0
-            if getattr(settings, "ENABLE_SNAPSHOT", False):
-                arch = save_wayback(c.url or c.source_url or "")
-                if arch:
-                    c.content_hash = (c.content_hash or f"wayback:{arch}")
-            # Always compute a normalized content hash for dedup
-            basis = getattr(c, 'quote_span', None) or c.claim or c.snippet or c.source_title or ""
-            c.content_hash = getattr(c, 'content_hash', None) or normalized_hash(basis)
-        
-        # Ensure quotes for primary sources via fallback mechanisms
-        ensure_quotes_for_primaries(cards)
+            # Batch-fetch DOI metadata for every card up front so the paywall and
+            # DOI fallbacks below read it from the DOI cache
+            self._prefetch_dois(cards)
+        
+            # Fetch each canonical URL once (bounded concurrency, per-host limits) and
+            # share the body between excerpting, quotes, dates and PDF handling
+            from research_system.enrich.fetch_stage import enrich_cards
+            enrichment = enrich_cards(cards, extract=getattr(settings, "ENABLE_EXTRACT", True))
+            self.context["enrichment"] = enrichment.summary()
+            self._write("enrichment.json", json.dumps(enrichment.to_dict(), indent=2))
+        
+            # v8.24.0: Re-evaluate primary status with card context for authoritative orgs
+            for c in cards:
+                if not c.is_primary_source:  # Only upgrade, never downgrade
+                    domain = c.source_domain or canonical_domain(c.url or "")
+                    if domain:
+                        # Check with card context now that we have enriched content
+                        if is_primary_domain_enhanced(domain, c):
+                            c.is_primary_source = True
+                            logger.debug(f"v8.24.0: Upgraded {domain} to primary based on numeric content")
+        
+            for c in cards:
+                if getattr(settings, "ENABLE_SNAPSHOT", False):
+                    arch = save_wayback(c.url or c.source_url or "")
+                    if arch:
+                        c.content_hash = (c.content_hash or f"wayback:{arch}")
+                # Always compute a normalized content hash for dedup
+                basis = getattr(c, 'quote_span', None) or c.claim or c.snippet or c.source_title or ""
+                c.content_hash = getattr(c, 'content_hash', None) or normalized_hash(basis)
+        
+            # Ensure quotes for primary sources via fallback mechanisms
+            ensure_quotes_for_primaries(cards)
+            
+            self._checkpoint("enrich", cards=cards)
         
         # DEDUPLICATE near-duplicates across domains (syndication control) BEFORE clustering
-        if getattr(settings, "ENABLE_MINHASH_DEDUP", True):
-            texts = [(getattr(c, "quote_span", None) or getattr(c, "claim", "") or getattr(c, "snippet", "") or getattr(c, "source_title","")) for c in cards]
-            dup_groups = minhash_near_dupes(texts, shingle_size=6, threshold=0.92)
-            drop = set()
-            for g in dup_groups:
-                # keep one (highest credibility), drop the rest
-                group = sorted(list(g), key=lambda i: getattr(cards[i], "credibility_score", 0.5), reverse=True)
-                drop.update(group[1:])
-            cards = [c for i, c in enumerate(cards) if i not in drop]
-        
-        # Enhanced dedup and ranking
-        cards = self._dedup(cards)  # Uses enhanced title-aware deduplication
-        
-        # Apply quality-based ranking
-        from research_system.collect.ranker import rerank_cards
-        cards = rerank_cards(cards)
-        
-        # MINIMUM CARDS FLOOR - Ensure we have enough cards for stable metrics
-        MIN_CARDS = 24
-        if len(cards) < MIN_CARDS:
-            logger.info(f"Low volume ({len(cards)}) — expanding providers for diversity")
-            from research_system.providers.registry import PROVIDERS
-            
-            extra_provs = ["oecd", "imf", "eurostat", "ec", "wto", "unctad", "bis"]
-            for p in extra_provs:
-                if p not in PROVIDERS:
-                    continue
-                impl = PROVIDERS[p]
-                if "search" not in impl:
-                    continue
+        if "dedup" not in done:
+            if getattr(settings, "ENABLE_MINHASH_DEDUP", True):
+                texts = [(getattr(c, "quote_span", None) or getattr(c, "claim", "") or getattr(c, "snippet", "") or getattr(c, "source_title","")) for c in cards]
+                dup_groups = minhash_near_dupes(texts, shingle_size=6, threshold=0.92)
+                drop = set()
+                for g in dup_groups:
+                    # keep one (highest credibility), drop the rest
+                    group = sorted(list(g), key=lambda i: getattr(cards[i], "credibility_score", 0.5), reverse=True)
+                    drop.update(group[1:])
+                cards = [c for i, c in enumerate(cards) if i not in drop]
+        
+            # Enhanced dedup and ranking
+            cards = self._dedup(cards)  # Uses enhanced title-aware deduplication
+        
+            # Apply quality-based ranking
+            from research_system.collect.ranker import rerank_cards
+            cards = rerank_cards(cards)
+        
+            # MINIMUM CARDS FLOOR - Ensure we have enough cards for stable metrics
+            MIN_CARDS = 24
+            if len(cards) < MIN_CARDS:
+                logger.info(f"Low volume ({len(cards)}) — expanding providers for diversity")
+                from research_system.providers.registry import PROVIDERS
+            
+                extra_provs = ["oecd", "imf", "eurostat", "ec", "wto", "unctad", "bis"]
+                for p in extra_provs:
+                    if p not in PROVIDERS:
+                        continue
+                    impl = PROVIDERS[p]
+                    if "search" not in impl:
+                        continue
                     
-                try:
-                    # Search for topic with this provider
-                    results = impl["search"](self.s.topic)
-                    if impl.get("to_cards"):
-                        new_cards = impl["to_cards"](results)
-                    else:
-                        new_cards = results
+                    try:
+                        # Search for topic with this provider
+                        results = impl["search"](self.s.topic)
+                        if impl.get("to_cards"):
+                            new_cards = impl["to_cards"](results)
+                        else:
+                            new_cards = results
                     
-                    # Convert to EvidenceCards
-                    for nc in new_cards[:5]:  # Take up to 5 from each provider
-                        cards.append(EvidenceCard(
-                            id=str(uuid.uuid4()),
-                            title=nc.get("title", ""),
-                            url=nc.get("url", ""),
-                            snippet=nc.get("snippet", ""),
-                            provider=p,
-                            credibility_score=nc.get("credibility_score", 0.8),
-                            relevance_score=nc.get("relevance_score", 0.7),
-                            confidence=nc.get("confidence", 0.5),
-                            source_domain=canonical_domain(nc.get("source_domain", nc.get("url", ""))),
-                            collected_at=datetime.now(timezone.utc).isoformat(),
-                            is_primary_source=True,
-                            claim=nc.get("claim", nc.get("title", "")),
-                            supporting_text=nc.get("supporting_text", nc.get("snippet", "")),
-                            subtopic_name="Research Findings",
-                            stance="neutral",
-                            claim_id=None,
-                            disputed_by=[],
-                            controversy_score=0.0
-                        ))
+                        # Convert to EvidenceCards
+                        for nc in new_cards[:5]:  # Take up to 5 from each provider
+                            cards.append(EvidenceCard(
+                                id=str(uuid.uuid4()),
+                                title=nc.get("title", ""),
+                                url=nc.get("url", ""),
+                                snippet=nc.get("snippet", ""),
+                                provider=p,
+                                credibility_score=nc.get("credibility_score", 0.8),
+                                relevance_score=nc.get("relevance_score", 0.7),
+                                confidence=nc.get("confidence", 0.5),
+                                source_domain=canonical_domain(nc.get("source_domain", nc.get("url", ""))),
+                                collected_at=datetime.now(timezone.utc).isoformat(),
+                                is_primary_source=True,
+                                claim=nc.get("claim", nc.get("title", "")),
+                                supporting_text=nc.get("supporting_text", nc.get("snippet", "")),
+                                subtopic_name="Research Findings",
+                                stance="neutral",
+                                claim_id=None,
+                                disputed_by=[],
+                                controversy_score=0.0
+                            ))
                         
-                    cards = self._dedup(cards)
-                    if len(cards) >= MIN_CARDS:
-                        break
-                except Exception as e:
-                    logger.warning(f"Failed to expand with {p}: {e}")
-                    continue
+                        cards = self._dedup(cards)
+                        if len(cards) >= MIN_CARDS:
+                            break
+                    except Exception as e:
+                        logger.warning(f"Failed to expand with {p}: {e}")
+                        continue
         
-        # Early diversity check - if any single domain exceeds 25%, inject diversity BEFORE final balancing
-        # This ensures we have diverse sources available for the final selection
-        from research_system.selection.domain_balance import BalanceConfig, enforce_cap
-        from collections import Counter
+            # Early diversity check - if any single domain exceeds 25%, inject diversity BEFORE final balancing
+            # This ensures we have diverse sources available for the final selection
+            from research_system.selection.domain_balance import BalanceConfig, enforce_cap
         
-        # Check domain distribution
-        domain_counts = Counter(canonical_domain(c.source_domain) for c in cards)
-        total = len(cards)
+            # Check domain distribution
+            domain_counts = Counter(canonical_domain(c.source_domain) for c in cards)
+            total = len(cards)
         
-        # If any domain exceeds 25%, proactively add diversity with generic class-based expansions
-        for domain, count in domain_counts.items():
-            if total > 0 and count / total > 0.25:
-                logger.info(f"Domain {domain} at {count/total:.1%}, injecting diversity")
+            # If any domain exceeds 25%, proactively add diversity with generic class-based expansions
+            for domain, count in domain_counts.items():
+                if total > 0 and count / total > 0.25:
+                    logger.info(f"Domain {domain} at {count/total:.1%}, injecting diversity")
                 
-                # Generic class-based diversity expansions (topic-agnostic)
-                diversity_queries = []
+                    # Generic class-based diversity expansions (topic-agnostic)
+                    diversity_queries = []
                 
-                # Check what types we already have to avoid duplication
-                existing_tlds = set()
-                for d in domain_counts.keys():
-                    if '.gov' in d:
-                        existing_tlds.add('.gov')
-                    elif '.edu' in d:
-                        existing_tlds.add('.edu')
-                    elif '.org' in d:
-                        existing_tlds.add('.org')
+                    # Check what types we already have to avoid duplication
+                    existing_tlds = set()
+                    for d in domain_counts.keys():
+                        if '.gov' in d:
+                            existing_tlds.add('.gov')
+                        elif '.edu' in d:
+                            existing_tlds.add('.edu')
+                        elif '.org' in d:
+                            existing_tlds.add('.org')
                 
-                # Add missing source classes (max 3 to stay within budget)
-                if '.gov' not in existing_tlds:
-                    diversity_queries.append(f"{self.s.topic} site:.gov")
-                if '.edu' not in existing_tlds:
-                    diversity_queries.append(f"{self.s.topic} site:.edu")
-                if len(diversity_queries) < 3:
-                    # Add reference sources if not already present
-                    if 'wikipedia.org' not in domain_counts and 'britannica.com' not in domain_counts:
-                        diversity_queries.append(f"{self.s.topic} site:wikipedia.org OR site:britannica.com")
-                if len(diversity_queries) < 3:
-                    # Add data sources if relevant
-                    if 'data.gov' not in domain_counts and 'catalog.data.gov' not in domain_counts:
-                        diversity_queries.append(f"{self.s.topic} (dataset OR data) site:data.gov OR site:catalog.data.gov")
+                    # Add missing source classes (max 3 to stay within budget)
+                    if '.gov' not in existing_tlds:
+                        diversity_queries.append(f"{self.s.topic} site:.gov")
+                    if '.edu' not in existing_tlds:
+                        diversity_queries.append(f"{self.s.topic} site:.edu")
+                    if len(diversity_queries) < 3:
+                        # Add reference sources if not already present
+                        if 'wikipedia.org' not in domain_counts and 'britannica.com' not in domain_counts:
+                            diversity_queries.append(f"{self.s.topic} site:wikipedia.org OR site:britannica.com")
+                    if len(diversity_queries) < 3:
+                        # Add data sources if relevant
+                        if 'data.gov' not in domain_counts and 'catalog.data.gov' not in domain_counts:
+                            diversity_queries.append(f"{self.s.topic} (dataset OR data) site:data.gov OR site:catalog.data.gov")
                 
-                # Execute diversity queries (limit to 2 for performance)
-                for div_query in diversity_queries[:2]:
-                    try:
-                        div_results = asyncio.run(
-                            parallel_provider_search(
-                                registry,
-                                query=div_query,
-                                count=3,
-                                freshness=settings.FRESHNESS_WINDOW,
-                                region="US"
-                            )
-                        )
+                    # Execute diversity queries (limit to 2 for performance)
+                    div_jobs = self._get_scheduler().run([
+                        SearchJob(query=div_query, count=3, freshness=settings.FRESHNESS_WINDOW,
+                                  priority=PRIORITY_LOW, phase="diversity")
+                        for div_query in diversity_queries[:2]
+                    ])
+                    for div_job in div_jobs:
+                        try:
+                            div_results = div_job.results
                         
-                        # Add diversity results
-                        for provider, hits in div_results.items():
-                            for h in hits[:2]:  # Limit per provider
-                                new_domain = domain_of(h.url)
-                                # Only add if it actually diversifies
-                                if new_domain not in domain_counts or domain_counts[new_domain] < 2:
-                                    cards.append(EvidenceCard(
-                                        id=str(uuid.uuid4()),
-                                        title=h.title,
-                                        url=h.url,
-                                        snippet=self._ensure_snippet(h.snippet, h.title, h.url),
-                                        provider=provider,
-                                        credibility_score=0.85,
-                                        relevance_score=0.75,
-                                        confidence=0.64,
-                                        is_primary_source=_is_primary_class(new_domain),
-                                        source_domain=canonical_domain(new_domain),
-                                        collected_at=datetime.now(timezone.utc).isoformat()
-                                    ))
-                                    # Update counts to prevent over-adding from same domain
-                                    domain_counts[new_domain] = domain_counts.get(new_domain, 0) + 1
-                    except Exception as e:
-                        logger.debug(f"Diversity injection failed: {e}")
-                        continue
+                            # Add diversity results
+                            for provider, hits in div_results.items():
+                                for h in hits[:2]:  # Limit per provider
+                                    new_domain = domain_of(h.url)
+                                    # Only add if it actually diversifies
+                                    if new_domain not in domain_counts or domain_counts[new_domain] < 2:
+                                        cards.append(EvidenceCard(
+                                            id=str(uuid.uuid4()),
+                                            title=h.title,
+                                            url=h.url,
+                                            snippet=self._ensure_snippet(h.snippet, h.title, h.url),
+                                            provider=provider,
+                                            credibility_score=0.85,
+                                            relevance_score=0.75,
+                                            confidence=0.64,
+                                            is_primary_source=_is_primary_class(new_domain),
+                                            source_domain=canonical_domain(new_domain),
+                                            collected_at=datetime.now(timezone.utc).isoformat()
+                                        ))
+                                        # Update counts to prevent over-adding from same domain
+                                        domain_counts[new_domain] = domain_counts.get(new_domain, 0) + 1
+                        except Exception as e:
+                            logger.debug(f"Diversity injection failed: {e}")
+                            continue
                 
-                break  # Only handle the first over-represented domain
+                    break  # Only handle the first over-represented domain
         
-        # Keep top cards based on depth (but keep all for triangulation)
-        max_cards = self.depth_to_count.get(self.s.depth, 20) * 3  # 3x for triangulation
-        if len(cards) > max_cards:
-            cards = cards[:max_cards]
+            # Keep top cards based on depth (but keep all for triangulation)
+            max_cards = self.depth_to_count.get(self.s.depth, 20) * 3  # 3x for triangulation
+            if len(cards) > max_cards:
+                cards = cards[:max_cards]
+            
+            self._checkpoint("dedup", cards=cards)
 
         # BUILD TRIANGULATION using enhanced paraphrase clustering
-        from research_system.triangulation.paraphrase_cluster import cluster_paraphrases
-        from research_system.triangulation.compute import compute_structured_triangles, union_rate
-        from research_system.metrics_compute import primary_share_in_triangulated as primary_share_in_union
-        from research_system.triangulation.post import sanitize_paraphrase_clusters, structured_triangles
-        
-        # Paraphrase clustering with SBERT
-        para_clusters = cluster_paraphrases(cards)
+        if "triangulate" not in done:
+            # Paraphrase clustering with SBERT
+            para_clusters = cluster_paraphrases(cards)
         
-        # Sanitize paraphrase clusters to prevent over-merging
-        para_clusters = sanitize_paraphrase_clusters(para_clusters, cards)
+            # Sanitize paraphrase clusters to prevent over-merging
+            para_clusters = sanitize_paraphrase_clusters(para_clusters, cards)
         
-        # Filter out contradictory clusters before representative selection
-        para_clusters = filter_contradictory_clusters(para_clusters)
-        logger.info(f"After contradiction filtering: {len(para_clusters)} paraphrase clusters")
+            # Filter out contradictory clusters before representative selection
+            para_clusters = filter_contradictory_clusters(para_clusters)
+            logger.info(f"After contradiction filtering: {len(para_clusters)} paraphrase clusters")
         
-        # Structured triangulation - NEW PE-grade indicator matching
-        structured_matches = structured_triangles(cards)
+            # Structured triangulation - NEW PE-grade indicator matching
+            structured_matches = structured_triangles(cards)
         
-        # Also compute legacy structured triangles if available
-        try:
-            legacy_structured = compute_structured_triangles(cards)
-            # Merge both structured triangle sources
-            if legacy_structured:
-                structured_matches.extend(legacy_structured)
-        except:
-            pass  # Use only new structured triangles
-        
-        # Calculate union rate for strict mode
-        tri_union = union_rate(para_clusters, structured_matches, len(cards))
-        
-        # Write single source of truth for triangulation
-        # Convert structured_matches cards from objects to indices for JSON serialization
-        serializable_structured = []
-        for match in structured_matches:
-            serializable_match = {
-                "key": match.get("key", ""),
-                "indices": match.get("indices", []),  # Use indices if available
-                "domains": match.get("domains", []),
-                "size": match.get("size", match.get("count", len(match.get("indices", []))))  # Handle both 'size' and 'count' fields
+            # Also compute legacy structured triangles if available
+            try:
+                legacy_structured = compute_structured_triangles(cards)
+                # Merge both structured triangle sources
+                if legacy_structured:
+                    structured_matches.extend(legacy_structured)
+            except:
+                pass  # Use only new structured triangles
+        
+            # Calculate union rate for strict mode
+            tri_union = union_rate(para_clusters, structured_matches, len(cards))
+        
+            # Write single source of truth for triangulation
+            # Convert structured_matches cards from objects to indices for JSON serialization
+            serializable_structured = []
+            for match in structured_matches:
+                serializable_match = {
+                    "key": match.get("key", ""),
+                    "indices": match.get("indices", []),  # Use indices if available
+                    "domains": match.get("domains", []),
+                    "size": match.get("size", match.get("count", len(match.get("indices", []))))  # Handle both 'size' and 'count' fields
+                }
+                # If indices not available but cards are, extract indices
+                if not serializable_match["indices"] and "cards" in match:
+                    serializable_match["indices"] = [cards.index(c) for c in match["cards"] if c in cards]
+                serializable_structured.append(serializable_match)
+        
+            artifact = {
+                "paraphrase_clusters": para_clusters,  # Already has correct structure with indices
+                "structured_triangles": serializable_structured
             }
-            # If indices not available but cards are, extract indices
-            if not serializable_match["indices"] and "cards" in match:
-                serializable_match["indices"] = [cards.index(c) for c in match["cards"] if c in cards]
-            serializable_structured.append(serializable_match)
-        
-        artifact = {
-            "paraphrase_clusters": para_clusters,  # Already has correct structure with indices
-            "structured_triangles": serializable_structured
-        }
-        self._write("triangulation.json", json.dumps(artifact, indent=2))
-        
-        # Calculate comprehensive metrics with domain and provider entropy
-        from collections import Counter
-        import math
-        N = len(cards)
-        # Use canonical domains for accurate metric calculation
-        dom_ct = Counter(canonical_domain(c.source_domain) for c in cards)
-        top_share = (dom_ct.most_common(1)[0][1]/N) if N and dom_ct else 0.0
-        prov_ct = Counter(getattr(c, "provider", None) for c in cards if getattr(c, "provider", None))
-        H = -sum((n/N)*math.log((n/N)+1e-12) for n in prov_ct.values()) if N and prov_ct else 0.0
-        H_norm = H / math.log(max(2, len(prov_ct))) if prov_ct and len(prov_ct) > 1 else 0.0
-        
-        # Get pack-specific primary domains and patterns
-        packs = classify_topic_multi(self.s.topic)
-        pack_domains = set(PRIMARY_CANONICALS)
-        pack_patterns = list(PRIMARY_PATTERNS)
-        
-        for pack_key in packs:
-            pack_config = PRIMARY_CONFIG.get(pack_key, {})
-            pack_domains |= set(pack_config.get("canonical", []))
-            for pat_str in pack_config.get("patterns", []):
-                import re
-                pack_patterns.append(re.compile(pat_str, re.I))
-        
-        # Calculate initial metrics for decision making (not final output)
-        primary_share = primary_share_in_union(cards, para_clusters, structured_matches, 
-                                              primary_domains=pack_domains, 
-                                              primary_patterns=pack_patterns)
-        
-        # Store values we'll need later for final metrics
-        initial_H_norm = H_norm
-        
-        # PRIMARY BACKFILL if needed
-        # v8.17.0: Honor strict mode - disable backfill when strict mode is on
-        if self.s.strict:
-            logger.info("Strict mode enabled: skipping backfill passes to match source strategy.")
-            # No backfill, proceed to finalize with current evidence
-        # v8.24.0: Use intent-aware threshold for backfill decision
-        else:
-            # Get intent-aware thresholds (use lenient for backfill decision)
-            backfill_thresholds = quality_for_intent(intent, strict=False)
-            if primary_share < backfill_thresholds.primary:
-                logger.info(f"Primary share {primary_share:.2%} < {backfill_thresholds.primary:.0%} (intent={intent}), running backfill")
-                from research_system.enrich.primary_fill import primary_fill_for_families
+            self._write("triangulation.json", json.dumps(artifact, indent=2))
+        
+            # Calculate comprehensive metrics with domain and provider entropy
+            N = len(cards)
+            # Use canonical domains for accurate metric calculation
+            dom_ct = Counter(canonical_domain(c.source_domain) for c in cards)
+            top_share = (dom_ct.most_common(1)[0][1]/N) if N and dom_ct else 0.0
+            prov_ct = Counter(getattr(c, "provider", None) for c in cards if getattr(c, "provider", None))
+            H = -sum((n/N)*math.log((n/N)+1e-12) for n in prov_ct.values()) if N and prov_ct else 0.0
+            H_norm = H / math.log(max(2, len(prov_ct))) if prov_ct and len(prov_ct) > 1 else 0.0
+        
+            # Get pack-specific primary domains and patterns
+            packs = classify_topic_multi(self.s.topic)
+            pack_domains = set(PRIMARY_CANONICALS)
+            pack_patterns = list(PRIMARY_PATTERNS)
+        
+            for pack_key in packs:
+                pack_config = PRIMARY_CONFIG.get(pack_key, {})
+                pack_domains |= set(pack_config.get("canonical", []))
+                for pat_str in pack_config.get("patterns", []):
+                    import re
+                    pack_patterns.append(re.compile(pat_str, re.I))
+        
+            # Calculate initial metrics for decision making (not final output)
+            primary_share = primary_share_in_union(cards, para_clusters, structured_matches, 
+                                                  primary_domains=pack_domains, 
+                                                  primary_patterns=pack_patterns)
+        
+            # Store values we'll need later for final metrics
+            initial_H_norm = H_norm
+        
+            # PRIMARY BACKFILL if needed
+            # v8.17.0: Honor strict mode - disable backfill when strict mode is on
+            if self.s.strict:
+                logger.info("Strict mode enabled: skipping backfill passes to match source strategy.")
+                # No backfill, proceed to finalize with current evidence
+            # v8.24.0: Use intent-aware threshold for backfill decision
+            else:
+                # Get intent-aware thresholds (use lenient for backfill decision)
+                backfill_thresholds = quality_for_intent(intent, strict=False)
+                if primary_share < backfill_thresholds.primary:
+                    logger.info(f"Primary share {primary_share:.2%} < {backfill_thresholds.primary:.0%} (intent={intent}), running backfill")
+                    from research_system.enrich.primary_fill import primary_fill_for_families
                 
-                # Get families that need primaries
-                families = para_clusters + structured_matches
-                families = [f for f in families if len(set(f.get("domains", []))) >= 2]
+                    # Get families that need primaries
+                    families = para_clusters + structured_matches
+                    families = [f for f in families if len(set(f.get("domains", []))) >= 2]
                 
-                # Simple search wrapper
-                def search_wrapper(query, n):
-                    try:
-                        results = asyncio.run(parallel_provider_search(registry, query, n, None, None))
-                        # Flatten results from all providers
-                        all_results = []
-                        for provider, hits in results.items():
-                            all_results.extend(hits)
-                        return all_results[:n]
-                    except:
-                        return []
+                    # Simple search wrapper
+                    def search_wrapper(query, n):
+                        try:
+                            results = self._get_scheduler().search(query, n, None, None,
+                                                                   phase="primary_backfill")
+                            # Flatten results from all providers
+                            all_results = []
+                            for provider, hits in results.items():
+                                all_results.extend(hits)
+                            return all_results[:n]
+                        except:
+                            return []
                 
-                # Extract wrapper  
-                def extract_wrapper(url):
-                    try:
-                        content = extract_article(url, timeout=20)
-                        if content and content.text:
-                            # Create minimal card
-                            from research_system.models import EvidenceCard
-                            return EvidenceCard(
-                                id=str(uuid.uuid4()),
-                                title=content.title or url,
-                                url=url,
-                                snippet=content.text[:500],
-                                provider="primary_backfill",
-                                credibility_score=0.85,
-                                relevance_score=0.75,
-                                confidence=0.80,
-                                is_primary_source=True,
-                                source_domain=canonical_domain(domain_of(url)),
-                                claim=content.title or "",
-                                supporting_text=content.text[:1000],
-                                subtopic_name=self.s.topic,
-                                collected_at=datetime.now(timezone.utc).isoformat()
-                            )
-                    except:
-                        return None
+                    # Extract wrapper  
+                    def extract_wrapper(url):
+                        try:
+                            content = extract_article(url, timeout=20)
+                            if content and content.text:
+                                # Create minimal card
+                                from research_system.models import EvidenceCard
+                                return EvidenceCard(
+                                    id=str(uuid.uuid4()),
+                                    title=content.title or url,
+                                    url=url,
+                                    snippet=content.text[:500],
+                                    provider="primary_backfill",
+                                    credibility_score=0.85,
+                                    relevance_score=0.75,
+                                    confidence=0.80,
+                                    is_primary_source=True,
+                                    source_domain=canonical_domain(domain_of(url)),
+                                    claim=content.title or "",
+                                    supporting_text=content.text[:1000],
+                                    subtopic_name=self.s.topic,
+                                    collected_at=datetime.now(timezone.utc).isoformat()
+                                )
+                        except:
+                            return None
                         
-                # Run primary backfill with pack-specific domains
-                new_cards = primary_fill_for_families(
-                    families=families,
-                    topic=self.s.topic,
-                    search_fn=search_wrapper,
-                    extract_fn=extract_wrapper,
-                    k_per_family=2,
-                    primary_domains=pack_domains,
-                    primary_patterns=pack_patterns
-                )
+                    # Run primary backfill with pack-specific domains
+                    new_cards = primary_fill_for_families(
+                        families=families,
+                        topic=self.s.topic,
+                        search_fn=search_wrapper,
+                        extract_fn=extract_wrapper,
+                        k_per_family=2,
+                        primary_domains=pack_domains,
+                        primary_patterns=pack_patterns
+                    )
                 
-                if new_cards:
-                    logger.info(f"Added {len(new_cards)} primary source cards")
-                    # Merge and re-triangulate
-                    cards = self._dedup(cards + new_cards)
+                    if new_cards:
+                        logger.info(f"Added {len(new_cards)} primary source cards")
+                        # Merge and re-triangulate
+                        cards = self._dedup(cards + new_cards)
                     
-                    # Re-run quote rescue on new cards
-                    ensure_quotes_for_primaries(cards, only=new_cards)
+                        # Re-run quote rescue on new cards
+                        ensure_quotes_for_primaries(cards, only=new_cards)
                     
-                    # Re-compute triangulation with new cards
-                    para_clusters = cluster_paraphrases(cards)
-                    para_clusters = sanitize_paraphrase_clusters(para_clusters, cards)
-                    para_clusters = filter_contradictory_clusters(para_clusters)
-                    structured_matches = compute_structured_triangles(cards)
-                    tri_union = union_rate(para_clusters, structured_matches, len(cards))
+                        # Re-compute triangulation with new cards
+                        para_clusters = cluster_paraphrases(cards)
+                        para_clusters = sanitize_paraphrase_clusters(para_clusters, cards)
+                        para_clusters = filter_contradictory_clusters(para_clusters)
+                        structured_matches = compute_structured_triangles(cards)
+                        tri_union = union_rate(para_clusters, structured_matches, len(cards))
                     
-                    # Recalculate values needed for final metrics
-                    primary_share = primary_share_in_union(cards, para_clusters, structured_matches,
-                                                          primary_domains=pack_domains,
-                                                          primary_patterns=pack_patterns)
+                        # Recalculate values needed for final metrics
+                        primary_share = primary_share_in_union(cards, para_clusters, structured_matches,
+                                                              primary_domains=pack_domains,
+                                                              primary_patterns=pack_patterns)
+            
+            self._checkpoint("triangulate", cards=cards, para_clusters=para_clusters, structured_matches=structured_matches,
+                             tri_union=tri_union, primary_share=primary_share,
+                             pack_domains=pack_domains, pack_patterns=pack_patterns)
         
         # CONTRADICTION DETECTION
-        claim_texts = [
-            (getattr(c, "quote_span", None) or getattr(c, "claim", "") or 
-             getattr(c, "snippet", "") or getattr(c, "source_title", ""))
-            for c in cards
-        ]
-        contradictions = find_numeric_conflicts(claim_texts, tol=0.10)
-        
-        # AREX: Refined targeted expansion for uncorroborated structured claims
-        triangulated_keys = {m.get("key") for m in structured_matches if m.get("key")}
-        
-        # Extract structured claims for AREX
-        from research_system.tools.claim_struct import extract_struct_claim, struct_key
-        structured_claims = []
-        for i, text in enumerate(claim_texts):
-            sc = extract_struct_claim(text)
-            key = struct_key(sc)
-            if key:
-                structured_claims.append({
-                    "index": i,
-                    "key": key,
-                    "entity": sc.entity,
-                    "metric": sc.metric,
-                    "period": sc.period,
-                    "value": sc.value,
-                    "unit": sc.unit,
-                    "text": text[:200]
-                })
-        
-        uncorroborated = select_uncorroborated_keys(structured_claims, triangulated_keys, max_keys=3)
-        
-        # Check if AREX is enabled via environment or settings
-        enable_arex = os.getenv("ENABLE_AREX", "false").lower() == "true" or getattr(settings, "ENABLE_AREX", False)
-        
-        if enable_arex and uncorroborated and len(cards) < 50:  # Only expand if under budget
-            # Get primary domains from policy
-            pol = getattr(self, "policy", POLICIES[route_topic(self.s.topic)])
-            discipline = getattr(self, "discipline", Discipline.GENERAL)
-            
-            # Import refined AREX tools
-            from research_system.tools.arex_refine import build_queries
-            from research_system.tools.arex_rerank import rerank_and_filter
-            
-            # Process each uncorroborated key with refined queries and reranking
-            for claim in uncorroborated:
-                entity = claim.get("entity", "")
-                metric = claim.get("metric", "")
-                period = claim.get("period", "")
+        if "arex" not in done:
+            claim_texts = [best_text(c) for c in cards]
+            contradictions = find_numeric_conflicts(claim_texts, tol=0.10)
+        
+            # AREX: Refined targeted expansion for uncorroborated structured claims
+            triangulated_keys = {m.get("key") for m in structured_matches if m.get("key")}
+        
+            # Extract structured claims for AREX
+            structured_claims = []
+            for i, text in enumerate(claim_texts):
+                features = text_features(text)
+                sc, key = features.struct_claim, features.struct_key
+                if key:
+                    structured_claims.append({
+                        "index": i,
+                        "key": key,
+                        "entity": sc.entity,
+                        "metric": sc.metric,
+                        "period": sc.period,
+                        "value": sc.value,
+                        "unit": sc.unit,
+                        "text": text[:200]
+                    })
+        
+            uncorroborated = select_uncorroborated_keys(structured_claims, triangulated_keys, max_keys=3)
+        
+            # Check if AREX is enabled via environment or settings
+            enable_arex = os.getenv("ENABLE_AREX", "false").lower() == "true" or getattr(settings, "ENABLE_AREX", False)
+        
+            if enable_arex and uncorroborated and len(cards) < 50:  # Only expand if under budget
+                # Get primary domains from policy
+                pol = getattr(self, "policy", POLICIES[route_topic(self.s.topic)])
+                discipline = getattr(self, "discipline", Discipline.GENERAL)
+            
+                # Import refined AREX tools
+                from research_system.tools.arex_refine import build_queries
+                from research_system.tools.arex_rerank import rerank_and_filter
+            
+                # Build refined queries for every uncorroborated key, then run them all at once
+                arex_batches = []
+                for claim in uncorroborated:
+                    entity = claim.get("entity", "")
+                    metric = claim.get("metric", "")
+                    period = claim.get("period", "")
                 
-                if not metric:  # Must have at least a metric
-                    continue
+                    if not metric:  # Must have at least a metric
+                        continue
                     
-                # Build refined queries with negative terms and primary hints
-                queries = build_queries(entity, metric, period, discipline.value)
-                
-                # Execute queries and collect results
-                key_text = f"{entity} {metric} {period}".strip()
-                
-                for query in queries[:4]:  # Limit to 4 queries per key
-                    # Execute search
-                    search_results = asyncio.run(
-                        parallel_provider_search(registry, query=query, count=6,
-                                               freshness=settings.FRESHNESS_WINDOW, region="US")
-                    )
+                    # Build refined queries with negative terms and primary hints
+                    queries = build_queries(entity, metric, period, discipline.value)
+                    key_text = f"{entity} {metric} {period}".strip()
+                    jobs = [
+                        SearchJob(query=query, count=6, freshness=settings.FRESHNESS_WINDOW,
+                                  priority=PRIORITY_LOW, phase="arex")
+                        for query in queries[:4]  # Limit to 4 queries per key
+                    ]
+                    arex_batches.append((metric, key_text, jobs))
+            
+                arex_futures = self._get_scheduler().submit(
+                    [job for _, _, jobs in arex_batches for job in jobs]
+                )
+                self._get_scheduler().wait(arex_futures)
+            
+                # Process each key's results with reranking, in query order
+                for metric, key_text, jobs in arex_batches:
+                    for job in jobs:
+                        search_results = job.results
                     
-                    # Process each provider's results
-                    for provider, hits in search_results.items():
-                        if not hits:
-                            continue
+                        # Process each provider's results
+                        for provider, hits in search_results.items():
+                            if not hits:
+                                continue
                             
-                        # Prepare candidates for reranking
-                        candidates = []
-                        for h in hits:
-                            text = f"{h.title or ''} {h.snippet or ''}".strip()
-                            if text:
-                                candidates.append((text, h.url))
+                            # Prepare candidates for reranking
+                            candidates = []
+                            for h in hits:
+                                text = f"{h.title or ''} {h.snippet or ''}".strip()
+                                if text:
+                                    candidates.append((text, h.url))
                         
-                        # Rerank by similarity to key
-                        if candidates:
-                            ranked = rerank_and_filter(key_text, candidates, min_sim=0.32)
+                            # Rerank by similarity to key
+                            if candidates:
+                                ranked = rerank_and_filter(key_text, candidates, min_sim=0.32)
                             
-                            # Keep only top 3 most relevant
-                            keep_urls = {url for _, url, _ in ranked[:3]}
+                                # Keep only top 3 most relevant
+                                keep_urls = {url for _, url, _ in ranked[:3]}
                             
-                            # Add filtered results as cards
-                            for h in hits:
-                                if h.url in keep_urls:
-                                    domain = domain_of(h.url)
-                                    credibility = pol.domain_priors.get(domain, 0.5)
+                                # Add filtered results as cards
+                                for h in hits:
+                                    if h.url in keep_urls:
+                                        domain = domain_of(h.url)
+                                        credibility = pol.domain_priors.get(domain, 0.5)
                                     
-                                    # Boost credibility for primary sources
-                                    if domain in pol.domain_priors:
-                                        credibility = min(1.0, credibility * 1.15)
+                                        # Boost credibility for primary sources
+                                        if domain in pol.domain_priors:
+                                            credibility = min(1.0, credibility * 1.15)
                                     
-                                    cards.append(EvidenceCard(
-                                        id=str(uuid.uuid4()),
-                                        title=h.title,
-                                        url=h.url,
-                                        snippet=self._ensure_snippet(h.snippet, h.title, h.url),
-                                        provider=provider,
-                                        date=h.date,
-                                        credibility_score=credibility,
-                                        relevance_score=0.75,  # Higher relevance for filtered AREX
-                                        confidence=credibility * 0.75,
-                                        is_primary_source=is_primary_domain_enhanced(domain, None),  # v8.24.0: Will check later with card
-                                        search_provider=provider,
-                                        source_domain=canonical_domain(domain),
-                                        collected_at=datetime.now(timezone.utc).isoformat(),
-                                        related_reason=f"arex_targeted_{metric}"
-                                    ))
+                                        cards.append(EvidenceCard(
+                                            id=str(uuid.uuid4()),
+                                            title=h.title,
+                                            url=h.url,
+                                            snippet=self._ensure_snippet(h.snippet, h.title, h.url),
+                                            provider=provider,
+                                            date=h.date,
+                                            credibility_score=credibility,
+                                            relevance_score=0.75,  # Higher relevance for filtered AREX
+                                            confidence=credibility * 0.75,
+                                            is_primary_source=is_primary_domain_enhanced(domain, None),  # v8.24.0: Will check later with card
+                                            search_provider=provider,
+                                            source_domain=canonical_domain(domain),
+                                            collected_at=datetime.now(timezone.utc).isoformat(),
+                                            related_reason=f"arex_targeted_{metric}"
+                                        ))
+            
+            self._checkpoint("arex", cards=cards, para_clusters=para_clusters, structured_matches=structured_matches,
+                             tri_union=tri_union, primary_share=primary_share,
+                             pack_domains=pack_domains, pack_patterns=pack_patterns, contradictions=contradictions)
         
         # CONTROVERSY DETECTION
         detector = ControversyDetector()
@@ -2507,22 +2678,19 @@ Full evidence corpus available in `evidence_cards.jsonl`. Top sources by credibi
                 logger.warning("No backfill queries generated, exiting loop")
                 break
             
-            # Execute backfill queries
+            # Execute backfill queries concurrently
             new_cards = []
-            for purpose, query in backfill_queries:
+            backfill_jobs = self._get_scheduler().run([
+                SearchJob(query=query, count=4, freshness=settings.FRESHNESS_WINDOW,
+                          priority=PRIORITY_NORMAL, phase=f"backfill:{purpose}")
+                for purpose, query in backfill_queries
+            ])
+            for (purpose, query), job in zip(backfill_queries, backfill_jobs):
                 try:
-                    logger.debug(f"Executing backfill query ({purpose}): {query}")
+                    logger.debug(f"Backfill query ({purpose}) {job.status}: {query}")
                     
                     # Use reranking for better precision
-                    backfill_results = asyncio.run(
-                        parallel_provider_search(
-                            registry,
-                            query=query,
-                            count=4,
-                            freshness=settings.FRESHNESS_WINDOW,
-                            region="US"
-                        )
-                    )
+                    backfill_results = job.results
                     
                     # Process results with reranking if available
                     for provider, hits in backfill_results.items():
@@ -2823,7 +2991,8 @@ Full evidence corpus available in `evidence_cards.jsonl`. Top sources by credibi
         # Trim in-memory set to match what was actually written
         if bad:
             from research_system.tools.evidence_io import read_jsonl
-            cards = read_jsonl(str(self.s.output_dir / "evidence_cards.jsonl"))
+            # Just written and validated, no need to validate again
+            cards = read_jsonl(str(self.s.output_dir / "evidence_cards.jsonl"), validate=False)
             logger.info(f"Trimmed cards from {N_final} to {len(cards)} after filtering invalid")
             
             # Recalculate metrics with actual valid cards
@@ -2861,6 +3030,9 @@ Full evidence corpus available in `evidence_cards.jsonl`. Top sources by credibi
             metrics["cards"] = evidence_count
             self._write("metrics.json", json.dumps(metrics, indent=2))
 
+        # Append written cards to the warehouse so report aggregates can query it
+        self._append_to_warehouse(cards)
+
         # CONSOLIDATE / QUALITY - derive from written JSONL
         evidence_path = self.s.output_dir / "evidence_cards.jsonl"
         quality_table = self._generate_quality_table_from_jsonl(evidence_path)
@@ -3221,4 +3393,6 @@ Full evidence corpus available in `evidence_cards.jsonl`. Top sources by credibi
             "providers": list(sorted({getattr(c,'provider','other') for c in cards})),
             "cards": len(cards),
             "strict": self.s.strict,
-        }, indent=2), encoding="utf-8")
\ No newline at end of file
+        }, indent=2), encoding="utf-8")
+        
+        self._checkpoint("report")
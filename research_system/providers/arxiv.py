@@ -4,27 +4,17 @@ from __future__ import annotations
 from typing import List, Dict
 from urllib.parse import quote
 import xml.etree.ElementTree as ET
-import httpx
-from .http import DEFAULT_TIMEOUT, RETRY_STATUSES
+from .http import DEFAULT_TIMEOUT, RETRY_STATUSES, get_client, _bucket_for
 import logging
-import time
 
 logger = logging.getLogger(__name__)
 
 _BASE = "https://export.arxiv.org/api/query"
-_last_call = 0
 
 def arxiv_search(query: str, max_results: int = 25) -> List[Dict]:
     """Search arXiv for papers. Respects 3-second rate limit."""
-    global _last_call
-    
-    # Enforce 3-second minimum between requests
-    now = time.time()
-    if _last_call > 0:
-        elapsed = now - _last_call
-        if elapsed < 3:
-            time.sleep(3 - elapsed)
-    _last_call = time.time()
+    # Enforce 3-second minimum between requests (shared arxiv bucket)
+    _bucket_for("arxiv").acquire()
     
     params = {
         "search_query": f"all:{query}",
@@ -32,16 +22,16 @@ def arxiv_search(query: str, max_results: int = 25) -> List[Dict]:
         "max_results": max_results
     }
     
+    headers = {"User-Agent": "research-agent/1.0"}
     try:
-        with httpx.Client(timeout=DEFAULT_TIMEOUT, headers={"User-Agent": "research-agent/1.0"}) as client:
-            r = client.get(_BASE, params=params)
-            # Retry on soft errors
-            if r.status_code in RETRY_STATUSES:
-                time.sleep(3)  # Respect rate limit on retry
-                r = client.get(_BASE, params=params)
-                _last_call = time.time()
-            r.raise_for_status()
-            root = ET.fromstring(r.text)
+        client = get_client()
+        r = client.get(_BASE, params=params, headers=headers, timeout=DEFAULT_TIMEOUT)
+        # Retry on soft errors
+        if r.status_code in RETRY_STATUSES:
+            _bucket_for("arxiv").acquire()  # Respect rate limit on retry
+            r = client.get(_BASE, params=params, headers=headers, timeout=DEFAULT_TIMEOUT)
+        r.raise_for_status()
+        root = ET.fromstring(r.text)
     except Exception as e:
         logger.warning(f"arXiv search failed: {e}")
         return []
@@ -5,10 +5,11 @@ import httpx
 import time
 import os
 from typing import Any, Dict, List, Optional
-from collections import defaultdict
 import logging
 from urllib.parse import urlparse
 from research_system.tools.log_redaction import redact_url, redact_headers, safe_log_params
+from research_system.net.pool import get_client, get_async_client
+from research_system.net.provider_health import get_registry
 
 logger = logging.getLogger(__name__)
 
@@ -210,16 +211,36 @@ POLICY = {
         "headers": lambda: {
             "User-Agent": "research-agent/1.0"
         }
+    },
+    "semanticscholar": {
+        "rps": 1,  # Unauthenticated pool; an API key raises the limit
+        "headers": lambda: {
+            "User-Agent": "research-agent/1.0",
+            **({"x-api-key": os.environ["S2_API_KEY"]} if os.getenv("S2_API_KEY") else {})
+        }
     }
 }
 
-# Track last call times for rate limiting
-_last_call = defaultdict(float)
-_daily_counts = defaultdict(int)
-_daily_reset = defaultdict(float)
+# Rate limiting: one token bucket per provider (rps or min_interval_seconds,
+# optional "burst") plus daily quotas persisted across restarts.
+from research_system.net import ratelimit
 
-def _apply_policy(provider: str, method: str, url: str, *, params=None, headers=None):
-    """Apply provider-specific policies for headers and rate limiting."""
+_daily_counts = ratelimit.daily_quota.counts
+_daily_reset = ratelimit.daily_quota.window_start
+
+def _bucket_for(provider: str) -> Optional[ratelimit.TokenBucket]:
+    """Return the shared token bucket implementing a provider's POLICY rate."""
+    pol = POLICY.get(provider, {})
+    if pol.get("min_interval_seconds"):
+        rate = 1.0 / pol["min_interval_seconds"]
+    elif pol.get("rps"):
+        rate = float(pol["rps"])
+    else:
+        return None
+    return ratelimit.get_bucket(provider, rate, pol.get("burst", 1))
+
+def _policy_headers_params(provider: str, url: str, params=None, headers=None):
+    """Resolve provider and domain headers/params without rate limiting."""
     pol = POLICY.get(provider, {})
     
     # Check domain-specific policies for anti-bot handling
@@ -251,42 +272,33 @@ def _apply_policy(provider: str, method: str, url: str, *, params=None, headers=
         provider_params = pol["params"]()
         params = {**(params or {}), **provider_params}
     
-    # Enforce minimum interval if configured
-    min_iv = pol.get("min_interval_seconds")
-    if min_iv:
-        now = time.time()
-        dt = now - _last_call[provider]
-        if dt < min_iv:
-            sleep_time = min_iv - dt
-            logger.debug(f"Rate limiting {provider}: sleeping {sleep_time:.2f}s")
-            time.sleep(sleep_time)
-        _last_call[provider] = time.time()
-    
-    # Enforce RPS limit if configured
-    elif "rps" in pol:
-        rps = pol["rps"]
-        min_interval = 1.0 / rps
-        now = time.time()
-        dt = now - _last_call[provider]
-        if dt < min_interval:
-            sleep_time = min_interval - dt
-            logger.debug(f"Rate limiting {provider}: sleeping {sleep_time:.2f}s (RPS={rps})")
-            time.sleep(sleep_time)
-        _last_call[provider] = time.time()
-    
-    # Check daily limit if configured
+    return params, headers
+
+def _consume_daily(provider: str) -> None:
+    pol = POLICY.get(provider, {})
     if "daily" in pol:
-        now = time.time()
-        # Reset counter daily
-        if now - _daily_reset[provider] > 86400:  # 24 hours
-            _daily_counts[provider] = 0
-            _daily_reset[provider] = now
-        
-        if _daily_counts[provider] >= pol["daily"]:
-            raise Exception(f"Daily limit reached for {provider}: {pol['daily']} requests")
-        
-        _daily_counts[provider] += 1
+        ratelimit.daily_quota.consume(provider, pol["daily"])
+
+def _apply_policy(provider: str, method: str, url: str, *, params=None, headers=None):
+    """Apply provider-specific policies for headers and rate limiting.
     
+    Blocks the calling thread until the provider's token bucket allows the
+    request; use ``_apply_policy_async`` from coroutines.
+    """
+    params, headers = _policy_headers_params(provider, url, params, headers)
+    _consume_daily(provider)
+    bucket = _bucket_for(provider)
+    if bucket:
+        bucket.acquire()
+    return params, headers
+
+async def _apply_policy_async(provider: str, method: str, url: str, *, params=None, headers=None):
+    """Awaitable ``_apply_policy`` that never blocks the event loop."""
+    params, headers = _policy_headers_params(provider, url, params, headers)
+    _consume_daily(provider)
+    bucket = _bucket_for(provider)
+    if bucket:
+        await bucket.aacquire()
     return params, headers
 
 def http_json(
@@ -295,9 +307,14 @@ def http_json(
     params: Optional[Dict] = None,
     headers: Optional[Dict] = None,
     data: Optional[Any] = None,
-    max_retries: int = 3
+    max_retries: int = 3,
+    timeout: Optional[float] = None
 ) -> Dict[str, Any]:
-    """Make HTTP request with retries and return JSON response."""
+    """Make HTTP request with retries and return JSON response.
+    
+    Requests go through the process-wide pooled client so connections to
+    provider hosts are kept alive across calls and retries.
+    """
     backoff = 0.5
     last_error = None
     
@@ -306,8 +323,10 @@ def http_json(
     
     for attempt in range(1, max_retries + 1):
         try:
-            with httpx.Client(timeout=DEFAULT_TIMEOUT, headers=merged_headers) as client:
-                response = client.request(method, url, params=params, json=data)
+            response = get_client().request(
+                method, url, params=params, json=data,
+                headers=merged_headers, timeout=timeout or DEFAULT_TIMEOUT
+            )
             
             if response.status_code in RETRY_STATUSES:
                 raise httpx.HTTPStatusError(
@@ -331,6 +350,50 @@ def http_json(
     
     raise last_error or Exception(f"Failed to complete request to {url}")
 
+async def async_http_json(
+    method: str,
+    url: str,
+    params: Optional[Dict] = None,
+    headers: Optional[Dict] = None,
+    data: Optional[Any] = None,
+    max_retries: int = 3,
+    timeout: Optional[float] = None
+) -> Dict[str, Any]:
+    """Async version of http_json using the event loop's pooled client."""
+    import asyncio
+    backoff = 0.5
+    last_error = None
+    merged_headers = _merge_headers_for_domain(url, headers)
+    
+    for attempt in range(1, max_retries + 1):
+        try:
+            response = await get_async_client().request(
+                method, url, params=params, json=data,
+                headers=merged_headers, timeout=timeout or DEFAULT_TIMEOUT
+            )
+            
+            if response.status_code in RETRY_STATUSES:
+                raise httpx.HTTPStatusError(
+                    f"Retryable status {response.status_code}",
+                    request=response.request,
+                    response=response
+                )
+            
+            response.raise_for_status()
+            return response.json()
+            
+        except (httpx.TransportError, httpx.HTTPStatusError) as e:
+            last_error = e
+            if attempt == max_retries:
+                logger.warning(f"HTTP request failed after {max_retries} attempts: {redact_url(url)}")
+                raise
+            
+            logger.debug(f"Retry {attempt}/{max_retries} for {redact_url(url)}: {e}")
+            await asyncio.sleep(backoff)
+            backoff *= 2
+    
+    raise last_error or Exception(f"Failed to complete request to {url}")
+
 def http_json_with_policy(
     provider: str,
     method: str,
@@ -348,12 +411,42 @@ def http_json_with_policy(
         headers=headers
     )
     
-    # Note: http_json doesn't support timeout directly, but we accept it
-    # for compatibility. The actual timeout is handled at the httpx level.
-    return http_json(
+    start = time.perf_counter()
+    result = http_json(
+        method, url,
+        params=params,
+        headers=headers,
+        data=data,
+        max_retries=max_retries,
+        timeout=timeout
+    )
+    get_registry().observe_latency(f"provider:{provider}", time.perf_counter() - start)
+    return result
+async def async_http_json_with_policy(
+    provider: str,
+    method: str,
+    url: str,
+    params: Optional[Dict] = None,
+    headers: Optional[Dict] = None,
+    data: Optional[Any] = None,
+    max_retries: int = 3,
+    timeout: Optional[int] = None
+) -> Dict[str, Any]:
+    """Async ``http_json_with_policy``: waits for rate-limit tokens with asyncio."""
+    params, headers = await _apply_policy_async(
+        provider, method, url,
+        params=params,
+        headers=headers
+    )
+    
+    start = time.perf_counter()
+    result = await async_http_json(
         method, url,
         params=params,
         headers=headers,
         data=data,
-        max_retries=max_retries
-    )
\ No newline at end of file
+        max_retries=max_retries,
+        timeout=timeout
+    )
+    get_registry().observe_latency(f"provider:{provider}", time.perf_counter() - start)
+    return result
@@ -1,8 +1,10 @@
 """IMF provider for international financial statistics."""
 
 from __future__ import annotations
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 from .http import http_json_with_policy as http_json
+from .sdmx_catalog import DataflowCatalog
+from research_system.net.provider_health import CircuitStateView, get_registry
 import logging
 import time
 import os
@@ -11,47 +13,55 @@ logger = logging.getLogger(__name__)
 
 _DATAFLOW = "https://dataservices.imf.org/REST/SDMX_JSON.svc/Dataflow"
 
-# Circuit breaker state
-_circuit_state = {
-    "is_open": False,
-    "last_failure": 0,
-    "consecutive_failures": 0,
-    "catalog_cache": None,
-    "cache_time": 0
-}
+# Circuit breaker state, shared with other processes through the health registry
+CIRCUIT_KEY = "catalog:imf"
 
 # Configuration
 # v8.26.1: Increased thresholds to be more tolerant of transient failures
 CIRCUIT_COOLDOWN = int(os.getenv("IMF_CIRCUIT_COOLDOWN", "600"))  # 10 minutes (was 5)
 CIRCUIT_THRESHOLD = int(os.getenv("IMF_CIRCUIT_THRESHOLD", "5"))  # Trip after 5 failures (was 2)
-CACHE_TTL = int(os.getenv("IMF_CACHE_TTL", "7200"))  # 2 hours (was 1)
+CACHE_TTL = int(os.getenv("IMF_CACHE_TTL", "7200"))  # 2 hours before background refresh
+
+# Live view of the shared circuit record (legacy dict shape)
+_circuit_state = CircuitStateView(CIRCUIT_KEY, CIRCUIT_COOLDOWN)
+
+def reset_circuit_state():
+    """Reset circuit breaker state and the in-memory catalog for testing."""
+    get_registry().reset(CIRCUIT_KEY)
+    CATALOG.reset()
+
+def _close_circuit(health) -> None:
+    health.open_until = 0.0
+    health.consecutive_failures = 0
 
 def _dataflows() -> List[Dict[str, Any]]:
-    """Fetch IMF dataflows catalog with circuit breaker and caching."""
+    """Return IMF dataflows as ``{"code", "name"}`` rows (read-only, shared)."""
+    return [{"code": code, **meta} for code, meta in CATALOG.dataflows().items()]
+
+def _fetch_dataflows() -> Optional[Dict[str, Dict[str, Any]]]:
+    """Download and parse the IMF dataflows catalog behind the circuit breaker.
+    
+    Returns None when the circuit is open or the request fails, so the
+    shared catalog keeps serving its previous copy.
+    """
     current_time = time.time()
     
     # Check circuit breaker
-    if _circuit_state["is_open"]:
-        if current_time - _circuit_state["last_failure"] < CIRCUIT_COOLDOWN:
-            logger.info("IMF circuit breaker OPEN, returning cached catalog")
-            return _circuit_state["catalog_cache"] or []
+    health = get_registry().get(CIRCUIT_KEY)
+    if health.open_until:
+        if health.is_open(current_time):
+            logger.info("IMF circuit breaker OPEN, serving cached catalog")
+            return None
         else:
             # Try to close circuit
             logger.info("IMF circuit breaker attempting to close")
-            _circuit_state["is_open"] = False
-            _circuit_state["consecutive_failures"] = 0
-    
-    # Check cache
-    if (_circuit_state["catalog_cache"] is not None and 
-        current_time - _circuit_state["cache_time"] < CACHE_TTL):
-        logger.debug("IMF returning cached catalog")
-        return _circuit_state["catalog_cache"]
+            get_registry().update(CIRCUIT_KEY, _close_circuit)
     
     try:
         data = http_json("imf", "GET", _DATAFLOW)
         # Typically {"Structure":{"Dataflows":{"Dataflow":[...]}}}
         flows = (((data.get("Structure") or {}).get("Dataflows") or {}).get("Dataflow")) or []
-        out = []
+        out = {}
         
         for f in flows:
             key = f.get("Key") or f.get("@id") or f.get("id")
@@ -61,38 +71,28 @@ def _dataflows() -> List[Dict[str, Any]]:
                 name = nm[0].get("$") or nm[0].get("value") or ""
             elif isinstance(nm, str):
                 name = nm
-            out.append({"code": key, "name": name})
+            if key:
+                out[str(key)] = {"name": name}
         
-        # Success - cache and reset failures
-        _circuit_state["catalog_cache"] = out
-        _circuit_state["cache_time"] = current_time
-        _circuit_state["consecutive_failures"] = 0
+        # Success - reset failures
+        get_registry().record_success(CIRCUIT_KEY)
         return out
         
     except Exception as e:
         logger.warning(f"IMF dataflows fetch failed: {e}")
-        _circuit_state["consecutive_failures"] += 1
-        _circuit_state["last_failure"] = current_time
-        
         # Trip circuit if threshold reached
-        if _circuit_state["consecutive_failures"] >= CIRCUIT_THRESHOLD:
-            _circuit_state["is_open"] = True
+        health = get_registry().record_failure(CIRCUIT_KEY, CIRCUIT_THRESHOLD, CIRCUIT_COOLDOWN)
+        if health.consecutive_failures >= CIRCUIT_THRESHOLD:
             logger.warning(f"IMF circuit breaker TRIPPED after {CIRCUIT_THRESHOLD} failures")
         
-        # Return cached data if available
-        return _circuit_state["catalog_cache"] or []
+        return None
+
+CATALOG = DataflowCatalog("imf", _fetch_dataflows, ttl=CACHE_TTL)
 
 def search_imf(query: str, limit: int = 25) -> List[Dict[str, Any]]:
     """Search IMF datasets by relevance to query."""
-    q = (query or "").lower()
-    flows = _dataflows()
-    
-    for f in flows:
-        f["score"] = sum((f.get("name", "") or "").lower().count(t) for t in q.split())
-        f["score"] += 2 if (f.get("code", "") or "").lower() in q else 0
-    
-    flows.sort(key=lambda x: x["score"], reverse=True)
-    return [f for f in flows if f["score"] > 0][:limit]
+    # Token index over the shared catalog; results are fresh dicts
+    return CATALOG.search(query, limit)
 
 def to_cards(rows: List[Dict[str, Any]]) -> List[dict]:
     """Convert IMF datasets to evidence cards."""
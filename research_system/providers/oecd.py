@@ -3,6 +3,8 @@
 from __future__ import annotations
 from typing import List, Dict, Any, Optional
 from .http import http_json_with_policy as http_json
+from .sdmx_catalog import DataflowCatalog
+from research_system.net.provider_health import CircuitStateView, get_registry
 import logging
 import time
 import os
@@ -27,50 +29,49 @@ DATAFLOW_URLS = [
     # Legacy endpoints removed - they're permanently offline
 ]
 
-# Circuit breaker state
-_circuit_state = {
-    "is_open": False,
-    "last_failure": 0,
-    "consecutive_failures": 0,
-    "catalog_cache": None,
-    "cache_time": 0
-}
+# Circuit breaker state, shared with other processes through the health registry
+CIRCUIT_KEY = "catalog:oecd"
 
 def reset_circuit_state():
-    """Reset circuit breaker state for testing."""
-    global _circuit_state
-    _circuit_state["is_open"] = False
-    _circuit_state["last_failure"] = 0
-    _circuit_state["consecutive_failures"] = 0
-    _circuit_state["catalog_cache"] = None
-    _circuit_state["cache_time"] = 0
+    """Reset circuit breaker state and the in-memory catalog for testing."""
+    get_registry().reset(CIRCUIT_KEY)
+    CATALOG.reset()
 
 # Configuration
 # v8.26.1: Increased thresholds to be more tolerant of transient failures
 CIRCUIT_COOLDOWN = int(os.getenv("OECD_CIRCUIT_COOLDOWN", "600"))  # 10 minutes (was 5)
 CIRCUIT_THRESHOLD = int(os.getenv("OECD_CIRCUIT_THRESHOLD", "5"))  # Trip after 5 failures (was 2)
-CACHE_TTL = int(os.getenv("OECD_CACHE_TTL", "3600"))  # 1 hour
+CACHE_TTL = int(os.getenv("OECD_CACHE_TTL", "3600"))  # 1 hour before background refresh
+
+# Live view of the shared circuit record (legacy dict shape)
+_circuit_state = CircuitStateView(CIRCUIT_KEY, CIRCUIT_COOLDOWN)
+
+def _close_circuit(health) -> None:
+    health.open_until = 0.0
+    health.consecutive_failures = 0
 
 def _dataflows() -> Dict[str, Dict[str, Any]]:
-    """Fetch OECD dataflows catalog with circuit breaker and caching."""
+    """Return the OECD dataflows catalog (read-only, shared, disk-backed)."""
+    return CATALOG.dataflows()
+
+def _fetch_dataflows() -> Optional[Dict[str, Dict[str, Any]]]:
+    """Download and parse the OECD dataflows catalog behind the circuit breaker.
+    
+    Returns None when the circuit is open or every endpoint fails, so the
+    shared catalog keeps serving its previous copy.
+    """
     current_time = time.time()
     
     # Check circuit breaker
-    if _circuit_state["is_open"]:
-        if current_time - _circuit_state["last_failure"] < CIRCUIT_COOLDOWN:
-            logger.info("OECD circuit breaker OPEN, returning cached catalog")
-            return _circuit_state["catalog_cache"] or {}
+    health = get_registry().get(CIRCUIT_KEY)
+    if health.open_until:
+        if health.is_open(current_time):
+            logger.info("OECD circuit breaker OPEN, serving cached catalog")
+            return None
         else:
             # Try to close circuit
             logger.info("OECD circuit breaker attempting to close")
-            _circuit_state["is_open"] = False
-            _circuit_state["consecutive_failures"] = 0
-    
-    # Check cache
-    if (_circuit_state["catalog_cache"] is not None and 
-        current_time - _circuit_state["cache_time"] < CACHE_TTL):
-        logger.debug("OECD returning cached catalog")
-        return _circuit_state["catalog_cache"]
+            get_registry().update(CIRCUIT_KEY, _close_circuit)
     
     # v8.24.0: Try multiple endpoints with fallback to alt hosts
     last_err = None
@@ -236,9 +237,7 @@ def _dataflows() -> Dict[str, Dict[str, Any]]:
                 logger.warning(f"OECD API returned unexpected type: {type(result)}, treating as empty")
                 result = {}
             
-            _circuit_state["catalog_cache"] = result
-            _circuit_state["cache_time"] = current_time
-            _circuit_state["consecutive_failures"] = 0
+            get_registry().record_success(CIRCUIT_KEY)
             logger.info(f"OECD dataflows fetched successfully from {url}")
             return result
             
@@ -251,16 +250,14 @@ def _dataflows() -> Dict[str, Dict[str, Any]]:
     logger.warning(f"All OECD endpoints failed: {last_err}")
     
     # All attempts failed
-    _circuit_state["consecutive_failures"] += 1
-    _circuit_state["last_failure"] = current_time
-    
     # Trip circuit if threshold reached
-    if _circuit_state["consecutive_failures"] >= CIRCUIT_THRESHOLD:
-        _circuit_state["is_open"] = True
+    health = get_registry().record_failure(CIRCUIT_KEY, CIRCUIT_THRESHOLD, CIRCUIT_COOLDOWN)
+    if health.consecutive_failures >= CIRCUIT_THRESHOLD:
         logger.warning(f"OECD circuit breaker TRIPPED after {CIRCUIT_THRESHOLD} failures")
     
-    # Return cached data if available
-    return _circuit_state["catalog_cache"] or {}
+    return None
+
+CATALOG = DataflowCatalog("oecd", _fetch_dataflows, ttl=CACHE_TTL)
 
 def search_oecd(query: str, limit: int = 25) -> List[Dict[str, Any]]:
     """Search OECD datasets by relevance to query."""
@@ -282,7 +279,7 @@ def search_oecd(query: str, limit: int = 25) -> List[Dict[str, Any]]:
     
     # v8.26.2: Use fallback datasets if API fails or returns wrong type
     # v8.26.5: Explicitly check for dict type to avoid 'list' object has no attribute 'items' error
-    if not isinstance(dfs, dict):
+    if not isinstance(dfs, dict) or not dfs:
         logger.warning("OECD API unavailable, using fallback dataset list")
         # Filter fallback datasets by query
         items = []
@@ -295,16 +292,8 @@ def search_oecd(query: str, limit: int = 25) -> List[Dict[str, Any]]:
         items.sort(key=lambda x: x["score"], reverse=True)
         return items[:limit]
     
-    items = []
-    
-    for code, meta in dfs.items():
-        name = (meta.get("name") or "").lower()
-        score = sum(name.count(t) for t in q.split()) + (2 if code.lower() in q else 0)
-        if score > 0:
-            items.append({"code": code, "name": meta.get("name"), "score": score})
-    
-    items.sort(key=lambda x: x["score"], reverse=True)
-    return items[:limit]
+    # Token index over the shared catalog; never touches the cached entries
+    return CATALOG.search(query, limit, flows=dfs)
 
 def to_cards(rows: List[Dict[str, Any]]) -> List[dict]:
     """Convert OECD datasets to evidence cards."""
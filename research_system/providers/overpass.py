@@ -4,8 +4,7 @@ from __future__ import annotations
 from typing import List, Dict, Any
 import httpx
 from urllib.parse import quote
-from .http import DEFAULT_TIMEOUT, RETRY_STATUSES
-import time
+from .http import DEFAULT_TIMEOUT, RETRY_STATUSES, _bucket_for
 import logging
 
 logger = logging.getLogger(__name__)
@@ -16,22 +15,14 @@ _OVERPASS_URLS = [
     "https://z.overpass-api.de/api/interpreter",      # German mirror
     "https://overpass-api.de/api/interpreter",        # Main instance (often slow)
 ]
-_last_call = 0
 
 def overpass_search(query: str, limit: int = 10) -> List[Dict[str, Any]]:
     """
     Conservative global POI search on OpenStreetMap.
     Enforces 1 request per second rate limit.
     """
-    global _last_call
-    
-    # Enforce 1-second minimum between requests
-    now = time.time()
-    if _last_call > 0:
-        elapsed = now - _last_call
-        if elapsed < 1:
-            time.sleep(1 - elapsed)
-    _last_call = time.time()
+    # Enforce 1-second minimum between requests (shared overpass bucket)
+    _bucket_for("overpass").acquire()
     
     q = query.strip()
     if not q:
@@ -58,9 +49,8 @@ def overpass_search(query: str, limit: int = 10) -> List[Dict[str, Any]]:
             with httpx.Client(timeout=DEFAULT_TIMEOUT) as client:
                 r = client.post(overpass_url, data={"data": overpass_q})
                 if r.status_code in RETRY_STATUSES:
-                    time.sleep(1)  # Respect rate limit on retry
+                    _bucket_for("overpass").acquire()  # Respect rate limit on retry
                     r = client.post(overpass_url, data={"data": overpass_q})
-                    _last_call = time.time()
                 r.raise_for_status()
                 js = r.json()
                 logger.info(f"Overpass search successful via {overpass_url}")
@@ -0,0 +1,202 @@
+"""Shared SDMX dataflow catalog for the OECD and IMF providers.
+
+Both agencies publish a dataflow catalog (OECD's is over 1 MB) that the
+providers used to download into a module-level dict on every new process
+and rescan with ``str.count`` per query. ``DataflowCatalog`` keeps one
+parsed copy per provider:
+
+* persisted to ``CATALOG_CACHE_DIR`` as compact ``[code, name, agency]`` rows,
+  so a new process starts warm without the network;
+* refreshed in a background thread once older than the provider TTL, while
+  the stale copy keeps serving queries;
+* searched through a prebuilt BM25 token index;
+* exposed as read-only mappings, so callers can never modify the cache.
+"""
+
+from __future__ import annotations
+import copy
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Mapping, Optional
+
+from research_system.retrieval.catalog import BM25Index, CatalogStore
+
+logger = logging.getLogger(__name__)
+
+BACKGROUND_REFRESH = os.getenv("SDMX_CATALOG_BACKGROUND_REFRESH", "true").lower() == "true"
+
+# Codes count double so "GDP" finds the GDP flow even with an unusual name
+_INDEX_FIELDS = {"name": 1.0, "code": 2.0}
+
+
+class FrozenDict(dict):
+    """A dict that refuses mutation; used for cached catalog entries."""
+
+    def _readonly(self, *args, **kwargs):
+        raise TypeError("cached SDMX catalog entries are read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return {k: copy.deepcopy(v, memo) for k, v in self.items()}
+
+    def __reduce__(self):
+        return (FrozenDict, (dict(self),))
+
+
+def _freeze(flows: Mapping[str, Any]) -> FrozenDict:
+    frozen = {}
+    for code, meta in flows.items():
+        if not code:
+            continue
+        if not isinstance(meta, Mapping):
+            meta = {"name": str(meta or "")}
+        frozen[str(code)] = FrozenDict((k, v) for k, v in meta.items() if k != "score")
+    return FrozenDict(frozen)
+
+
+class DataflowCatalog:
+    """Disk-backed, indexed dataflow catalog for one SDMX provider.
+
+    Args:
+        name: Provider name (also the cache file name).
+        loader: Fetches ``{code: {"name": ..., ...}}`` from the network and
+            returns None on failure (the provider's circuit breaker lives there).
+        ttl: Seconds after which the catalog is refreshed.
+    """
+
+    def __init__(self, name: str, loader: Callable[[], Optional[Mapping[str, Mapping[str, Any]]]],
+                 ttl: int):
+        self.name = name
+        self.loader = loader
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._refreshing = False
+        self._flows: Optional[FrozenDict] = None
+        self._index: Optional[BM25Index] = None
+        self._codes: List[str] = []
+        self._fetched_at = 0.0
+        self._skip_disk = False
+
+    @property
+    def store(self) -> CatalogStore:
+        return CatalogStore(f"sdmx_{self.name}_dataflows", ttl=self.ttl)
+
+    def dataflows(self) -> FrozenDict:
+        """Return the read-only catalog, loading or refreshing it as needed."""
+        with self._lock:
+            if self._flows is None:
+                self._load_from_disk()
+            flows, stale = self._flows, time.time() - self._fetched_at >= self.ttl
+        if flows is None:
+            return self.refresh() or FrozenDict()
+        if stale:
+            if BACKGROUND_REFRESH:
+                self._refresh_in_background()
+            else:
+                return self.refresh() or flows
+        return flows
+
+    def search(self, query: str, limit: int = 25,
+               flows: Optional[Mapping[str, Mapping[str, Any]]] = None) -> List[Dict[str, Any]]:
+        """Rank dataflows for ``query``; returns new ``{"code", "name", "score"}`` dicts.
+
+        Args:
+            flows: Search this mapping instead of the cached catalog (a
+                throwaway index is built unless it *is* the cached catalog).
+        """
+        if flows is None:
+            flows = self.dataflows()
+        with self._lock:
+            if flows is self._flows and self._index is not None:
+                index, codes = self._index, self._codes
+            else:
+                codes = list(flows)
+                index = BM25Index([{"code": c, "name": (flows[c] or {}).get("name") or ""}
+                                   for c in codes], _INDEX_FIELDS)
+        return [
+            {"code": codes[i], "name": (flows[codes[i]] or {}).get("name"), "score": round(score, 4)}
+            for i, score in index.search(query or "", limit)
+        ]
+
+    def refresh(self) -> Optional[FrozenDict]:
+        """Fetch the catalog now; returns None (keeping the old copy) on failure.
+
+        An empty catalog counts as a failure: it would otherwise overwrite a
+        good snapshot shared with other processes for the whole TTL.
+        """
+        fetched = self.loader()
+        if not fetched:
+            if fetched is not None:
+                logger.warning(f"{self.name} catalog fetch returned no dataflows; keeping current copy")
+            return None
+        return self.replace(fetched)
+
+    def replace(self, flows: Mapping[str, Mapping[str, Any]],
+                fetched_at: Optional[float] = None, persist: bool = True) -> FrozenDict:
+        """Install a new catalog snapshot and rebuild the index."""
+        frozen = _freeze(flows)
+        codes = list(frozen)
+        index = BM25Index([{"code": c, "name": frozen[c].get("name") or ""} for c in codes],
+                          _INDEX_FIELDS)
+        with self._lock:
+            self._flows, self._index, self._codes = frozen, index, codes
+            self._skip_disk = False
+            self._fetched_at = fetched_at if fetched_at is not None else time.time()
+        if persist:
+            self.store.save(
+                [[c, frozen[c].get("name") or "", frozen[c].get("agency") or ""] for c in codes]
+            )
+        logger.debug(f"{self.name} catalog loaded: {len(codes)} dataflows")
+        return frozen
+
+    def reset(self) -> None:
+        """Drop the in-memory catalog so the next lookup fetches it again.
+
+        The on-disk snapshot is shared with other processes and is left in
+        place; it is overwritten by the next successful fetch.
+        """
+        with self._lock:
+            self._flows, self._index, self._codes, self._fetched_at = None, None, [], 0.0
+            self._skip_disk = True
+
+    def _load_from_disk(self) -> None:
+        if self._skip_disk:
+            return
+        entry = self.store.load()
+        if not entry:
+            return
+        flows = {}
+        for row in entry["rows"]:
+            code, name, agency = (list(row) + ["", "", ""])[:3]
+            flows[code] = {"name": name, "agency": agency} if agency else {"name": name}
+        frozen = _freeze(flows)
+        codes = list(frozen)
+        self._index = BM25Index([{"code": c, "name": frozen[c].get("name") or ""} for c in codes],
+                                _INDEX_FIELDS)
+        self._flows, self._codes = frozen, codes
+        self._fetched_at = entry.get("fetched_at", 0.0)
+        logger.debug(f"{self.name} catalog loaded from disk: {len(codes)} dataflows")
+
+    def _refresh_in_background(self) -> None:
+        with self._lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+
+        def run():
+            try:
+                self.refresh()
+            except Exception as e:
+                logger.debug(f"{self.name} background catalog refresh failed: {e}")
+            finally:
+                with self._lock:
+                    self._refreshing = False
+
+        threading.Thread(target=run, name=f"{self.name}-catalog-refresh", daemon=True).start()
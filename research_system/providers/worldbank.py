@@ -1,13 +1,37 @@
-"""World Bank API provider for development indicators."""
+"""World Bank API provider for development indicators.
+
+The full indicator catalog (~29k series) is paged down once, stored under
+``CATALOG_CACHE_DIR`` with its ETag, and searched through a local BM25
+index. Warm starts load the snapshot and the saved index from disk without
+touching the network; after ``WORLDBANK_CATALOG_TTL`` seconds the snapshot
+is revalidated with ``If-None-Match``.
+"""
 
 from __future__ import annotations
-from typing import List, Dict, Any
-from .http import http_json_with_policy as http_json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Tuple
+from .http import http_json_with_policy as http_json, _apply_policy, _merge_headers_for_domain, DEFAULT_TIMEOUT
+from research_system.net.pool import get_client
+from research_system.retrieval.catalog import BM25Index, CatalogStore, CATALOG_TTL_SECONDS
 import logging
 
 logger = logging.getLogger(__name__)
 
 _INDICATORS = "https://api.worldbank.org/v2/indicator"
+CATALOG_PAGE_SIZE = int(os.getenv("WORLDBANK_CATALOG_PAGE_SIZE", "5000"))
+CATALOG_TTL = int(os.getenv("WORLDBANK_CATALOG_TTL", str(CATALOG_TTL_SECONDS)))
+
+# Name matches count three times as much as the long source note
+_INDEX_FIELDS = {"name": 3.0, "id": 2.0, "topics": 1.5, "sourceNote": 1.0}
+
+_catalog_lock = threading.Lock()
+_catalog: Optional[Dict[str, Any]] = None
+_index: Optional[BM25Index] = None
+_last_failure = 0.0
+_RETRY_AFTER_FAILURE = 300  # seconds before retrying a failed catalog download
 
 def _indicators_page(per_page: int = 1000, page: int = 1) -> List[Dict[str, Any]]:
     """Fetch a page of World Bank indicators."""
@@ -19,20 +43,96 @@ def _indicators_page(per_page: int = 1000, page: int = 1) -> List[Dict[str, Any]
         logger.warning(f"World Bank indicators fetch failed: {e}")
         return []
 
+def _fetch_page(page: int, etag: Optional[str] = None) -> Tuple[int, Optional[str], Dict[str, Any], List[Dict[str, Any]]]:
+    """Fetch one catalog page, returning ``(status, etag, meta, rows)``."""
+    params, headers = _apply_policy(
+        "worldbank", "GET", _INDICATORS,
+        params={"format": "json", "per_page": CATALOG_PAGE_SIZE, "page": page},
+    )
+    headers = _merge_headers_for_domain(_INDICATORS, headers)
+    if etag:
+        headers["If-None-Match"] = etag
+    r = get_client().get(_INDICATORS, params=params, headers=headers, timeout=DEFAULT_TIMEOUT)
+    if r.status_code == 304:
+        return 304, etag, {}, []
+    r.raise_for_status()
+    data = r.json()
+    meta = data[0] if isinstance(data, list) and data and isinstance(data[0], dict) else {}
+    rows = (data[1] if isinstance(data, list) and len(data) > 1 else []) or []
+    return r.status_code, r.headers.get("ETag"), meta, rows
+
+def _slim(row: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep the fields used for search and card building."""
+    return {
+        "id": row.get("id"),
+        "name": row.get("name"),
+        "sourceNote": row.get("sourceNote") or "",
+        "source": {"value": (row.get("source") or {}).get("value")},
+        "sourceOrganization": row.get("sourceOrganization") or "",
+        "topics": " ".join(t.get("value", "") for t in row.get("topics") or [] if isinstance(t, dict)),
+    }
+
+def _download_catalog(store: CatalogStore, cached: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Download (or revalidate) the full catalog; None when the network fails."""
+    try:
+        status, etag, meta, rows = _fetch_page(1, etag=(cached or {}).get("etag"))
+        if status == 304 and cached:
+            logger.info("World Bank catalog unchanged (304); refreshing TTL")
+            return store.touch(cached)
+        pages = int(meta.get("pages") or 1)
+        for page in range(2, pages + 1):
+            rows.extend(_fetch_page(page)[3])
+        if not rows:
+            return None
+        logger.info(f"Downloaded World Bank catalog: {len(rows)} indicators in {pages} pages")
+        return store.save([_slim(r) for r in rows], etag=etag)
+    except Exception as e:
+        logger.warning(f"World Bank catalog download failed: {e}")
+        return None
+
+def _index_path(store: CatalogStore) -> Path:
+    return store.path.with_name("worldbank_index.npz")
+
+def load_catalog(force_refresh: bool = False) -> Tuple[List[Dict[str, Any]], Optional[BM25Index]]:
+    """Return the cached indicator rows and their search index.
+
+    Loads from memory, then disk, and only goes to the network when the
+    snapshot is missing, expired or ``force_refresh`` is set. A stale
+    snapshot is still served if the refresh fails.
+    """
+    global _catalog, _index, _last_failure
+    with _catalog_lock:
+        store = CatalogStore("worldbank_indicators", ttl=CATALOG_TTL)
+        entry = _catalog if _catalog is not None else store.load()
+        recently_failed = time.time() - _last_failure < _RETRY_AFTER_FAILURE
+        if force_refresh or (not store.is_fresh(entry) and not recently_failed):
+            fresh = _download_catalog(store, entry)
+            if fresh is None:
+                _last_failure = time.time()
+            entry = fresh or entry
+        if not entry:
+            return [], None
+
+        stamp = f"{entry.get('fetched_at')}:{entry.get('etag')}:{len(entry['rows'])}"
+        if entry is not _catalog or _index is None:
+            index = BM25Index.load(_index_path(store), stamp)
+            if index is None or len(index) != len(entry["rows"]):
+                index = BM25Index(entry["rows"], _INDEX_FIELDS)
+                try:
+                    index.save(_index_path(store), stamp)
+                except OSError as e:
+                    logger.debug(f"Could not persist World Bank index: {e}")
+            _catalog, _index = entry, index
+        return _catalog["rows"], _index
+
 def search_worldbank(query: str, limit: int = 25) -> List[Dict[str, Any]]:
     """Search World Bank indicators by relevance to query."""
-    q = (query or "").lower()
-    rows = _indicators_page(per_page=1000, page=1)
-    
-    # Simple relevance: token overlap on name/sourceNote/id
-    toks = [t for t in q.replace("/", " ").split() if t]
-    
-    def score(r):
-        hay = " ".join(str(r.get(k, "") or "") for k in ("name", "sourceNote", "id")).lower()
-        return sum(hay.count(t) for t in toks)
-    
-    ranked = sorted(rows, key=score, reverse=True)
-    return ranked[:limit]
+    rows, index = load_catalog()
+    if index is None:
+        # No catalog at all (offline cold start): fall back to one live page
+        rows = _indicators_page(per_page=1000, page=1)
+        index = BM25Index(rows, _INDEX_FIELDS)
+    return [rows[i] for i, _ in index.search(query or "", limit)]
 
 def to_cards(rows: List[Dict[str, Any]]) -> List[dict]:
     """Convert World Bank indicators to evidence cards."""
@@ -54,4 +154,4 @@ def to_cards(rows: List[Dict[str, Any]]) -> List[dict]:
                 "license": "CC BY-4.0"  # World Bank Open Data license
             }
         })
-    return cards
\ No newline at end of file
+    return cards
@@ -10,8 +10,9 @@ import logging
 
 logger = logging.getLogger(__name__)
 
-# Import from unified config
-from research_system.config.settings import PRIMARY_ORGS, SEMI_AUTHORITATIVE_ORGS
+# PRIMARY_ORGS / SEMI_AUTHORITATIVE_ORGS (config.settings) are matched through
+# the compiled authority index as the "authority" / "semi" tags
+from research_system.tools import authority_index
 
 # Pattern to detect numeric content (years, percentages, large numbers)
 NUMERIC_PATTERN = re.compile(
@@ -59,16 +60,15 @@ def is_primary_source(card: Any) -> bool:
     if not hostname:
         return False
     
-    # Check against primary organizations
-    for primary_domain in PRIMARY_ORGS:
+    # Check against primary organizations (the org or any of its subdomains)
+    matches = authority_index.lookup(hostname)
+    primary_domain = matches.get("authority")
+    if primary_domain:
         if primary_domain.startswith('.'):
-            # Check suffix for academic domains
-            if hostname.endswith(primary_domain):
-                _set_primary_metadata(card, f"academic domain ({primary_domain})")
-                return True
-        elif primary_domain in hostname:
+            _set_primary_metadata(card, f"academic domain ({primary_domain})")
+        else:
             _set_primary_metadata(card, f"authoritative org ({primary_domain})")
-            return True
+        return True
     
     # v8.24.0: Check for authoritative PDFs with numeric content
     is_pdf = url.lower().endswith('.pdf')
@@ -83,10 +83,10 @@ def is_primary_source(card: Any) -> bool:
         if has_numeric:
             # PDFs with numeric content from semi-authoritative sources
             
-            for org in SEMI_AUTHORITATIVE_ORGS:
-                if org in hostname:
-                    _set_primary_metadata(card, f"authoritative PDF with metrics ({org})")
-                    return True
+            org = matches.get("semi")
+            if org:
+                _set_primary_metadata(card, f"authoritative PDF with metrics ({org})")
+                return True
             
             # Any .gov/.edu PDF with numbers is primary
             if hostname.endswith('.gov') or hostname.endswith('.edu'):
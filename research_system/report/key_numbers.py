@@ -6,6 +6,7 @@ import statistics
 from collections import defaultdict, Counter
 from dataclasses import dataclass
 from typing import List, Dict, Tuple, Optional, Any
+from ..evidence.features import text_features
 import logging
 
 logger = logging.getLogger(__name__)
@@ -238,10 +239,7 @@ def _extract_key_numbers(cards: List[Any], max_items: int = 6) -> List[KeyNumber
         year = getattr(card, "year", None) or getattr(card, "publication_year", None)
         
         # Find numeric tokens
-        for match in _NUM_PAT.finditer(full_text):
-            token = match.group("raw")
-            value, unit = _canonicalize_unit(token)
-            
+        for match_pos, value, unit in text_features(full_text).number_tokens:
             if math.isnan(value):
                 continue
             
@@ -250,7 +248,6 @@ def _extract_key_numbers(cards: List[Any], max_items: int = 6) -> List[KeyNumber
                 continue
             
             # Build label from context
-            match_pos = match.start()
             label = _build_label_from_context(full_text, match_pos)
             
             # Extract quote span around the number
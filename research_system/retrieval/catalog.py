@@ -0,0 +1,196 @@
+"""On-disk catalog cache and in-memory BM25 index for provider metadata.
+
+Statistical providers (World Bank, OECD, IMF) publish catalogs of tens of
+thousands of series. Fetching them per query is slow and usually truncated,
+so providers page the catalog down once, keep it on disk with a TTL and the
+server's ETag, and search it locally through ``BM25Index``.
+"""
+
+from __future__ import annotations
+import gzip
+import json
+import logging
+import os
+import re
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+CATALOG_CACHE_DIR = "./.catalog_cache"
+CATALOG_TTL_SECONDS = int(os.getenv("CATALOG_TTL_SECONDS", str(7 * 86400)))
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_STOPWORDS = frozenset(
+    "a an and are as at by for from in is it of on or the to with per".split()
+)
+
+
+def cache_dir() -> str:
+    """Directory holding cached catalogs (``CATALOG_CACHE_DIR`` env overrides)."""
+    return os.environ.get("CATALOG_CACHE_DIR", CATALOG_CACHE_DIR)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase word tokens with stopwords removed and plural ``s`` stripped."""
+    out = []
+    for tok in _TOKEN_RE.findall((text or "").lower()):
+        if tok in _STOPWORDS:
+            continue
+        if len(tok) > 3 and tok.endswith("s") and not tok.endswith("ss"):
+            tok = tok[:-1]
+        out.append(tok)
+    return out
+
+
+class BM25Index:
+    """Okapi BM25 over weighted document fields.
+
+    Per-term impact scores are precomputed at build time, so a query is a
+    handful of numpy scatter-adds over posting arrays.
+
+    Args:
+        docs: One mapping of field name to text per document.
+        fields: Field name to weight (a weight of 3 counts each token 3x).
+        k1, b: Standard BM25 parameters.
+    """
+
+    def __init__(self, docs: Sequence[Dict[str, Any]], fields: Dict[str, float],
+                 k1: float = 1.2, b: float = 0.75):
+        self.size = len(docs)
+        vocab: Dict[str, int] = {}
+        term_ids: List[int] = []
+        doc_ids: List[int] = []
+        freqs: List[float] = []
+        lengths = np.zeros(self.size, dtype=np.float32)
+        for i, doc in enumerate(docs):
+            counts: Counter = Counter()
+            for field, weight in fields.items():
+                for tok, n in Counter(tokenize(str(doc.get(field) or ""))).items():
+                    counts[tok] += n * weight
+            for tok, n in counts.items():
+                term_ids.append(vocab.setdefault(tok, len(vocab)))
+                doc_ids.append(i)
+                freqs.append(n)
+            lengths[i] = sum(counts.values())
+
+        terms = np.asarray(term_ids, dtype=np.int32)
+        ids = np.asarray(doc_ids, dtype=np.int32)
+        tf = np.asarray(freqs, dtype=np.float32)
+        order = np.argsort(terms, kind="stable")
+        terms, ids, tf = terms[order], ids[order], tf[order]
+        df = np.bincount(terms, minlength=len(vocab)).astype(np.float32)
+        idf = np.log(1 + (self.size - df + 0.5) / (df + 0.5))
+        avgdl = float(lengths.mean()) if self.size else 0.0
+        norm = k1 * (1 - b + b * lengths / (avgdl or 1.0))
+        impact = (idf[terms] * tf * (k1 + 1) / (tf + norm[ids])).astype(np.float32)
+        offsets = np.concatenate(([0], np.cumsum(df).astype(np.int64)))
+        self._set_postings(list(vocab), offsets, ids, impact)
+
+    def _set_postings(self, vocab: List[str], offsets: np.ndarray,
+                      ids: np.ndarray, impact: np.ndarray) -> None:
+        self._arrays = (vocab, offsets, ids, impact)
+        self._postings: Dict[str, Tuple[np.ndarray, np.ndarray]] = {
+            tok: (ids[offsets[t]:offsets[t + 1]], impact[offsets[t]:offsets[t + 1]])
+            for t, tok in enumerate(vocab)
+        }
+
+    def save(self, path: Path, stamp: str = "") -> None:
+        """Persist postings as ``.npz`` so warm starts skip tokenization."""
+        vocab, offsets, ids, impact = self._arrays
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npz")
+        np.savez(tmp, vocab=np.asarray(vocab, dtype=str), offsets=offsets, ids=ids,
+                 impact=impact, size=np.int64(self.size), stamp=np.asarray(stamp))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path: Path, stamp: str = "") -> Optional["BM25Index"]:
+        """Load a saved index, or None if missing or built from another snapshot."""
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                if str(data["stamp"]) != stamp:
+                    return None
+                index = cls.__new__(cls)
+                index.size = int(data["size"])
+                index._set_postings(data["vocab"].tolist(), data["offsets"],
+                                    data["ids"], data["impact"])
+                return index
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError, KeyError) as e:
+            logger.debug(f"Ignoring unreadable index {path}: {e}")
+            return None
+
+    def __len__(self) -> int:
+        return self.size
+
+    def search(self, query: str, limit: int = 25) -> List[Tuple[int, float]]:
+        """Return ``(doc_index, score)`` pairs for the best matches."""
+        terms = [self._postings[t] for t in set(tokenize(query)) if t in self._postings]
+        if not terms or limit <= 0:
+            return []
+        scores = np.zeros(self.size, dtype=np.float32)
+        for ids, impact in terms:
+            scores[ids] += impact  # ids are unique per term
+        hits = np.flatnonzero(scores)
+        if len(hits) > limit:
+            hits = hits[np.argpartition(-scores[hits], limit - 1)[:limit]]
+        hits = hits[np.argsort(-scores[hits], kind="stable")]
+        return [(int(i), float(scores[i])) for i in hits]
+
+
+class CatalogStore:
+    """Gzipped JSON snapshot of one provider catalog with TTL and ETag.
+
+    Args:
+        name: Catalog name, used as the file name.
+        ttl: Seconds before the snapshot needs revalidation.
+    """
+
+    def __init__(self, name: str, ttl: int = CATALOG_TTL_SECONDS,
+                 directory: Optional[str] = None):
+        self.name = name
+        self.ttl = ttl
+        self.path = Path(directory or cache_dir()) / f"{name}.json.gz"
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """Return ``{"fetched_at", "etag", "rows"}`` or None if absent/corrupt."""
+        try:
+            with gzip.open(self.path, "rt", encoding="utf-8") as fh:
+                entry = json.load(fh)
+            if isinstance(entry.get("rows"), list):
+                return entry
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable {self.name} catalog cache: {e}")
+        return None
+
+    def is_fresh(self, entry: Optional[Dict[str, Any]]) -> bool:
+        return bool(entry) and time.time() - entry.get("fetched_at", 0) < self.ttl
+
+    def save(self, rows: Iterable[Dict[str, Any]], etag: Optional[str] = None) -> Dict[str, Any]:
+        entry = {"fetched_at": time.time(), "etag": etag, "rows": list(rows)}
+        self._write(entry)
+        return entry
+
+    def touch(self, entry: Dict[str, Any]) -> Dict[str, Any]:
+        """Mark a revalidated (304) snapshot as fresh again."""
+        entry["fetched_at"] = time.time()
+        self._write(entry)
+        return entry
+
+    def _write(self, entry: Dict[str, Any]) -> None:
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(f".{os.getpid()}.tmp")
+            with gzip.open(tmp, "wt", encoding="utf-8") as fh:
+                json.dump(entry, fh)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning(f"Could not persist {self.name} catalog: {e}")
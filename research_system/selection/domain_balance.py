@@ -2,6 +2,7 @@ from __future__ import annotations
 from collections import Counter, defaultdict
 from typing import List, Iterable, Dict, Tuple, Set
 from dataclasses import dataclass
+from research_system.tools import authority_index
 from research_system.tools.domain_norm import canonical_domain
 
 @dataclass(frozen=True)
@@ -42,32 +43,16 @@ def get_primary_pool_for_intent(intent: str) -> Set[str]:
 
 def is_primary_source(domain: str, intent: str = "generic") -> bool:
     """Check if a domain is a primary source for the given intent"""
-    primary_pool = get_primary_pool_for_intent(intent)
-    
-    # Check exact match first
-    if domain in primary_pool:
-        return True
-    
-    # Check wildcard patterns
-    for pattern in primary_pool:
-        if pattern.startswith("*."):
-            suffix = pattern[1:]  # Remove the *
-            if domain.endswith(suffix):
-                return True
-    
-    return False
+    pool = intent if intent in PRIMARY_POOLS_BY_INTENT else "generic"
+    # Exact and "*." wildcard entries are compiled into the authority index
+    return f"pool:{pool}" in authority_index.lookup(domain)
 
 def get_domain_family(domain: str) -> str:
     """Get the family name for a domain"""
-    for family_name, domains in DOMAIN_FAMILIES.items():
-        if domain in domains:
+    matches = authority_index.lookup(domain)
+    for family_name in DOMAIN_FAMILIES:
+        if f"family:{family_name}" in matches:
             return family_name
-        # Check wildcards
-        for pattern in domains:
-            if pattern.startswith("*."):
-                suffix = pattern[1:]
-                if domain.endswith(suffix):
-                    return family_name
     return domain  # Return the domain itself if no family found
 
 def _domain(card) -> str:
@@ -1,6 +1,7 @@
 import re
 import math
 from ..guardrails import load_guardrails
+from ..evidence.features import text_features
 
 NUM_PAT = re.compile(
     r"""
@@ -49,7 +50,7 @@ def as_markdown_bullets(claims, max_items=None):
     items = []
     seen = set()
     for c in claims:
-        nums = pick_salient_numbers(extract_numbers(getattr(c,"text","") or ""))
+        nums = pick_salient_numbers(text_features(getattr(c,"text","") or "").numbers)
         if not nums:
             continue
         src = getattr(c,"source",{}) or {}
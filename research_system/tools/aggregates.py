@@ -8,19 +8,15 @@ from collections import defaultdict, Counter
 from urllib.parse import urlparse
 from datetime import datetime
 from .claims import canonical_claim_key, cluster_claims_sbert
+from .domain_parse import parse_host
+from ..evidence.features import text_features
 
 
 def canonical_domain(url: str) -> str:
     """Extract canonical domain from URL"""
     try:
-        netloc = urlparse(url).netloc.lower()
-        # Remove port if present
-        domain = netloc.split(":")[0]
-        # Remove www prefix
-        if domain.startswith("www."):
-            domain = domain[4:]
-        # Return "unknown" if domain is empty
-        return domain if domain else "unknown"
+        # Lower-cased, port and www prefix removed; "unknown" if empty
+        return parse_host(urlparse(url).netloc).bare or "unknown"
     except:
         return "unknown"
 
@@ -63,7 +59,7 @@ def source_quality(cards: List) -> List[Dict]:
         
         # Track unique claims using canonical keys
         claim_text = getattr(card, 'claim', '') or getattr(card, 'snippet', '') or getattr(card, 'title', '')
-        key = canonical_claim_key(claim_text)
+        key = text_features(claim_text).claim_key
         if key:
             slot["unique_claims"].add(key)
             by_claim[key].add(domain)
@@ -241,7 +237,7 @@ def triangulate_claims(cards: List) -> Dict[str, Dict]:
         if i in clustered_indices:
             continue
             
-        key = canonical_claim_key(claim_text)
+        key = text_features(claim_text).claim_key
         if not key:
             continue
             
@@ -64,19 +64,16 @@ def rerank_and_filter(
     
     try:
         # Try to use SBERT for better semantic similarity
-        from sentence_transformers import SentenceTransformer, util
+        from research_system.triangulation.embeddings import encode
         
         logger.debug(f"Using SBERT to rerank {len(candidates)} candidates")
         
-        model = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
-        
-        # Encode key and candidates
-        key_embedding = model.encode([key], normalize_embeddings=True)
+        # Encode key and candidates in one batch through the shared service
         candidate_texts = [text for text, _ in candidates]
-        candidate_embeddings = model.encode(candidate_texts, normalize_embeddings=True)
+        embeddings = encode([key] + candidate_texts, normalize=True)
         
-        # Calculate cosine similarities
-        similarities = util.cos_sim(key_embedding, candidate_embeddings).cpu().tolist()[0]
+        # Embeddings are normalized, so the dot product is the cosine similarity
+        similarities = (embeddings[1:] @ embeddings[0]).tolist()
         
         # Create scored results
         scored = [
@@ -0,0 +1,240 @@
+"""Compiled authority index for primary-source and domain-family lookups.
+
+All authority lists (``resources/primary_domains.yaml``,
+``resources/pack_seed_domains.yaml``, ``config.settings.PRIMARY_ORGS`` /
+``SEMI_AUTHORITATIVE_ORGS``, ``domain_norm.PRIMARY_ORGS`` and the intent
+pools / families of ``selection.domain_balance``) are compiled once into a
+single index:
+
+* an exact-host hash for entries that only match themselves;
+* a reversed-label suffix trie for entries that match a domain and its
+  subdomains (``oecd.org``) or only its subdomains (``*.gov`` / ``.edu``);
+* one combined regex per tag for the few YAML patterns that are not a plain
+  suffix (``\\.gov\\.[a-z]{2}$``).
+
+``lookup(host)`` walks the trie once (O(label count)), returns every tag the
+host matches with the entry that matched it, and is memoized per host
+(``AUTHORITY_INDEX_CACHE_SIZE`` entries). The shared index is rebuilt when
+one of the YAML files changes (checked at most every
+``AUTHORITY_INDEX_RELOAD_SECONDS``) or on ``reload()``.
+
+Tags:
+    primary           default canonical domains of primary_domains.yaml
+    primary:pattern   default patterns of primary_domains.yaml
+    pack:<name>       canonical domains and patterns of a pack section
+    seed:<pack>       pack seed domains
+    authority         settings.PRIMARY_ORGS
+    authority:numeric domain_norm.PRIMARY_ORGS (primary with numeric content)
+    semi              settings.SEMI_AUTHORITATIVE_ORGS
+    pool:<intent>     domain_balance.PRIMARY_POOLS_BY_INTENT
+    family:<name>     domain_balance.DOMAIN_FAMILIES
+"""
+
+from __future__ import annotations
+import logging
+import os
+import re
+import threading
+import time
+from functools import lru_cache
+from pathlib import Path
+from types import MappingProxyType
+from typing import Dict, Iterable, Mapping, Optional, Tuple
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+RESOURCES = Path(__file__).resolve().parents[1] / "resources"
+SOURCES = (RESOURCES / "primary_domains.yaml", RESOURCES / "pack_seed_domains.yaml")
+CACHE_SIZE = int(os.getenv("AUTHORITY_INDEX_CACHE_SIZE", "50000"))
+RELOAD_SECONDS = float(os.getenv("AUTHORITY_INDEX_RELOAD_SECONDS", "5"))
+
+# "\.gov$", "\.gov\.uk$": a pure label suffix, i.e. the wildcard "*.gov"
+_SUFFIX_PATTERN_RE = re.compile(r"^\\\.((?:[a-z0-9-]+\\\.)*[a-z0-9-]+)\$$", re.I)
+
+
+class _Node:
+    __slots__ = ("children", "subtree", "wildcard")
+
+    def __init__(self):
+        self.children: Dict[str, _Node] = {}
+        self.subtree: Dict[str, str] = {}   # tag -> entry; matches this domain and below
+        self.wildcard: Dict[str, str] = {}  # tag -> entry; matches strictly below
+
+
+def _clean(host: str) -> str:
+    return (host or "").strip().lower().rstrip(".")
+
+
+def suffix_of_pattern(pattern: str) -> Optional[str]:
+    """Domain suffix a regex is equivalent to (``\\.gov$`` -> ``gov``), else None."""
+    m = _SUFFIX_PATTERN_RE.match(pattern)
+    return m.group(1).replace("\\.", ".").lower() if m else None
+
+
+class AuthorityIndex:
+    """Exact-host hash + reversed-label suffix trie + regex fallback, by tag.
+
+    Args:
+        cache_size: Hosts memoized by ``lookup``.
+    """
+
+    def __init__(self, cache_size: int = CACHE_SIZE):
+        self._exact: Dict[str, Dict[str, str]] = {}
+        self._root = _Node()
+        self._patterns: Dict[str, list] = {}
+        self._regex: Dict[str, re.Pattern] = {}
+        self._lookup = lru_cache(maxsize=cache_size)(self._match)
+
+    def add(self, entry: str, tag: str, subdomains: bool = False) -> None:
+        """Index one entry under ``tag``.
+
+        ``*.x`` and ``.x`` match strict subdomains of ``x``; a plain host
+        matches itself, plus its subdomains when ``subdomains`` is true.
+        """
+        raw = (entry or "").strip().lower()
+        wildcard = raw.startswith(("*.", "."))
+        host = _clean(raw[2:] if raw.startswith("*.") else raw.lstrip("."))
+        if not host:
+            return
+        if not wildcard and not subdomains:
+            self._exact.setdefault(host, {}).setdefault(tag, entry)
+        else:
+            node = self._root
+            for label in reversed(host.split(".")):
+                node = node.children.setdefault(label, _Node())
+            (node.wildcard if wildcard else node.subtree).setdefault(tag, entry)
+        self._lookup.cache_clear()
+
+    def add_all(self, entries: Iterable[str], tag: str, subdomains: bool = False) -> None:
+        for entry in entries or ():
+            self.add(entry, tag, subdomains)
+
+    def add_pattern(self, pattern: str, tag: str) -> None:
+        """Index a regex; pure suffix patterns go to the trie, others to a combined regex."""
+        suffix = suffix_of_pattern(pattern)
+        if suffix is not None:
+            self.add(f"*.{suffix}", tag)
+            return
+        self._patterns.setdefault(tag, []).append(pattern)
+        self._regex[tag] = re.compile("|".join(f"(?:{p})" for p in self._patterns[tag]), re.I)
+        self._lookup.cache_clear()
+
+    def _match(self, host: str) -> Mapping[str, str]:
+        found: Dict[str, str] = dict(self._exact.get(host, {}))
+        labels = host.split(".")
+        node = self._root
+        for depth, label in enumerate(reversed(labels), 1):
+            node = node.children.get(label)
+            if node is None:
+                break
+            # Deeper (more specific) entries win
+            found.update(node.subtree)
+            if depth < len(labels):
+                found.update(node.wildcard)
+        for tag, regex in self._regex.items():
+            if tag not in found and regex.search(host):
+                found[tag] = next(p for p in self._patterns[tag] if re.search(p, host, re.I))
+        return MappingProxyType(found)
+
+    def lookup(self, host: str) -> Mapping[str, str]:
+        """Read-only ``{tag: matching entry}`` for a bare host (memoized)."""
+        return self._lookup(_clean(host))
+
+    def matches(self, host: str, tag: str) -> bool:
+        return tag in self.lookup(host)
+
+    def cache_info(self):
+        return self._lookup.cache_info()
+
+
+def _load_yaml(path: Path) -> dict:
+    try:
+        return yaml.safe_load(path.read_text()) or {}
+    except FileNotFoundError:
+        return {}
+    except Exception as e:
+        logger.warning(f"Ignoring unreadable authority config {path}: {e}")
+        return {}
+
+
+def build_index() -> AuthorityIndex:
+    """Compile every authority source into a fresh index."""
+    # Imported here: these modules look the index up at call time
+    from research_system.config.settings import PRIMARY_ORGS, SEMI_AUTHORITATIVE_ORGS
+    from research_system.selection.domain_balance import DOMAIN_FAMILIES, PRIMARY_POOLS_BY_INTENT
+    from research_system.tools import domain_norm
+
+    index = AuthorityIndex()
+    primary_cfg = _load_yaml(SOURCES[0])
+    default = primary_cfg.get("default") or {}
+    index.add_all(domain_norm._PRIMARY_ALIASES, "primary")
+    index.add_all(default.get("canonical"), "primary")
+    for pattern in default.get("patterns") or ():
+        index.add_pattern(pattern, "primary:pattern")
+    for pack, section in primary_cfg.items():
+        if pack == "default" or not isinstance(section, dict):
+            continue
+        index.add_all(section.get("canonical"), f"pack:{pack}")
+        for pattern in section.get("patterns") or ():
+            index.add_pattern(pattern, f"pack:{pack}")
+
+    seeds = _load_yaml(SOURCES[1]).get("seed_domains") or {}
+    for pack, domains in seeds.items():
+        index.add_all(domains, f"seed:{pack}", subdomains=True)
+
+    index.add_all(PRIMARY_ORGS, "authority", subdomains=True)
+    index.add_all(domain_norm.PRIMARY_ORGS, "authority:numeric", subdomains=True)
+    index.add_all(SEMI_AUTHORITATIVE_ORGS, "semi", subdomains=True)
+    for intent, pool in PRIMARY_POOLS_BY_INTENT.items():
+        index.add_all(pool, f"pool:{intent}")
+    for family, domains in DOMAIN_FAMILIES.items():
+        index.add_all(domains, f"family:{family}")
+    return index
+
+
+_lock = threading.Lock()
+_index: Optional[AuthorityIndex] = None
+_signature: Optional[Tuple] = None
+_checked = 0.0
+
+
+def _sources_signature() -> Tuple:
+    sig = []
+    for path in SOURCES:
+        try:
+            st = path.stat()
+            sig.append((str(path), st.st_mtime_ns, st.st_size))
+        except OSError:
+            sig.append((str(path), None, None))
+    return tuple(sig)
+
+
+def get_index() -> AuthorityIndex:
+    """Shared index, rebuilt when a source YAML file has changed."""
+    global _index, _signature, _checked
+    now = time.monotonic()
+    if _index is not None and now - _checked < RELOAD_SECONDS:
+        return _index
+    with _lock:
+        signature = _sources_signature()
+        if _index is None or signature != _signature:
+            if _index is not None:
+                logger.info("Authority config changed; rebuilding index")
+            _index, _signature = build_index(), signature
+        _checked = now
+        return _index
+
+
+def reload() -> AuthorityIndex:
+    """Rebuild the shared index now (after editing the Python-side lists)."""
+    global _index, _signature, _checked
+    with _lock:
+        _index, _signature, _checked = build_index(), _sources_signature(), time.monotonic()
+        return _index
+
+
+def lookup(host: str) -> Mapping[str, str]:
+    """``get_index().lookup(host)``."""
+    return get_index().lookup(host)
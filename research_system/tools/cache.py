@@ -1,12 +1,17 @@
-"""HTTP cache with ETag and Last-Modified support."""
+"""HTTP cache with ETag and Last-Modified support.
+
+Responses live in a content-addressed ``HttpCacheStore`` (SQLite index plus
+compressed, de-duplicated body blobs) shared by ``get`` and ``get_binary``.
+"""
 
-import hashlib
-import json
 import os
 import httpx
-from datetime import datetime, timedelta
-from typing import Tuple, Dict, Optional, Any
+from datetime import timedelta
+from functools import lru_cache
+from typing import Tuple, Dict, Optional
 import logging
+
+from .http_store import HttpCacheStore, CachedResponse
 # Use default cache dir
 HTTP_CACHE_DIR = "./.http_cache"
 
@@ -20,39 +25,85 @@ def _get_cache_dir():
 DEFAULT_TTL = timedelta(days=7)
 
 
-def _cache_key(url: str) -> str:
-    """Generate cache key from URL."""
-    return hashlib.sha256(url.encode()).hexdigest()
+@lru_cache(maxsize=None)
+def _store_for(cache_dir: str) -> HttpCacheStore:
+    return HttpCacheStore(cache_dir)
+
+
+def _store() -> HttpCacheStore:
+    """Shared content-addressed store for the current cache directory."""
+    return _store_for(os.path.abspath(_get_cache_dir()))
 
 
-def _cache_path(url: str) -> str:
-    """Get cache file path for URL."""
-    key = _cache_key(url)
-    # Use subdirectories to avoid too many files in one directory
-    subdir = key[:2]
-    return os.path.join(_get_cache_dir(), subdir, f"{key}.json")
+def _header(headers: Dict[str, str], name: str) -> Optional[str]:
+    """Case-insensitive header lookup (httpx lower-cases stored headers)."""
+    name = name.lower()
+    for k, v in headers.items():
+        if k.lower() == name:
+            return v
+    return None
 
 
-def _save_to_cache(path: str, response: httpx.Response):
-    """Save response to cache file."""
+def _save_to_cache(url: str, response: httpx.Response):
+    """Save response to the cache store."""
     try:
-        os.makedirs(os.path.dirname(path), exist_ok=True)
-        
-        cache_data = {
-            "ts": datetime.utcnow().timestamp(),
-            "status": response.status_code,
-            "headers": dict(response.headers),
-            "content": response.text[:2_000_000],  # Limit content size
-            "url": str(response.url)
-        }
-        
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(cache_data, f)
-            
+        _store().put(url, response.status_code, dict(response.headers),
+                     response.content, response.encoding)
     except Exception as e:
         logger.warning(f"Failed to save cache: {e}")
 
 
+def _fetch(
+    url: str,
+    headers: Optional[Dict[str, str]],
+    timeout: int,
+    ttl: Optional[timedelta]
+) -> Tuple[int, Dict[str, str], Optional[CachedResponse], Optional[httpx.Response]]:
+    """Cached GET shared by ``get`` and ``get_binary``.
+    
+    Returns the cached entry when it is fresh or revalidated with a 304,
+    otherwise the new response (already stored).
+    """
+    if ttl is None:
+        ttl = DEFAULT_TTL
+    
+    try:
+        cached = _store().get(url)
+    except Exception as e:
+        logger.warning(f"Cache read error: {e}")
+        cached = None
+    
+    req_headers = dict(headers or {})
+    if cached is not None:
+        if cached.age() < ttl.total_seconds():
+            # Cache is fresh, return it
+            logger.debug(f"Cache hit for {url}")
+            return cached.status, cached.headers, cached, None
+        
+        # Cache is stale, add conditional headers if available
+        etag = _header(cached.headers, "ETag")
+        last_modified = _header(cached.headers, "Last-Modified")
+        if etag:
+            req_headers["If-None-Match"] = etag
+        if last_modified:
+            req_headers["If-Modified-Since"] = last_modified
+    
+    r = httpx.get(url, headers=req_headers, timeout=timeout, follow_redirects=True)
+    
+    if r.status_code == 304 and cached is not None:
+        # Not modified, only the timestamp changes
+        logger.debug(f"304 Not Modified for {url}")
+        try:
+            _store().touch(url)
+        except Exception as e:
+            logger.warning(f"Failed to refresh cache entry: {e}")
+        return cached.status, cached.headers, cached, None
+    
+    # No cache or content has changed, save new version
+    _save_to_cache(url, r)
+    return r.status_code, dict(r.headers), None, r
+
+
 def get(
     url: str,
     headers: Optional[Dict[str, str]] = None,
@@ -71,65 +122,8 @@ def get(
     Returns:
         Tuple of (status_code, headers, content)
     """
-    if ttl is None:
-        ttl = DEFAULT_TTL
-        
-    os.makedirs(_get_cache_dir(), exist_ok=True)
-    cache_path = _cache_path(url)
-    
-    # Check cache
-    if os.path.exists(cache_path):
-        try:
-            with open(cache_path, "r", encoding="utf-8") as f:
-                cache_data = json.load(f)
-            
-            # Check if cache is still valid
-            cache_age = datetime.utcnow().timestamp() - cache_data["ts"]
-            
-            if cache_age < ttl.total_seconds():
-                # Cache is fresh, return it
-                logger.debug(f"Cache hit for {url}")
-                return (
-                    cache_data["status"],
-                    cache_data["headers"],
-                    cache_data["content"]
-                )
-            
-            # Cache is stale, try conditional GET
-            req_headers = headers or {}
-            
-            # Add conditional headers if available
-            if "ETag" in cache_data["headers"]:
-                req_headers["If-None-Match"] = cache_data["headers"]["ETag"]
-            if "Last-Modified" in cache_data["headers"]:
-                req_headers["If-Modified-Since"] = cache_data["headers"]["Last-Modified"]
-            
-            # Make conditional request
-            r = httpx.get(url, headers=req_headers, timeout=timeout, follow_redirects=True)
-            
-            if r.status_code == 304:
-                # Not modified, update timestamp and return cached content
-                logger.debug(f"304 Not Modified for {url}")
-                cache_data["ts"] = datetime.utcnow().timestamp()
-                with open(cache_path, "w", encoding="utf-8") as f:
-                    json.dump(cache_data, f)
-                return (
-                    cache_data["status"],
-                    cache_data["headers"],
-                    cache_data["content"]
-                )
-            
-            # Content has changed, save new version
-            _save_to_cache(cache_path, r)
-            return r.status_code, dict(r.headers), r.text
-            
-        except Exception as e:
-            logger.warning(f"Cache read error: {e}")
-    
-    # No cache or error, make fresh request
-    r = httpx.get(url, headers=headers, timeout=timeout, follow_redirects=True)
-    _save_to_cache(cache_path, r)
-    return r.status_code, dict(r.headers), r.text
+    status, resp_headers, cached, r = _fetch(url, headers, timeout, ttl)
+    return status, resp_headers, (cached.text() if cached is not None else r.text)
 
 
 def get_binary(
@@ -150,66 +144,15 @@ def get_binary(
     Returns:
         Tuple of (status_code, headers, content_bytes)
     """
-    if ttl is None:
-        ttl = DEFAULT_TTL
-        
-    os.makedirs(_get_cache_dir(), exist_ok=True)
-    
-    # Use separate binary cache
-    key = _cache_key(url)
-    subdir = key[:2]
-    cache_path = os.path.join(_get_cache_dir(), subdir, f"{key}.bin")
-    meta_path = os.path.join(_get_cache_dir(), subdir, f"{key}.meta.json")
-    
-    # Check cache
-    if os.path.exists(cache_path) and os.path.exists(meta_path):
-        try:
-            with open(meta_path, "r", encoding="utf-8") as f:
-                meta = json.load(f)
-            
-            # Check if cache is still valid
-            cache_age = datetime.utcnow().timestamp() - meta["ts"]
-            
-            if cache_age < ttl.total_seconds():
-                # Cache is fresh
-                logger.debug(f"Binary cache hit for {url}")
-                with open(cache_path, "rb") as f:
-                    content = f.read()
-                return meta["status"], meta["headers"], content
-                
-        except Exception as e:
-            logger.warning(f"Binary cache read error: {e}")
-    
-    # Make fresh request
-    r = httpx.get(url, headers=headers, timeout=timeout, follow_redirects=True)
-    
-    # Save to cache
-    try:
-        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
-        
-        with open(cache_path, "wb") as f:
-            f.write(r.content)
-        
-        meta = {
-            "ts": datetime.utcnow().timestamp(),
-            "status": r.status_code,
-            "headers": dict(r.headers),
-            "url": str(r.url)
-        }
-        
-        with open(meta_path, "w", encoding="utf-8") as f:
-            json.dump(meta, f)
-            
-    except Exception as e:
-        logger.warning(f"Failed to save binary cache: {e}")
-    
-    return r.status_code, dict(r.headers), r.content
+    status, resp_headers, cached, r = _fetch(url, headers, timeout, ttl)
+    return status, resp_headers, (cached.body if cached is not None else r.content)
 
 
 def clear_cache():
     """Clear all cached files."""
     import shutil
     
+    _store_for.cache_clear()
     if os.path.exists(_get_cache_dir()):
         try:
             cache_dir = _get_cache_dir()
@@ -219,19 +162,13 @@ def clear_cache():
             logger.error(f"Failed to clear cache: {e}")
 
 
-def get_cache_size() -> int:
-    """Get total size of cache in bytes."""
-    total_size = 0
-    
+def get_cache_stats() -> Dict[str, int]:
+    """Entry, blob and compressed byte counts of the cache."""
     if not os.path.exists(_get_cache_dir()):
-        return 0
-    
-    for dirpath, _, filenames in os.walk(_get_cache_dir()):
-        for filename in filenames:
-            filepath = os.path.join(dirpath, filename)
-            try:
-                total_size += os.path.getsize(filepath)
-            except Exception:
-                pass
-                
-    return total_size
\ No newline at end of file
+        return {"entries": 0, "blobs": 0, "bytes": 0}
+    return _store().stats()
+
+
+def get_cache_size() -> int:
+    """Get total size of cached bodies in bytes (compressed)."""
+    return get_cache_stats()["bytes"]
@@ -7,7 +7,6 @@ import re
 import hashlib
 from typing import Optional, List, Set
 import numpy as np
-from sentence_transformers import SentenceTransformer
 from sklearn.metrics.pairwise import cosine_similarity
 from sklearn.cluster import AgglomerativeClustering
 
@@ -62,9 +61,8 @@ def cluster_claims_sbert(texts: List[str], min_size: int = 2, cos_threshold: flo
         return []
     
     try:
-        # Use a lightweight model for fast inference
-        model = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
-        embeddings = model.encode(texts, normalize_embeddings=True, show_progress_bar=False)
+        from research_system.triangulation.embeddings import encode
+        embeddings = encode(texts, normalize=True)
         
         # Calculate pairwise cosine similarity
         similarity_matrix = cosine_similarity(embeddings)
@@ -4,7 +4,8 @@ Contradiction detection for conflicting numeric claims
 
 from __future__ import annotations
 from typing import List, Dict, Any
-from .claim_struct import extract_struct_claim, struct_key, numbers_close
+from .claim_struct import numbers_close
+from ..evidence.features import text_features
 
 def find_numeric_conflicts(texts: List[str], tol: float = 0.10) -> List[Dict[str, Any]]:
     """
@@ -22,12 +23,12 @@ def find_numeric_conflicts(texts: List[str], tol: float = 0.10) -> List[Dict[str
         - claims: The structured claims involved
     """
     # Extract structured claims
-    scs = [extract_struct_claim(t) for t in texts]
+    features = [text_features(t) for t in texts]
     
     # Group by key
     by_key = {}
-    for i, sc in enumerate(scs):
-        k = struct_key(sc)
+    for i, f in enumerate(features):
+        sc, k = f.struct_claim, f.struct_key
         if not k:
             continue
         by_key.setdefault(k, []).append((i, sc))
@@ -7,6 +7,8 @@ import re
 import logging
 from typing import Optional, Dict, Any
 
+from .doi_service import crossref_work, unpaywall_record
+
 log = logging.getLogger(__name__)
 
 # API endpoints
@@ -26,12 +28,9 @@ def crossref_meta(doi: str, email: str = "ci@example.org") -> Optional[Dict[str,
     """
     try:
         headers = {"User-Agent": f"research-agent/1.0 (+mailto:{email})"}
-        r = httpx.get(CR_BASE + doi, headers=headers, timeout=20)
-        
-        if r.status_code != 200:
+        j = crossref_work(doi, headers=headers, timeout=20)
+        if not j:
             return None
-            
-        j = r.json().get("message", {})
         
         # Extract title
         title = " ".join(j.get("title", [])[:1]).strip()
@@ -80,14 +79,10 @@ def unpaywall_meta(doi: str, email: str = "ci@example.org") -> Optional[Dict[str
         Dict with title and OA URL if successful, None otherwise
     """
     try:
-        params = {"email": email}
         headers = {"User-Agent": f"research-agent/1.0 (+mailto:{email})"}
-        r = httpx.get(UPW_BASE + doi, params=params, headers=headers, timeout=20)
-        
-        if r.status_code != 200:
+        j = unpaywall_record(doi, email, headers=headers, timeout=20)
+        if not j:
             return None
-            
-        j = r.json()
         
         title = j.get("title") or ""
         
@@ -157,27 +152,17 @@ def doi_rescue(doi: str, email: str = "ci@example.org", fetch_pdf: bool = True)
     # If we have OA URL and no abstract yet, try to fetch PDF
     if fetch_pdf and combined.get("oa_url") and not combined.get("abstract"):
         try:
-            from research_system.net.pdf_fetch import download_pdf
-            import pypdf
-            from io import BytesIO
+            from research_system.net.pdf_fetch import download_pdf_path
+            from research_system.tools.pdf_extract import extract_pdf_text
             
             log.info(f"Attempting to fetch PDF from Unpaywall OA URL: {combined['oa_url']}")
             
             with httpx.Client() as client:
-                pdf_content = download_pdf(client, combined["oa_url"])
-                
-            if pdf_content:
-                # Extract text from first few pages
-                reader = pypdf.PdfReader(BytesIO(pdf_content))
-                text_parts = []
-                max_pages = min(3, len(reader.pages))  # First 3 pages
-                
-                for page_num in range(max_pages):
-                    page_text = reader.pages[page_num].extract_text()
-                    if page_text:
-                        text_parts.append(page_text)
+                pdf_path = download_pdf_path(client, combined["oa_url"])
                 
-                full_text = "\n".join(text_parts)
+            if pdf_path:
+                # Extract text from first 3 pages of the spooled file (page text is cached)
+                full_text = extract_pdf_text(pdf_path, max_pages=3).get("text", "").strip()
                 # Take first 5000 chars as abstract
                 if full_text:
                     combined["abstract"] = full_text[:5000]
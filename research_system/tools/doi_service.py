@@ -0,0 +1,425 @@
+"""Batched, persistently cached DOI metadata lookups.
+
+The per-DOI helpers (``doi_fallback.crossref_meta``, ``unpaywall_meta``,
+``connectors.semantics.s2_by_doi``, ``connectors.core.core_by_doi``, the
+paywall resolver) each issued one request per DOI, and the orchestrator
+resolved doi.org URLs one redirect chain at a time. This module gives them a
+shared SQLite cache (``DOI_CACHE_DIR``) of raw provider records keyed by
+``(doi, source)``, and ``DoiService`` fills it for every DOI of a run at
+once through the bulk endpoints:
+
+* OpenAlex ``/works?filter=doi:a|b|...`` (up to 50 DOIs per request);
+* Crossref ``/works?filter=doi:a,doi:b,...`` (``CROSSREF_BATCH`` per request);
+* Semantic Scholar ``POST /graph/v1/paper/batch``.
+
+Found records are kept for ``DOI_CACHE_TTL_DAYS``; DOIs a provider does not
+know are remembered as misses for ``DOI_CACHE_NEGATIVE_TTL_HOURS`` so they are
+not asked for again in the same run. Transient errors are never cached.
+"""
+
+from __future__ import annotations
+import asyncio
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+from urllib.parse import urlparse
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+DOI_CACHE_DIR = "./.doi_cache"
+TTL = float(os.getenv("DOI_CACHE_TTL_DAYS", "30")) * 86400
+NEGATIVE_TTL = float(os.getenv("DOI_CACHE_NEGATIVE_TTL_HOURS", "24")) * 3600
+
+OPENALEX_BATCH = 50
+CROSSREF_BATCH = int(os.getenv("CROSSREF_BATCH", "20"))
+S2_BATCH = 500
+S2_FIELDS = "title,abstract,year,venue,openAccessPdf,externalIds"
+
+OPENALEX_WORKS = "https://api.openalex.org/works"
+CROSSREF_WORKS = "https://api.crossref.org/works"
+S2_PAPER = "https://api.semanticscholar.org/graph/v1/paper"
+UNPAYWALL_BASE = "https://api.unpaywall.org/v2/"
+CORE_WORKS = "https://api.core.ac.uk/v3/search/works"
+
+# Landing-page resolution of DOIs no metadata source had a URL for
+RESOLVE_WORKERS = int(os.getenv("DOI_RESOLVE_CONCURRENCY", "8"))
+
+_DOI_RX = re.compile(r"10\.\d{4,9}/\S+", re.I)
+# Crossref's reference lists are large and never read
+_DROP_KEYS = {"crossref": ("reference",)}
+
+_MISSING = object()
+
+
+def normalize_doi(doi: str) -> str:
+    """Bare lower-case DOI (``10.x/y``) from a DOI, ``doi:`` or doi.org URL."""
+    doi = (doi or "").strip()
+    m = _DOI_RX.search(doi)
+    if m:
+        doi = m.group(0)
+    return doi.rstrip(".,;").lower()
+
+
+def _doi_from_url(url: str) -> Optional[str]:
+    host = (urlparse(url or "").hostname or "").lower()
+    if host.endswith("doi.org"):
+        m = _DOI_RX.search(urlparse(url).path)
+        return normalize_doi(m.group(0)) if m else None
+    return None
+
+
+def collect_dois(cards: Iterable[Any]) -> List[str]:
+    """Unique DOIs of evidence cards, from ``doi`` fields and DOI-bearing URLs."""
+    from .doi_fallback import extract_doi_from_url
+
+    seen: Dict[str, None] = {}
+    for c in cards:
+        for doi in (getattr(c, "doi", None),
+                    extract_doi_from_url(getattr(c, "url", None) or "")):
+            if doi:
+                seen.setdefault(normalize_doi(doi), None)
+    return list(seen)
+
+
+class DoiCache:
+    """SQLite cache of raw DOI records per source, with positive and negative TTLs.
+
+    Args:
+        root: Cache directory (``DOI_CACHE_DIR``).
+        ttl: Seconds a found record stays valid (``DOI_CACHE_TTL_DAYS``).
+        negative_ttl: Seconds a miss is remembered (``DOI_CACHE_NEGATIVE_TTL_HOURS``).
+    """
+
+    def __init__(self, root: str, ttl: Optional[float] = None,
+                 negative_ttl: Optional[float] = None):
+        self.path = os.path.join(root, "doi.sqlite")
+        self.ttl = TTL if ttl is None else ttl
+        self.negative_ttl = NEGATIVE_TTL if negative_ttl is None else negative_ttl
+        os.makedirs(root, exist_ok=True)
+        self._local = threading.local()
+        with self._transaction() as db:
+            db.execute("CREATE TABLE IF NOT EXISTS records "
+                       "(doi TEXT NOT NULL, source TEXT NOT NULL, payload TEXT, "
+                       "fetched REAL NOT NULL, PRIMARY KEY (doi, source))")
+
+    def _db(self) -> sqlite3.Connection:
+        # Connections must not cross a fork, so they are keyed by pid too
+        db = getattr(self._local, "db", None)
+        if db is None or self._local.pid != os.getpid():
+            db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            self._local.db, self._local.pid = db, os.getpid()
+        return db
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        db = self._db()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            yield db
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        db.execute("COMMIT")
+
+    def get_many(self, source: str, dois: Sequence[str]) -> Dict[str, Optional[dict]]:
+        """Fresh cached records; a DOI maps to ``None`` if it is a known miss.
+
+        DOIs absent from the result are not cached or have expired.
+        """
+        now = time.time()
+        found: Dict[str, Optional[dict]] = {}
+        db = self._db()
+        for i in range(0, len(dois), 500):
+            chunk = list(dois[i:i + 500])
+            rows = db.execute(
+                f"SELECT doi, payload, fetched FROM records WHERE source = ? "
+                f"AND doi IN ({','.join('?' * len(chunk))})", [source, *chunk]
+            ).fetchall()
+            for doi, payload, fetched in rows:
+                ttl = self.ttl if payload is not None else self.negative_ttl
+                if now - fetched < ttl:
+                    found[doi] = json.loads(payload) if payload is not None else None
+        return found
+
+    def get(self, source: str, doi: str) -> Any:
+        """Cached record, ``None`` for a known miss, or ``_MISSING``."""
+        return self.get_many(source, [doi]).get(doi, _MISSING)
+
+    def put_many(self, source: str, records: Dict[str, Optional[dict]]) -> None:
+        """Store records (``None`` marks a miss)."""
+        drop = _DROP_KEYS.get(source, ())
+        now = time.time()
+        rows = []
+        for doi, rec in records.items():
+            if rec is not None and drop:
+                rec = {k: v for k, v in rec.items() if k not in drop}
+            rows.append((doi, source, json.dumps(rec) if rec is not None else None, now))
+        with self._transaction() as db:
+            db.executemany("INSERT OR REPLACE INTO records (doi, source, payload, fetched) "
+                           "VALUES (?, ?, ?, ?)", rows)
+
+    def put(self, source: str, doi: str, record: Optional[dict]) -> None:
+        self.put_many(source, {doi: record})
+
+    def purge(self) -> int:
+        """Delete expired rows; returns how many were removed."""
+        now = time.time()
+        with self._transaction() as db:
+            cur = db.execute("DELETE FROM records WHERE (payload IS NOT NULL AND fetched < ?) "
+                             "OR (payload IS NULL AND fetched < ?)",
+                             (now - self.ttl, now - self.negative_ttl))
+            return cur.rowcount
+
+    def stats(self) -> Dict[str, int]:
+        """Row counts per source."""
+        rows = self._db().execute("SELECT source, COUNT(*) FROM records GROUP BY source").fetchall()
+        return dict(rows)
+
+
+@lru_cache(maxsize=None)
+def _cache_for(cache_dir: str) -> DoiCache:
+    return DoiCache(cache_dir)
+
+
+def doi_cache() -> DoiCache:
+    """Shared DOI cache for the current ``DOI_CACHE_DIR``."""
+    return _cache_for(os.path.abspath(os.environ.get("DOI_CACHE_DIR", DOI_CACHE_DIR)))
+
+
+def cached_record(source: str, doi: str,
+                  fetch: Callable[[str], Optional[dict]]) -> Optional[dict]:
+    """Read-through lookup of one DOI record.
+
+    ``fetch`` returns the record, ``None`` when the source does not know the
+    DOI, and raises on transient errors (which are not cached).
+    """
+    key = normalize_doi(doi)
+    try:
+        cache = doi_cache()
+        hit = cache.get(source, key)
+    except Exception as e:
+        logger.debug(f"DOI cache unavailable: {e}")
+        cache, hit = None, _MISSING
+    if hit is not _MISSING:
+        return hit
+    record = fetch(doi)
+    if cache is not None:
+        try:
+            cache.put(source, key, record)
+        except Exception as e:
+            logger.debug(f"DOI cache write failed for {doi}: {e}")
+    return record
+
+
+def _json_or_miss(r: httpx.Response) -> Optional[dict]:
+    if r.status_code == 200:
+        return r.json()
+    if r.status_code in (400, 404):
+        return None
+    raise httpx.HTTPStatusError(f"status {r.status_code}", request=r.request, response=r)
+
+
+# -- single-DOI accessors ----------------------------------------------------
+
+def crossref_work(doi: str, headers: Optional[Dict[str, str]] = None,
+                  timeout: float = 20) -> Optional[dict]:
+    """Crossref ``message`` record of a DOI, or ``None``."""
+    def fetch(d):
+        r = _json_or_miss(httpx.get(f"{CROSSREF_WORKS}/{d}", headers=headers, timeout=timeout))
+        return r.get("message") if r else None
+    return cached_record("crossref", doi, fetch)
+
+
+def unpaywall_record(doi: str, email: str, headers: Optional[Dict[str, str]] = None,
+                     timeout: float = 20) -> Optional[dict]:
+    """Unpaywall record of a DOI, or ``None``."""
+    def fetch(d):
+        return _json_or_miss(httpx.get(UNPAYWALL_BASE + d, params={"email": email},
+                                       headers=headers, timeout=timeout))
+    return cached_record("unpaywall", doi, fetch)
+
+
+def s2_paper(doi: str, timeout: float = 20) -> Optional[dict]:
+    """Semantic Scholar paper record of a DOI, or ``None``."""
+    def fetch(d):
+        return _json_or_miss(httpx.get(f"{S2_PAPER}/DOI:{d}", params={"fields": S2_FIELDS},
+                                       timeout=timeout))
+    return cached_record("s2", doi, fetch)
+
+
+def core_work(doi: str, timeout: float = 20) -> Optional[dict]:
+    """First CORE search hit for a DOI, or ``None``."""
+    def fetch(d):
+        data = _json_or_miss(httpx.get(CORE_WORKS, params={"q": f"doi:{d}", "limit": 1},
+                                       headers={"Accept": "application/json"}, timeout=timeout))
+        hits = (data or {}).get("results") or []
+        return hits[0] if hits else None
+    return cached_record("core", doi, fetch)
+
+
+# -- batched lookups ---------------------------------------------------------
+
+def _chunks(items: Sequence[str], size: int) -> Iterator[List[str]]:
+    for i in range(0, len(items), size):
+        yield list(items[i:i + size])
+
+
+async def _openalex_batch(dois: List[str]) -> Dict[str, Optional[dict]]:
+    from research_system.providers.http import async_http_json_with_policy
+    data = await async_http_json_with_policy(
+        "openalex", "GET", OPENALEX_WORKS,
+        params={"filter": "doi:" + "|".join(dois), "per-page": len(dois)},
+    )
+    found = {normalize_doi(w.get("doi") or ""): w for w in data.get("results") or []}
+    return {d: found.get(d) for d in dois}
+
+
+async def _crossref_batch(dois: List[str]) -> Dict[str, Optional[dict]]:
+    from research_system.providers.http import async_http_json_with_policy
+    data = await async_http_json_with_policy(
+        "crossref", "GET", CROSSREF_WORKS,
+        params={"filter": ",".join(f"doi:{d}" for d in dois), "rows": len(dois)},
+    )
+    items = (data.get("message") or {}).get("items") or []
+    found = {normalize_doi(w.get("DOI") or ""): w for w in items}
+    return {d: found.get(d) for d in dois}
+
+
+async def _s2_batch(dois: List[str]) -> Dict[str, Optional[dict]]:
+    from research_system.providers.http import async_http_json_with_policy
+    data = await async_http_json_with_policy(
+        "semanticscholar", "POST", f"{S2_PAPER}/batch",
+        params={"fields": S2_FIELDS}, data={"ids": [f"DOI:{d}" for d in dois]},
+    )
+    # The batch endpoint answers with one entry (or null) per requested id
+    papers = data if isinstance(data, list) else []
+    return {d: (p or None) for d, p in zip(dois, papers)}
+
+
+_BATCHERS: Dict[str, Tuple[Callable, int]] = {
+    "openalex": (_openalex_batch, OPENALEX_BATCH),
+    "crossref": (_crossref_batch, CROSSREF_BATCH),
+    "s2": (_s2_batch, S2_BATCH),
+}
+
+PREFETCH_SOURCES = tuple(s.strip() for s in os.getenv("DOI_PREFETCH_SOURCES", "crossref,openalex").split(",")
+                         if s.strip() in _BATCHERS)
+
+
+class DoiService:
+    """Resolves all DOIs of a run concurrently through bulk endpoints.
+
+    Args:
+        cache: DOI cache; defaults to the shared ``doi_cache()``.
+        resolver: Redirect-following resolver for DOIs no metadata source
+            has a landing URL for (``tools.doi.resolve_doi``).
+    """
+
+    def __init__(self, cache: Optional[DoiCache] = None,
+                 resolver: Optional[Callable[[str], Optional[str]]] = None):
+        self.cache = cache or doi_cache()
+        if resolver is None:
+            from .doi import resolve_doi as resolver
+        self.resolver = resolver
+
+    def prefetch(self, dois: Iterable[str],
+                 sources: Sequence[str] = PREFETCH_SOURCES) -> Dict[str, int]:
+        """Fetch every uncached DOI from each source; returns fetched counts."""
+        from research_system.enrich.fetch_stage import _run
+
+        # Commas and pipes separate DOIs in the filter syntax
+        keys = list(dict.fromkeys(normalize_doi(d) for d in dois if d))
+        keys = [d for d in keys if "," not in d and "|" not in d]
+        todo = {}
+        for source in sources:
+            cached = self.cache.get_many(source, keys)
+            missing = [d for d in keys if d not in cached]
+            if missing:
+                todo[source] = missing
+        if not todo:
+            return {}
+        return _run(self._prefetch(todo))
+
+    async def _prefetch(self, todo: Dict[str, List[str]]) -> Dict[str, int]:
+        jobs = [(source, chunk) for source, dois in todo.items()
+                for chunk in _chunks(dois, _BATCHERS[source][1])]
+        results = await asyncio.gather(*(_BATCHERS[s][0](chunk) for s, chunk in jobs),
+                                       return_exceptions=True)
+        counts: Dict[str, int] = {}
+        for (source, chunk), res in zip(jobs, results):
+            if isinstance(res, BaseException):
+                logger.debug(f"{source} DOI batch of {len(chunk)} failed: {res}")
+                continue
+            self.cache.put_many(source, res)
+            counts[source] = counts.get(source, 0) + sum(1 for r in res.values() if r)
+        logger.info(f"DOI prefetch: {counts} found for {sum(map(len, todo.values()))} lookups")
+        return counts
+
+    def records(self, source: str, dois: Iterable[str]) -> Dict[str, Optional[dict]]:
+        """Records of DOIs from one source, batch-fetching the uncached ones."""
+        keys = list(dict.fromkeys(normalize_doi(d) for d in dois if d))
+        self.prefetch(keys, sources=(source,))
+        return self.cache.get_many(source, keys)
+
+    def landing_urls(self, urls: Iterable[str]) -> Dict[str, str]:
+        """Publisher landing pages for doi.org URLs.
+
+        Uses Crossref's registered resource URL or OpenAlex's landing page from
+        the (batched) metadata, and follows the doi.org redirect chain
+        concurrently only for DOIs neither source knows. URLs that cannot be
+        resolved are left out.
+        """
+        by_doi: Dict[str, List[str]] = {}
+        for url in urls:
+            doi = _doi_from_url(url)
+            if doi:
+                by_doi.setdefault(doi, []).append(url)
+        if not by_doi:
+            return {}
+
+        dois = list(by_doi)
+        landing = {d: r["url"] for d, r in self.cache.get_many("landing", dois).items() if r}
+        pending = [d for d in dois if d not in landing]
+        if pending:
+            self.prefetch(pending, sources=("crossref", "openalex"))
+            crossref = self.cache.get_many("crossref", pending)
+            openalex = self.cache.get_many("openalex", pending)
+            for d in pending:
+                url = _crossref_landing(crossref.get(d)) or _openalex_landing(openalex.get(d))
+                if url:
+                    landing[d] = url
+            unresolved = [d for d in pending if d not in landing]
+            if unresolved:
+                with ThreadPoolExecutor(max_workers=max(1, RESOLVE_WORKERS)) as pool:
+                    resolved = pool.map(lambda d: self.resolver(by_doi[d][0]), unresolved)
+                    for d, url in zip(unresolved, resolved):
+                        if url and not _is_doi_host(url):
+                            landing[d] = url
+            self.cache.put_many("landing", {d: {"url": landing[d]} for d in pending if d in landing})
+
+        return {url: landing[d] for d, group in by_doi.items() if d in landing for url in group}
+
+
+def _is_doi_host(url: str) -> bool:
+    return (urlparse(url).hostname or "").lower().endswith("doi.org")
+
+
+def _crossref_landing(record: Optional[dict]) -> Optional[str]:
+    url = ((record or {}).get("resource") or {}).get("primary", {}).get("URL")
+    return url if url and not _is_doi_host(url) else None
+
+
+def _openalex_landing(record: Optional[dict]) -> Optional[str]:
+    url = ((record or {}).get("primary_location") or {}).get("landing_page_url")
+    return url if url and not _is_doi_host(url) else None
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 import re
-import httpx
 import datetime as dt
 from typing import Optional, Dict, Any
 
+from .doi_service import crossref_work
+
 # Pattern to extract DOI from URLs
 _DOI_RE = re.compile(r"/doi/(?:abs/|pdf/|full/)?(?P<doi>10\.\d{4,9}/[^\s?#]+)", re.I)
 
@@ -37,15 +38,9 @@ def crossref_meta(doi: str) -> Dict[str, Any]:
         Dictionary with title, abstract, date fields (may be empty)
     """
     try:
-        r = httpx.get(
-            f"https://api.crossref.org/works/{doi}",
-            timeout=20,
-            headers={"User-Agent": "ResearchAgent/1.0"}
-        )
-        if r.status_code != 200:
+        item = crossref_work(doi, headers={"User-Agent": "ResearchAgent/1.0"}, timeout=20)
+        if not item:
             return {}
-            
-        item = r.json().get("message", {})
         
         # Extract title (first item in title array)
         title = (item.get("title") or [None])[0]
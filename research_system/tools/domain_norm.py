@@ -6,6 +6,9 @@ from pathlib import Path
 import yaml
 import re
 
+from . import authority_index
+from .domain_parse import DomainParts, parse_host
+
 _PRIMARY_ALIASES = {
     # UNWTO family
     "unwto.org": {"unwto.org", "www.unwto.org", "e-unwto.org",
@@ -47,50 +50,40 @@ def load_primary_domains():
 # Load primary domains on module init
 PRIMARY_CONFIG = load_primary_domains()
 
-def canonical_domain(url_or_domain: str) -> str:
-    """Convert URL or domain to canonical form."""
+def _host_parts(url_or_domain: str) -> DomainParts:
+    """Memoized parts of the host of a URL or bare domain."""
     host = url_or_domain
     if "://" in (url_or_domain or ""):
         try:
             host = urlparse(url_or_domain).netloc
         except Exception:
             host = url_or_domain
-    host = (host or "").lower()
-    # strip port
-    host = host.split(":")[0]
+    # parse_host lower-cases and strips the port
+    return parse_host(host or "")
+
+def canonical_domain(url_or_domain: str) -> str:
+    """Convert URL or domain to canonical form."""
+    host = _host_parts(url_or_domain).host
     return _CANON.get(host, host)
 
 def normalize_domain(url_or_domain: str) -> str:
     """Extract and normalize domain from URL or domain string."""
-    host = url_or_domain
-    if "://" in (url_or_domain or ""):
-        try:
-            host = urlparse(url_or_domain).netloc
-        except Exception:
-            host = url_or_domain
-    host = (host or "").lower()
-    # strip port
-    host = host.split(":")[0]
     # strip www prefix for consistency
-    if host.startswith("www."):
-        host = host[4:]
-    return host
+    return _host_parts(url_or_domain).bare
 
 def is_primary_domain(url_or_domain: str, additional_domains: set[str] = None, patterns: list = None) -> bool:
     """Check if domain is a primary source."""
     domain = canonical_domain(url_or_domain)
+    matches = authority_index.lookup(domain)
     
     # Check against primary canonicals and any additional domains
-    domains_to_check = PRIMARY_CANONICALS
-    if additional_domains:
-        domains_to_check = domains_to_check | additional_domains
-    
-    if domain in domains_to_check:
+    if "primary" in matches or (additional_domains and domain in additional_domains):
         return True
     
-    # Check against patterns
-    patterns_to_check = patterns if patterns is not None else PRIMARY_PATTERNS
-    for pattern in patterns_to_check:
+    # Check against patterns (the default ones are compiled into the index)
+    if patterns is None:
+        return "primary:pattern" in matches
+    for pattern in patterns:
         if pattern.search(domain):
             return True
     
@@ -121,25 +114,24 @@ def is_primary_domain_enhanced(url_or_domain: str, card=None) -> bool:
     # v8.24.0: Check if this is an authoritative org with numeric content
     domain = canonical_domain(url_or_domain)
     
-    # Check if domain is an authoritative organization
-    for org in PRIMARY_ORGS:
-        if domain.endswith(org):
-            # If we have a card, check for numeric tokens
-            if card:
-                numeric_token_count = getattr(card, "numeric_token_count", 0)
-                # Also check for numbers in the text if numeric_token_count not set
-                if numeric_token_count == 0:
-                    text = getattr(card, "snippet", "") or getattr(card, "supporting_text", "")
-                    import re
-                    numbers = re.findall(r'\b\d+(?:\.\d+)?%?\b', text)
-                    numeric_token_count = len(numbers)
-                
-                # Consider primary if has 2+ numeric signals
-                if numeric_token_count >= 2:
-                    return True
-            else:
-                # Without card context, authoritative orgs are borderline primary
-                # Let caller decide based on other factors
-                return False
+    # Check if domain is (a subdomain of) an authoritative organization
+    if "authority:numeric" in authority_index.lookup(domain):
+        # If we have a card, check for numeric tokens
+        if card:
+            numeric_token_count = getattr(card, "numeric_token_count", 0)
+            # Also check for numbers in the text if numeric_token_count not set
+            if numeric_token_count == 0:
+                text = getattr(card, "snippet", "") or getattr(card, "supporting_text", "")
+                import re
+                numbers = re.findall(r'\b\d+(?:\.\d+)?%?\b', text)
+                numeric_token_count = len(numbers)
+            
+            # Consider primary if has 2+ numeric signals
+            if numeric_token_count >= 2:
+                return True
+        else:
+            # Without card context, authoritative orgs are borderline primary
+            # Let caller decide based on other factors
+            return False
     
     return False
\ No newline at end of file
@@ -0,0 +1,153 @@
+"""Offline, memoized host and registrable-domain parsing.
+
+Registrable domains (``bbc.co.uk`` for ``news.bbc.co.uk``) are computed from
+the public suffix list snapshot bundled in
+``resources/public_suffix_list.dat`` (ICANN section only, like tldextract's
+default), so parsing never touches the network. Update the snapshot by
+replacing that file with https://publicsuffix.org/list/public_suffix_list.dat.
+
+``parse_host`` is the one implementation behind ``url_norm.domain_of``,
+``domain_norm.canonical_domain`` / ``normalize_domain`` and
+``aggregates.canonical_domain``; it is LRU-cached by host
+(``DOMAIN_PARSE_CACHE_SIZE`` entries).
+"""
+
+from __future__ import annotations
+import ipaddress
+import os
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import FrozenSet, NamedTuple, Tuple
+
+PSL_PATH = Path(__file__).resolve().parents[1] / "resources" / "public_suffix_list.dat"
+CACHE_SIZE = int(os.getenv("DOMAIN_PARSE_CACHE_SIZE", "100000"))
+
+_SCHEME_RE = re.compile(r"^(?:[a-z][a-z0-9+.-]*:)?//", re.I)
+_PATH_RE = re.compile(r"[/?#\\]")
+
+
+class DomainParts(NamedTuple):
+    """A host split at its public suffix.
+
+    ``host`` is the lower-cased input without port, exactly as the domain
+    helpers have always keyed it; the other fields come from the cleaned host
+    (no credentials, brackets or trailing dot).
+    """
+    host: str
+    subdomain: str
+    domain: str
+    suffix: str
+
+    @property
+    def bare(self) -> str:
+        """Host without a leading ``www.``."""
+        return self.host[4:] if self.host.startswith("www.") else self.host
+
+    @property
+    def registered_domain(self) -> str:
+        """``domain.suffix``, or "" when either part is missing (as tldextract)."""
+        return f"{self.domain}.{self.suffix}" if self.domain and self.suffix else ""
+
+    @property
+    def root(self) -> str:
+        """``domain.suffix`` with missing parts dropped."""
+        return ".".join(p for p in (self.domain, self.suffix) if p)
+
+
+@lru_cache(maxsize=1)
+def _rules() -> Tuple[FrozenSet[str], FrozenSet[str], FrozenSet[str]]:
+    """(exact rules, wildcard parents, exceptions) of the bundled snapshot."""
+    exact, wildcard, exceptions = set(), set(), set()
+    with open(PSL_PATH, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line.startswith("// ===BEGIN PRIVATE DOMAINS==="):
+                break
+            if not line or line.startswith("//"):
+                continue
+            rule = line.split()[0].lower()
+            if rule.startswith("!"):
+                exceptions.add(rule[1:])
+            elif rule.startswith("*."):
+                wildcard.add(rule[2:])
+            else:
+                exact.add(rule)
+    return frozenset(exact), frozenset(wildcard), frozenset(exceptions)
+
+
+def _decode(label: str) -> str:
+    if label.startswith("xn--"):
+        try:
+            return label.encode("ascii").decode("idna")
+        except (UnicodeError, ValueError):
+            return label
+    return label
+
+
+def suffix_length(labels: Tuple[str, ...]) -> int:
+    """Number of trailing labels that form the public suffix (0 if unlisted)."""
+    exact, wildcard, exceptions = _rules()
+    keys = [_decode(label) for label in labels]
+    for i in range(len(keys)):
+        candidate = ".".join(keys[i:])
+        if candidate in exceptions:
+            return len(keys) - i - 1
+        if candidate in exact:
+            return len(keys) - i
+        parent = ".".join(keys[i + 1:])
+        if i + 1 < len(keys) and parent in wildcard:
+            return len(keys) - i
+    return 0
+
+
+def _is_ip(host: str) -> bool:
+    try:
+        ipaddress.ip_address(host)
+        return True
+    except ValueError:
+        return False
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def parse_host(raw_host: str) -> DomainParts:
+    """Split a host (optionally with credentials/port) at its public suffix."""
+    host = (raw_host or "").lower().split(":")[0]
+    clean = (raw_host or "").lower().rpartition("@")[2]
+    if clean.startswith("["):
+        clean = clean[1:].split("]")[0]
+    elif clean.count(":") == 1:
+        clean = clean.split(":")[0]
+    clean = clean.strip().rstrip(".")
+    if not clean:
+        return DomainParts(host, "", "", "")
+    if _is_ip(clean):
+        return DomainParts(host, "", clean, "")
+    labels = tuple(clean.split("."))
+    n = suffix_length(labels)
+    if n == len(labels):
+        return DomainParts(host, "", "", clean)
+    if n == 0:
+        return DomainParts(host, ".".join(labels[:-1]), labels[-1], "")
+    return DomainParts(host, ".".join(labels[:-n - 1]), labels[-n - 1], ".".join(labels[-n:]))
+
+
+def netloc_of(url: str) -> str:
+    """Network location of a URL; scheme-less input is taken as ``host/path``."""
+    rest = _SCHEME_RE.sub("", (url or "").strip(), count=1)
+    return _PATH_RE.split(rest, maxsplit=1)[0]
+
+
+def parse_url(url: str) -> DomainParts:
+    """``parse_host`` of a URL's network location."""
+    return parse_host(netloc_of(url))
+
+
+def registered_domain(url: str) -> str:
+    """Registrable domain of a URL ("" for IPs and bare suffixes)."""
+    return parse_url(url).registered_domain
+
+
+def cache_info():
+    """LRU statistics of ``parse_host``."""
+    return parse_host.cache_info()
@@ -11,10 +11,36 @@ import logging
 logger = logging.getLogger(__name__)
 
 
-def render_source_quality_md(jsonl_path: str) -> str:
+def _load_cards(con, jsonl_path: str, run_id: Optional[str] = None) -> None:
+    """
+    Create the ``cards`` table for one run: from the evidence warehouse when
+    the run has been appended there, otherwise by parsing the JSONL.
+    """
+    if run_id:
+        from .warehouse import EvidenceWarehouse
+        warehouse = EvidenceWarehouse()
+        if warehouse.has_run(run_id):
+            con.execute("""
+                CREATE TABLE cards AS
+                SELECT * FROM read_parquet(?, hive_partitioning = true, union_by_name = true)
+                WHERE run_id = ?
+            """, [f"{warehouse.root.as_posix()}/**/*.parquet", run_id])
+            return
+    
+    con.execute("""
+        CREATE TABLE cards AS 
+        SELECT * FROM read_json_auto(?, 
+            format='newline_delimited',
+            maximum_object_size=10485760
+        )
+    """, [jsonl_path])
+
+
+def render_source_quality_md(jsonl_path: str, run_id: Optional[str] = None) -> str:
     """
     Generate source quality markdown table using DuckDB.
-    Fast and efficient for large evidence sets.
+    Fast and efficient for large evidence sets; with ``run_id`` the cards are
+    read from the evidence warehouse instead of re-parsing the JSONL.
     """
     try:
         import duckdb
@@ -22,14 +48,8 @@ def render_source_quality_md(jsonl_path: str) -> str:
         # Connect to in-memory database
         con = duckdb.connect()
         
-        # Read JSONL file into DuckDB
-        con.execute("""
-            CREATE TABLE cards AS 
-            SELECT * FROM read_json_auto(?, 
-                format='newline_delimited',
-                maximum_object_size=10485760
-            )
-        """, [jsonl_path])
+        # Read this run's cards into DuckDB
+        _load_cards(con, jsonl_path, run_id)
         
         # Analyze source quality
         df = con.execute("""
@@ -89,7 +109,7 @@ def render_source_quality_md(jsonl_path: str) -> str:
         return f"| Error | {str(e)} |\n|---|---|"
 
 
-def analyze_triangulation(jsonl_path: str) -> Dict[str, Any]:
+def analyze_triangulation(jsonl_path: str, run_id: Optional[str] = None) -> Dict[str, Any]:
     """
     Analyze triangulation patterns in evidence cards using DuckDB.
     """
@@ -98,14 +118,7 @@ def analyze_triangulation(jsonl_path: str) -> Dict[str, Any]:
         
         con = duckdb.connect()
         
-        # Read evidence cards
-        con.execute("""
-            CREATE TABLE cards AS 
-            SELECT * FROM read_json_auto(?, 
-                format='newline_delimited',
-                maximum_object_size=10485760
-            )
-        """, [jsonl_path])
+        _load_cards(con, jsonl_path, run_id)
         
         # Analyze claim corroboration
         result = con.execute("""
@@ -170,7 +183,7 @@ def analyze_triangulation(jsonl_path: str) -> Dict[str, Any]:
         }
 
 
-def generate_evidence_summary(jsonl_path: str) -> Dict[str, Any]:
+def generate_evidence_summary(jsonl_path: str, run_id: Optional[str] = None) -> Dict[str, Any]:
     """
     Generate comprehensive evidence summary statistics using DuckDB.
     """
@@ -179,14 +192,7 @@ def generate_evidence_summary(jsonl_path: str) -> Dict[str, Any]:
         
         con = duckdb.connect()
         
-        # Read evidence cards
-        con.execute("""
-            CREATE TABLE cards AS 
-            SELECT * FROM read_json_auto(?, 
-                format='newline_delimited',
-                maximum_object_size=10485760
-            )
-        """, [jsonl_path])
+        _load_cards(con, jsonl_path, run_id)
         
         # Comprehensive statistics
         summary = {}
@@ -311,7 +317,7 @@ def export_to_parquet(jsonl_path: str, output_path: str = None) -> Optional[str]
         return None
 
 
-def validate_evidence_schema(jsonl_path: str) -> Dict[str, Any]:
+def validate_evidence_schema(jsonl_path: str, run_id: Optional[str] = None) -> Dict[str, Any]:
     """
     Validate evidence card schema and data quality using DuckDB.
     """
@@ -320,14 +326,7 @@ def validate_evidence_schema(jsonl_path: str) -> Dict[str, Any]:
         
         con = duckdb.connect()
         
-        # Read evidence cards
-        con.execute("""
-            CREATE TABLE cards AS 
-            SELECT * FROM read_json_auto(?, 
-                format='newline_delimited',
-                maximum_object_size=10485760
-            )
-        """, [jsonl_path])
+        _load_cards(con, jsonl_path, run_id)
         
         # Check for required fields and data quality
         validation = con.execute("""
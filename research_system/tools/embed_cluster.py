@@ -36,11 +36,10 @@ def _jaccard_clusters(texts: List[str], threshold=0.82, min_overlap=3) -> List[S
 
 def _sbert_clusters(texts: List[str], cos_threshold=0.86, min_size=2) -> List[Set[int]]:
     try:
-        from sentence_transformers import SentenceTransformer
+        from research_system.triangulation.embeddings import encode
         from sklearn.metrics.pairwise import cosine_similarity
         from sklearn.cluster import AgglomerativeClustering
-        model = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
-        emb = model.encode(texts, normalize_embeddings=True)
+        emb = encode(texts, normalize=True)
         from numpy import clip
         from numpy import asarray
         dist = 1 - cosine_similarity(emb)
@@ -1,14 +1,26 @@
 from __future__ import annotations
-from typing import List, Dict, Any, Tuple, Optional
+from typing import List, Dict, Any, Tuple, Optional, Iterable, Iterator, IO
 from pathlib import Path
+import gzip
+import io
 import json
-from jsonschema import validate, ValidationError
+import os
+import zlib
+from jsonschema import ValidationError
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
 from research_system.models import EvidenceCard
 try:
     from importlib import resources
 except ImportError:
     import importlib_resources as resources
 
+# Optional fast JSON encoder/decoder (falls back to stdlib json)
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
 # Required fields that MUST be present and valid
 REQUIRED_FIELDS = [
     "title", "url", "snippet", "provider", 
@@ -32,6 +44,7 @@ def _load_schema() -> dict:
 
 # Lazy load to avoid import-time issues
 _SCHEMA = None
+_VALIDATOR = None
 
 def _schema():
     global _SCHEMA
@@ -39,6 +52,31 @@ def _schema():
         _SCHEMA = _load_schema()
     return _SCHEMA
 
+def _validator():
+    """Schema validator, checked and compiled once per process."""
+    global _VALIDATOR
+    if _VALIDATOR is None:
+        cls = validator_for(_schema())
+        cls.check_schema(_schema())
+        _VALIDATOR = cls(_schema())
+    return _VALIDATOR
+
+def _validate_sample() -> float:
+    """Fraction of cards given full schema validation (``EVIDENCE_VALIDATE_SAMPLE``)."""
+    try:
+        return min(1.0, max(0.0, float(os.getenv("EVIDENCE_VALIDATE_SAMPLE", "1.0"))))
+    except ValueError:
+        return 1.0
+
+def _sampled(doc: Dict[str, Any], rate: float) -> bool:
+    """Deterministically pick a ``rate`` fraction of cards by id."""
+    if rate >= 1.0:
+        return True
+    if rate <= 0.0:
+        return False
+    key = str(doc.get("id") or doc.get("url") or "").encode()
+    return zlib.crc32(key) < rate * 0x100000000
+
 def _repair_minimal(doc: Dict[str, Any]) -> Dict[str, Any]:
     """Enhanced self-healing with snippet repair chain"""
     import uuid
@@ -97,13 +135,17 @@ def _repair_minimal(doc: Dict[str, Any]) -> Dict[str, Any]:
     
     return doc
 
-def validate_evidence_dict(data: dict) -> None:
-    """Enhanced validation with strict field requirements"""
+def validate_evidence_dict(data: dict, *, schema: bool = True) -> None:
+    """Enhanced validation with strict field requirements
+    
+    ``schema=False`` skips the JSONSchema pass and keeps only the cheap
+    required-field and bound checks (used for sampled validation).
+    """
     # JSONSchema validation (existing)
-    try:
-        validate(instance=data, schema=_schema())
-    except ValidationError as e:
-        raise ValueError(f"Evidence schema validation failed: {e.message}")
+    if schema:
+        error = best_match(_validator().iter_errors(data))
+        if error is not None:
+            raise ValueError(f"Evidence schema validation failed: {error.message}")
     
     # Additional hard checks (strong guardrail)
     missing = [k for k in REQUIRED_FIELDS if k not in data]
@@ -142,18 +184,52 @@ def _coerce_item(item: Any) -> Dict[str, Any]:
     # Fallback: use JSON encoding with default handler
     return json.loads(json.dumps(item, default=lambda o: getattr(o, "__dict__", str(o))))
 
-def write_jsonl(path: str, items: List[Any], *, skip_invalid: bool = True, 
-                errors_path: Optional[str] = None) -> Tuple[int, int]:
+def _dumps(doc: Dict[str, Any]) -> str:
+    """Serialize one card; orjson when available, same values as ``json.dumps(default=str)``."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(doc, default=str, option=orjson.OPT_PASSTHROUGH_DATETIME).decode()
+        except TypeError:
+            pass  # e.g. non-string keys or huge ints; let json handle them
+    return json.dumps(doc, default=str)
+
+def _loads(line: str) -> Any:
+    return orjson.loads(line) if orjson is not None else json.loads(line)
+
+def _open_text(path: Path, mode: str) -> IO[str]:
+    """Open a JSONL file, compressed by suffix: ``.zst`` (zstandard) or ``.gz``."""
+    if path.suffix == ".gz":
+        return gzip.open(path, mode + "t", encoding="utf-8", compresslevel=6)
+    if path.suffix == ".zst":
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError("Writing .zst evidence requires zstandard (pip install zstandard)") from e
+        return zstandard.open(path, mode + "t", encoding="utf-8")
+    return path.open(mode, encoding="utf-8", buffering=io.DEFAULT_BUFFER_SIZE * 16)
+
+def write_jsonl(path: str, items: Iterable[Any], *, skip_invalid: bool = True, 
+                errors_path: Optional[str] = None,
+                validate_sample: Optional[float] = None,
+                encoded: Optional[Dict[int, Optional[str]]] = None) -> Tuple[int, int]:
     """
     Write evidence cards to JSONL, with resilience against invalid cards.
     
     Handles dicts, Pydantic models, dataclasses, and objects with to_jsonl_dict.
+    Items are streamed, so a generator can be passed; ``.gz``/``.zst`` paths
+    are compressed.
     
     Args:
         path: Output JSONL path
-        items: List of evidence objects (EvidenceCard, dict, dataclass, etc.)
+        items: Evidence objects (EvidenceCard, dict, dataclass, etc.)
         skip_invalid: If True, skip invalid cards instead of raising
         errors_path: Optional path to write error details
+        validate_sample: Fraction of cards given full schema validation
+            (default ``EVIDENCE_VALIDATE_SAMPLE``, 1.0); required fields and
+            score bounds are always checked
+        encoded: Optional memo of ``id(item)`` -> encoded line (None if
+            invalid), shared between writes of overlapping card sets so each
+            card is repaired, validated and serialized once
         
     Returns:
         Tuple of (successful_count, failed_count)
@@ -163,6 +239,7 @@ def write_jsonl(path: str, items: List[Any], *, skip_invalid: bool = True,
     
     p = Path(path)
     p.parent.mkdir(parents=True, exist_ok=True)
+    rate = _validate_sample() if validate_sample is None else validate_sample
     
     # Setup error file if requested
     err_fp = Path(errors_path) if errors_path else None
@@ -175,52 +252,79 @@ def write_jsonl(path: str, items: List[Any], *, skip_invalid: bool = True,
     ok = 0
     bad = 0
     
-    with p.open("w", encoding="utf-8") as f:
-        for i, item in enumerate(items):
-            # Coerce to dict using enhanced handler
-            doc = _coerce_item(item)
-            
-            # Apply minimal repairs
-            doc = _repair_minimal(doc)
-            
-            # Validate against schema + required fields
-            try:
-                validate_evidence_dict(doc)
-            except (ValueError, ValidationError) as e:
-                bad += 1
-                error_msg = str(e)
-                logger.warning(f"Validation failed for card {i+1}/{len(items)}: {error_msg}")
-                logger.warning(f"Card ID: {doc.get('id', 'unknown')}, URL: {doc.get('url', 'unknown')}")
+    try:
+        with _open_text(p, "w") as f:
+            for i, item in enumerate(items):
+                if encoded is not None and id(item) in encoded:
+                    line = encoded[id(item)]
+                    if line is None:
+                        bad += 1
+                    else:
+                        f.write(line)
+                        ok += 1
+                    continue
                 
-                if ef:
-                    ef.write(json.dumps({
-                        "id": doc.get("id"), 
-                        "url": doc.get("url"), 
-                        "error": error_msg
-                    }) + "\n")
+                # Coerce to dict using enhanced handler
+                doc = _coerce_item(item)
                 
-                if not skip_invalid:
-                    raise
-                continue
-            
-            f.write(json.dumps(doc, default=str) + "\n")
-            ok += 1
-    
-    if ef:
-        ef.close()
+                # Apply minimal repairs
+                doc = _repair_minimal(doc)
+                
+                # Validate against schema + required fields
+                try:
+                    validate_evidence_dict(doc, schema=_sampled(doc, rate))
+                except (ValueError, ValidationError) as e:
+                    bad += 1
+                    error_msg = str(e)
+                    logger.warning(f"Validation failed for card {i+1}: {error_msg}")
+                    logger.warning(f"Card ID: {doc.get('id', 'unknown')}, URL: {doc.get('url', 'unknown')}")
+                    
+                    if ef:
+                        ef.write(json.dumps({
+                            "id": doc.get("id"), 
+                            "url": doc.get("url"), 
+                            "error": error_msg
+                        }) + "\n")
+                    
+                    if encoded is not None:
+                        encoded[id(item)] = None
+                    if not skip_invalid:
+                        raise
+                    continue
+                
+                line = _dumps(doc) + "\n"
+                if encoded is not None:
+                    encoded[id(item)] = line
+                f.write(line)
+                ok += 1
+    finally:
+        if ef:
+            ef.close()
     
     logger.info(f"JSONL write complete: {ok} successful, {bad} failed")
     return ok, bad
 
-def read_jsonl(path: str) -> List[EvidenceCard]:
-    p = Path(path); 
-    if not p.exists(): 
-        return []
-    out: List[EvidenceCard] = []
-    with p.open("r", encoding="utf-8") as f:
+def iter_jsonl(path: str, *, validate: bool = True,
+               validate_sample: Optional[float] = None) -> Iterator[EvidenceCard]:
+    """Lazily read evidence cards from a (possibly compressed) JSONL file.
+    
+    Args:
+        path: Input JSONL path (``.gz``/``.zst`` are decompressed)
+        validate: Validate each card before building it
+        validate_sample: Fraction of cards given full schema validation
+            (default ``EVIDENCE_VALIDATE_SAMPLE``)
+    """
+    p = Path(path)
+    if not p.exists():
+        return
+    rate = _validate_sample() if validate_sample is None else validate_sample
+    with _open_text(p, "r") as f:
         for line in f:
             if not line.strip(): continue
-            obj = json.loads(line)
-            validate_evidence_dict(obj)
-            out.append(EvidenceCard(**obj))
-    return out
\ No newline at end of file
+            obj = _loads(line)
+            if validate:
+                validate_evidence_dict(obj, schema=_sampled(obj, rate))
+            yield EvidenceCard(**obj)
+
+def read_jsonl(path: str, *, validate: bool = True) -> List[EvidenceCard]:
+    return list(iter_jsonl(path, validate=validate))
@@ -1,6 +1,7 @@
 from __future__ import annotations
 import httpx, datetime as dt, os, logging, re
-from typing import Optional, Dict, Any, Tuple
+from pathlib import Path
+from typing import Optional, Dict, Any, Tuple, Union
 from urllib.parse import urlparse
 
 logger = logging.getLogger(__name__)
@@ -33,6 +34,7 @@ from .doi_fallback import doi_rescue, extract_doi_from_url
 from .warc_dump import warc_capture
 from .langpipe import to_english, detect_language
 from .pdf_tables import find_numeric_cells
+from research_system.extraction.pdf_pages import PdfDocument
 # Import removed - using environment variables directly
 from research_system.config.settings import PER_DOMAIN_HEADERS
 
@@ -71,6 +73,15 @@ def _get_headers(url: str = "") -> Dict[str, str]:
     
     return headers
 
+def _get_ua(url: str = "") -> Dict[str, str]:
+    """User-Agent header for the URL (SEC hosts get the contact-email form)."""
+    return {"User-Agent": _get_headers(url)["User-Agent"]}
+
+def get_settings():
+    """Construct Settings lazily so env changes after import are honoured."""
+    from research_system.config.settings import Settings
+    return Settings()
+
 def fetch_html(url: str) -> Tuple[Optional[str], Optional[str]]:
     """Fetch HTML with caching, politeness, and paywall detection."""
     try:
@@ -129,7 +140,59 @@ def fetch_html(url: str) -> Tuple[Optional[str], Optional[str]]:
         pass
     return None, None
 
+def pdf_article(url: str, content: Union[bytes, Path]) -> Dict[str, Any]:
+    """Build article metadata from already-downloaded PDF bytes (or a spooled file)."""
+    settings = get_settings()
+    
+    # WARC capture if enabled
+    if settings.ENABLE_WARC:
+        warc_capture(url, headers=_get_headers(url))
+    
+    # One parsed document serves text, deeper quote search and tables
+    with PdfDocument(content) as doc:
+        # Extract PDF text with page limit
+        max_pages = int(os.getenv("PDF_MAX_PAGES", "6"))
+        pdf = extract_pdf_text(doc, max_pages=max_pages)
+        text = pdf.get("text", "") or ""
+        
+        quotes = select_claim_sentences(text, max_sentences=2)
+        # No claim in the opening pages: search deeper; already parsed pages come from the cache
+        quote_pages = int(os.getenv("PDF_QUOTE_MAX_PAGES", "30"))
+        if not quotes and pdf.get("pages", 0) > pdf.get("extracted_pages", pdf.get("pages", 0)) \
+                and quote_pages > max_pages:
+            deeper = extract_pdf_text(doc, max_pages=quote_pages)
+            deeper_quotes = select_claim_sentences(deeper.get("text", "") or "", max_sentences=2)
+            if deeper_quotes:
+                pdf, text, quotes = deeper, deeper.get("text", "") or "", deeper_quotes
+        
+        # Try table extraction if text is sparse
+        if not quotes and settings.ENABLE_PDF_TABLES:
+            table_cells = find_numeric_cells(doc, max_tables=5)
+            if table_cells:
+                # Use table data as quotes
+                quotes = table_cells[:2]
+    
+    # Language detection and translation prep
+    if settings.ENABLE_LANGDETECT:
+        lang = detect_language(text[:1000])
+        if lang and lang != "en":
+            # Prepare for future translation
+            text = to_english(text)
+    
+    return {
+        "title": pdf.get("title"),
+        "text": text,
+        "date": None,
+        "publisher": None,
+        "quotes": quotes
+    }
+
 def extract_article(url: str, html: Optional[str] = None) -> Dict[str, Any]:
+    """Extract title, text, date and quote sentences for a URL.
+    
+    When ``html`` is supplied (e.g. by the enrichment stage, which has
+    already downloaded the page) the page itself is not fetched again.
+    """
     from urllib.parse import urlparse
     from research_system.net.circuit import CIRCUIT
     from research_system.net.cache import get as cache_get, set as cache_set, parse_cache_control
@@ -169,7 +232,7 @@ def extract_article(url: str, html: Optional[str] = None) -> Dict[str, Any]:
             # Fetch with GET request (not HEAD) for better content
             try:
                 timeout = get_timeout(30)
-                r = httpx.get(url, timeout=timeout, headers=_get_ua(), follow_redirects=True)
+                r = httpx.get(url, timeout=timeout, headers=_get_headers(url), follow_redirects=True)
                 
                 # Cache successful responses
                 if 200 <= r.status_code < 300:
@@ -211,7 +274,7 @@ def extract_article(url: str, html: Optional[str] = None) -> Dict[str, Any]:
                     mu = get_unwto_mirror_url(url)
                     if mu:
                         try:
-                            mr = httpx.get(mu, headers=_get_ua(), timeout=30)
+                            mr = httpx.get(mu, headers=_get_headers(mu), timeout=30)
                             if mr.status_code == 200 and len((mr.text or "")) > 500:
                                 return {"title": None, "text": mr.text, "quotes": None, "source": "mirror", "mirror_url": mu}
                         except Exception:
@@ -244,49 +307,14 @@ def extract_article(url: str, html: Optional[str] = None) -> Dict[str, Any]:
     # PDF path with enhanced extraction
     if (html_ct and "pdf" in html_ct) or (url or "").lower().endswith(".pdf"):
         try:
-            # Get settings for PDF processing
-            settings = get_settings()
-            
             # Use new PDF fetch with size limits and timeouts
             from research_system.net.pdf_fetch import download_pdf
             with httpx.Client() as cl:
                 content = download_pdf(cl, url)
-            
-            # WARC capture if enabled
-            if settings.ENABLE_WARC:
-                warc_capture(url, headers=_get_ua())
-            
-            # Extract PDF text with page limit
-            max_pages = int(os.getenv("PDF_MAX_PAGES", "6"))
-            pdf = extract_pdf_text(content, max_pages=max_pages)
-            text = pdf.get("text", "") or ""
-            
-            # Try table extraction if text is sparse
-            quotes = select_claim_sentences(text, max_sentences=2)
-            if not quotes and settings.ENABLE_PDF_TABLES:
-                table_cells = find_numeric_cells(content, max_tables=5)
-                if table_cells:
-                    # Use table data as quotes
-                    quotes = table_cells[:2]
-            
-            # Language detection and translation prep
-            if settings.ENABLE_LANGDETECT:
-                lang = detect_language(text[:1000])
-                if lang and lang != "en":
-                    # Prepare for future translation
-                    text = to_english(text)
-            
-            return {
-                "title": pdf.get("title"),
-                "text": text,
-                "date": None,
-                "publisher": None,
-                "quotes": quotes
-            }
+            return pdf_article(url, content)
         except Exception:
             # Return minimal structure on PDF extraction failure
             return {"title": None, "text": "", "date": None, "publisher": None, "quotes": []}
-        return {"title": None, "text": "", "date": None, "publisher": None, "quotes": []}
     
     base_url = get_base_url(html, url)
     meta = {}
@@ -37,45 +37,65 @@ def fetch_excerpt(url: str, max_chars: int = 800) -> Optional[str]:
             if "text/html" not in ct:
                 return None
                 
-            # Parse HTML
-            soup = BeautifulSoup(r.text, "html.parser")
-            
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
-            
-            # Prefer article content, fallback to body paragraphs
-            article = soup.find("article")
-            if article:
-                paras = article.find_all("p")
-            else:
-                # Try main content areas
-                for selector in ["main", "div.content", "div#content", "div.article"]:
-                    content = soup.select_one(selector)
-                    if content:
-                        paras = content.find_all("p")
-                        break
-                else:
-                    # Fallback to all paragraphs
-                    paras = soup.find_all("p")
-            
-            # Extract and clean text
-            text_parts = []
-            for p in paras:
-                text = p.get_text(" ", strip=True)
-                if text and len(text) > 50:  # Skip very short paragraphs
-                    text_parts.append(text)
-                    
-            # Join and normalize whitespace
-            full_text = " ".join(text_parts)
-            full_text = " ".join(full_text.split())  # normalize whitespace
-            
-            # Return truncated excerpt
-            return full_text[:max_chars] if full_text else None
+            return excerpt_from_html(r.text, max_chars=max_chars)
             
     except httpx.TimeoutException:
         logger.debug(f"Timeout fetching {url}")
         return None
     except Exception as e:
         logger.debug(f"Error fetching {url}: {e}")
-        return None
\ No newline at end of file
+        return None
+
+
+def excerpt_from_html(html: str, max_chars: int = 800) -> Optional[str]:
+    """
+    Extract a short excerpt from an already-fetched HTML body.
+    
+    Used by fetch_excerpt and by the enrichment stage, which downloads
+    each page once and shares the body across extractors.
+    
+    Args:
+        html: Raw HTML text
+        max_chars: Maximum characters to extract
+        
+    Returns:
+        Extracted text excerpt or None if nothing usable was found
+    """
+    if not html:
+        return None
+    
+    # Parse HTML
+    soup = BeautifulSoup(html, "html.parser")
+    
+    # Remove script and style elements
+    for script in soup(["script", "style"]):
+        script.decompose()
+    
+    # Prefer article content, fallback to body paragraphs
+    article = soup.find("article")
+    if article:
+        paras = article.find_all("p")
+    else:
+        # Try main content areas
+        for selector in ["main", "div.content", "div#content", "div.article"]:
+            content = soup.select_one(selector)
+            if content:
+                paras = content.find_all("p")
+                break
+        else:
+            # Fallback to all paragraphs
+            paras = soup.find_all("p")
+    
+    # Extract and clean text
+    text_parts = []
+    for p in paras:
+        text = p.get_text(" ", strip=True)
+        if text and len(text) > 50:  # Skip very short paragraphs
+            text_parts.append(text)
+            
+    # Join and normalize whitespace
+    full_text = " ".join(text_parts)
+    full_text = " ".join(full_text.split())  # normalize whitespace
+    
+    # Return truncated excerpt
+    return full_text[:max_chars] if full_text else None
@@ -0,0 +1,224 @@
+"""Content-addressed on-disk store behind the HTTP cache.
+
+Layout under the cache directory (``HTTP_CACHE_DIR``):
+
+* ``index.sqlite``: one row per URL (status, headers, fetch time, last use)
+  pointing at a body digest, one row per body blob with its reference count,
+  and running totals so ``stats()`` never scans;
+* ``blobs/<xx>/<sha256>.z``: zlib-compressed response bodies, named by the
+  SHA-256 of the raw body, so identical bodies served under different URLs
+  are stored once.
+
+The store is bounded by size (``HTTP_CACHE_MAX_MB``, least recently used
+entries go first) and by age (entries fetched more than
+``HTTP_CACHE_MAX_AGE_DAYS`` ago are dropped even if they could still be
+revalidated). Every operation, including blob file creation and removal,
+runs inside a SQLite ``BEGIN IMMEDIATE`` transaction, so worker processes
+sharing the directory never see an index row without its blob.
+"""
+
+from __future__ import annotations
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterator, Optional
+
+logger = logging.getLogger(__name__)
+
+_COUNTERS = ("entries", "blobs", "bytes")
+
+
+@dataclass
+class CachedResponse:
+    """A cached HTTP response; ``body`` is the raw (uncompressed) content."""
+    url: str
+    status: int
+    headers: Dict[str, str]
+    body: bytes
+    encoding: Optional[str]
+    fetched: float
+
+    def age(self) -> float:
+        return time.time() - self.fetched
+
+    def text(self) -> str:
+        try:
+            return self.body.decode(self.encoding or "utf-8", errors="replace")
+        except LookupError:
+            return self.body.decode("utf-8", errors="replace")
+
+
+def url_key(url: str) -> str:
+    """Index key of a URL."""
+    return hashlib.sha256(url.encode()).hexdigest()
+
+
+class HttpCacheStore:
+    """SQLite-indexed, content-addressed HTTP response cache.
+
+    Args:
+        root: Cache directory.
+        max_bytes: Compressed body bytes kept before LRU eviction
+            (``HTTP_CACHE_MAX_MB``).
+        max_age: Seconds after which an entry is evicted regardless of use
+            (``HTTP_CACHE_MAX_AGE_DAYS``).
+    """
+
+    def __init__(self, root: str, max_bytes: Optional[int] = None,
+                 max_age: Optional[float] = None):
+        self.path = Path(root)
+        self.max_bytes = max_bytes or int(float(os.getenv("HTTP_CACHE_MAX_MB", "2048")) * 1024 * 1024)
+        self.max_age = max_age or float(os.getenv("HTTP_CACHE_MAX_AGE_DAYS", "30")) * 86400
+        self._blob_dir = self.path / "blobs"
+        self._blob_dir.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        with self._transaction() as db:
+            db.execute("CREATE TABLE IF NOT EXISTS entries "
+                       "(key TEXT PRIMARY KEY, url TEXT NOT NULL, status INTEGER NOT NULL, "
+                       "headers TEXT NOT NULL, encoding TEXT, digest TEXT NOT NULL, "
+                       "fetched REAL NOT NULL, used INTEGER NOT NULL)")
+            db.execute("CREATE INDEX IF NOT EXISTS entries_used ON entries(used)")
+            db.execute("CREATE INDEX IF NOT EXISTS entries_fetched ON entries(fetched)")
+            db.execute("CREATE TABLE IF NOT EXISTS blobs "
+                       "(digest TEXT PRIMARY KEY, size INTEGER NOT NULL, refs INTEGER NOT NULL)")
+            db.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER)")
+            db.executemany("INSERT OR IGNORE INTO meta (name, value) VALUES (?, 0)",
+                           [(c,) for c in _COUNTERS + ("tick",)])
+
+    def _db(self) -> sqlite3.Connection:
+        # Connections must not cross a fork, so they are keyed by pid too
+        db = getattr(self._local, "db", None)
+        if db is None or self._local.pid != os.getpid():
+            db = sqlite3.connect(str(self.path / "index.sqlite"), timeout=30,
+                                 isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            self._local.db, self._local.pid = db, os.getpid()
+        return db
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        db = self._db()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            yield db
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        db.execute("COMMIT")
+
+    def _bump(self, db: sqlite3.Connection, name: str, delta: int) -> None:
+        db.execute("UPDATE meta SET value = value + ? WHERE name = ?", (delta, name))
+
+    def _tick(self, db: sqlite3.Connection) -> int:
+        """Monotonic use counter, so LRU order has no clock ties."""
+        self._bump(db, "tick", 1)
+        return db.execute("SELECT value FROM meta WHERE name = 'tick'").fetchone()[0]
+
+    def _blob_path(self, digest: str) -> Path:
+        return self._blob_dir / digest[:2] / f"{digest}.z"
+
+    def _release(self, db: sqlite3.Connection, digest: str) -> None:
+        """Drop one reference to a blob, deleting it with the last one."""
+        db.execute("UPDATE blobs SET refs = refs - 1 WHERE digest = ?", (digest,))
+        row = db.execute("SELECT size FROM blobs WHERE digest = ? AND refs <= 0",
+                         (digest,)).fetchone()
+        if row:
+            db.execute("DELETE FROM blobs WHERE digest = ?", (digest,))
+            self._bump(db, "blobs", -1)
+            self._bump(db, "bytes", -row[0])
+            self._blob_path(digest).unlink(missing_ok=True)
+
+    def _remove(self, db: sqlite3.Connection, key: str, digest: str) -> None:
+        db.execute("DELETE FROM entries WHERE key = ?", (key,))
+        self._bump(db, "entries", -1)
+        self._release(db, digest)
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """Return the cached response for a URL, fresh or stale."""
+        key = url_key(url)
+        with self._transaction() as db:
+            row = db.execute("SELECT url, status, headers, encoding, digest, fetched "
+                             "FROM entries WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            cached_url, status, headers, encoding, digest, fetched = row
+            try:
+                body = zlib.decompress(self._blob_path(digest).read_bytes())
+            except (OSError, zlib.error) as e:
+                logger.warning(f"Dropping unreadable cache entry for {url}: {e}")
+                self._remove(db, key, digest)
+                return None
+            db.execute("UPDATE entries SET used = ? WHERE key = ?", (self._tick(db), key))
+        return CachedResponse(cached_url, status, json.loads(headers), body, encoding, fetched)
+
+    def put(self, url: str, status: int, headers: Dict[str, str], body: bytes,
+            encoding: Optional[str] = None) -> None:
+        """Store a response, replacing any previous one for the URL."""
+        key = url_key(url)
+        digest = hashlib.sha256(body).hexdigest()
+        packed = zlib.compress(body, 6)
+        with self._transaction() as db:
+            if db.execute("SELECT 1 FROM blobs WHERE digest = ?", (digest,)).fetchone():
+                db.execute("UPDATE blobs SET refs = refs + 1 WHERE digest = ?", (digest,))
+            else:
+                path = self._blob_path(digest)
+                path.parent.mkdir(exist_ok=True)
+                tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+                tmp.write_bytes(packed)
+                os.replace(tmp, path)
+                db.execute("INSERT INTO blobs (digest, size, refs) VALUES (?, ?, 1)",
+                           (digest, len(packed)))
+                self._bump(db, "blobs", 1)
+                self._bump(db, "bytes", len(packed))
+
+            old = db.execute("SELECT digest FROM entries WHERE key = ?", (key,)).fetchone()
+            if old:
+                self._remove(db, key, old[0])
+            db.execute("INSERT INTO entries (key, url, status, headers, encoding, digest, fetched, used) "
+                       "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                       (key, url, status, json.dumps(headers), encoding, digest,
+                        time.time(), self._tick(db)))
+            self._bump(db, "entries", 1)
+            self._evict(db)
+
+    def touch(self, url: str) -> None:
+        """Mark a cached response as just revalidated (after a 304)."""
+        with self._transaction() as db:
+            db.execute("UPDATE entries SET fetched = ?, used = ? WHERE key = ?",
+                       (time.time(), self._tick(db), url_key(url)))
+
+    def _evict(self, db: sqlite3.Connection) -> None:
+        expired = db.execute("SELECT key, digest FROM entries WHERE fetched < ?",
+                             (time.time() - self.max_age,)).fetchall()
+        for key, digest in expired:
+            self._remove(db, key, digest)
+        while db.execute("SELECT value FROM meta WHERE name = 'bytes'").fetchone()[0] > self.max_bytes:
+            victims = db.execute("SELECT key, digest FROM entries ORDER BY used LIMIT 64").fetchall()
+            if not victims:
+                break
+            for key, digest in victims:
+                self._remove(db, key, digest)
+                if db.execute("SELECT value FROM meta WHERE name = 'bytes'").fetchone()[0] <= self.max_bytes:
+                    break
+
+    def stats(self) -> Dict[str, int]:
+        """Entry, blob and compressed byte counts."""
+        rows = self._db().execute("SELECT name, value FROM meta").fetchall()
+        return {name: value for name, value in rows if name in _COUNTERS}
+
+    def clear(self) -> None:
+        """Remove every entry and blob."""
+        with self._transaction() as db:
+            for (digest,) in db.execute("SELECT digest FROM blobs").fetchall():
+                self._blob_path(digest).unlink(missing_ok=True)
+            db.execute("DELETE FROM entries")
+            db.execute("DELETE FROM blobs")
+            db.executemany("UPDATE meta SET value = 0 WHERE name = ?", [(c,) for c in _COUNTERS])
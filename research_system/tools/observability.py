@@ -81,7 +81,7 @@ def generate_triangulation_breakdown(
     lines.append("## Top Uncorroborated Structured Claims")
     
     # Extract all structured claims
-    from .claim_struct import extract_struct_claim, struct_key
+    from ..evidence.features import text_features
     
     all_keys = []
     key_examples = {}
@@ -89,8 +89,8 @@ def generate_triangulation_breakdown(
         text = getattr(card, 'quote_span', None) or \
                getattr(card, 'claim', '') or \
                getattr(card, 'snippet', '')
-        sc = extract_struct_claim(text)
-        k = struct_key(sc)
+        features = text_features(text)
+        sc, k = features.struct_claim, features.struct_key
         if k:
             all_keys.append(k)
             if k not in key_examples:
@@ -2,6 +2,8 @@ from __future__ import annotations
 import re, os, httpx, datetime as dt
 from typing import Optional, Dict, Any, Tuple
 
+from .doi_service import crossref_work, unpaywall_record
+
 UA = {"User-Agent": "ResearchAgent/1.0 (+mailto:research@example.com)"}
 
 # ---- DOI utilities -----------------------------------------------------------
@@ -19,9 +21,8 @@ def extract_doi_from_html(html: str) -> Optional[str]:
 
 def crossref_meta(doi: str) -> Dict[str, Any]:
     try:
-        r = httpx.get(f"https://api.crossref.org/works/{doi}", headers=UA, timeout=25)
-        if r.status_code != 200: return {}
-        msg = (r.json() or {}).get("message", {})
+        msg = crossref_work(doi, headers=UA, timeout=25)
+        if not msg: return {}
         title = (msg.get("title") or [None])[0]
         abstract = msg.get("abstract") or ""
         y = (msg.get("issued",{}).get("date-parts") or [[None]])[0][0]
@@ -33,9 +34,7 @@ def crossref_meta(doi: str) -> Dict[str, Any]:
 def unpaywall_best_oa(doi: str) -> Optional[str]:
     email = os.getenv("UNPAYWALL_EMAIL", "open@example.com")
     try:
-        r = httpx.get(f"https://api.unpaywall.org/v2/{doi}?email={email}", timeout=25)
-        if r.status_code != 200: return None
-        best = (r.json() or {}).get("best_oa_location") or {}
+        best = (unpaywall_record(doi, email, timeout=25) or {}).get("best_oa_location") or {}
         return best.get("url_for_pdf") or best.get("url")
     except Exception:
         return None
@@ -1,5 +1,9 @@
 """
 PDF text extraction utilities with table support
+
+Text, layout and tables all go through ``extraction.pdf_pages.PdfDocument``,
+which opens a document once and caches parsed page text by content hash.
+Pass a ``PdfDocument`` instead of bytes to share it across these helpers.
 """
 
 from __future__ import annotations
@@ -8,79 +12,50 @@ import io
 import logging
 from pathlib import Path
 
+from research_system.extraction.pdf_pages import PdfDocument, open_document
+
 logger = logging.getLogger(__name__)
 
 
-def extract_pdf_text(path_or_bytes: Union[str, Path, bytes, io.BytesIO], max_pages: Optional[int] = None) -> Dict[str, Any]:
+def extract_pdf_text(path_or_bytes: Union[str, Path, bytes, io.BytesIO, PdfDocument], max_pages: Optional[int] = None) -> Dict[str, Any]:
     """
     Returns: {"text": str, "pages": int, "title": Optional[str], "tables": List[...]}
     Strategy: PyMuPDF (fitz) if available; else pdfplumber. Tables via pdfplumber if present.
+    Pages parsed before (same content) come from the page text cache.
     
     Args:
-        path_or_bytes: PDF path or bytes
+        path_or_bytes: PDF path, bytes or an open PdfDocument
         max_pages: Maximum pages to extract (for quote extraction efficiency)
     """
     import os
     max_pages = max_pages or int(os.getenv("PDF_MAX_PAGES", "6"))
     result: Dict[str, Any] = {"text": "", "pages": 0, "title": None, "tables": []}
 
-    # Normalize to bytes
-    if isinstance(path_or_bytes, (str, Path)):
-        with open(path_or_bytes, "rb") as f:
-            data = f.read()
-    elif isinstance(path_or_bytes, io.BytesIO):
-        data = path_or_bytes.getvalue()
-    else:
-        data = path_or_bytes
-
-    # Try PyMuPDF first
+    doc = open_document(path_or_bytes)
     try:
-        import fitz  # PyMuPDF
-        doc = fitz.open(stream=data, filetype="pdf")
-        parts = []
         # Only process first max_pages for quote extraction
-        pages_to_process = min(doc.page_count, max_pages) if max_pages else doc.page_count
-        for i in range(pages_to_process):
-            parts.append(doc[i].get_text("text"))
-        result["text"] = "\n".join(parts)
+        texts = doc.page_texts(0, max_pages)
         result["pages"] = doc.page_count
-        result["extracted_pages"] = pages_to_process
-        meta = doc.metadata or {}
-        result["title"] = meta.get("title") or None
-        doc.close()
-        # Light table pass (optional): PyMuPDF doesn't do tables natively
-        return result
-    except Exception:
-        pass
-
-    # Fallback: pdfplumber (includes simple table extraction)
-    try:
-        import pdfplumber
-        with pdfplumber.open(io.BytesIO(data)) as pdf:
-            text_parts = []
-            # Only process first max_pages for quote extraction
-            pages_to_process = min(len(pdf.pages), max_pages) if max_pages else len(pdf.pages)
-            for i in range(pages_to_process):
-                page = pdf.pages[i]
-                text_parts.append(page.extract_text() or "")
-                for table_idx, table in enumerate(page.extract_tables() or []):
-                    if table:
-                        result["tables"].append({
-                            "page": page.page_number, "index": table_idx, "data": table
-                        })
-            result["text"] = "\n\n".join(text_parts)
-            result["pages"] = len(pdf.pages)
-            result["extracted_pages"] = pages_to_process
-            if pdf.metadata:
-                title = pdf.metadata.get("Title")
-                result["title"] = title if title and isinstance(title, str) else None
+        result["extracted_pages"] = len(texts)
+        result["title"] = doc.title
+        if doc.backend == "pdfplumber":
+            # pdfplumber fallback also harvests simple tables
+            result["text"] = "\n\n".join(texts)
+            for page, table_idx, table in doc.iter_tables(max_pages):
+                if table:
+                    result["tables"].append({"page": page, "index": table_idx, "data": table})
+        else:
+            result["text"] = "\n".join(texts)
         return result
     except Exception as e:
         result["error"] = f"pdf extraction failed: {e}"
         return result
+    finally:
+        if doc is not path_or_bytes:
+            doc.close()
 
 
-def extract_pdf_with_layout(path_or_bytes: Union[str, Path, bytes]) -> Dict[str, Any]:
+def extract_pdf_with_layout(path_or_bytes: Union[str, Path, bytes, PdfDocument]) -> Dict[str, Any]:
     """
     Extract PDF preserving layout information (useful for forms, reports).
     Uses PyMuPDF's layout preservation mode.
@@ -92,38 +67,23 @@ def extract_pdf_with_layout(path_or_bytes: Union[str, Path, bytes]) -> Dict[str,
         "error": None
     }
     
+    doc = open_document(path_or_bytes)
     try:
-        import fitz
-        
-        if isinstance(path_or_bytes, (bytes, bytearray)):
-            doc = fitz.open(stream=path_or_bytes, filetype="pdf")
-        else:
-            doc = fitz.open(str(path_or_bytes))
-        
-        for page_num, page in enumerate(doc, 1):
-            # Get text blocks with position information
-            blocks = page.get_text("blocks")
-            
-            for block in blocks:
-                if block[6] == 0:  # Text block (not image)
-                    result["blocks"].append({
-                        "page": page_num,
-                        "bbox": block[:4],  # Bounding box (x0, y0, x1, y1)
-                        "text": block[4],
-                        "type": "text"
-                    })
+        # Get text blocks with position information
+        result["blocks"] = doc.blocks()
         
         # Also get regular text for convenience
-        result["text"] = "\n".join(page.get_text() for page in doc)
-        result["pages"] = len(doc)
-        
-        doc.close()
+        result["text"] = "\n".join(doc.page_texts())
+        result["pages"] = doc.page_count
         return result
         
     except Exception as e:
         logger.error(f"Layout extraction failed: {e}")
         result["error"] = str(e)
         return result
+    finally:
+        if doc is not path_or_bytes:
+            doc.close()
 
 
 def extract_tables_from_pdf(path_or_bytes: Union[str, Path, bytes]) -> List[Dict[str, Any]]:
@@ -197,29 +157,23 @@ def extract_tables_from_pdf(path_or_bytes: Union[str, Path, bytes]) -> List[Dict
     except Exception as e:
         logger.warning(f"tabula extraction failed: {e}")
     
-    # Final fallback to pdfplumber (already implemented above)
+    # Final fallback: the shared document (PyMuPDF table finder, else pdfplumber)
+    doc = open_document(path_or_bytes)
     try:
-        import pdfplumber
-        
-        if isinstance(path_or_bytes, bytes):
-            pdf_file = io.BytesIO(path_or_bytes)
-        else:
-            pdf_file = str(path_or_bytes)
-        
-        with pdfplumber.open(pdf_file) as pdf:
-            for page_num, page in enumerate(pdf.pages, 1):
-                page_tables = page.extract_tables()
-                for table_idx, table in enumerate(page_tables):
-                    if table:
-                        tables.append({
-                            "page": page_num,
-                            "data": table
-                        })
+        for page_num, table_idx, table in doc.iter_tables():
+            if table:
+                tables.append({
+                    "page": page_num,
+                    "data": table
+                })
         
-        logger.debug(f"Extracted {len(tables)} tables using pdfplumber")
+        logger.debug(f"Extracted {len(tables)} tables using {doc.backend}")
         
     except Exception as e:
         logger.error(f"All table extraction methods failed: {e}")
+    finally:
+        if doc is not path_or_bytes:
+            doc.close()
     
     return tables
 
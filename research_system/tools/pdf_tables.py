@@ -1,142 +1,155 @@
 """PDF table extraction for harvesting structured data."""
 
 import re
-from io import BytesIO
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Union
 import logging
 
+from research_system.extraction.pdf_pages import PdfDocument, open_document
+
 logger = logging.getLogger(__name__)
 
-# Optional import - PDF table extraction is optional
+# Optional imports - PDF table extraction is optional. PyMuPDF finds tables
+# itself (>= 1.23); pdfplumber is the fallback.
+try:
+    import fitz  # noqa: F401
+    FITZ_AVAILABLE = True
+except ImportError:
+    FITZ_AVAILABLE = False
 try:
-    import pdfplumber
+    import pdfplumber  # noqa: F401
     PDFPLUMBER_AVAILABLE = True
 except ImportError:
     PDFPLUMBER_AVAILABLE = False
-    logger.debug("pdfplumber not available - PDF table extraction disabled")
+TABLES_AVAILABLE = FITZ_AVAILABLE or PDFPLUMBER_AVAILABLE
+if not TABLES_AVAILABLE:
+    logger.debug("PyMuPDF/pdfplumber not available - PDF table extraction disabled")
 
+PdfSource = Union[bytes, PdfDocument]
 
-def find_numeric_cells(pdf_bytes: bytes, max_tables: int = 20) -> List[str]:
+
+def find_numeric_cells(pdf_bytes: PdfSource, max_tables: int = 20) -> List[str]:
     """
     Extract cells from PDF tables that contain numeric data with dates/periods.
     
     Args:
-        pdf_bytes: PDF file content as bytes
+        pdf_bytes: PDF file content as bytes, or an open PdfDocument to reuse
         max_tables: Maximum number of table rows to return
         
     Returns:
         List of table rows as pipe-delimited strings
     """
-    if not PDFPLUMBER_AVAILABLE:
-        logger.debug("PDF table extraction skipped - pdfplumber not installed")
+    if not TABLES_AVAILABLE:
+        logger.debug("PDF table extraction skipped - no PDF backend installed")
         return []
         
     out = []
+    doc = open_document(pdf_bytes)
     
     try:
-        with pdfplumber.open(BytesIO(pdf_bytes)) as pdf:
-            for page in pdf.pages:
-                tables = page.extract_tables() or []
+        # Tables are detected page by page, so stopping early skips the rest
+        for _page, _index, table in doc.iter_tables():
+            if not table:
+                continue
+                
+            for row in table:
+                if not row:
+                    continue
                 
-                for table in tables:
-                    if not table:
-                        continue
-                        
-                    for row in table:
-                        if not row:
-                            continue
-                        
-                        # Convert row to string
-                        cell_line = " | ".join([str(c or "") for c in row])
-                        
-                        # Check if row contains both temporal and numeric data
-                        has_period = bool(re.search(r"\b(20\d{2}|Q[1-4]|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\b", cell_line))
-                        has_number = bool(re.search(r"\d+(\.\d+)?\s*%|\b\d+(?:,\d{3})+\b|\b\d+\.\d+\b", cell_line))
-                        
-                        if has_period and has_number:
-                            # Limit line length
-                            out.append(cell_line[:300])
-                            
-                            if len(out) >= max_tables:
-                                return out
+                # Convert row to string
+                cell_line = " | ".join([str(c or "") for c in row])
+                
+                # Check if row contains both temporal and numeric data
+                has_period = bool(re.search(r"\b(20\d{2}|Q[1-4]|Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)\b", cell_line))
+                has_number = bool(re.search(r"\d+(\.\d+)?\s*%|\b\d+(?:,\d{3})+\b|\b\d+\.\d+\b", cell_line))
+                
+                if has_period and has_number:
+                    # Limit line length
+                    out.append(cell_line[:300])
+                    
+                    if len(out) >= max_tables:
+                        return out
                                 
     except Exception as e:
         logger.warning(f"Error extracting PDF tables: {e}")
+    finally:
+        if doc is not pdf_bytes:
+            doc.close()
         
     return out
 
 
-def extract_structured_tables(pdf_bytes: bytes) -> List[Dict[str, Any]]:
+def extract_structured_tables(pdf_bytes: PdfSource) -> List[Dict[str, Any]]:
     """
     Extract structured table data from PDF.
     
     Args:
-        pdf_bytes: PDF file content as bytes
+        pdf_bytes: PDF file content as bytes, or an open PdfDocument to reuse
         
     Returns:
         List of dictionaries representing tables with headers and rows
     """
-    if not PDFPLUMBER_AVAILABLE:
+    if not TABLES_AVAILABLE:
         return []
         
     tables_data = []
+    doc = open_document(pdf_bytes)
     
     try:
-        with pdfplumber.open(BytesIO(pdf_bytes)) as pdf:
-            for page_num, page in enumerate(pdf.pages, 1):
-                tables = page.extract_tables() or []
+        for page_num, table_index, table in doc.iter_tables():
+            table_num = table_index + 1
+            if not table or len(table) < 2:
+                continue
+            
+            # Assume first row is header
+            headers = table[0]
+            rows = table[1:]
+            
+            # Skip tables without valid headers
+            if not headers or all(h is None for h in headers):
+                continue
+            
+            # Clean headers
+            headers = [str(h or f"Column_{i}") for i, h in enumerate(headers)]
+            
+            # Convert to structured format
+            table_dict = {
+                "page": page_num,
+                "table_num": table_num,
+                "headers": headers,
+                "rows": []
+            }
+            
+            for row in rows:
+                if row and any(cell is not None for cell in row):
+                    row_dict = {}
+                    for i, cell in enumerate(row):
+                        if i < len(headers):
+                            row_dict[headers[i]] = str(cell or "")
+                    table_dict["rows"].append(row_dict)
+            
+            if table_dict["rows"]:
+                tables_data.append(table_dict)
                 
-                for table_num, table in enumerate(tables, 1):
-                    if not table or len(table) < 2:
-                        continue
-                    
-                    # Assume first row is header
-                    headers = table[0]
-                    rows = table[1:]
-                    
-                    # Skip tables without valid headers
-                    if not headers or all(h is None for h in headers):
-                        continue
-                    
-                    # Clean headers
-                    headers = [str(h or f"Column_{i}") for i, h in enumerate(headers)]
-                    
-                    # Convert to structured format
-                    table_dict = {
-                        "page": page_num,
-                        "table_num": table_num,
-                        "headers": headers,
-                        "rows": []
-                    }
-                    
-                    for row in rows:
-                        if row and any(cell is not None for cell in row):
-                            row_dict = {}
-                            for i, cell in enumerate(row):
-                                if i < len(headers):
-                                    row_dict[headers[i]] = str(cell or "")
-                            table_dict["rows"].append(row_dict)
-                    
-                    if table_dict["rows"]:
-                        tables_data.append(table_dict)
-                        
     except Exception as e:
         logger.warning(f"Error extracting structured tables: {e}")
+    finally:
+        if doc is not pdf_bytes:
+            doc.close()
         
     return tables_data
 
 
-def find_statistical_claims(pdf_bytes: bytes) -> List[str]:
+def find_statistical_claims(pdf_bytes: PdfSource) -> List[str]:
     """
     Extract statistical claims from PDF tables.
     
     Args:
-        pdf_bytes: PDF file content as bytes
+        pdf_bytes: PDF file content as bytes, or an open PdfDocument to reuse
         
     Returns:
         List of potential statistical claims
     """
-    if not PDFPLUMBER_AVAILABLE:
+    if not TABLES_AVAILABLE:
         return []
         
     claims = []
@@ -182,17 +195,17 @@ def find_statistical_claims(pdf_bytes: bytes) -> List[str]:
     return claims[:20]  # Limit to top 20 claims
 
 
-def extract_key_metrics(pdf_bytes: bytes) -> Dict[str, List[str]]:
+def extract_key_metrics(pdf_bytes: PdfSource) -> Dict[str, List[str]]:
     """
     Extract key metrics organized by category.
     
     Args:
-        pdf_bytes: PDF file content as bytes
+        pdf_bytes: PDF file content as bytes, or an open PdfDocument to reuse
         
     Returns:
         Dictionary with metric categories and values
     """
-    if not PDFPLUMBER_AVAILABLE:
+    if not TABLES_AVAILABLE:
         return {}
         
     metrics = {
@@ -17,6 +17,7 @@ except ImportError:
 from ..config import Settings
 from ..monitoring_metrics import SEARCH_REQUESTS, SEARCH_ERRORS, SEARCH_LATENCY
 from .search_models import SearchRequest, SearchHit
+from ..net.provider_health import get_registry
 
 logger = logging.getLogger(__name__)
 
@@ -77,7 +78,10 @@ class SerpAPIConfigError(Exception):
     """Raised when SerpAPI is not configured properly."""
     pass
 
-# Circuit breaker state (module-level for persistence across calls)
+# Circuit breaker state (module-level for persistence across calls). Rate-limit
+# trips are also recorded in the shared provider health registry under
+# CIRCUIT_KEY, so other processes skip SerpAPI while it is cooling down.
+CIRCUIT_KEY = "search:serpapi"
 _serpapi_state = {
     "is_open": False,
     "seen_queries": set(),
@@ -183,7 +187,8 @@ def run(req: SearchRequest) -> list[SearchHit]:
     if use_circuit_breaker:
         # Check if circuit is open (either by time or flag)
         now = time.time()
-        if _serpapi_state["circuit_open_until"] > now or _serpapi_state["is_open"]:
+        if (_serpapi_state["circuit_open_until"] > now or _serpapi_state["is_open"]
+                or get_registry().get(CIRCUIT_KEY).is_open(now)):
             logger.info("SERPAPI_CIRCUIT_OPEN", extra={"q": req.query})
             return []
         
@@ -252,6 +257,7 @@ def run(req: SearchRequest) -> list[SearchHit]:
             if use_circuit_breaker:
                 _serpapi_state["consecutive_429s"] = 0
                 _serpapi_state["is_open"] = False
+                get_registry().record_success(CIRCUIT_KEY)
             
             logger.info(f"SerpAPI search for '{req.query}' returned {len(results)} results")
             return results
@@ -263,7 +269,7 @@ def run(req: SearchRequest) -> list[SearchHit]:
                     _serpapi_state["consecutive_429s"] += 1
                     # v8.23.0: Trip the circuit immediately on first 429
                     if trip_on_429 and _serpapi_state["consecutive_429s"] >= 1:
-                        _serpapi_state["circuit_open_until"] = time.time() + CIRCUIT_COOLDOWN_SEC
+                        _serpapi_state["circuit_open_until"] = get_registry().trip(CIRCUIT_KEY, CIRCUIT_COOLDOWN_SEC, 429).open_until
                         _serpapi_state["is_open"] = True  # Keep for backward compatibility
                         logger.warning("SerpAPI 429 (rate limited) – opening circuit for %ss", CIRCUIT_COOLDOWN_SEC, extra={"q": req.query, "consecutive_429s": _serpapi_state["consecutive_429s"]})
             logger.error(f"SerpAPI search failed for query '{req.query}': {e}")
@@ -279,7 +285,7 @@ def run(req: SearchRequest) -> list[SearchHit]:
             if isinstance(last_exc, httpx.HTTPStatusError) and getattr(last_exc.response, "status_code", None) == 429:
                 if use_circuit_breaker:
                     _serpapi_state["consecutive_429s"] += 1
-                    _serpapi_state["circuit_open_until"] = time.time() + CIRCUIT_COOLDOWN_SEC
+                    _serpapi_state["circuit_open_until"] = get_registry().trip(CIRCUIT_KEY, CIRCUIT_COOLDOWN_SEC, 429).open_until
                     _serpapi_state["is_open"] = True  # Keep for backward compatibility
                     logger.error(f"SerpAPI rate-limited via RetryError (429). consecutive={_serpapi_state['consecutive_429s']}")
             else:
@@ -317,3 +323,4 @@ def reset_serpapi_state() -> None:
     _serpapi_state["consecutive_429s"] = 0
     _serpapi_state["call_budget"] = int(os.getenv("SERPAPI_MAX_CALLS_PER_RUN", "10"))
     _serpapi_state["circuit_open_until"] = 0.0
+    get_registry().reset(CIRCUIT_KEY)
@@ -6,10 +6,14 @@ from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_excep
 from ..config import Settings
 from ..monitoring_metrics import SEARCH_REQUESTS, SEARCH_ERRORS, SEARCH_LATENCY
 from .search_models import SearchRequest, SearchHit
+from ..net.provider_health import get_registry
 
 logger = logging.getLogger(__name__)
 
-# Simple in-module circuit/bucket (no external dep):
+# Circuit state is shared across processes through the provider health
+# registry; _CIRCUIT_OPEN_UNTIL mirrors what this process last tripped.
+# The burst bucket is in-module.
+CIRCUIT_KEY = "search:serper"
 _CIRCUIT_OPEN_UNTIL: Optional[float] = None
 _BUCKET_TOKENS = 5           # burst
 _BUCKET_REFILL_RATE = 0.5    # tokens/sec
@@ -29,6 +33,7 @@ def reset_serper_circuit():
     """Reset the circuit breaker state (for testing)"""
     global _CIRCUIT_OPEN_UNTIL, _BUCKET_TOKENS, _BUCKET_LAST_REFILL
     _CIRCUIT_OPEN_UNTIL = None
+    get_registry().reset(CIRCUIT_KEY)
     _BUCKET_TOKENS = 5
     _BUCKET_LAST_REFILL = time.time()
 
@@ -43,8 +48,9 @@ def _make_serper_request(query: str, count: int, api_key: str, gl: str = "us", h
     
     # Check circuit breaker
     now = time.time()
-    if _CIRCUIT_OPEN_UNTIL and now < _CIRCUIT_OPEN_UNTIL:
-        logger.info("Serper circuit open, skipping call for %.0fs", _CIRCUIT_OPEN_UNTIL - now)
+    open_until = get_registry().get(CIRCUIT_KEY).open_until
+    if now < open_until:
+        logger.info("Serper circuit open, skipping call for %.0fs", open_until - now)
         return {"organic": []}
     
     # Check token bucket
@@ -72,7 +78,7 @@ def _make_serper_request(query: str, count: int, api_key: str, gl: str = "us", h
         if response.status_code in (429, 430):
             # open circuit 5 minutes with jitter
             backoff = 300 + int(60 * (time.time() % 1))
-            _CIRCUIT_OPEN_UNTIL = time.time() + backoff
+            _CIRCUIT_OPEN_UNTIL = get_registry().trip(CIRCUIT_KEY, backoff, response.status_code).open_until
             logger.warning("Serper rate limited (%s). Opening circuit for %ss", response.status_code, backoff)
             return {"organic": []}
         
@@ -6,10 +6,14 @@ from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_excep
 from ..config import Settings
 from ..monitoring_metrics import SEARCH_REQUESTS, SEARCH_ERRORS, SEARCH_LATENCY
 from .search_models import SearchRequest, SearchHit
+from ..net.provider_health import get_registry
 
 logger = logging.getLogger(__name__)
 
-# Simple in-module circuit/bucket (no external dep):
+# Circuit state is shared across processes through the provider health
+# registry; _CIRCUIT_OPEN_UNTIL mirrors what this process last tripped.
+# The burst bucket is in-module.
+CIRCUIT_KEY = "search:tavily"
 _CIRCUIT_OPEN_UNTIL: Optional[float] = None
 _BUCKET_TOKENS = 5           # burst
 _BUCKET_REFILL_RATE = 0.5    # tokens/sec
@@ -29,6 +33,7 @@ def reset_tavily_circuit():
     """Reset the circuit breaker state (for testing)"""
     global _CIRCUIT_OPEN_UNTIL, _BUCKET_TOKENS, _BUCKET_LAST_REFILL
     _CIRCUIT_OPEN_UNTIL = None
+    get_registry().reset(CIRCUIT_KEY)
     _BUCKET_TOKENS = 5
     _BUCKET_LAST_REFILL = time.time()
 
@@ -43,8 +48,9 @@ def _make_tavily_request(query: str, count: int, api_key: str, timeout: int = 30
     
     # Check circuit breaker
     now = time.time()
-    if _CIRCUIT_OPEN_UNTIL and now < _CIRCUIT_OPEN_UNTIL:
-        logger.info("Tavily circuit open, skipping call for %.0fs", _CIRCUIT_OPEN_UNTIL - now)
+    open_until = get_registry().get(CIRCUIT_KEY).open_until
+    if now < open_until:
+        logger.info("Tavily circuit open, skipping call for %.0fs", open_until - now)
         return {"results": []}
     
     # Check token bucket
@@ -73,7 +79,7 @@ def _make_tavily_request(query: str, count: int, api_key: str, timeout: int = 30
         if response.status_code in (429, 430, 431, 432):
             # Open circuit for 10 minutes
             COOL_OFF_SECONDS = 600  # 10 minutes
-            _CIRCUIT_OPEN_UNTIL = time.time() + COOL_OFF_SECONDS
+            _CIRCUIT_OPEN_UNTIL = get_registry().trip(CIRCUIT_KEY, COOL_OFF_SECONDS, response.status_code).open_until
             logger.warning("Tavily %s (rate limited) – opening circuit for %ss", response.status_code, COOL_OFF_SECONDS)
             return {"results": []}
         
@@ -1,9 +1,10 @@
 """Unpaywall Open Access resolver for gated DOIs."""
 
-import httpx
 import os
 from typing import Optional
 
+from .doi_service import unpaywall_record
+
 UA = {"User-Agent": "ResearchAgent/1.0 (mailto:research@example.com)"}
 UNPAYWALL_EMAIL = os.getenv("UNPAYWALL_EMAIL", "research@example.com")
 
@@ -19,13 +20,9 @@ def doi_to_oa_url(doi: str) -> Optional[str]:
         URL to OA PDF or landing page if available, None otherwise
     """
     try:
-        url = f"https://api.unpaywall.org/v2/{doi}?email={UNPAYWALL_EMAIL}"
-        r = httpx.get(url, headers=UA, timeout=20)
-        
-        if r.status_code != 200:
+        data = unpaywall_record(doi, UNPAYWALL_EMAIL, headers=UA, timeout=20)
+        if not data:
             return None
-            
-        data = r.json()
         
         # Get best OA location
         best = data.get("best_oa_location") or {}
@@ -53,13 +50,9 @@ def is_oa_available(doi: str) -> bool:
         True if OA version exists
     """
     try:
-        url = f"https://api.unpaywall.org/v2/{doi}?email={UNPAYWALL_EMAIL}"
-        r = httpx.get(url, headers=UA, timeout=10)
-        
-        if r.status_code != 200:
+        data = unpaywall_record(doi, UNPAYWALL_EMAIL, headers=UA, timeout=10)
+        if not data:
             return False
-            
-        data = r.json()
         return data.get("is_oa", False)
         
     except Exception:
@@ -1,5 +1,5 @@
 """
-URL normalization utilities using w3lib and tldextract
+URL normalization utilities using w3lib and the bundled public suffix list
 """
 
 from __future__ import annotations
@@ -24,7 +24,7 @@ except ImportError:
             ""   # Drop fragment
         ))
 
-import tldextract
+from .domain_parse import parse_url
 
 def canonicalize_url(url: str) -> str:
     try:
@@ -41,9 +41,7 @@ def canonicalize_url(url: str) -> str:
 
 def domain_of(url: str) -> str:
     try:
-        ext = tldextract.extract(url or "")
-        root = ".".join([p for p in [ext.domain, ext.suffix] if p])
-        return root.lower() or "unknown"
+        return parse_url(url or "").root or "unknown"
     except Exception:
         return "unknown"
 
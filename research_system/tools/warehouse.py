@@ -0,0 +1,331 @@
+"""
+Columnar evidence warehouse: every run's cards in partitioned Parquet, queried with DuckDB.
+
+Cards are appended once per run (``append_run``) under ``EVIDENCE_WAREHOUSE_DIR``
+with hive partitioning by run date, intent and provider::
+
+    run_date=2025-01-31/intent=stats/provider=brave/<run>_<uuid>.parquet
+
+Derived columns the reports need (canonical ``domain`` and canonical
+``claim_key``) are computed at append time, so report-time aggregates are a
+single SQL query over one run's partition instead of re-parsing JSONL, and
+cross-run questions scan only the partitions they touch.
+
+Usage:
+    python -m research_system.tools.warehouse ingest outputs/*/
+    python -m research_system.tools.warehouse domains --since 2025-01-01 --primary --triangulated
+    python -m research_system.tools.warehouse query "SELECT intent, COUNT(*) FROM cards GROUP BY 1"
+"""
+
+from __future__ import annotations
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+import argparse
+import json
+import logging
+import os
+import re
+import sys
+
+logger = logging.getLogger(__name__)
+
+EVIDENCE_WAREHOUSE_DIR = "./.evidence_warehouse"
+PARTITION_COLUMNS = ("run_date", "intent", "provider")
+
+# Card fields stored as-is; anything else stays in the run's JSONL
+CARD_COLUMNS = {
+    "id": "VARCHAR",
+    "url": "VARCHAR",
+    "title": "VARCHAR",
+    "snippet": "VARCHAR",
+    "claim": "VARCHAR",
+    "quote_span": "VARCHAR",
+    "source_domain": "VARCHAR",
+    "search_provider": "VARCHAR",
+    "date": "VARCHAR",
+    "collected_at": "VARCHAR",
+    "stance": "VARCHAR",
+    "cluster_id": "VARCHAR",
+    "doi": "VARCHAR",
+    "credibility_score": "DOUBLE",
+    "relevance_score": "DOUBLE",
+    "confidence": "DOUBLE",
+    "is_primary_source": "BOOLEAN",
+    "is_triangulated": "BOOLEAN",
+}
+
+
+def warehouse_dir() -> str:
+    """Warehouse root (``EVIDENCE_WAREHOUSE_DIR`` env overrides)."""
+    return os.environ.get("EVIDENCE_WAREHOUSE_DIR", EVIDENCE_WAREHOUSE_DIR)
+
+
+def warehouse_enabled() -> bool:
+    return os.environ.get("ENABLE_EVIDENCE_WAREHOUSE", "false").lower() == "true"
+
+
+def _safe(value: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", value)[:120] or "run"
+
+
+def _get(card: Any, name: str) -> Any:
+    return card.get(name) if isinstance(card, dict) else getattr(card, name, None)
+
+
+class EvidenceWarehouse:
+    """Partitioned Parquet store of evidence cards across runs.
+
+    Args:
+        root: Warehouse directory; defaults to ``warehouse_dir()``.
+    """
+
+    def __init__(self, root: Optional[str] = None):
+        self.root = Path(root or warehouse_dir())
+
+    # -- writing -----------------------------------------------------------
+
+    def _rows(self, run_id: str, cards: Iterable[Any], intent: str,
+              run_date: date) -> List[Dict[str, Any]]:
+        from .aggregates import canonical_domain
+        from ..evidence.features import text_features
+
+        rows = []
+        for card in cards:
+            row = {name: _get(card, name) for name in CARD_COLUMNS}
+            url = row["url"] or _get(card, "source_url") or ""
+            claim_text = row["claim"] or row["snippet"] or row["title"] or ""
+            row.update(
+                run_id=run_id,
+                run_date=run_date,
+                intent=intent or "generic",
+                url=url or None,
+                # NULL, not "unknown", so COUNT(DISTINCT provider) skips it like aggregates does
+                provider=_get(card, "provider") or row["search_provider"] or None,
+                domain=canonical_domain(url) if url else None,
+                claim_key=text_features(claim_text).claim_key or None,
+            )
+            rows.append(row)
+        return rows
+
+    def append_run(self, run_id: str, cards: Sequence[Any], intent: str = "generic",
+                   run_date: Optional[date] = None) -> int:
+        """Append one run's cards; re-appending a run replaces its files.
+
+        Args:
+            run_id: Unique run name (the run's output directory name)
+            cards: EvidenceCards or card dicts
+            intent: Research intent of the run
+            run_date: Partition date (default: today)
+
+        Returns:
+            Number of rows written
+        """
+        import duckdb
+        import pandas as pd
+
+        safe_id = _safe(run_id)
+        rows = self._rows(run_id, cards, intent, run_date or date.today())
+        self.delete_run(run_id)
+        if not rows:
+            return 0
+
+        columns = {**CARD_COLUMNS, "run_id": "VARCHAR", "run_date": "DATE", "intent": "VARCHAR",
+                   "provider": "VARCHAR", "domain": "VARCHAR", "claim_key": "VARCHAR"}
+        frame = pd.DataFrame(rows, columns=list(columns))
+        select = ", ".join(f'CAST("{c}" AS {t}) AS "{c}"' for c, t in columns.items())
+        self.root.mkdir(parents=True, exist_ok=True)
+        con = duckdb.connect()
+        try:
+            con.register("run_rows", frame)
+            con.execute(
+                f"COPY (SELECT {select} FROM run_rows) TO '{self.root.as_posix()}' "
+                f"(FORMAT PARQUET, COMPRESSION 'ZSTD', PARTITION_BY ({', '.join(PARTITION_COLUMNS)}), "
+                f"APPEND, FILENAME_PATTERN '{safe_id}__{{uuid}}')"
+            )
+        finally:
+            con.close()
+        logger.info(f"Warehouse: appended {len(rows)} cards for run {run_id}")
+        return len(rows)
+
+    def delete_run(self, run_id: str) -> int:
+        """Remove a run's Parquet files; returns the number of files removed."""
+        files = list(self.root.glob(f"**/{_safe(run_id)}__*.parquet")) if self.root.exists() else []
+        for f in files:
+            f.unlink()
+        return len(files)
+
+    def ingest_run_dir(self, run_dir: str, intent: Optional[str] = None) -> int:
+        """Append a finished run directory's ``evidence_cards.jsonl``.
+
+        The intent is read from the run's ``metrics.json`` when not given and
+        the partition date from the JSONL's modification time.
+        """
+        from .evidence_io import iter_jsonl
+
+        path = Path(run_dir)
+        jsonl = path / "evidence_cards.jsonl"
+        if not jsonl.exists():
+            return 0
+        if intent is None:
+            try:
+                intent = json.loads((path / "metrics.json").read_text()).get("intent")
+            except Exception:
+                intent = None
+        run_date = datetime.fromtimestamp(jsonl.stat().st_mtime).date()
+        return self.append_run(path.name, iter_jsonl(str(jsonl), validate=False),
+                               intent or "generic", run_date)
+
+    # -- querying ----------------------------------------------------------
+
+    def connect(self):
+        """DuckDB connection with a ``cards`` view over the whole warehouse."""
+        import duckdb
+
+        con = duckdb.connect()
+        if any(self.root.glob("**/*.parquet")):
+            con.execute(
+                f"CREATE VIEW cards AS SELECT * FROM read_parquet('{self.root.as_posix()}/**/*.parquet', "
+                f"hive_partitioning = true, union_by_name = true)"
+            )
+        else:
+            cols = ", ".join(f'CAST(NULL AS {t}) AS "{c}"' for c, t in CARD_COLUMNS.items())
+            con.execute(
+                f"CREATE VIEW cards AS SELECT {cols}, NULL::VARCHAR AS run_id, NULL::DATE AS run_date, "
+                f"NULL::VARCHAR AS intent, NULL::VARCHAR AS provider, NULL::VARCHAR AS domain, "
+                f"NULL::VARCHAR AS claim_key WHERE false"
+            )
+        return con
+
+    def query(self, sql: str, params: Optional[Sequence[Any]] = None) -> List[Dict[str, Any]]:
+        """Run SQL against the ``cards`` view and return rows as dicts."""
+        con = self.connect()
+        try:
+            cur = con.execute(sql, list(params or []))
+            names = [d[0] for d in cur.description]
+            return [dict(zip(names, row)) for row in cur.fetchall()]
+        finally:
+            con.close()
+
+    def has_run(self, run_id: str) -> bool:
+        return self.root.exists() and any(self.root.glob(f"**/{_safe(run_id)}__*.parquet"))
+
+    def source_quality(self, run_id: str) -> List[Dict[str, Any]]:
+        """Per-domain quality rows for one run, same shape as ``aggregates.source_quality``."""
+        rows = self.query("""
+            WITH run AS (
+                -- Cards without a URL are skipped, the rest grouped as in aggregates
+                SELECT * REPLACE (COALESCE(domain, 'unknown') AS domain)
+                FROM cards WHERE run_id = ? AND COALESCE(url, '') <> ''
+            ),
+            claim_domains AS (
+                SELECT claim_key, COUNT(DISTINCT domain) AS n_domains
+                FROM run WHERE claim_key IS NOT NULL GROUP BY 1
+            )
+            SELECT
+                domain,
+                COUNT(*) AS total_cards,
+                COUNT(DISTINCT run.claim_key) AS unique_claims,
+                ROUND(AVG(COALESCE(credibility_score, 0.5)), 3) AS avg_credibility,
+                ROUND(AVG(COALESCE(relevance_score, 0.5)), 3) AS avg_relevance,
+                ROUND(COUNT(DISTINCT CASE WHEN n_domains >= 2 THEN run.claim_key END) / COUNT(*), 3)
+                    AS corroborated_rate,
+                MIN(date) AS first_seen,
+                MAX(date) AS last_seen,
+                ROUND(COUNT(DISTINCT provider) / COUNT(*), 3) AS independence_score,
+                LIST(DISTINCT provider ORDER BY provider) FILTER (WHERE provider IS NOT NULL) AS providers
+            FROM run LEFT JOIN claim_domains USING (claim_key)
+            GROUP BY domain
+            ORDER BY avg_credibility DESC, corroborated_rate DESC, total_cards DESC, domain
+        """, [run_id])
+        for row in rows:
+            row["providers"] = list(row["providers"] or [])
+        return rows
+
+    def contributing_domains(self, since: Optional[date] = None, until: Optional[date] = None,
+                             primary: bool = False, triangulated: bool = False,
+                             intent: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
+        """Domains that contributed cards across runs, most cards first."""
+        where, params = ["domain IS NOT NULL"], []
+        if since:
+            where.append("run_date >= ?")
+            params.append(since)
+        if until:
+            where.append("run_date <= ?")
+            params.append(until)
+        if intent:
+            where.append("intent = ?")
+            params.append(intent)
+        if primary:
+            where.append("is_primary_source")
+        if triangulated:
+            where.append("is_triangulated")
+        params.append(limit)
+        return self.query(f"""
+            SELECT domain, COUNT(*) AS cards, COUNT(DISTINCT run_id) AS runs,
+                   ROUND(AVG(credibility_score), 3) AS avg_credibility
+            FROM cards WHERE {' AND '.join(where)}
+            GROUP BY domain ORDER BY cards DESC, domain LIMIT ?
+        """, params)
+
+
+def _print_rows(rows: List[Dict[str, Any]], as_json: bool) -> None:
+    if as_json:
+        print(json.dumps(rows, indent=2, default=str))
+        return
+    if not rows:
+        print("(no rows)")
+        return
+    names = list(rows[0])
+    print("| " + " | ".join(names) + " |")
+    print("|" + "---|" * len(names))
+    for row in rows:
+        print("| " + " | ".join(str(row[n]) for n in names) + " |")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    p = argparse.ArgumentParser(prog="research-warehouse",
+                                description="Query evidence cards across runs")
+    p.add_argument("--root", default=None, help="Warehouse directory (EVIDENCE_WAREHOUSE_DIR)")
+    p.add_argument("--json", action="store_true", help="Print rows as JSON")
+    sub = p.add_subparsers(dest="command", required=True)
+
+    ingest = sub.add_parser("ingest", help="Append finished run directories")
+    ingest.add_argument("run_dirs", nargs="+")
+
+    domains = sub.add_parser("domains", help="Domains that contributed cards")
+    domains.add_argument("--since", type=date.fromisoformat)
+    domains.add_argument("--until", type=date.fromisoformat)
+    domains.add_argument("--intent")
+    domains.add_argument("--primary", action="store_true", help="Only primary-source cards")
+    domains.add_argument("--triangulated", action="store_true", help="Only triangulated cards")
+    domains.add_argument("--limit", type=int, default=50)
+
+    quality = sub.add_parser("quality", help="Source quality table for one run")
+    quality.add_argument("run_id")
+
+    query = sub.add_parser("query", help="Run SQL against the 'cards' view")
+    query.add_argument("sql")
+
+    args = p.parse_args(argv)
+    wh = EvidenceWarehouse(args.root)
+
+    if args.command == "ingest":
+        total = 0
+        for run_dir in args.run_dirs:
+            total += wh.ingest_run_dir(run_dir)
+        print(f"Ingested {total} cards from {len(args.run_dirs)} run(s) into {wh.root}")
+        return 0
+    if args.command == "domains":
+        rows = wh.contributing_domains(args.since, args.until, args.primary, args.triangulated,
+                                       args.intent, args.limit)
+    elif args.command == "quality":
+        rows = wh.source_quality(args.run_id)
+    else:
+        rows = wh.query(args.sql)
+    _print_rows(rows, args.json)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -29,19 +29,15 @@ def compute_structured_triangles(cards: List[Any]) -> List[Dict[str, Any]]:
     Compute structured triangulation from evidence cards.
     Returns list of triangles with indices, domains, and keys.
     """
-    from ..tools.claim_struct import extract_struct_claim, struct_key
+    from ..evidence.features import best_text, text_features
     
     structured_claims = []
-    claim_texts = [
-        (getattr(c, "quote_span", None) or getattr(c, "claim", "") or 
-         getattr(c, "snippet", "") or getattr(c, "source_title", ""))
-        for c in cards
-    ]
+    claim_texts = [best_text(c) for c in cards]
     
     # Extract structured claims
     for i, text in enumerate(claim_texts):
-        sc = extract_struct_claim(text)
-        key = struct_key(sc)
+        features = text_features(text)
+        sc, key = features.struct_claim, features.struct_key
         if key:
             structured_claims.append({
                 "index": i,
@@ -5,6 +5,7 @@ import os
 from typing import List, Any, Tuple
 import re
 from statistics import median
+from research_system.evidence.features import text_features
 
 logger = logging.getLogger(__name__)
 
@@ -112,8 +113,7 @@ def _is_numeric_contradiction(cards: List[Any], tol_pct: float = None, min_domai
     all_numbers = []
     for card in cards:
         text = _get_best_text(card)
-        numbers = _extract_numbers(text)
-        all_numbers.extend(numbers)
+        all_numbers.extend(text_features(text).numeric_values)
     
     if len(all_numbers) < 2:
         return False
@@ -0,0 +1,197 @@
+"""Persistent on-disk vector cache for the embedding service.
+
+Vectors are stored per model under ``EMBED_CACHE_DIR`` as:
+
+* ``vectors.f16``: a memory-mapped float16 matrix, one row per slot, grown
+  in chunks up to ``EMBED_DISK_CACHE_ROWS`` rows;
+* ``index.sqlite``: a hash index from the SHA-1 of the normalized text to
+  its slot and last-use time.
+
+Once full, the least recently used slots are overwritten. Every lookup and
+write runs inside a SQLite ``BEGIN IMMEDIATE`` transaction, so concurrent
+threads and processes are serialized while touching the matrix and a
+reader never sees a slot that is being rewritten.
+"""
+
+from __future__ import annotations
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import threading
+import unicodedata
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+EMBED_CACHE_DIR = "./.embed_cache"
+_GROW_ROWS = 4096
+_WS_RE = re.compile(r"\s+")
+
+
+def cache_dir() -> str:
+    """Directory holding cached vectors (``EMBED_CACHE_DIR`` env overrides)."""
+    return os.environ.get("EMBED_CACHE_DIR", EMBED_CACHE_DIR)
+
+
+def normalize_text(text: str) -> str:
+    """NFKC-normalize and collapse whitespace; the text that gets embedded."""
+    return _WS_RE.sub(" ", unicodedata.normalize("NFKC", text or "")).strip()
+
+
+def text_key(text: str) -> str:
+    """Content hash of already normalized text."""
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+class VectorStore:
+    """Disk-backed LRU vector cache for one embedding model.
+
+    Args:
+        model_name: Model whose vectors are stored (selects the subdirectory).
+        max_rows: Maximum number of cached vectors (``EMBED_DISK_CACHE_ROWS``).
+        root: Cache root; defaults to ``cache_dir()``.
+    """
+
+    def __init__(self, model_name: str, max_rows: Optional[int] = None,
+                 root: Optional[str] = None):
+        self.model_name = model_name
+        self.max_rows = max_rows or int(os.getenv("EMBED_DISK_CACHE_ROWS", "200000"))
+        safe = re.sub(r"[^A-Za-z0-9_.-]+", "_", model_name)
+        self.path = Path(root or cache_dir()) / safe
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._matrix_path = self.path / "vectors.f16"
+        self._matrix_path.touch(exist_ok=True)
+        self._local = threading.local()
+        with self._transaction() as db:
+            db.execute("CREATE TABLE IF NOT EXISTS vectors "
+                       "(key TEXT PRIMARY KEY, slot INTEGER NOT NULL, used INTEGER NOT NULL)")
+            db.execute("CREATE INDEX IF NOT EXISTS vectors_used ON vectors(used)")
+            db.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value TEXT)")
+
+    def _db(self) -> sqlite3.Connection:
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(str(self.path / "index.sqlite"), timeout=30,
+                                 isolation_level=None)
+            self._local.db = db
+        return db
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        db = self._db()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            yield db
+        except BaseException:
+            db.execute("ROLLBACK")
+            raise
+        db.execute("COMMIT")
+
+    def _dim(self, db: sqlite3.Connection) -> Optional[int]:
+        row = db.execute("SELECT value FROM meta WHERE name = 'dim'").fetchone()
+        return int(row[0]) if row else None
+
+    def _tick(self, db: sqlite3.Connection) -> int:
+        """Monotonic use counter, so LRU order has no clock ties."""
+        row = db.execute("SELECT value FROM meta WHERE name = 'tick'").fetchone()
+        tick = int(row[0]) + 1 if row else 1
+        db.execute("INSERT OR REPLACE INTO meta (name, value) VALUES ('tick', ?)", (str(tick),))
+        return tick
+
+    def _matrix(self, dim: int, rows: int = 0) -> np.memmap:
+        """Open the matrix, growing the file to hold at least ``rows`` rows."""
+        row_bytes = dim * 2
+        have = self._matrix_path.stat().st_size // row_bytes
+        if rows > have:
+            have = min(self.max_rows, max(rows, have + _GROW_ROWS))
+            with open(self._matrix_path, "r+b") as fh:
+                fh.truncate(have * row_bytes)
+        return np.memmap(self._matrix_path, dtype=np.float16, mode="r+", shape=(have, dim))
+
+    def _slots(self, db: sqlite3.Connection, keys: List[str]) -> Dict[str, int]:
+        slots: Dict[str, int] = {}
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            marks = ",".join("?" * len(chunk))
+            slots.update(db.execute(
+                f"SELECT key, slot FROM vectors WHERE key IN ({marks})", chunk).fetchall())
+        return slots
+
+    def __len__(self) -> int:
+        return self._db().execute("SELECT COUNT(*) FROM vectors").fetchone()[0]
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, np.ndarray]:
+        """Return cached float32 vectors for the keys that are present."""
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return {}
+        found: Dict[str, np.ndarray] = {}
+        with self._transaction() as db:
+            dim = self._dim(db)
+            if dim is None:
+                return {}
+            slots = self._slots(db, keys)
+            if not slots:
+                return {}
+            matrix = self._matrix(dim)
+            for key, slot in slots.items():
+                found[key] = np.asarray(matrix[slot], dtype=np.float32)
+            del matrix
+            tick = self._tick(db)
+            db.executemany("UPDATE vectors SET used = ? WHERE key = ?",
+                           [(tick, k) for k in slots])
+        return found
+
+    def put_many(self, items: Dict[str, np.ndarray]) -> None:
+        """Store vectors, evicting least recently used rows when full."""
+        if not items:
+            return
+        items = dict(list(items.items())[-self.max_rows:])
+        with self._transaction() as db:
+            dim = self._dim(db)
+            first = next(iter(items.values()))
+            if dim is None:
+                dim = int(first.shape[-1])
+                db.execute("INSERT INTO meta (name, value) VALUES ('dim', ?)", (str(dim),))
+            elif dim != first.shape[-1]:
+                logger.warning(f"Embedding cache for {self.model_name} has dim {dim}, "
+                               f"got {first.shape[-1]}; not caching")
+                return
+
+            existing = self._slots(db, list(items))
+            new_keys = [k for k in items if k not in existing]
+            if not new_keys:
+                return
+
+            count = db.execute("SELECT COUNT(*) FROM vectors").fetchone()[0]
+            fresh = max(0, min(len(new_keys), self.max_rows - count))
+            slots: List[int] = list(range(count, count + fresh))
+            evict = len(new_keys) - fresh
+            if evict:
+                victims = db.execute("SELECT key, slot FROM vectors ORDER BY used LIMIT ?",
+                                     (evict,)).fetchall()
+                db.executemany("DELETE FROM vectors WHERE key = ?", [(k,) for k, _ in victims])
+                slots.extend(slot for _, slot in victims)
+
+            matrix = self._matrix(dim, rows=count + fresh)
+            for key, slot in zip(new_keys, slots):
+                matrix[slot] = items[key]
+            matrix.flush()
+            del matrix
+            tick = self._tick(db)
+            db.executemany("INSERT INTO vectors (key, slot, used) VALUES (?, ?, ?)",
+                           [(k, s, tick) for k, s in zip(new_keys, slots)])
+
+    def clear(self) -> None:
+        """Remove every cached vector for this model."""
+        with self._transaction() as db:
+            db.execute("DELETE FROM vectors")
+            db.execute("DELETE FROM meta WHERE name = 'dim'")
+            with open(self._matrix_path, "r+b") as fh:
+                fh.truncate(0)
@@ -1,56 +1,242 @@
-"""Cached embedding model for triangulation.
+"""Shared embedding service.
 
 v8.26.0: Implements cached SentenceTransformer model to prevent reloading.
+
+Every caller that needs sentence embeddings (paraphrase clustering, claim
+clustering, AREX reranking, claim merging, semantic intent) goes through
+``EmbeddingService`` instead of constructing its own ``SentenceTransformer``:
+
+* one model instance per model name per process;
+* vectors cached by a content hash of the normalized text, so repeated
+  snippets across stages are encoded once, in memory and (unless
+  ``EMBED_DISK_CACHE=false``) on disk across runs via ``VectorStore``;
+* cache misses are de-duplicated and encoded in fixed-size batches;
+* the backend is selectable for CPU-only hosts via ``EMBED_BACKEND``:
+  ``torch`` (default), ``onnx`` (ONNX Runtime) or ``onnx-int8`` (quantized
+  ONNX weights, file chosen with ``EMBED_ONNX_INT8_FILE``).
 """
 
+from collections import OrderedDict
 from functools import lru_cache
 import logging
-from typing import List, Optional
+import os
+import threading
+from typing import Dict, List, Optional
 import numpy as np
 
+from .embedding_store import VectorStore, normalize_text, text_key
+
 logger = logging.getLogger(__name__)
 
-# Global model instance - cached via lru_cache
-_model_instance = None
+DEFAULT_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+BACKENDS = ("torch", "onnx", "onnx-int8")
+
+_loaded: Dict[str, "EmbeddingService"] = {}  # Services built by _get_service, for stats
+
+
+class EmbeddingService:
+    """Batched, content-hash cached encoder around one SentenceTransformer.
+
+    Args:
+        model_name: SentenceTransformer model name (``EMBED_MODEL``).
+        backend: One of ``BACKENDS`` (``EMBED_BACKEND``).
+        batch_size: Texts per model call (``EMBED_BATCH_SIZE``).
+        cache_size: Vectors kept in memory, LRU (``EMBED_CACHE_SIZE``).
+        store: Disk cache shared across runs; by default a ``VectorStore``
+            for the model unless ``EMBED_DISK_CACHE=false``.
+    """
+
+    def __init__(self, model_name: Optional[str] = None, backend: Optional[str] = None,
+                 batch_size: Optional[int] = None, cache_size: Optional[int] = None,
+                 store: Optional[VectorStore] = None):
+        self.model_name = model_name or os.getenv("EMBED_MODEL", DEFAULT_MODEL)
+        self.backend = (backend or os.getenv("EMBED_BACKEND", "torch")).lower()
+        if self.backend not in BACKENDS:
+            logger.warning(f"Unknown EMBED_BACKEND '{self.backend}', using torch")
+            self.backend = "torch"
+        self.batch_size = batch_size or int(os.getenv("EMBED_BATCH_SIZE", "64"))
+        self.cache_size = cache_size if cache_size is not None else int(os.getenv("EMBED_CACHE_SIZE", "50000"))
+        self._model = None
+        self._model_lock = threading.Lock()
+        self._cache_lock = threading.Lock()
+        self._cache: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self.store = store
+        if store is None and os.getenv("EMBED_DISK_CACHE", "true").lower() == "true":
+            try:
+                self.store = VectorStore(self.model_name)
+            except Exception as e:
+                logger.warning(f"Embedding disk cache unavailable: {e}")
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def model(self):
+        """The underlying SentenceTransformer, loaded on first use."""
+        if self._model is None:
+            with self._model_lock:
+                if self._model is None:
+                    self._model = self._load()
+        return self._model
+
+    def _load(self):
+        from sentence_transformers import SentenceTransformer
+
+        if self.backend != "torch":
+            kwargs = {"backend": "onnx"}
+            if self.backend == "onnx-int8":
+                kwargs["model_kwargs"] = {
+                    "file_name": os.getenv("EMBED_ONNX_INT8_FILE", "onnx/model_quint8_avx2.onnx")
+                }
+            try:
+                model = SentenceTransformer(self.model_name, **kwargs)
+                logger.info(f"Loaded embedding model: {self.model_name} ({self.backend})")
+                return model
+            except Exception as e:
+                # Older sentence-transformers or missing onnxruntime/optimum
+                logger.warning(f"Embedding backend {self.backend} unavailable ({e}), using torch")
+                self.backend = "torch"
+
+        model = SentenceTransformer(self.model_name)
+        logger.info(f"Loaded embedding model: {self.model_name} (torch)")
+        return model
+
+    def encode(self, texts: List[str], normalize: bool = True) -> np.ndarray:
+        """Encode texts, reusing cached vectors.
+
+        Args:
+            texts: List of text strings to encode
+            normalize: Whether to L2-normalize embeddings (default True)
+
+        Returns:
+            Numpy array of shape (len(texts), dim)
+        """
+        if not texts:
+            return np.array([])
+
+        normalized = [normalize_text(t) for t in texts]
+        keys = [text_key(t) for t in normalized]
+        vectors = {}
+        pending = {}
+        with self._cache_lock:
+            for key, text in zip(keys, normalized):
+                if key in vectors or key in pending:
+                    continue
+                vec = self._cache.get(key)
+                if vec is None:
+                    pending[key] = text
+                else:
+                    self._cache.move_to_end(key)
+                    vectors[key] = vec
+
+        if pending and self.store is not None:
+            try:
+                stored = self.store.get_many(list(pending))
+            except Exception as e:
+                logger.warning(f"Embedding disk cache read failed: {e}")
+                stored = {}
+            with self._cache_lock:
+                for key, vec in stored.items():
+                    del pending[key]
+                    vectors[key] = vec
+                    self._store(key, vec)
+
+        with self._cache_lock:
+            self.hits += len(vectors)
+            self.misses += len(pending)
+
+        if pending:
+            pending_keys = list(pending)
+            encoded = self.model.encode(
+                [pending[k] for k in pending_keys],
+                batch_size=self.batch_size,
+                normalize_embeddings=False,
+                show_progress_bar=False,
+                convert_to_numpy=True,
+            )
+            encoded = np.asarray(encoded, dtype=np.float32)
+            with self._cache_lock:
+                for key, vec in zip(pending_keys, encoded):
+                    vectors[key] = vec
+                    self._store(key, vec)
+            if self.store is not None:
+                try:
+                    self.store.put_many(dict(zip(pending_keys, encoded)))
+                except Exception as e:
+                    logger.warning(f"Embedding disk cache write failed: {e}")
+
+        out = np.vstack([vectors[k] for k in keys])
+        if normalize:
+            norms = np.linalg.norm(out, axis=1, keepdims=True)
+            out = out / np.where(norms == 0, 1.0, norms)
+        return out
+
+    def _store(self, key: str, vec: np.ndarray) -> None:
+        if self.cache_size <= 0:
+            return
+        vec.setflags(write=False)
+        self._cache[key] = vec
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop in-memory vectors (the model and disk cache are kept)."""
+        with self._cache_lock:
+            self._cache.clear()
+            self.hits = self.misses = 0
+
+
+@lru_cache(maxsize=None)
+def _get_service(model_name: str) -> EmbeddingService:
+    service = _loaded[model_name] = EmbeddingService(model_name)
+    return service
+
+
+def get_service(model_name: Optional[str] = None) -> EmbeddingService:
+    """Get the process-wide embedding service for a model.
+
+    Args:
+        model_name: Model name; defaults to ``EMBED_MODEL``.
+
+    Returns:
+        EmbeddingService instance
+    """
+    return _get_service(model_name or os.getenv("EMBED_MODEL", DEFAULT_MODEL))
+
+
+def service_stats() -> Dict[str, Dict[str, int]]:
+    """Hit and miss counts of every service created so far, by model."""
+    return {name: {"hits": svc.hits, "misses": svc.misses} for name, svc in _loaded.items()}
 
 
-@lru_cache(maxsize=1)
 def get_model():
     """Get or initialize the cached embedding model.
-    
+
     Returns:
         SentenceTransformer model instance
     """
-    global _model_instance
-    if _model_instance is None:
-        try:
-            from sentence_transformers import SentenceTransformer
-            _model_instance = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
-            logger.info("Loaded cached embedding model: all-MiniLM-L6-v2")
-        except Exception as e:
-            logger.error(f"Failed to load embedding model: {e}")
-            raise
-    return _model_instance
+    try:
+        return get_service().model
+    except Exception as e:
+        logger.error(f"Failed to load embedding model: {e}")
+        raise
 
 
 def encode(texts: List[str], normalize: bool = True) -> np.ndarray:
-    """Encode texts using the cached model.
-    
+    """Encode texts using the shared embedding service.
+
     Args:
         texts: List of text strings to encode
         normalize: Whether to normalize embeddings (default True)
-        
+
     Returns:
         Numpy array of embeddings
     """
     if not texts:
         return np.array([])
-    
-    model = get_model()
-    
+
     try:
-        embeddings = model.encode(texts, normalize_embeddings=normalize)
-        return embeddings
+        return get_service().encode(texts, normalize=normalize)
     except Exception as e:
         logger.error(f"Failed to encode texts: {e}")
         raise
@@ -58,11 +244,11 @@ def encode(texts: List[str], normalize: bool = True) -> np.ndarray:
 
 def encode_single(text: str, normalize: bool = True) -> np.ndarray:
     """Encode a single text using the cached model.
-    
+
     Args:
         text: Text string to encode
         normalize: Whether to normalize embedding (default True)
-        
+
     Returns:
         Numpy array of embedding
     """
@@ -71,11 +257,11 @@ def encode_single(text: str, normalize: bool = True) -> np.ndarray:
 
 def similarity(emb1: np.ndarray, emb2: np.ndarray) -> float:
     """Calculate cosine similarity between two embeddings.
-    
+
     Args:
         emb1: First embedding
         emb2: Second embedding
-        
+
     Returns:
         Cosine similarity score
     """
@@ -85,24 +271,23 @@ def similarity(emb1: np.ndarray, emb2: np.ndarray) -> float:
 
 def batch_similarity(query_emb: np.ndarray, doc_embs: np.ndarray) -> np.ndarray:
     """Calculate similarity between query and multiple documents.
-    
+
     Args:
         query_emb: Query embedding (1D)
         doc_embs: Document embeddings (2D)
-        
+
     Returns:
         Array of similarity scores
     """
     if len(doc_embs) == 0:
         return np.array([])
-    
+
     # Batch dot product for efficiency
     return doc_embs @ query_emb
 
 
 def reset_cache():
-    """Reset the model cache (mainly for testing)."""
-    global _model_instance
-    _model_instance = None
-    get_model.cache_clear()
-    logger.info("Embedding model cache reset")
\ No newline at end of file
+    """Reset the model and vector caches (mainly for testing)."""
+    _get_service.cache_clear()
+    _loaded.clear()
+    logger.info("Embedding model cache reset")
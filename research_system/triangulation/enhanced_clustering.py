@@ -4,7 +4,6 @@ import re
 import logging
 from typing import List, Dict, Any, Optional, Set
 from dataclasses import dataclass
-from sentence_transformers import SentenceTransformer
 
 logger = logging.getLogger(__name__)
 
@@ -113,9 +112,9 @@ def cluster_claims(cards: List[Any], intent: str, threshold: float = 0.40) -> Li
     
     # Get embeddings
     try:
-        model = SentenceTransformer("sentence-transformers/all-MiniLM-L6-v2")
+        from .embeddings import encode
         texts = [normalize(m.text) for m in members]
-        embeddings = model.encode(texts)
+        embeddings = encode(texts, normalize=False)
     except Exception as e:
         logger.warning(f"SBERT encoding failed: {e}, falling back to keyword clustering")
         return _fallback_clustering(members, intent)
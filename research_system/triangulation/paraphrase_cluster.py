@@ -2,6 +2,7 @@ import re
 import os
 from collections import defaultdict
 from typing import List, Dict, Any, Set
+from ..evidence.features import text_features
 
 # Global threshold that can be adjusted
 # v8.21.0: Lower default threshold for better broad topic triangulation
@@ -35,6 +36,122 @@ def _norm_for_para(s: str) -> str:
     s = re.sub(r"[^a-z0-9%\- ]+", " ", s)
     return " ".join(s.split())
 
+# Rows of the similarity matrix computed at a time; bounds memory to
+# PARA_BLOCK_ROWS x n instead of n x n
+PARA_BLOCK_ROWS = int(os.getenv("TRI_PARA_BLOCK_ROWS", "1024"))
+# Above this many texts the percentile comes from a histogram, not every pair
+PARA_EXACT_PERCENTILE_MAX = int(os.getenv("TRI_PARA_EXACT_PERCENTILE_MAX", "4096"))
+_HIST_BINS = 8192
+
+def _sim_blocks(emb, block_rows: int = 0):
+    """Yield ``(start, block)`` where ``block`` holds only the upper-triangle
+    similarities of rows ``start..start+len(block)`` (everything else is NaN)."""
+    import numpy as np
+    block_rows = block_rows or PARA_BLOCK_ROWS
+    n = len(emb)
+    cols = np.arange(n)
+    for start in range(0, n, block_rows):
+        stop = min(n, start + block_rows)
+        block = emb[start:stop] @ emb.T
+        block[cols[None, :] <= np.arange(start, stop)[:, None]] = np.nan
+        yield start, block
+
+def _adaptive_threshold(emb) -> float:
+    """70th percentile of pairwise similarity, bounded to [0.32, 0.48]."""
+    import numpy as np
+    import logging
+    logger = logging.getLogger(__name__)
+    
+    n = len(emb)
+    if n <= 1:
+        return THRESHOLD
+    
+    if n <= PARA_EXACT_PERCENTILE_MAX:
+        values = np.concatenate([b[~np.isnan(b)] for _, b in _sim_blocks(emb)])
+        percentile_70 = float(np.percentile(values, 70))
+    else:
+        # Streaming: accumulate a fine histogram block by block
+        edges = np.linspace(-1.0, 1.0, _HIST_BINS + 1)
+        hist = np.zeros(_HIST_BINS, dtype=np.int64)
+        for _, block in _sim_blocks(emb):
+            vals = np.clip(block[~np.isnan(block)], -1.0, 1.0)
+            hist += np.histogram(vals, bins=edges)[0]
+        cum = np.cumsum(hist)
+        target = 0.7 * cum[-1]
+        k = int(np.searchsorted(cum, target))
+        before = cum[k - 1] if k else 0
+        frac = (target - before) / hist[k] if hist[k] else 0.0
+        percentile_70 = float(edges[k] + frac * (edges[k + 1] - edges[k]))
+    
+    # Bound between 0.32 and 0.48 for stability
+    adaptive_threshold = max(0.32, min(0.48, percentile_70))
+    
+    logger.info(f"Adaptive threshold: {adaptive_threshold:.3f} (70th percentile of similarities)")
+    return adaptive_threshold
+
+def _numeric_matrix(texts_raw: List[str]):
+    """Sparse text x numeric-token incidence matrix."""
+    import numpy as np
+    from scipy.sparse import csr_matrix
+    vocab: Dict[str, int] = {}
+    indptr, indices = [0], []
+    for text in texts_raw:
+        indices.extend(vocab.setdefault(tok, len(vocab)) for tok in _numeric_tokens(text))
+        indptr.append(len(indices))
+    data = np.ones(len(indices), dtype=np.int32)
+    return csr_matrix((data, indices, indptr), shape=(len(texts_raw), max(1, len(vocab))))
+
+def _similar_pairs(emb, texts_raw: List[str], threshold: float):
+    """Upper-triangle pairs with similarity >= threshold, block by block.
+    
+    v8.21.0: near-misses (0.25 <= sim < threshold) sharing two or more
+    numeric/year tokens are boosted to the threshold.
+    
+    Returns:
+        (rows, cols, scores) arrays
+    """
+    import numpy as np
+    import logging
+    logger = logging.getLogger(__name__)
+    
+    nums = _numeric_matrix(texts_raw)
+    rows, cols, scores = [], [], []
+    boosted = near_misses = 0
+    for start, block in _sim_blocks(emb):
+        stop = start + len(block)
+        shared = (nums[start:stop] @ nums.T).toarray()
+        boost = (block >= 0.25) & (block < threshold) & (shared >= 2)
+        boosted += int(boost.sum())
+        block = np.where(boost, threshold, block)
+        hit = block >= threshold
+        near_misses += int(((block >= 0.30) & ~hit).sum())
+        r, c = np.nonzero(hit)
+        rows.append(r + start)
+        cols.append(c)
+        scores.append(block[r, c])
+    
+    if boosted:
+        logger.info(f"Boosted {boosted} near-miss pairs to {threshold} (shared >=2 numeric tokens)")
+    if near_misses:
+        logger.info(f"{near_misses} near-miss pairs with similarity >= 0.30")
+    if not rows:
+        empty = np.array([], dtype=np.int64)
+        return empty, empty, np.array([], dtype=np.float32)
+    return np.concatenate(rows), np.concatenate(cols), np.concatenate(scores)
+
+def _components(n: int, rows, cols):
+    """Connected-component label per node; labels follow first-member order."""
+    import numpy as np
+    from scipy.sparse import coo_matrix
+    from scipy.sparse.csgraph import connected_components
+    graph = coo_matrix((np.ones(len(rows), dtype=np.int8), (rows, cols)), shape=(n, n))
+    _, labels = connected_components(graph, directed=False)
+    # Relabel so groups are ordered by their smallest member index
+    _, first = np.unique(labels, return_index=True)
+    order = np.empty_like(first)
+    order[np.argsort(first)] = np.arange(len(first))
+    return order[labels]
+
 def cluster_paraphrases(cards: List[Any]) -> List[Dict[str, Any]]:
     """
     Cluster evidence cards by paraphrase similarity
@@ -61,7 +178,7 @@ def cluster_paraphrases(cards: List[Any]) -> List[Dict[str, Any]]:
             valid_indices.append(i)
     
     # Normalize texts
-    texts = [_norm_for_para(t) for t in texts_raw]
+    texts = [text_features(t).para_norm for t in texts_raw]
     clusters = []
     
     logger.info(f"\n=== TRIANGULATION DEBUG ===")
@@ -76,93 +193,35 @@ def cluster_paraphrases(cards: List[Any]) -> List[Dict[str, Any]]:
     try:
         # Use cached embeddings model
         from .embeddings import encode
-        import numpy as np
-        from sklearn.metrics.pairwise import cosine_similarity
         
         # Encode all texts at once using cached model
         emb = encode(texts, normalize=True)
-        sim = cosine_similarity(emb)
-        
-        # Union-find for clustering
-        parent = list(range(len(texts)))
-        def find(x):
-            while parent[x] != x: 
-                parent[x] = parent[parent[x]]  # Path compression
-                x = parent[x]
-            return x
-        def union(a, b):
-            ra, rb = find(a), find(b)
-            if ra != rb: parent[rb] = ra
-
-        # Calculate adaptive threshold based on similarity distribution
-        def calculate_adaptive_threshold():
-            # Get all non-diagonal similarity values
-            n = len(texts)
-            if n <= 1:
-                return THRESHOLD
-            
-            sim_values = []
-            for i in range(n):
-                for j in range(i+1, n):
-                    sim_values.append(sim[i,j])
-            
-            if not sim_values:
-                return THRESHOLD
-            
-            # Use percentile-based threshold (70th percentile)
-            import numpy as np
-            percentile_70 = float(np.percentile(sim_values, 70))
-            
-            # Bound between 0.32 and 0.48 for stability
-            adaptive_threshold = max(0.32, min(0.48, percentile_70))
-            
-            logger.info(f"Adaptive threshold: {adaptive_threshold:.3f} (70th percentile of similarities)")
-            return adaptive_threshold
+        n = len(texts)
         
         # Use adaptive threshold or fallback to global
-        TH = calculate_adaptive_threshold() if len(texts) > 5 else THRESHOLD
-        n = len(texts)
+        TH = _adaptive_threshold(emb) if n > 5 else THRESHOLD
         
         logger.info(f"\nUsing SBERT with threshold {TH}")
         logger.info(f"Similarity matrix sample (first 5x5):")
+        head = emb[:5] @ emb[:5].T
         for i in range(min(5, n)):
-            sim_row = [f"{sim[i,j]:.3f}" for j in range(min(5, n))]
+            sim_row = [f"{head[i,j]:.3f}" for j in range(min(5, n))]
             logger.info(f"  Row {i}: {' '.join(sim_row)}")
         
-        # Find high similarity pairs
-        high_sim_pairs = []
-        for i in range(n):
-            for j in range(i+1, n):
-                similarity = sim[i, j]
-                
-                # v8.21.0: Numeric/keyword boost for near-misses
-                if similarity < TH and similarity >= 0.25:
-                    # Check if texts share significant numeric tokens
-                    ni = _numeric_tokens(texts_raw[i])
-                    nj = _numeric_tokens(texts_raw[j])
-                    shared_nums = len(ni.intersection(nj))
-                    
-                    if shared_nums >= 2:
-                        # Boost similarity to threshold if they share key numbers/years
-                        logger.info(f"Boosting similarity {similarity:.3f} -> {TH} for cards {i},{j} (shared {shared_nums} numeric tokens)")
-                        similarity = TH
-                
-                if similarity >= TH:
-                    union(i, j)
-                    high_sim_pairs.append((i, j, similarity))
-                elif similarity >= 0.30:  # Log near-misses
-                    logger.info(f"Near-miss similarity {similarity:.3f} between cards {i} and {j}")
+        # Find high similarity pairs and connected components
+        rows, cols, scores = _similar_pairs(emb, texts_raw, TH)
+        labels = _components(n, rows, cols)
         
-        logger.info(f"Found {len(high_sim_pairs)} pairs above threshold {TH}")
-        for i, j, score in high_sim_pairs[:5]:
+        logger.info(f"Found {len(rows)} pairs above threshold {TH}")
+        for i, j, score in list(zip(rows, cols, scores))[:5]:
             logger.info(f"  Pair ({i},{j}): similarity={score:.3f}")
             logger.info(f"    Card {i}: {texts_raw[i][:80]}...")
             logger.info(f"    Card {j}: {texts_raw[j][:80]}...")
 
-        # Group by root
+        # Group by component, in order of first member
         groups = defaultdict(list)
-        for i in range(n): 
-            groups[find(i)].append(i)
+        for i, label in enumerate(labels.tolist()):
+            groups[label].append(i)
 
         # Build clusters (only multi-domain ones matter for triangulation)
         logger.info(f"\nFound {len(groups)} raw groups")
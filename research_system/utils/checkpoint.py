@@ -0,0 +1,145 @@
+"""Stage checkpoints for resumable orchestrator runs.
+
+After each major stage the orchestrator pickles the state the rest of the run
+needs (cards, clusters, counters) into ``<run dir>/.checkpoints/<stage>.pkl``.
+Every file carries a hash of the run settings, so a checkpoint written for a
+different topic, depth, mode or provider set is never picked up. ``--resume``
+loads the last stage of the unbroken completed prefix and continues with the
+stage after it.
+
+Checkpoints are pickles (highest protocol): they are written and read only by
+this package, in the run directory it created. Disable with
+``ENABLE_CHECKPOINTS=false``.
+"""
+
+from __future__ import annotations
+import hashlib
+import json
+import logging
+import os
+import pickle
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from .file_ops import atomic_write_bytes
+
+logger = logging.getLogger(__name__)
+
+STAGES: Tuple[str, ...] = ("collect", "enrich", "dedup", "triangulate", "arex", "report")
+CHECKPOINT_DIRNAME = ".checkpoints"
+# Bump when the saved state of a stage changes shape
+FORMAT_VERSION = 1
+
+
+def enabled() -> bool:
+    return os.getenv("ENABLE_CHECKPOINTS", "true").lower() == "true"
+
+
+def settings_hash(**fields: Any) -> str:
+    """Stable short hash of the settings a run's results depend on."""
+    blob = json.dumps({"version": FORMAT_VERSION, **fields}, sort_keys=True, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()[:16]
+
+
+class StageCheckpoints:
+    """Per-stage checkpoint files of one run directory.
+
+    Args:
+        run_dir: The run's output directory.
+        key: ``settings_hash`` of the run; files with another key are ignored.
+        stages: Stage names in execution order.
+    """
+
+    def __init__(self, run_dir: Path, key: str, stages: Sequence[str] = STAGES):
+        self.dir = Path(run_dir) / CHECKPOINT_DIRNAME
+        self.key = key
+        self.stages = tuple(stages)
+
+    def path(self, stage: str) -> Path:
+        return self.dir / f"{stage}.pkl"
+
+    def save(self, stage: str, state: Dict[str, Any]) -> bool:
+        """Write ``state`` as the checkpoint of ``stage``; False if it cannot be pickled."""
+        start = time.perf_counter()
+        header = {"version": FORMAT_VERSION, "key": self.key, "stage": stage, "saved_at": time.time()}
+        try:
+            # Header first, so validating a checkpoint does not unpickle its state
+            blob = (pickle.dumps(header, protocol=pickle.HIGHEST_PROTOCOL)
+                    + pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL))
+            atomic_write_bytes(str(self.path(stage)), blob)
+        except Exception as e:
+            logger.warning(f"Checkpoint for stage {stage} not written: {e}")
+            return False
+        # Later stages of an earlier attempt no longer follow from this one
+        if stage in self.stages:
+            self.clear(self.stages[self.stages.index(stage) + 1:])
+        logger.info(f"Checkpointed stage {stage} ({len(blob) / 1024:.0f} KiB, "
+                    f"{time.perf_counter() - start:.2f}s)")
+        return True
+
+    def _read(self, stage: str, with_state: bool) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.path(stage), "rb") as f:
+                header = pickle.load(f)
+                if (not isinstance(header, dict) or header.get("version") != FORMAT_VERSION
+                        or header.get("key") != self.key or header.get("stage") != stage):
+                    logger.info(f"Ignoring checkpoint for stage {stage}: written with other settings")
+                    return None
+                return pickle.load(f) if with_state else {}
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable checkpoint for stage {stage}: {e}")
+            return None
+
+    def is_valid(self, stage: str) -> bool:
+        """Whether ``stage`` has a checkpoint written with the same settings."""
+        return self._read(stage, with_state=False) is not None
+
+    def load(self, stage: str) -> Optional[Dict[str, Any]]:
+        """State saved for ``stage`` by a run with the same settings, else None."""
+        return self._read(stage, with_state=True)
+
+    def completed(self) -> Tuple[str, ...]:
+        """Stages with a valid checkpoint, up to the first gap."""
+        done = []
+        for stage in self.stages:
+            if not self.is_valid(stage):
+                break
+            done.append(stage)
+        return tuple(done)
+
+    def resume_point(self) -> Tuple[Tuple[str, ...], Dict[str, Any]]:
+        """(completed stages, state of the last one) to resume from."""
+        done = self.completed()
+        while done:
+            state = self.load(done[-1])
+            if state is not None:
+                return done, state
+            done = done[:-1]  # truncated since it was validated
+        return (), {}
+
+    def clear(self, stages: Optional[Sequence[str]] = None) -> None:
+        """Remove the checkpoints of ``stages`` (default: all)."""
+        for stage in self.stages if stages is None else stages:
+            try:
+                self.path(stage).unlink()
+            except FileNotFoundError:
+                pass
+
+
+def latest_unfinished_run(base_dir: Path, prefix: str) -> Optional[Path]:
+    """Newest ``<prefix>_*`` run directory whose RUN_STATE.json is not COMPLETED."""
+    stamp = re.compile(re.escape(prefix) + r"_\d{8}_\d{6}")
+    runs = sorted((d for d in Path(base_dir).glob(f"{prefix}_*") if stamp.fullmatch(d.name)), reverse=True)
+    for run_dir in runs:
+        try:
+            status = json.loads((run_dir / "RUN_STATE.json").read_text(encoding="utf-8")).get("status")
+        except (OSError, ValueError):
+            continue
+        if status != "COMPLETED":
+            return run_dir
+    return None
+
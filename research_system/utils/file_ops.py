@@ -6,7 +6,7 @@ import json
 import shutil
 import contextlib
 from datetime import datetime
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
 def atomic_write_bytes(path: str, data: bytes) -> None:
     """Write bytes atomically using temp file + rename."""
@@ -28,37 +28,62 @@ def atomic_write_json(path: str, obj: Dict[str, Any], indent: int = 2) -> None:
     """Write JSON atomically."""
     atomic_write_text(path, json.dumps(obj, indent=indent, ensure_ascii=False))
 
+def _read_run_state(path: str) -> Dict[str, Any]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+class RunState:
+    """Handle yielded by ``run_transaction``; records which stages finished."""
+
+    def __init__(self, path: str, stages: Optional[List[str]] = None):
+        self.path = path
+        self.stages: List[str] = list(stages or [])
+        self.started_at = datetime.utcnow().isoformat() + "Z"
+
+    def write(self, status: str, **extra: Any) -> None:
+        atomic_write_json(self.path, {
+            "status": status,
+            "started_at": self.started_at,
+            "stages": self.stages,
+            **extra
+        })
+
+    def stage_done(self, stage: str) -> None:
+        """Record ``stage`` as finished (kept in order, once)."""
+        if stage not in self.stages:
+            self.stages.append(stage)
+        self.write("RUNNING")
+
 @contextlib.contextmanager
-def run_transaction(run_dir: str):
+def run_transaction(run_dir: str, resume: bool = False):
     """
     Ensures partial outputs are cleaned on crash; creates RUN_STATE.json.
     
+    Yields a ``RunState`` whose ``stage_done`` records finished stages in
+    RUN_STATE.json. With ``resume`` the stages of the previous attempt are
+    kept.
+    
     On success: marks run as COMPLETED
     On failure: marks run as ABORTED and removes partial final reports
     """
     os.makedirs(run_dir, exist_ok=True)
     state_path = os.path.join(run_dir, "RUN_STATE.json")
+    previous = _read_run_state(state_path).get("stages") if resume else None
+    state = RunState(state_path, previous)
     
     # Mark run as RUNNING
-    atomic_write_json(state_path, {
-        "status": "RUNNING",
-        "started_at": datetime.utcnow().isoformat() + "Z"
-    })
+    state.write("RUNNING")
     
     try:
-        yield
+        yield state
         # Mark run as COMPLETED
-        atomic_write_json(state_path, {
-            "status": "COMPLETED",
-            "finished_at": datetime.utcnow().isoformat() + "Z"
-        })
+        state.write("COMPLETED", finished_at=datetime.utcnow().isoformat() + "Z")
     except Exception as e:
         # Mark run as ABORTED
-        atomic_write_json(state_path, {
-            "status": "ABORTED",
-            "error": repr(e),
-            "finished_at": datetime.utcnow().isoformat() + "Z"
-        })
+        state.write("ABORTED", error=repr(e), finished_at=datetime.utcnow().isoformat() + "Z")
         
         # Delete glossy reports if any exist
         for f in ("final_report.md", "final_report.html", "executive_summary.md"):
@@ -68,4 +93,4 @@ def run_transaction(run_dir: str):
                     os.remove(p)
                 except:
                     pass  # Best effort
-        raise
\ No newline at end of file
+        raise
@@ -1,11 +1,32 @@
 #!/usr/bin/env python3.11
-"""Benchmark suite for testing research system across multiple topics."""
+"""Benchmark suite for testing research system across multiple topics.
+
+Modes:
+    live    (default) real network calls; timings include provider latency
+    record  live runs that also store every HTTP exchange in one cassette
+            per topic (``--cassettes DIR``)
+    replay  offline runs served from those cassettes, with optional injected
+            latency, so timings are reproducible
+
+Each run writes ``stage_profile.json`` (per-stage wall time, CPU time, peak
+RSS and cache hit rates). ``--baseline FILE`` compares stage wall times with
+a stored profile and fails on regressions beyond ``--tolerance``;
+``--save-baseline FILE`` stores this run's profile.
+
+Usage:
+    python scripts/benchmark.py --mode record --cassettes benchmarks/cassettes
+    python scripts/benchmark.py --mode replay --cassettes benchmarks/cassettes \
+        --baseline benchmarks/baseline.json
+"""
+import argparse
+import os
 import subprocess
 import json
 import pathlib
 import sys
+import tempfile
 import time
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 # Benchmark topics covering different domains
 BENCHMARK_TOPICS = [
@@ -41,19 +62,58 @@ BENCHMARK_TOPICS = [
 ]
 
 
-def run_topic(topic: str, output_base: pathlib.Path) -> Dict[str, Any]:
+# Search provider keys the CLI requires; replayed requests never send them
+REPLAY_PLACEHOLDER_KEYS = ["TAVILY_API_KEY", "BRAVE_API_KEY", "SERPER_API_KEY", "SERPAPI_API_KEY"]
+
+
+def safe_name(topic: str) -> str:
+    return "".join(c if c.isalnum() or c in "-_" else "_" for c in topic)[:50]
+
+
+def topic_env(topic: str, mode: str, cassettes: Optional[pathlib.Path],
+              latency_ms: float, latency_scale: float) -> Dict[str, str]:
+    """Environment of one benchmark run.
+
+    Recorded and replayed runs get fresh cache directories so both issue the
+    same requests and cache hit rates are comparable between runs.
+    """
+    env = dict(os.environ, STAGE_PROFILE="true")
+    if mode == "live":
+        return env
+    cache_root = pathlib.Path(tempfile.mkdtemp(prefix="bench_caches_"))
+    for var in ("DOI_CACHE_DIR", "INTENT_CACHE_DIR", "PDF_CACHE_DIR", "PROVIDER_HEALTH_DIR",
+                "SEARCH_CACHE_DIR", "EMBED_CACHE_DIR"):
+        env[var] = str(cache_root / var.lower())
+    env["HTTP_CASSETTE_MODE"] = mode
+    env["HTTP_CASSETTE"] = str(cassettes / f"{safe_name(topic)}.zip")
+    env["HTTP_REPLAY_LATENCY_MS"] = str(latency_ms)
+    env["HTTP_REPLAY_LATENCY_SCALE"] = str(latency_scale)
+    if mode == "replay":
+        for var in REPLAY_PLACEHOLDER_KEYS:
+            env.setdefault(var, "replay-placeholder")
+    return env
+
+
+def latest_run_dir(output_dir: pathlib.Path) -> pathlib.Path:
+    """The ``<topic>_<timestamp>`` directory the CLI created under ``output_dir``."""
+    runs = sorted(p for p in output_dir.glob("*") if p.is_dir())
+    return runs[-1] if runs else output_dir
+
+
+def run_topic(topic: str, output_base: pathlib.Path, env: Optional[Dict[str, str]] = None,
+              timeout: int = 600) -> Dict[str, Any]:
     """Run research on a single topic.
     
     Args:
         topic: Research topic
         output_base: Base output directory
+        env: Environment of the run (defaults to the current one)
+        timeout: Seconds before the run is killed
         
     Returns:
-        Result dictionary with metrics and status
+        Result dictionary with metrics, stage profile and status
     """
-    # Create safe directory name
-    safe_name = "".join(c if c.isalnum() or c in "-_" else "_" for c in topic)[:50]
-    output_dir = output_base / safe_name
+    output_dir = output_base / safe_name(topic)
     
     print(f"\n📊 Testing: {topic}")
     print(f"   Output: {output_dir}")
@@ -62,7 +122,7 @@ def run_topic(topic: str, output_base: pathlib.Path) -> Dict[str, Any]:
     
     # Run the research
     cmd = [
-        "python", "-m", "research_system",
+        sys.executable, "-m", "research_system",
         "--topic", topic,
         "--output-dir", str(output_dir),
         "--strict"
@@ -73,18 +133,22 @@ def run_topic(topic: str, output_base: pathlib.Path) -> Dict[str, Any]:
             cmd,
             capture_output=True,
             text=True,
-            timeout=600  # 10 minute timeout
+            timeout=timeout,
+            env=env,
         )
         
         wall_time = time.time() - start_time
+        run_dir = latest_run_dir(output_dir)
         
         # Load metrics if available
-        metrics_path = output_dir / "metrics.json"
+        metrics_path = run_dir / "metrics.json"
         if metrics_path.exists():
             metrics = json.loads(metrics_path.read_text())
             metrics["wall_time_seconds"] = wall_time
         else:
             metrics = {"wall_time_seconds": wall_time}
+        profile_path = run_dir / "stage_profile.json"
+        profile = json.loads(profile_path.read_text()) if profile_path.exists() else {}
         
         # Check quality gates
         from quality_gate import check_quality_gates
@@ -94,9 +158,10 @@ def run_topic(topic: str, output_base: pathlib.Path) -> Dict[str, Any]:
             "topic": topic,
             "status": "success" if result.returncode == 0 and not errors else "failed",
             "metrics": metrics,
+            "profile": profile,
             "errors": errors,
             "wall_time": wall_time,
-            "output_dir": str(output_dir)
+            "output_dir": str(run_dir)
         }
         
     except subprocess.TimeoutExpired:
@@ -104,8 +169,8 @@ def run_topic(topic: str, output_base: pathlib.Path) -> Dict[str, Any]:
             "topic": topic,
             "status": "timeout",
             "metrics": {},
-            "errors": ["Execution timeout (600s)"],
-            "wall_time": 600,
+            "errors": [f"Execution timeout ({timeout}s)"],
+            "wall_time": timeout,
             "output_dir": str(output_dir)
         }
     except Exception as e:
@@ -119,20 +184,85 @@ def run_topic(topic: str, output_base: pathlib.Path) -> Dict[str, Any]:
         }
 
 
-def main():
+def stage_table(results: List[Dict[str, Any]]) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """{topic: {stage: {wall_s, cpu_s, peak_rss_mb}}} of runs that produced a profile."""
+    return {
+        r["topic"]: {s["stage"]: {k: v for k, v in s.items() if k != "stage"}
+                     for s in r.get("profile", {}).get("stages", [])}
+        for r in results if r.get("profile")
+    }
+
+
+def compare_to_baseline(current: Dict[str, Dict[str, Dict[str, float]]],
+                        baseline: Dict[str, Dict[str, Dict[str, float]]],
+                        tolerance: float, min_seconds: float = 0.5) -> List[str]:
+    """Stages whose wall time grew by more than ``tolerance`` over the baseline.
+
+    Stages under ``min_seconds`` in both runs are ignored as noise.
+    """
+    regressions = []
+    for topic, stages in current.items():
+        for stage, now in stages.items():
+            before = baseline.get(topic, {}).get(stage)
+            if not before or max(now["wall_s"], before["wall_s"]) < min_seconds:
+                continue
+            if now["wall_s"] > before["wall_s"] * (1 + tolerance):
+                regressions.append(f"{topic} / {stage}: {before['wall_s']:.2f}s -> {now['wall_s']:.2f}s")
+    return regressions
+
+
+def print_profiles(results: List[Dict[str, Any]]) -> None:
+    for r in results:
+        profile = r.get("profile")
+        if not profile:
+            continue
+        print(f"\n⏱️ {r['topic']}")
+        for s in profile.get("stages", []):
+            print(f"  {s['stage']:<12} wall {s['wall_s']:>8.2f}s  cpu {s['cpu_s']:>8.2f}s  "
+                  f"rss {s.get('peak_rss_mb', 0):>8.1f} MB")
+        for name, stats in profile.get("caches", {}).items():
+            print(f"  cache {name}: {stats}")
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    p = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    p.add_argument("--mode", choices=["live", "record", "replay"], default="live")
+    p.add_argument("--cassettes", type=pathlib.Path, default=pathlib.Path("benchmarks/cassettes"),
+                   help="Cassette directory for record/replay")
+    p.add_argument("--latency-ms", type=float, default=0.0,
+                   help="Fixed latency added to each replayed response")
+    p.add_argument("--latency-scale", type=float, default=0.0,
+                   help="Fraction of the recorded latency added to each replayed response")
+    p.add_argument("--topics", type=int, default=len(BENCHMARK_TOPICS),
+                   help="Run only the first N topics")
+    p.add_argument("--timeout", type=int, default=600, help="Seconds per topic")
+    p.add_argument("--baseline", type=pathlib.Path, help="Stage profile to compare against")
+    p.add_argument("--save-baseline", type=pathlib.Path, help="Write this run's stage profile here")
+    p.add_argument("--tolerance", type=float, default=0.25,
+                   help="Allowed relative wall-time growth per stage")
+    return p.parse_args(argv)
+
+
+def main(argv=None):
     """Run benchmark suite."""
+    args = parse_args(argv)
+    topics = BENCHMARK_TOPICS[:args.topics]
+    
     # Setup output directory
     timestamp = time.strftime("%Y%m%d_%H%M%S")
     output_base = pathlib.Path(f"benchmark_{timestamp}")
     output_base.mkdir(exist_ok=True)
+    if args.mode != "live":
+        args.cassettes.mkdir(parents=True, exist_ok=True)
     
-    print(f"🚀 Running benchmark suite with {len(BENCHMARK_TOPICS)} topics")
+    print(f"🚀 Running benchmark suite with {len(topics)} topics ({args.mode})")
     print(f"📁 Output directory: {output_base}")
     
     # Run all topics
     results = []
-    for topic in BENCHMARK_TOPICS:
-        result = run_topic(topic, output_base)
+    for topic in topics:
+        env = topic_env(topic, args.mode, args.cassettes, args.latency_ms, args.latency_scale)
+        result = run_topic(topic, output_base, env=env, timeout=args.timeout)
         results.append(result)
         
         # Print immediate feedback
@@ -144,12 +274,14 @@ def main():
     # Generate summary report
     summary = {
         "timestamp": timestamp,
-        "total_topics": len(BENCHMARK_TOPICS),
+        "mode": args.mode,
+        "total_topics": len(topics),
         "passed": sum(1 for r in results if r["status"] == "success"),
         "failed": sum(1 for r in results if r["status"] == "failed"),
         "timeout": sum(1 for r in results if r["status"] == "timeout"),
         "error": sum(1 for r in results if r["status"] == "error"),
-        "results": results
+        "results": results,
+        "stages": stage_table(results),
     }
     
     # Write summary
@@ -176,10 +308,25 @@ def main():
                 avg = sum(values) / len(values)
                 print(f"  {key}: {avg:.3f} (avg)")
     
+    print_profiles(results)
+    
+    regressions = []
+    if args.baseline:
+        baseline = json.loads(args.baseline.read_text())
+        regressions = compare_to_baseline(summary["stages"], baseline.get("stages", {}), args.tolerance)
+        print(f"\n📉 Baseline {args.baseline}: "
+              f"{len(regressions)} stage regression(s) beyond {args.tolerance:.0%}")
+        for line in regressions:
+            print(f"  {line}")
+    if args.save_baseline:
+        args.save_baseline.parent.mkdir(parents=True, exist_ok=True)
+        args.save_baseline.write_text(json.dumps({"mode": args.mode, "stages": summary["stages"]}, indent=2))
+        print(f"💾 Baseline written to {args.save_baseline}")
+    
     print(f"\n📁 Full results: {summary_path}")
     
-    # Exit with error if any failed
-    if summary["failed"] + summary["timeout"] + summary["error"] > 0:
+    # Exit with error if any failed or regressed
+    if summary["failed"] + summary["timeout"] + summary["error"] + len(regressions) > 0:
         sys.exit(1)
     else:
         sys.exit(0)
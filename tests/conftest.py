@@ -0,0 +1,16 @@
+"""Shared test fixtures."""
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_caches(tmp_path_factory, monkeypatch):
+    """Give every test its own DOI, intent, PDF, search and catalog caches and
+    provider health records so results and tripped circuits never leak between tests."""
+    root = tmp_path_factory.mktemp("caches")
+    monkeypatch.setenv("CATALOG_CACHE_DIR", str(root / "catalog"))
+    monkeypatch.setenv("DOI_CACHE_DIR", str(root / "doi"))
+    monkeypatch.setenv("INTENT_CACHE_DIR", str(root / "intent"))
+    monkeypatch.setenv("PDF_CACHE_DIR", str(root / "pdf"))
+    monkeypatch.setenv("PROVIDER_HEALTH_DIR", str(root / "health"))
+    monkeypatch.setenv("SEARCH_CACHE_DIR", str(root / "search"))
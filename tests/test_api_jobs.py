@@ -0,0 +1,145 @@
+"""Tests for the background research job manager."""
+
+import logging
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from research_system.api.jobs import (
+    CANCELLED, COMPLETED, FAILED, CapacityError, Job, JobManager, collect_deliverables,
+)
+
+
+def write_report(request, output_dir):
+    logging.getLogger("research_system.orchestrator").info(f"Researching {request['topic']}")
+    out = Path(output_dir)
+    out.mkdir(parents=True)
+    (out / "final_report.md").write_text("# Report\n")
+    (out / "evidence_cards.jsonl").write_text("{}\n{}\n")
+    return collect_deliverables(out)
+
+
+def sleep_forever(request, output_dir):
+    time.sleep(600)
+
+
+def explode(request, output_dir):
+    raise RuntimeError("provider outage")
+
+
+@pytest.fixture
+def make_manager(tmp_path):
+    managers = []
+
+    def make(runner, **kw):
+        manager = JobManager(runner=runner, output_root=str(tmp_path), **kw)
+        managers.append(manager)
+        return manager
+
+    yield make
+    for manager in managers:
+        manager.shutdown()
+
+
+def test_job_completes_with_deliverables_and_progress(make_manager):
+    manager = make_manager(write_report, workers=1)
+    job = manager.submit({"topic": "tourism recovery"})
+    assert job.status in ("queued", "running")
+
+    job = manager.wait(job.id, timeout=60)
+    assert job.status == COMPLETED
+    assert job.deliverables == ["evidence_cards.jsonl", "final_report.md"]
+    assert job.summary["evidence_count"] == 2
+    kinds = [e["event"] for e in job.events]
+    assert kinds[0] == "queued" and kinds[-1] == COMPLETED
+    assert any(e["event"] == "progress" and "tourism recovery" in e["data"]["message"]
+               for e in job.events)
+
+
+def test_failures_are_reported(make_manager):
+    manager = make_manager(explode)
+    job = manager.wait(manager.submit({"topic": "x"}).id, timeout=60)
+    assert job.status == FAILED
+    assert "provider outage" in job.error
+
+
+def test_admission_is_bounded_by_worker_capacity(make_manager):
+    manager = make_manager(sleep_forever, workers=1, max_queued=1)
+    running = manager.submit({"topic": "a"})
+    queued = manager.submit({"topic": "b"})
+    with pytest.raises(CapacityError):
+        manager.submit({"topic": "c"})
+    assert manager.capacity()["available"] == 0
+
+    # Cancelling the queued job frees its slot without touching the running one
+    assert manager.cancel(queued.id)
+    assert queued.status == CANCELLED
+    assert manager.get(running.id).status == "running"
+    manager.submit({"topic": "c"})
+
+
+def test_running_job_can_be_cancelled(make_manager):
+    manager = make_manager(sleep_forever, workers=1)
+    job = manager.submit({"topic": "slow"})
+    proc = manager._procs[job.id]
+    assert manager.cancel(job.id)
+    assert job.status == CANCELLED and not proc.is_alive()
+    assert not manager.cancel(job.id)
+    assert manager.capacity()["running"] == 0
+
+
+def test_jobs_past_the_wall_timeout_are_killed(make_manager):
+    manager = make_manager(sleep_forever, timeout=0.5)
+    job = manager.wait(manager.submit({"topic": "slow"}).id, timeout=30)
+    assert job.status == FAILED and "timed out" in job.error
+
+
+def test_events_resume_after_a_sequence_number(make_manager):
+    manager = make_manager(write_report)
+    job = manager.wait(manager.submit({"topic": "t"}).id, timeout=60)
+    first = job.events[0]["seq"]
+    assert [e["seq"] for e in job.events_since(first)] == [e["seq"] for e in list(job.events)[1:]]
+
+
+def test_events_can_be_read_while_appended():
+    job = Job(id="j", request={}, output_dir="")
+    stop = threading.Event()
+
+    def writer():
+        while not stop.is_set():
+            job.add_event("progress", {})
+
+    thread = threading.Thread(target=writer)
+    thread.start()
+    try:
+        for _ in range(2000):
+            job.events_since(0)
+    finally:
+        stop.set()
+        thread.join()
+
+
+def test_job_endpoints(make_manager, monkeypatch):
+    pytest.importorskip("slowapi")
+    from fastapi.testclient import TestClient
+    from research_system.api import jobs, server
+
+    monkeypatch.setenv("API_GATEWAY_KEY", "secret")
+    monkeypatch.setattr(jobs, "_manager", make_manager(write_report, workers=1, max_queued=0))
+    client, headers = TestClient(server.app), {"x-api-key": "secret"}
+
+    created = client.post("/v1/jobs", json={"topic": "tourism"}, headers=headers)
+    assert created.status_code == 202
+    job_id = created.json()["id"]
+    assert client.post("/v1/jobs", json={"topic": "more"}, headers=headers).status_code == 503
+
+    with client.stream("GET", f"/v1/jobs/{job_id}/events", headers=headers) as events:
+        body = "".join(events.iter_text())
+    assert "event: completed" in body
+
+    status = client.get(f"/v1/jobs/{job_id}", headers=headers).json()
+    assert status["status"] == COMPLETED and "final_report.md" in status["deliverables"]
+    report = client.get(f"/v1/jobs/{job_id}/artifacts/final_report.md", headers=headers)
+    assert report.text == "# Report\n"
@@ -0,0 +1,120 @@
+"""Tests for the compiled authority index."""
+
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from research_system.tools import authority_index
+from research_system.tools.authority_index import AuthorityIndex, suffix_of_pattern
+from research_system.tools.domain_norm import is_primary_domain, is_primary_domain_enhanced
+from research_system.quality.primary_detection import is_primary_source as card_is_primary
+from research_system.selection.domain_balance import get_domain_family, is_primary_source
+
+
+def test_exact_subtree_and_wildcard_entries():
+    index = AuthorityIndex()
+    index.add("census.gov", "exact")
+    index.add("oecd.org", "org", subdomains=True)
+    index.add("*.edu", "edu")
+    index.add(".mil", "mil")
+
+    assert "exact" in index.lookup("census.gov")
+    assert "exact" not in index.lookup("www.census.gov")
+    assert index.lookup("stats.oecd.org")["org"] == "oecd.org"
+    assert "org" in index.lookup("OECD.org.")
+    assert "org" not in index.lookup("notoecd.org")
+    assert "edu" in index.lookup("mit.edu")
+    assert "edu" not in index.lookup("edu")
+    assert "mil" in index.lookup("army.mil")
+
+
+def test_most_specific_entry_wins():
+    index = AuthorityIndex()
+    index.add("europa.eu", "org", subdomains=True)
+    index.add("ec.europa.eu", "org", subdomains=True)
+    assert index.lookup("eurostat.ec.europa.eu")["org"] == "ec.europa.eu"
+
+
+def test_suffix_patterns_compile_into_the_trie():
+    assert suffix_of_pattern(r"\.gov$") == "gov"
+    assert suffix_of_pattern(r"\.gov\.uk$") == "gov.uk"
+    assert suffix_of_pattern(r"\.gov\.[a-z]{2}$") is None
+    assert suffix_of_pattern(r"^[a-z]+\.nih\.gov$") is None
+
+    index = AuthorityIndex()
+    index.add_pattern(r"\.gov$", "p")
+    index.add_pattern(r"\.gov\.[a-z]{2}$", "p")
+    index.add_pattern(r"^[a-z]+\.nih\.gov$", "nih")
+    assert index.lookup("state.gov")["p"] == "*.gov"
+    assert index.lookup("ons.gov.uk")["p"] == r"\.gov\.[a-z]{2}$"
+    assert "p" not in index.lookup("gov.example.com")
+    assert "nih" in index.lookup("nci.nih.gov")
+    assert "nih" not in index.lookup("a.b.nih.gov")
+
+
+def test_lookups_are_memoized():
+    index = AuthorityIndex()
+    index.add("who.int", "org", subdomains=True)
+    index.lookup("data.who.int")
+    index.lookup("data.who.int")
+    assert index.cache_info().hits == 1
+    with pytest.raises(TypeError):
+        index.lookup("data.who.int")["x"] = "y"
+
+
+def test_shared_index_rebuilds_when_a_source_changes(tmp_path, monkeypatch):
+    primary = tmp_path / "primary_domains.yaml"
+    primary.write_text("default:\n  canonical: [first.example]\n")
+    monkeypatch.setattr(authority_index, "SOURCES", (primary, tmp_path / "missing.yaml"))
+    monkeypatch.setattr(authority_index, "RELOAD_SECONDS", 0)
+    try:
+        authority_index.reload()
+        assert "primary" in authority_index.lookup("first.example")
+
+        primary.write_text("default:\n  canonical: [second.example]\n")
+        stat = primary.stat()
+        os.utime(primary, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert "primary" in authority_index.lookup("second.example")
+        assert "primary" not in authority_index.lookup("first.example")
+    finally:
+        monkeypatch.undo()
+        authority_index.reload()
+
+
+def test_primary_domain_call_sites():
+    assert is_primary_domain("https://www.census.gov/data")
+    assert is_primary_domain("data.oecd.org")
+    assert is_primary_domain("ons.gov.uk")
+    assert not is_primary_domain("stats.oecd.example")
+    assert is_primary_domain("cdc.gov", {"cdc.gov"}, [])
+
+    numeric = SimpleNamespace(numeric_token_count=3)
+    assert is_primary_domain_enhanced("https://data.unesco.org/x", numeric)
+    assert not is_primary_domain_enhanced("https://notunesco.org/x", numeric)
+
+
+def test_card_detection_uses_label_suffixes():
+    card = SimpleNamespace(url="https://stats.bls.gov/cpi", meta={})
+    assert card_is_primary(card)
+    assert card.meta["primary_reason"] == "authoritative org (bls.gov)"
+
+    # "ata.org" must not match unrelated hosts that merely contain it
+    assert not card_is_primary(SimpleNamespace(url="https://data.org.example.com/", meta={}))
+
+    pdf = SimpleNamespace(url="https://www.mckinsey.com/report.pdf", snippet="Up 12% in 2023", meta={})
+    assert card_is_primary(pdf)
+    assert pdf.meta["primary_reason"] == "authoritative PDF with metrics (mckinsey.com)"
+
+
+def test_intent_pools_and_families():
+    assert is_primary_source("mit.edu", "academic")
+    assert not is_primary_source("edu", "academic")
+    assert is_primary_source("bls.gov", "stats")
+    assert not is_primary_source("www.bls.gov", "stats")
+    assert is_primary_source("anything.gov", "unknown-intent")
+    assert not is_primary_source("cdc.gov", "news")
+
+    assert get_domain_family("nps.gov") == "nps"
+    assert get_domain_family("epa.gov") == "gov"
+    assert get_domain_family("example.com") == "example.com"
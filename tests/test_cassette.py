@@ -0,0 +1,119 @@
+"""Tests for HTTP record/replay cassettes."""
+
+import asyncio
+import json
+import threading
+import time
+import zipfile
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import httpx
+import pytest
+import requests
+
+from research_system.net import cassette
+from research_system.net.cassette import request_key
+
+
+class _Handler(BaseHTTPRequestHandler):
+    hits = 0
+
+    def _reply(self):
+        type(self).hits += 1
+        length = int(self.headers.get("Content-Length") or 0)
+        body = json.dumps({"path": self.path, "n": type(self).hits,
+                           "sent": self.rfile.read(length).decode()}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = do_POST = _reply
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    _Handler.hits = 0
+    httpd = HTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture(autouse=True)
+def _restore_transports():
+    yield
+    cassette.uninstall()
+
+
+def test_request_key_drops_credentials_and_orders_params():
+    a = request_key("get", "https://API.x.org/s?q=tourism&api_key=secret&n=5")
+    b = request_key("GET", "https://api.x.org/s?n=5&q=tourism&api_key=other")
+    assert a == b == "GET https://api.x.org/s?n=5&q=tourism"
+    assert (request_key("POST", "https://t.io/search", b'{"api_key": "1", "query": "q"}')
+            == request_key("POST", "https://t.io/search", b'{"query": "q", "api_key": "2"}'))
+
+
+def test_record_then_replay_offline(server, tmp_path):
+    path = tmp_path / "run.zip"
+    cassette.install("record", str(path))
+    with httpx.Client() as client:
+        first = client.get(f"{server}/a?q=1").json()
+        client.get(f"{server}/a?q=1")
+        posted = client.post(f"{server}/p", json={"query": "q", "api_key": "k"}).json()
+    via_requests = requests.get(f"{server}/r").json()
+    cassette.uninstall()
+    assert _Handler.hits == 4
+    with zipfile.ZipFile(path) as zf:
+        assert "k" not in json.dumps(json.loads(zf.read("index.json")))
+
+    cassette.install("replay", str(path))
+    with httpx.Client() as client:
+        assert client.get(f"{server}/a?q=1").json() == first
+        assert client.get(f"{server}/a?q=1").json()["n"] == 2
+        assert client.get(f"{server}/a?q=1").json()["n"] == 2  # last one repeats
+        assert client.post(f"{server}/p", json={"api_key": "other", "query": "q"}).json() == posted
+        with pytest.raises(httpx.ConnectError):
+            client.get(f"{server}/never-recorded")
+    assert requests.get(f"{server}/r").json() == via_requests
+    assert _Handler.hits == 4
+    assert cassette.active().stats["misses"] == 1
+
+
+def test_async_clients_and_injected_latency(server, tmp_path):
+    path = tmp_path / "async.zip"
+
+    async def fetch():
+        async with httpx.AsyncClient() as client:
+            return (await client.get(f"{server}/async")).json()
+
+    cassette.install("record", str(path))
+    recorded = asyncio.run(fetch())
+    cassette.uninstall()
+
+    cassette.install("replay", str(path), latency_ms=100)
+    start = time.perf_counter()
+    assert asyncio.run(fetch()) == recorded
+    assert time.perf_counter() - start >= 0.1
+
+
+def test_saves_merge_with_other_recordings(server, tmp_path):
+    path = tmp_path / "shared.zip"
+    for name in ("one", "two"):
+        cassette.install("record", str(path))
+        httpx.get(f"{server}/{name}")
+        cassette.uninstall()
+
+    replay = cassette.install("replay", str(path))
+    assert len(replay) == 2
+
+
+def test_replay_requires_a_cassette(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        cassette.install("replay", str(tmp_path / "missing.zip"))
@@ -0,0 +1,85 @@
+"""Tests for stage checkpoints and run-state stage tracking."""
+
+import json
+
+import pytest
+
+from research_system.utils.checkpoint import (
+    StageCheckpoints, latest_unfinished_run, settings_hash,
+)
+from research_system.utils.file_ops import run_transaction
+
+
+def test_save_and_load_roundtrip(tmp_path):
+    ckpt = StageCheckpoints(tmp_path, settings_hash(topic="t"))
+    assert ckpt.save("collect", {"cards": [1, 2], "seen": {"a"}})
+
+    assert ckpt.load("collect") == {"cards": [1, 2], "seen": {"a"}}
+    assert ckpt.completed() == ("collect",)
+
+
+def test_other_settings_are_ignored(tmp_path):
+    StageCheckpoints(tmp_path, settings_hash(topic="t")).save("collect", {"cards": []})
+
+    other = StageCheckpoints(tmp_path, settings_hash(topic="t", strict=True))
+    assert other.load("collect") is None
+    assert other.resume_point() == ((), {})
+
+
+def test_resume_point_stops_at_first_gap(tmp_path):
+    ckpt = StageCheckpoints(tmp_path, "k")
+    for stage in ("collect", "enrich", "dedup"):
+        ckpt.save(stage, {"stage": stage})
+    ckpt.path("enrich").unlink()
+
+    assert ckpt.resume_point() == (("collect",), {"stage": "collect"})
+
+
+def test_saving_a_stage_clears_later_ones(tmp_path):
+    ckpt = StageCheckpoints(tmp_path, "k")
+    for stage in ("collect", "enrich", "dedup"):
+        ckpt.save(stage, {})
+    ckpt.save("collect", {"again": True})
+
+    assert ckpt.completed() == ("collect",)
+    assert not ckpt.path("dedup").exists()
+
+
+def test_corrupt_checkpoint_is_ignored(tmp_path):
+    ckpt = StageCheckpoints(tmp_path, "k")
+    ckpt.save("collect", {})
+    ckpt.path("collect").write_bytes(b"not a pickle")
+
+    assert ckpt.completed() == ()
+
+
+def test_unpicklable_state_is_not_saved(tmp_path):
+    ckpt = StageCheckpoints(tmp_path, "k")
+    assert not ckpt.save("collect", {"fn": lambda: None})
+    assert not ckpt.path("collect").exists()
+
+
+def test_run_transaction_records_stages(tmp_path):
+    with run_transaction(str(tmp_path)) as state:
+        state.stage_done("collect")
+        assert json.loads((tmp_path / "RUN_STATE.json").read_text())["stages"] == ["collect"]
+
+    with pytest.raises(RuntimeError):
+        with run_transaction(str(tmp_path), resume=True) as state:
+            state.stage_done("enrich")
+            raise RuntimeError("crash")
+
+    run_state = json.loads((tmp_path / "RUN_STATE.json").read_text())
+    assert run_state["status"] == "ABORTED"
+    assert run_state["stages"] == ["collect", "enrich"]
+
+
+def test_latest_unfinished_run(tmp_path):
+    for name, status in [("topic_20260101_000000", "ABORTED"),
+                         ("topic_20260102_000000", "COMPLETED"),
+                         ("topic_extra_20260103_000000", "ABORTED")]:
+        (tmp_path / name).mkdir()
+        (tmp_path / name / "RUN_STATE.json").write_text(json.dumps({"status": status}))
+
+    assert latest_unfinished_run(tmp_path, "topic") == tmp_path / "topic_20260101_000000"
+    assert latest_unfinished_run(tmp_path, "other") is None
@@ -0,0 +1,124 @@
+"""Tests for the run-scoped web search scheduler."""
+
+import threading
+import time
+
+import pytest
+
+from research_system import time_budget
+from research_system.collection import scheduler as sched
+from research_system.collection.scheduler import (
+    CollectionScheduler, SearchJob, PRIORITY_HIGH, PRIORITY_LOW,
+)
+from research_system.tools.search_models import SearchHit
+
+
+class FakeRegistry:
+    """Registry whose search tools sleep briefly and record peak concurrency."""
+
+    def __init__(self, delay=0.05, fail=()):
+        self.delay = delay
+        self.fail = set(fail)
+        self.lock = threading.Lock()
+        self.active = {}
+        self.peak = {}
+        self.peak_total = 0
+        self.calls = []
+
+    def execute(self, tool, payload):
+        with self.lock:
+            self.calls.append((tool, payload["query"]))
+            self.active[tool] = self.active.get(tool, 0) + 1
+            self.peak[tool] = max(self.peak.get(tool, 0), self.active[tool])
+            self.peak_total = max(self.peak_total, sum(self.active.values()))
+        try:
+            time.sleep(self.delay)
+            if tool in self.fail:
+                raise RuntimeError("provider down")
+            provider = tool.replace("search_", "")
+            return [SearchHit(title=payload["query"], url=f"https://{provider}.example/1",
+                              provider=provider)]
+        finally:
+            with self.lock:
+                self.active[tool] -= 1
+
+
+@pytest.fixture(autouse=True)
+def providers(monkeypatch):
+    monkeypatch.setattr(sched, "search_targets",
+                        lambda query: [("brave", "search_brave"), ("tavily", "search_tavily")])
+    monkeypatch.setattr(time_budget, "_GLOBAL_BUDGET", None)
+
+
+def test_results_keep_provider_shape_and_order():
+    registry = FakeRegistry()
+    with CollectionScheduler(registry) as scheduler:
+        jobs = scheduler.run([SearchJob(query=f"q{i}", count=3) for i in range(4)])
+
+    assert [j.query for j in jobs] == ["q0", "q1", "q2", "q3"]
+    assert all(j.status == "ok" for j in jobs)
+    assert set(jobs[0].results) == {"brave", "tavily"}
+    assert jobs[2].results["brave"][0].title == "q2"
+    assert jobs[0].hit_count == 2
+
+
+def test_concurrency_is_bounded_globally_and_per_provider():
+    registry = FakeRegistry(delay=0.05)
+    with CollectionScheduler(registry, global_limit=3, per_provider_limit=2) as scheduler:
+        start = time.perf_counter()
+        scheduler.run([SearchJob(query=f"q{i}", count=3) for i in range(8)])
+        elapsed = time.perf_counter() - start
+
+    assert len(registry.calls) == 16
+    assert registry.peak_total <= 3
+    assert max(registry.peak.values()) <= 2
+    # 16 calls of 50ms at 3 in flight is well under the 0.8s a sequential loop takes
+    assert elapsed < 0.6
+
+
+def test_failed_provider_stays_empty():
+    registry = FakeRegistry(fail={"search_tavily"})
+    with CollectionScheduler(registry) as scheduler:
+        results = scheduler.search("q", count=3)
+
+    assert results["tavily"] == []
+    assert len(results["brave"]) == 1
+
+
+def test_low_priority_jobs_skipped_when_budget_short():
+    time_budget.set_global_budget(60)
+    registry = FakeRegistry()
+    with CollectionScheduler(registry, low_priority_reserve=120) as scheduler:
+        high, low = scheduler.run([
+            SearchJob(query="high", count=3, priority=PRIORITY_HIGH),
+            SearchJob(query="low", count=3, priority=PRIORITY_LOW, phase="arex"),
+        ])
+
+    assert high.status == "ok"
+    assert low.status == "skipped" and low.results == {}
+    assert {q for _, q in registry.calls} == {"high"}
+    assert scheduler.stats[("arex", "skipped")] == 1
+
+
+def test_running_low_priority_jobs_cancelled_when_budget_runs_short(monkeypatch):
+    monkeypatch.setattr(sched, "_WATCH_INTERVAL", 0.05)
+    budget = time_budget.set_global_budget(600)
+    registry = FakeRegistry(delay=0.5)
+    with CollectionScheduler(registry, low_priority_reserve=120) as scheduler:
+        futures = scheduler.submit([SearchJob(query="low", count=3, priority=PRIORITY_LOW)])
+        time.sleep(0.1)
+        budget.deadline = time.time() + 60
+        low, = scheduler.wait(futures)
+
+    assert low.status == "cancelled"
+
+
+def test_nothing_starts_after_budget_expires():
+    budget = time_budget.set_global_budget(60)
+    budget.deadline = time.time() - 1
+    registry = FakeRegistry()
+    with CollectionScheduler(registry) as scheduler:
+        job, = scheduler.run([SearchJob(query="q", count=3, priority=PRIORITY_HIGH)])
+
+    assert job.status == "skipped"
+    assert registry.calls == []
@@ -0,0 +1,88 @@
+"""Tests for indexed claim clustering and contradiction detection."""
+
+import random
+
+import pytest
+
+from research_system import controversy
+from research_system.controversy import ControversyDetector
+from research_system.models import EvidenceCard
+
+
+def _card(claim, supporting_text="short"):
+    return EvidenceCard(
+        title="t", url="https://example.org/a", snippet=claim, provider="brave",
+        credibility_score=0.5, relevance_score=0.5, supporting_text=supporting_text,
+        claim=claim,
+    )
+
+
+def _corpus(n=150, seed=7):
+    rng = random.Random(seed)
+    words = ["".join(rng.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(rng.randint(4, 9)))
+             for _ in range(400)]
+    bases = [" ".join(rng.choice(words) for _ in range(12)) for _ in range(40)]
+    claims = []
+    for _ in range(n):
+        toks = rng.choice(bases).split()
+        toks[rng.randrange(len(toks))] = rng.choice(words)
+        claims.append(" ".join(toks))
+    return claims
+
+
+def _groups(clusters):
+    return sorted(sorted(c.claim for c in cluster) for cluster in clusters.values())
+
+
+def test_indexed_clustering_matches_all_pairs(monkeypatch):
+    pytest.importorskip("datasketch")
+    claims = _corpus()
+    indexed = ControversyDetector().cluster_claims([_card(c) for c in claims])
+
+    monkeypatch.setattr(controversy, "LSH_MIN_CARDS", 10 ** 9)
+    exhaustive = ControversyDetector().cluster_claims([_card(c) for c in claims])
+
+    assert _groups(indexed) == _groups(exhaustive)
+    assert len(indexed) < len(claims)
+
+
+def test_indexed_clustering_skips_dissimilar_pairs(monkeypatch):
+    pytest.importorskip("datasketch")
+    scored = []
+    original = ControversyDetector._normalized_similar
+
+    def counting(self, a, b):
+        scored.append((a, b))
+        return original(self, a, b)
+
+    monkeypatch.setattr(ControversyDetector, "_normalized_similar", counting)
+    claims = _corpus()
+    ControversyDetector().cluster_claims([_card(c) for c in claims])
+
+    assert len(scored) < len(claims) * (len(claims) - 1) // 4
+
+
+def test_keyword_contradiction():
+    detector = ControversyDetector()
+    assert detector.detect_contradiction(_card("Tourism spending increases"),
+                                         _card("Tourism spending decreases"))
+    assert not detector.detect_contradiction(_card("Tourism spending increases"),
+                                             _card("Tourism spending increases"))
+
+
+def test_numeric_contradiction_requires_similar_claims():
+    detector = ControversyDetector()
+    assert detector.detect_contradiction(_card("Hotel occupancy reached 80% in 2023"),
+                                         _card("Hotel occupancy reached 30% in 2023"))
+    assert not detector.detect_contradiction(_card("Hotel occupancy reached 80% in 2023"),
+                                             _card("Airline fuel costs were 30 dollars"))
+
+
+def test_features_follow_card_content():
+    detector = ControversyDetector()
+    card = _card("Tourism spending increases")
+    other = _card("Tourism spending decreases")
+    assert detector.detect_contradiction(card, other)
+
+    card.claim = "Tourism spending decreases"
+    assert not detector.detect_contradiction(card, other)
@@ -0,0 +1,108 @@
+"""Tests for the batched, cached DOI service."""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from research_system.tools import doi_service
+from research_system.tools.doi_service import DoiCache, DoiService, normalize_doi, collect_dois
+from research_system.tools.doi_fallback import crossref_meta
+from research_system.models import EvidenceCard
+
+
+@pytest.fixture
+def batches(monkeypatch):
+    """Fake bulk endpoints that know DOIs 10.1000/a and 10.1000/b and record each batch."""
+    calls = []
+    known = {"10.1000/a", "10.1000/b"}
+
+    def fake(source):
+        async def batch(dois):
+            calls.append((source, list(dois)))
+            return {d: ({"DOI": d, "title": [f"{source} {d}"],
+                         "resource": {"primary": {"URL": f"https://pub.example/{d}"}}}
+                        if d in known else None) for d in dois}
+        return batch
+
+    monkeypatch.setattr(doi_service, "_BATCHERS", {
+        "crossref": (fake("crossref"), 2),
+        "openalex": (fake("openalex"), 50),
+        "s2": (fake("s2"), 500),
+    })
+    return calls
+
+
+def test_normalize_doi():
+    assert normalize_doi("https://doi.org/10.1234/ABC.") == "10.1234/abc"
+    assert normalize_doi("doi:10.1234/x") == "10.1234/x"
+
+
+def test_collect_dois_from_fields_and_urls():
+    cards = [MagicMock(doi="10.1000/A", url="https://example.com"),
+             MagicMock(doi=None, url="https://doi.org/10.1000/b"),
+             MagicMock(doi=None, url="https://journal.example/doi/10.1000/a")]
+    assert collect_dois(cards) == ["10.1000/a", "10.1000/b"]
+
+
+def test_prefetch_batches_and_caches(tmp_path, batches):
+    service = DoiService(DoiCache(str(tmp_path)))
+    counts = service.prefetch(["10.1000/a", "10.1000/b", "10.1000/c"], sources=("crossref", "openalex"))
+
+    assert counts == {"crossref": 2, "openalex": 2}
+    # Crossref chunked by its batch size, OpenAlex in one request
+    assert sorted(len(c) for s, c in batches if s == "crossref") == [1, 2]
+    assert [len(c) for s, c in batches if s == "openalex"] == [3]
+
+    batches.clear()
+    service.prefetch(["10.1000/a", "10.1000/b", "10.1000/c"], sources=("crossref", "openalex"))
+    assert batches == []  # found records and misses both come from the cache
+
+
+def test_misses_expire_before_records(tmp_path, batches):
+    cache = DoiCache(str(tmp_path), ttl=3600, negative_ttl=60)
+    DoiService(cache).prefetch(["10.1000/a", "10.1000/c"], sources=("crossref",))
+    cache._db().execute("UPDATE records SET fetched = fetched - 120")
+
+    assert list(cache.get_many("crossref", ["10.1000/a", "10.1000/c"])) == ["10.1000/a"]
+    assert cache.purge() == 1
+
+
+def test_single_lookup_reads_prefetched_record(batches):
+    DoiService().prefetch(["10.1000/a"], sources=("crossref",))
+    with patch("httpx.get") as get:
+        meta = crossref_meta("10.1000/A")
+
+    get.assert_not_called()
+    assert meta["title"] == "crossref 10.1000/a"
+
+
+def test_transient_errors_are_not_cached():
+    response = MagicMock(status_code=503)
+    with patch("httpx.get", return_value=response) as get:
+        assert crossref_meta("10.1000/z") is None
+        assert crossref_meta("10.1000/z") is None
+    assert get.call_count == 2
+
+
+def test_landing_urls_prefer_metadata_then_resolve(tmp_path, batches):
+    resolved = []
+
+    def resolver(url):
+        resolved.append(url)
+        return "https://other.example/landing"
+
+    service = DoiService(DoiCache(str(tmp_path)), resolver=resolver)
+    urls = ["https://doi.org/10.1000/a", "https://dx.doi.org/10.1000/A", "https://doi.org/10.1000/c",
+            "https://example.com/page"]
+    landing = service.landing_urls(urls)
+
+    assert landing == {"https://doi.org/10.1000/a": "https://pub.example/10.1000/a",
+                       "https://dx.doi.org/10.1000/A": "https://pub.example/10.1000/a",
+                       "https://doi.org/10.1000/c": "https://other.example/landing"}
+    assert resolved == ["https://doi.org/10.1000/c"]
+
+    resolved.clear()
+    assert service.landing_urls(["https://doi.org/10.1000/c"]) == {
+        "https://doi.org/10.1000/c": "https://other.example/landing"}
+    assert resolved == []
@@ -0,0 +1,69 @@
+"""Tests for offline, memoized domain parsing."""
+
+import socket
+
+import pytest
+
+from research_system.tools import domain_parse
+from research_system.tools.domain_parse import parse_host, parse_url, registered_domain
+from research_system.tools.domain_norm import canonical_domain, normalize_domain
+from research_system.tools.url_norm import domain_of
+from research_system.tools.aggregates import canonical_domain as agg_canonical_domain
+
+
+@pytest.mark.parametrize("url,root", [
+    ("https://news.bbc.co.uk/world", "bbc.co.uk"),
+    ("https://www.sec.gov/Archives/edgar", "sec.gov"),
+    ("https://user:pw@Sub.Example.COM:443/a?b#c", "example.com"),
+    ("example.org/path", "example.org"),
+    ("//cdn.example.net/x.js", "example.net"),
+    ("https://example.com.", "example.com"),
+    ("http://127.0.0.1:8080/x", "127.0.0.1"),
+    ("https://localhost", "localhost"),
+    ("https://co.uk", "co.uk"),
+    ("", "unknown"),
+])
+def test_domain_of(url, root):
+    assert domain_of(url) == root
+
+
+def test_wildcard_and_exception_rules():
+    # *.ck is a wildcard suffix, but !www.ck makes www.ck registrable
+    assert parse_url("http://foo.bar.ck").registered_domain == "foo.bar.ck"
+    assert parse_url("http://www.ck").registered_domain == "www.ck"
+    assert parse_url("https://a.b.kawasaki.jp").suffix == "b.kawasaki.jp"
+    assert parse_url("https://city.kawasaki.jp").registered_domain == "city.kawasaki.jp"
+
+
+def test_private_suffixes_are_ignored():
+    # Like tldextract's default, PSL private domains are not suffixes
+    assert registered_domain("https://x.blogspot.com") == "blogspot.com"
+
+
+def test_registered_domain_empty_for_ips_and_suffixes():
+    assert registered_domain("http://10.0.0.1/") == ""
+    assert registered_domain("https://co.uk") == ""
+
+
+def test_domain_helpers_share_the_host_cache():
+    parse_host.cache_clear()
+    canonical_domain("https://www.Example.com:8443/a")
+    normalize_domain("https://www.example.com:8443/b")
+    agg_canonical_domain("https://www.example.com:8443/c")
+    info = parse_host.cache_info()
+    assert info.misses == 2 and info.hits == 1  # "www.Example.com:8443" vs lower-case key
+
+    assert canonical_domain("https://www.unwto.org/x") == "unwto.org"
+    assert normalize_domain("WWW.Example.com:80") == "example.com"
+    assert agg_canonical_domain("not a url") == "unknown"
+
+
+def test_parsing_never_uses_the_network(monkeypatch):
+    def no_network(*args, **kwargs):
+        raise AssertionError("network access")
+
+    monkeypatch.setattr(socket, "create_connection", no_network)
+    monkeypatch.setattr(socket, "getaddrinfo", no_network)
+    domain_parse._rules.cache_clear()
+    parse_host.cache_clear()
+    assert domain_of("https://docs.python.org.uk/3/") == "python.org.uk"
@@ -0,0 +1,135 @@
+"""Tests for the shared embedding service."""
+
+import numpy as np
+import pytest
+
+from research_system.triangulation import embeddings
+from research_system.triangulation.embedding_store import VectorStore
+from research_system.triangulation.embeddings import EmbeddingService
+
+
+class FakeModel:
+    def __init__(self):
+        self.calls = []
+
+    def encode(self, texts, batch_size=32, normalize_embeddings=False, **kwargs):
+        self.calls.append(list(texts))
+        return np.array([[float(len(t)), 1.0, 0.0] for t in texts], dtype=np.float32)
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("EMBED_CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def service():
+    svc = EmbeddingService("fake-model", backend="torch", batch_size=8, cache_size=100)
+    svc._model = FakeModel()
+    return svc
+
+
+def test_repeated_texts_are_encoded_once(service):
+    first = service.encode(["alpha", "beta", "alpha"])
+    second = service.encode(["beta", "gamma"])
+
+    assert service.model.calls == [["alpha", "beta"], ["gamma"]]
+    assert first.shape == (3, 3)
+    np.testing.assert_allclose(first[0], first[2])
+    np.testing.assert_allclose(first[1], second[0])
+
+
+def test_normalize_is_applied_on_cached_vectors(service):
+    raw = service.encode(["alpha"], normalize=False)
+    unit = service.encode(["alpha"], normalize=True)
+
+    assert len(service.model.calls) == 1
+    assert raw[0][0] == 5.0
+    assert np.isclose(np.linalg.norm(unit[0]), 1.0)
+
+
+def test_cache_is_bounded(service):
+    service.cache_size = 2
+    service.store = None
+    service.encode(["a", "b", "c"])
+    service.encode(["a"])
+
+    assert service.model.calls[-1] == ["a"]
+
+
+def test_unknown_backend_falls_back_to_torch():
+    assert EmbeddingService("fake-model", backend="tpu").backend == "torch"
+
+
+def test_module_encode_uses_shared_service(monkeypatch):
+    svc = EmbeddingService("fake-model")
+    svc._model = FakeModel()
+    monkeypatch.setattr(embeddings, "get_service", lambda model_name=None: svc)
+
+    embeddings.encode(["one", "two"])
+    embeddings.encode(["two"])
+
+    assert svc.model.calls == [["one", "two"]]
+
+
+def test_default_and_explicit_model_share_one_service(monkeypatch):
+    monkeypatch.delenv("EMBED_MODEL", raising=False)
+    embeddings.reset_cache()
+    try:
+        service = embeddings.get_service()
+        assert service is embeddings.get_service(embeddings.DEFAULT_MODEL)
+        assert list(embeddings.service_stats()) == [embeddings.DEFAULT_MODEL]
+    finally:
+        embeddings.reset_cache()
+
+    assert embeddings.service_stats() == {}
+    assert embeddings.get_service() is not service
+    embeddings.reset_cache()
+
+
+def test_warm_restart_reads_vectors_from_disk(service):
+    service.encode(["alpha", "beta"])
+
+    restarted = EmbeddingService("fake-model", backend="torch")
+    restarted._model = FakeModel()
+    vectors = restarted.encode(["beta", "alpha", "delta"], normalize=False)
+
+    assert restarted.model.calls == [["delta"]]
+    assert vectors[1][0] == 5.0
+
+
+def test_cache_key_uses_normalized_text(service):
+    service.encode(["gdp  grew\n3%"])
+    service.encode([" gdp grew 3% "])
+
+    assert service.model.calls == [["gdp grew 3%"]]
+
+
+def test_store_evicts_least_recently_used(tmp_path):
+    store = VectorStore("fake-model", max_rows=2, root=str(tmp_path))
+    store.put_many({"a": np.ones(3), "b": np.ones(3) * 2})
+    store.get_many(["a"])
+    store.put_many({"c": np.ones(3) * 3})
+
+    found = store.get_many(["a", "b", "c"])
+    assert sorted(found) == ["a", "c"]
+    assert found["c"][0] == 3.0
+    assert len(store) == 2
+
+
+def test_store_concurrent_writers(tmp_path):
+    from concurrent.futures import ThreadPoolExecutor
+
+    store = VectorStore("fake-model", max_rows=1000, root=str(tmp_path))
+
+    def write(worker):
+        store.put_many({f"{worker}-{i}": np.full(4, worker * 100 + i) for i in range(50)})
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(write, range(4)))
+
+    reopened = VectorStore("fake-model", root=str(tmp_path))
+    found = reopened.get_many([f"{w}-{i}" for w in range(4) for i in range(50)])
+    assert len(found) == 200
+    assert all(found[f"{w}-{i}"][0] == w * 100 + i for w in range(4) for i in range(50))
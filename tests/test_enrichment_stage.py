@@ -0,0 +1,160 @@
+"""Tests for the concurrent ENRICH fetch stage."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from research_system.enrich.fetch_stage import (
+    EnrichmentFetcher,
+    enrich_cards,
+    OUTCOME_OK,
+    OUTCOME_BLOCKED,
+    OUTCOME_PAYWALL,
+    OUTCOME_TIMEOUT,
+)
+from research_system.models import EvidenceCard
+from research_system.net.circuit import CIRCUIT
+
+ARTICLE = (
+    "<html><head><title>Report</title></head><body><article>"
+    "<p>International tourist arrivals grew 12% in 2024 according to the latest barometer data.</p>"
+    "<p>Spending recovered to 2019 levels in most regions, with Europe leading the rebound.</p>"
+    "</article></body></html>"
+)
+
+
+def _card(url):
+    return EvidenceCard(
+        title="t", url=url, snippet="Content from t", provider="brave",
+        credibility_score=0.5, relevance_score=0.5, supporting_text="short",
+    )
+
+
+@pytest.fixture(autouse=True)
+def _reset_circuit():
+    CIRCUIT.clear()
+    yield
+    CIRCUIT.clear()
+
+
+def test_each_url_fetched_once_and_shared():
+    calls = []
+
+    def handler(request):
+        calls.append(str(request.url))
+        return httpx.Response(200, headers={"content-type": "text/html"}, text=ARTICLE)
+
+    fetcher = EnrichmentFetcher(transport=httpx.MockTransport(handler))
+    cards = [_card("https://example.com/a"), _card("https://example.com/a"), _card("https://other.org/b")]
+    report = enrich_cards(cards, extract=False, fetcher=fetcher)
+
+    assert sorted(calls) == ["https://example.com/a", "https://other.org/b"]
+    assert report.unique_urls == 2
+    assert all(o["outcome"] == OUTCOME_OK for o in report.outcomes)
+    assert "12%" in cards[0].supporting_text
+    assert cards[0].supporting_text == cards[1].supporting_text
+    assert cards[0].snippet.startswith("International")
+    assert cards[0].metadata["fetch_outcome"] == OUTCOME_OK
+
+
+def test_outcomes_are_classified():
+    def handler(request):
+        if request.url.host == "blocked.com":
+            return httpx.Response(403, text="forbidden")
+        if request.url.host == "paid.com":
+            return httpx.Response(402, text="pay")
+        return httpx.Response(200, headers={"content-type": "text/html"}, text=ARTICLE)
+
+    fetcher = EnrichmentFetcher(transport=httpx.MockTransport(handler))
+    cards = [_card("https://blocked.com/x"), _card("https://paid.com/y"), _card("https://ok.com/z")]
+    report = enrich_cards(cards, extract=False, fetcher=fetcher)
+
+    by_url = {o["url"]: o["outcome"] for o in report.outcomes}
+    assert by_url["https://blocked.com/x"] == OUTCOME_BLOCKED
+    assert by_url["https://paid.com/y"] == OUTCOME_PAYWALL
+    assert by_url["https://ok.com/z"] == OUTCOME_OK
+    assert cards[0].reachability == 0.0
+    assert cards[1].reachability == 0.0
+    assert report.summary()["by_outcome"] == {OUTCOME_BLOCKED: 1, OUTCOME_PAYWALL: 1, OUTCOME_OK: 1}
+
+
+def test_timeout_is_recorded():
+    async def handler(request):
+        await asyncio.sleep(1.0)
+        return httpx.Response(200, text=ARTICLE)
+
+    fetcher = EnrichmentFetcher(timeout=0.05, transport=httpx.MockTransport(handler))
+    report = enrich_cards([_card("https://slow.com/p")], extract=False, fetcher=fetcher)
+    assert report.outcomes[0]["outcome"] == OUTCOME_TIMEOUT
+
+
+def test_per_host_limit_is_respected():
+    active = {"now": 0, "peak": 0}
+
+    async def handler(request):
+        active["now"] += 1
+        active["peak"] = max(active["peak"], active["now"])
+        await asyncio.sleep(0.02)
+        active["now"] -= 1
+        return httpx.Response(200, headers={"content-type": "text/html"}, text=ARTICLE)
+
+    fetcher = EnrichmentFetcher(global_limit=8, per_host_limit=2, transport=httpx.MockTransport(handler))
+    urls = [f"https://same.com/{i}" for i in range(10)]
+    pages = asyncio.run(fetcher.fetch_all(urls))
+    assert len(pages) == 10
+    assert active["peak"] <= 2
+
+
+def test_per_domain_headers_and_oecd_mirror():
+    seen = {}
+
+    def handler(request):
+        seen[request.url.host] = request.headers["user-agent"]
+        if request.url.host == "stats.oecd.org":
+            return httpx.Response(403, text="forbidden")
+        return httpx.Response(200, headers={"content-type": "text/html"}, text=ARTICLE)
+
+    fetcher = EnrichmentFetcher(transport=httpx.MockTransport(handler))
+    cards = [_card("https://www.sec.gov/Archives/edgar/data/1"), _card("https://stats.oecd.org/t")]
+    report = enrich_cards(cards, extract=False, fetcher=fetcher)
+
+    assert "research@example.com" in seen["www.sec.gov"]
+    assert "stats-nxd.oecd.org" in seen
+    assert [o["outcome"] for o in report.outcomes] == [OUTCOME_OK, OUTCOME_OK]
+    assert report.outcomes[1]["url"] == "https://stats.oecd.org/t"
+
+
+def test_body_decoded_with_response_charset():
+    body = ARTICLE.replace("Europe", "Zürich and Québec").encode("iso-8859-1")
+
+    def handler(request):
+        return httpx.Response(200, headers={"content-type": "text/html; charset=ISO-8859-1"}, content=body)
+
+    fetcher = EnrichmentFetcher(transport=httpx.MockTransport(handler))
+    pages = asyncio.run(fetcher.fetch_all(["https://latin.example/p"]))
+    assert "Zürich and Québec" in pages["https://latin.example/p"].text
+
+
+def test_robots_disallowed_pages_are_never_requested(monkeypatch):
+    from research_system.tools import politeness
+
+    calls, throttled = [], []
+
+    async def throttle(url, min_interval=0.8):
+        throttled.append(url)
+
+    def handler(request):
+        calls.append(str(request.url))
+        return httpx.Response(200, headers={"content-type": "text/html"}, text=ARTICLE)
+
+    monkeypatch.setenv("ENABLE_POLITENESS", "true")
+    monkeypatch.setattr(politeness, "allowed", lambda url, user_agent="ResearchAgentBot": "private" not in url)
+    monkeypatch.setattr(politeness, "host_throttle", throttle)
+    fetcher = EnrichmentFetcher(transport=httpx.MockTransport(handler))
+    cards = [_card("https://example.com/private/a"), _card("https://example.com/public/b")]
+    report = enrich_cards(cards, extract=False, fetcher=fetcher)
+
+    assert calls == throttled == ["https://example.com/public/b"]
+    assert [o["outcome"] for o in report.outcomes] == [OUTCOME_BLOCKED, OUTCOME_OK]
+    assert report.outcomes[0]["error"] == "disallowed by robots.txt"
@@ -0,0 +1,58 @@
+"""Tests for the shared per-text feature cache."""
+
+from types import SimpleNamespace
+
+from research_system.controversy import ControversyDetector
+from research_system.evidence import features
+from research_system.evidence.features import best_text, card_features, text_features
+from research_system.text.numbers import extract_numbers
+from research_system.tools.claim_struct import extract_struct_claim, struct_key
+from research_system.tools.claims import canonical_claim_key
+from research_system.triangulation.paraphrase_cluster import _norm_for_para
+
+TEXT = "Global international tourist arrivals grew 7.5% to 1.3 billion in 2024, UNWTO said."
+
+
+def test_same_text_shares_one_entry():
+    assert text_features(TEXT) is text_features(str(TEXT))
+    assert text_features(None) is text_features("")
+
+
+def test_features_match_the_stage_functions():
+    f = text_features(TEXT)
+    assert f.struct_claim == extract_struct_claim(TEXT)
+    assert f.struct_key == struct_key(extract_struct_claim(TEXT))
+    assert list(f.numbers) == extract_numbers(TEXT)
+    assert f.para_norm == _norm_for_para(TEXT)
+    assert f.claim_key == canonical_claim_key(TEXT)
+    assert f.claim_norm == ControversyDetector().normalize_claim(TEXT) == (
+        "global international tourist arrivals grew 75 to 13 billion in 2024 unwto said")
+
+
+def test_features_are_computed_once(monkeypatch):
+    calls = []
+    from research_system.tools import claim_struct
+    real = claim_struct.extract_struct_claim
+    monkeypatch.setattr(claim_struct, "extract_struct_claim", lambda t: calls.append(t) or real(t))
+    features.clear_cache()
+
+    f = text_features("Hotel occupancy rate reached 71% in Q2 2024")
+    f.struct_claim, f.struct_key
+    text_features("Hotel occupancy rate reached 71% in Q2 2024").struct_claim
+    assert len(calls) == 1
+
+
+def test_best_text_prefers_quote_span():
+    card = SimpleNamespace(quote_span="quoted", claim="claim", snippet="snippet", source_title="title")
+    assert best_text(card) == "quoted"
+    assert best_text(SimpleNamespace(claim="", snippet="", source_title="title")) == "title"
+    assert card_features(card) is text_features("quoted")
+
+
+def test_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(features, "FEATURE_CACHE_SIZE", 2)
+    features.clear_cache()
+    first = text_features("a")
+    text_features("b")
+    text_features("c")
+    assert text_features("a") is not first
@@ -22,4 +22,57 @@ def test_evidence_roundtrip(tmp_path: Path):
     )
     write_jsonl(str(p), [card])
     out = read_jsonl(str(p))
-    assert len(out) == 1 and out[0].source_domain == "example.org"
\ No newline at end of file
+    assert len(out) == 1 and out[0].source_domain == "example.org"
+
+def _card(i: int) -> EvidenceCard:
+    return EvidenceCard(
+        id=f"00000000-0000-4000-8000-{i:012d}",
+        url=f"https://example.org/{i}",
+        title=f"Title {i}",
+        snippet="support",
+        provider="tavily",
+        subtopic_name="Overview",
+        claim="claim",
+        supporting_text="support",
+        source_domain="example.org",
+        credibility_score=0.9,
+        relevance_score=0.9,
+        confidence=0.8,
+    )
+
+
+def test_compressed_roundtrip_is_lazy(tmp_path: Path):
+    from research_system.tools.evidence_io import iter_jsonl
+
+    p = tmp_path/"ev.jsonl.gz"
+    ok, bad = write_jsonl(str(p), (_card(i) for i in range(5)))
+    it = iter_jsonl(str(p))
+
+    assert (ok, bad) == (5, 0)
+    assert next(it).url == "https://example.org/0"
+    assert [c.title for c in it] == [f"Title {i}" for i in range(1, 5)]
+
+
+def test_shared_encoding_memo_serializes_each_card_once(tmp_path: Path, monkeypatch):
+    from research_system.tools import evidence_io
+
+    calls = []
+    original = evidence_io._dumps
+    monkeypatch.setattr(evidence_io, "_dumps", lambda doc: calls.append(doc["id"]) or original(doc))
+    cards = [_card(i).model_dump() for i in range(4)]
+    encoded = {}
+    write_jsonl(str(tmp_path/"final.jsonl"), cards[:2], encoded=encoded)
+    write_jsonl(str(tmp_path/"all.jsonl"), cards, encoded=encoded)
+
+    assert len(calls) == 4
+    assert (tmp_path/"all.jsonl").read_text().splitlines()[:2] == (tmp_path/"final.jsonl").read_text().splitlines()
+
+
+def test_sampled_validation_still_checks_required_fields(tmp_path: Path):
+    docs = [_card(i).model_dump() for i in range(3)]
+    docs[1]["relevance_score"] = 2.0
+    del docs[2]["confidence"]
+
+    ok, bad = write_jsonl(str(tmp_path/"ev.jsonl"), docs, validate_sample=0.0)
+
+    assert (ok, bad) == (1, 2)
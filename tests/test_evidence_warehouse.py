@@ -0,0 +1,116 @@
+"""Tests for the partitioned Parquet evidence warehouse."""
+
+from datetime import date
+
+import pytest
+
+pytest.importorskip("duckdb")
+pytest.importorskip("pandas")
+
+from research_system.models import EvidenceCard
+from research_system.tools import duck_agg
+from research_system.tools.aggregates import source_quality
+from research_system.tools.warehouse import EvidenceWarehouse, main
+
+
+def _cards():
+    rows = [
+        ("bls.gov", "brave", "GDP grew 3% in 2024", 0.9, True, True),
+        ("bea.gov", "tavily", "GDP grew 3% in 2024", 0.8, True, True),
+        ("bls.gov", "tavily", "Unemployment fell to 4%", 0.7, True, False),
+        ("example-blog.com", "brave", "Something unrelated", 0.3, False, False),
+    ]
+    return [
+        EvidenceCard(url=f"https://www.{domain}/{i}", title=f"T{i}", snippet=claim, provider=provider,
+                     claim=claim, credibility_score=cred, relevance_score=0.6,
+                     is_primary_source=primary, is_triangulated=tri)
+        for i, (domain, provider, claim, cred, primary, tri) in enumerate(rows)
+    ]
+
+
+@pytest.fixture
+def warehouse(tmp_path, monkeypatch):
+    monkeypatch.setenv("EVIDENCE_WAREHOUSE_DIR", str(tmp_path / "wh"))
+    return EvidenceWarehouse()
+
+
+def test_append_partitions_by_date_intent_provider(warehouse):
+    assert warehouse.append_run("run_a", _cards(), "stats", date(2025, 3, 1)) == 4
+
+    paths = sorted(p.relative_to(warehouse.root).parent.as_posix()
+                   for p in warehouse.root.rglob("*.parquet"))
+    assert paths == ["run_date=2025-03-01/intent=stats/provider=brave",
+                     "run_date=2025-03-01/intent=stats/provider=tavily"]
+
+
+def test_reappending_a_run_replaces_it(warehouse):
+    warehouse.append_run("run_a", _cards(), "stats")
+    warehouse.append_run("run_a", _cards()[:1], "stats")
+
+    assert warehouse.query("SELECT COUNT(*) AS n FROM cards")[0]["n"] == 1
+
+
+def test_source_quality_matches_python_aggregate(warehouse):
+    cards = _cards()
+    warehouse.append_run("run_a", cards, "stats")
+    warehouse.append_run("run_b", cards[:2], "news")
+
+    keys = ("domain", "total_cards", "unique_claims", "avg_credibility", "avg_relevance",
+            "corroborated_rate")
+    expected = [{k: r[k] for k in keys} | {"providers": sorted(r["providers"])}
+                for r in source_quality(cards)]
+    got = [{k: r[k] for k in keys} | {"providers": r["providers"]}
+           for r in warehouse.source_quality("run_a")]
+    assert got == expected
+
+
+def test_source_quality_parity_for_missing_provider_and_host(warehouse):
+    cards = _cards()
+    cards.append(EvidenceCard(url="https://www.bls.gov/9", title="T9", snippet="GDP grew 3% in 2024",
+                              provider="", claim="GDP grew 3% in 2024", credibility_score=0.5,
+                              relevance_score=0.6))
+    cards.append(EvidenceCard(url="file:///tmp/report.html", title="T10", snippet="Local copy",
+                              provider="brave", claim="Local copy", credibility_score=0.4,
+                              relevance_score=0.6))
+    warehouse.append_run("run_a", cards, "stats")
+
+    keys = ("domain", "total_cards", "unique_claims", "avg_credibility", "avg_relevance",
+            "corroborated_rate", "independence_score")
+    expected = [{k: r[k] for k in keys} | {"providers": sorted(r["providers"])}
+                for r in source_quality(cards)]
+    got = [{k: r[k] for k in keys} | {"providers": r["providers"]}
+           for r in warehouse.source_quality("run_a")]
+    assert sorted(got, key=lambda r: r["domain"]) == sorted(expected, key=lambda r: r["domain"])
+    assert "unknown" in {r["domain"] for r in got}
+
+
+def test_cross_run_domain_query(warehouse):
+    warehouse.append_run("run_a", _cards(), "stats", date(2025, 1, 10))
+    warehouse.append_run("run_b", _cards(), "stats", date(2025, 2, 10))
+
+    rows = warehouse.contributing_domains(since=date(2025, 2, 1), primary=True, triangulated=True)
+
+    assert [(r["domain"], r["cards"], r["runs"]) for r in rows] == [("bea.gov", 1, 1), ("bls.gov", 1, 1)]
+
+
+def test_duck_agg_reads_run_from_warehouse(warehouse, tmp_path):
+    warehouse.append_run("run_a", _cards(), "stats")
+
+    table = duck_agg.render_source_quality_md(str(tmp_path / "missing.jsonl"), run_id="run_a")
+
+    assert "| www.bls.gov | 2 |" in table
+
+
+def test_empty_warehouse_query(warehouse):
+    assert warehouse.query("SELECT COUNT(*) AS n FROM cards") == [{"n": 0}]
+
+
+def test_cli_ingest_and_query(warehouse, tmp_path, capsys):
+    from research_system.tools.evidence_io import write_jsonl
+
+    run_dir = tmp_path / "topic_20250101_000000"
+    write_jsonl(str(run_dir / "evidence_cards.jsonl"), _cards())
+
+    assert main(["ingest", str(run_dir)]) == 0
+    assert main(["--json", "query", "SELECT run_id, COUNT(*) AS n FROM cards GROUP BY 1"]) == 0
+    assert '"n": 4' in capsys.readouterr().out
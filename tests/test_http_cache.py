@@ -0,0 +1,128 @@
+"""Tests for the content-addressed HTTP cache."""
+
+import os
+from datetime import timedelta
+from multiprocessing import get_context
+
+import httpx
+import pytest
+
+from research_system.tools import cache
+from research_system.tools.http_store import HttpCacheStore
+
+
+class FakeGet:
+    """Stand-in for httpx.get serving fixed bodies and honouring ETags."""
+
+    def __init__(self, bodies):
+        self.bodies = bodies
+        self.requests = []
+
+    def __call__(self, url, headers=None, timeout=None, follow_redirects=True):
+        headers = headers or {}
+        self.requests.append((url, dict(headers)))
+        body = self.bodies[url]
+        etag = f'"{hash(body)}"'
+        request = httpx.Request("GET", url)
+        if headers.get("If-None-Match") == etag:
+            return httpx.Response(304, request=request)
+        return httpx.Response(200, content=body, request=request,
+                              headers={"ETag": etag, "Content-Type": "text/html; charset=utf-8"})
+
+
+@pytest.fixture
+def fake_get(tmp_path, monkeypatch):
+    monkeypatch.setenv("HTTP_CACHE_DIR", str(tmp_path / "http"))
+    cache._store_for.cache_clear()
+    fake = FakeGet({"https://a.example/1": "héllo".encode(), "https://b.example/2": "héllo".encode(),
+                    "https://c.example/doc.pdf": b"%PDF-1.4 binary"})
+    monkeypatch.setattr(cache.httpx, "get", fake)
+    yield fake
+    cache._store_for.cache_clear()
+
+
+def test_fresh_hit_skips_network(fake_get):
+    first = cache.get("https://a.example/1")
+    second = cache.get("https://a.example/1")
+
+    assert first == second
+    assert first[2] == "héllo"
+    assert len(fake_get.requests) == 1
+
+
+def test_stale_entry_is_revalidated_with_etag(fake_get):
+    cache.get("https://a.example/1")
+    status, headers, text = cache.get("https://a.example/1", ttl=timedelta(0))
+
+    assert status == 200 and text == "héllo"
+    assert "If-None-Match" in fake_get.requests[-1][1]
+    # The 304 refreshed the entry, so it is fresh again
+    cache.get("https://a.example/1")
+    assert len(fake_get.requests) == 2
+
+
+def test_identical_bodies_share_one_blob(fake_get):
+    cache.get("https://a.example/1")
+    cache.get("https://b.example/2")
+
+    assert cache.get_cache_stats()["entries"] == 2
+    assert cache.get_cache_stats()["blobs"] == 1
+
+
+def test_get_and_get_binary_share_entries(fake_get):
+    _, _, content = cache.get_binary("https://c.example/doc.pdf")
+    _, _, text = cache.get("https://c.example/doc.pdf")
+
+    assert content == b"%PDF-1.4 binary"
+    assert text == "%PDF-1.4 binary"
+    assert len(fake_get.requests) == 1
+
+
+def test_size_bound_evicts_least_recently_used(tmp_path):
+    store = HttpCacheStore(str(tmp_path), max_bytes=2500)
+    bodies = {u: os.urandom(1000) for u in ("u1", "u2", "u3")}
+    store.put("u1", 200, {}, bodies["u1"])
+    store.put("u2", 200, {}, bodies["u2"])
+    store.get("u1")
+    store.put("u3", 200, {}, bodies["u3"])
+
+    assert store.get("u2") is None
+    assert store.get("u1").body == bodies["u1"]
+    assert store.stats()["bytes"] <= 2500
+    assert len(list((tmp_path / "blobs").rglob("*.z"))) == store.stats()["blobs"] == 2
+
+
+def test_replacing_entry_releases_old_blob(tmp_path):
+    store = HttpCacheStore(str(tmp_path))
+    store.put("u", 200, {}, b"old")
+    store.put("u", 200, {}, b"new")
+
+    assert store.get("u").body == b"new"
+    assert store.stats() == {"entries": 1, "blobs": 1, "bytes": store.stats()["bytes"]}
+
+
+def test_expired_entries_are_dropped(tmp_path):
+    store = HttpCacheStore(str(tmp_path), max_age=60)
+    store.put("old", 200, {}, b"a")
+    store._db().execute("UPDATE entries SET fetched = fetched - 120")
+    store.put("new", 200, {}, b"b")
+
+    assert store.get("old") is None
+    assert store.stats()["entries"] == 1
+
+
+def _write_many(args):
+    root, worker = args
+    store = HttpCacheStore(root)
+    for i in range(30):
+        store.put(f"https://w{worker}.example/{i}", 200, {}, f"body {i % 10}".encode())
+
+
+def test_concurrent_processes(tmp_path):
+    with get_context("fork").Pool(3) as pool:
+        pool.map(_write_many, [(str(tmp_path), w) for w in range(3)])
+
+    store = HttpCacheStore(str(tmp_path))
+    assert store.stats()["entries"] == 90
+    assert store.stats()["blobs"] == 10
+    assert store.get("https://w2.example/13").body == b"body 3"
@@ -0,0 +1,111 @@
+"""Tests for the pooled, keep-alive provider HTTP transport."""
+
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from research_system.net import pool
+from research_system.net.pool import (
+    AsyncPooledClient, PooledClient, get_async_client, get_client, pool_stats,
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive
+
+    def do_GET(self):
+        body = b'{"ok": true}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    t = threading.Thread(target=httpd.serve_forever, daemon=True)
+    t.start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_connections_are_reused(server):
+    client = PooledClient()
+    try:
+        for i in range(5):
+            r = client.get(f"{server}/item/{i}")
+            assert r.json() == {"ok": True}
+        snap = client.stats.snapshot()
+        assert snap["requests"] == 5
+        assert snap["new_connections"] == 1
+        assert snap["reuse_ratio"] == pytest.approx(0.8)
+        assert snap["open_connections"] == 1
+    finally:
+        client.close()
+
+
+def test_async_client_reuses_connections(server):
+    async def run():
+        client = AsyncPooledClient()
+        try:
+            for i in range(3):
+                r = await client.get(f"{server}/a/{i}")
+                assert r.status_code == 200
+            return client.stats.snapshot()
+        finally:
+            await client.aclose()
+
+    snap = asyncio.run(run())
+    assert snap["requests"] == 3
+    assert snap["new_connections"] == 1
+
+
+def test_async_clients_close_when_their_loop_ends():
+    async def client():
+        c = get_async_client()
+        assert c is get_async_client()
+        return c
+
+    first, second = asyncio.run(client()), asyncio.run(client())
+    assert first is not second
+    assert first._client.is_closed and second._client.is_closed
+
+
+def test_per_host_limit_bounds_concurrency():
+    active = {"now": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def handler(request):
+        with lock:
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+        time.sleep(0.02)
+        with lock:
+            active["now"] -= 1
+        return httpx.Response(200, json={})
+
+    client = PooledClient(per_host=2, transport=httpx.MockTransport(handler))
+    threads = [threading.Thread(target=client.get, args=(f"http://h.example/{i}",)) for i in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert active["peak"] <= 2
+    assert client.stats.snapshot()["requests"] == 8
+
+
+def test_get_client_is_process_wide():
+    assert get_client() is get_client()
+    stats = pool_stats()
+    assert set(stats) == {"http2", "sync", "async"}
+    assert "reuse_ratio" in stats["sync"]
@@ -0,0 +1,130 @@
+"""Tests for the intent result cache, embedding cache and linear fast path."""
+
+import numpy as np
+import pytest
+
+from research_system.intent import classifier, linear, semantic
+from research_system.intent import cache as intent_cache
+from research_system.intent.classifier import Intent, classify
+
+
+@pytest.fixture
+def no_models(monkeypatch):
+    """Count model-stage calls; semantic and NLI never decide."""
+    calls = []
+    monkeypatch.setattr(classifier, "_classify_semantic", lambda q: calls.append(("semantic", q)))
+    monkeypatch.setattr(classifier, "_classify_nli", lambda q: calls.append(("nli", q)))
+    return calls
+
+
+def test_model_decisions_are_cached(monkeypatch, no_models):
+    monkeypatch.setattr(classifier, "_classify_semantic",
+                        lambda q: no_models.append(("semantic", q)) or Intent.ENCYCLOPEDIA)
+
+    assert classify("quantum computing explained") == Intent.ENCYCLOPEDIA
+    assert classify("  Quantum computing   EXPLAINED ") == Intent.ENCYCLOPEDIA
+    assert no_models == [("semantic", "quantum computing explained")]
+
+    # Survives the process: a fresh cache object reads it back from disk
+    intent_cache._results_for.cache_clear()
+    assert classify("quantum computing explained") == Intent.ENCYCLOPEDIA
+    assert len(no_models) == 1
+
+
+def test_cache_is_keyed_by_labels_file(tmp_path, monkeypatch, no_models):
+    labels = tmp_path / "labels.yaml"
+    labels.write_text(open(intent_cache.DEFAULT_LABELS_FILE).read())
+    monkeypatch.setenv("INTENT_LABELS_FILE", str(labels))
+    monkeypatch.setattr(classifier, "_model_stages_available", lambda: True)
+
+    classify("quantum computing explained")
+    classify("quantum computing explained")
+    labels.write_text(labels.read_text() + "\n# edited\n")
+    classify("quantum computing explained")
+
+    assert [stage for stage, _ in no_models] == ["semantic", "nli", "semantic", "nli"]
+
+
+def test_cache_is_keyed_by_classifier_settings(monkeypatch, no_models):
+    monkeypatch.setattr(classifier, "_classify_semantic",
+                        lambda q: no_models.append(("semantic", q)) or Intent.STATS)
+
+    assert classify("quantum computing explained") == Intent.STATS
+    # The linear fast path now decides; a stale entry would still say STATS
+    monkeypatch.setenv("INTENT_USE_LINEAR", "true")
+    assert classify("quantum computing explained") == Intent.ENCYCLOPEDIA
+    monkeypatch.delenv("INTENT_USE_LINEAR")
+    assert classify("quantum computing explained") == Intent.STATS
+    assert len(no_models) == 1
+
+
+def test_transient_stage_failures_are_not_cached(monkeypatch):
+    from research_system.intent import nli_fallback
+
+    calls = []
+
+    def broken():
+        calls.append(1)
+        raise RuntimeError("model server unavailable")
+
+    monkeypatch.setattr(semantic, "init", broken)
+    monkeypatch.setattr(nli_fallback, "init", broken)
+    monkeypatch.setattr(classifier, "_model_stages_available", lambda: True)
+
+    assert classify("quantum computing explained") == Intent.GENERIC
+    assert classify("quantum computing explained") == Intent.GENERIC
+    assert len(calls) == 4
+
+
+def test_unavailable_models_do_not_pin_generic(no_models):
+    classify("quantum computing explained")
+    classify("quantum computing explained")
+    assert len(no_models) == 4
+
+
+def test_linear_fast_path_skips_models(monkeypatch, no_models):
+    monkeypatch.setenv("INTENT_USE_LINEAR", "true")
+
+    assert classify("quantum computing explained") == Intent.ENCYCLOPEDIA
+    assert no_models == []
+
+
+def test_ambiguous_queries_still_reach_nli(monkeypatch, no_models):
+    monkeypatch.setenv("INTENT_USE_LINEAR", "true")
+    monkeypatch.setenv("INTENT_LINEAR_MIN_PROB", "0.99")
+    monkeypatch.setenv("INTENT_LINEAR_AMBIGUOUS_PROB", "0.99")
+
+    classify("quantum computing explained")
+    assert [stage for stage, _ in no_models] == ["semantic", "nli"]
+
+
+def test_linear_model_learns_label_examples():
+    model = linear.get_model()
+    assert model.score("symptoms of diabetes")[0][0] == "medical"
+    assert model.score("itinerary for Japan trip")[0][0] == "travel"
+
+
+class FakeService:
+    model_name = "fake-model"
+
+    def __init__(self):
+        self.encoded = 0
+
+    def encode(self, texts, normalize=True):
+        self.encoded += len(texts)
+        return np.ones((len(texts), 4), dtype=np.float32)
+
+
+def test_label_embeddings_persist_per_signature(monkeypatch):
+    service = FakeService()
+    monkeypatch.setattr(semantic, "_MODEL", service)
+    semantic._load_labels(intent_cache.DEFAULT_LABELS_FILE)
+    signature = intent_cache.labels_signature(intent_cache.DEFAULT_LABELS_FILE)
+
+    semantic._prep_embeddings(signature)
+    first = service.encoded
+    semantic._prep_embeddings(signature)
+
+    assert first > 0 and service.encoded == first
+    assert semantic._LBL_EMB.shape == (len(semantic._LABELS), 4)
+    assert set(semantic._EX_EMB) == set(semantic._EXAMPLES)
@@ -0,0 +1,59 @@
+"""Tests for the vectorized, blocked paraphrase clustering helpers."""
+
+import numpy as np
+import pytest
+
+pytest.importorskip("scipy")
+
+from research_system.triangulation import paraphrase_cluster as pc
+
+
+def _embeddings(n=120, dim=64, seed=3):
+    rng = np.random.default_rng(seed)
+    centers = rng.normal(size=(n // 6, dim))
+    emb = centers[rng.integers(0, len(centers), n)] + rng.normal(scale=0.8, size=(n, dim))
+    return (emb / np.linalg.norm(emb, axis=1, keepdims=True)).astype(np.float32)
+
+
+def _reference_pairs(emb, texts, threshold):
+    sim = emb @ emb.T
+    pairs = set()
+    for i in range(len(emb)):
+        for j in range(i + 1, len(emb)):
+            s = sim[i, j]
+            if threshold > s >= 0.25 and len(pc._numeric_tokens(texts[i]) & pc._numeric_tokens(texts[j])) >= 2:
+                s = threshold
+            if s >= threshold:
+                pairs.add((i, j))
+    return pairs
+
+
+@pytest.mark.parametrize("block_rows", [7, 1024])
+def test_similar_pairs_match_pairwise_scan(monkeypatch, block_rows):
+    monkeypatch.setattr(pc, "PARA_BLOCK_ROWS", block_rows)
+    emb = _embeddings()
+    texts = [f"rose {i % 4}% in {2020 + i % 3}" for i in range(len(emb))]
+
+    rows, cols, _ = pc._similar_pairs(emb, texts, 0.4)
+
+    assert set(zip(rows.tolist(), cols.tolist())) == _reference_pairs(emb, texts, 0.4)
+
+
+def test_streaming_percentile_matches_exact(monkeypatch):
+    emb = _embeddings(n=300)
+    # Shift every vector toward a shared direction so the percentile is inside the bounds
+    emb = emb + 0.6 * np.eye(emb.shape[1], dtype=np.float32)[0]
+    emb /= np.linalg.norm(emb, axis=1, keepdims=True)
+    exact = pc._adaptive_threshold(emb)
+
+    monkeypatch.setattr(pc, "PARA_EXACT_PERCENTILE_MAX", 10)
+    monkeypatch.setattr(pc, "PARA_BLOCK_ROWS", 32)
+    streamed = pc._adaptive_threshold(emb)
+
+    assert 0.32 < exact < 0.48
+    assert streamed == pytest.approx(exact, abs=1e-3)
+
+
+def test_components_ordered_by_first_member():
+    labels = pc._components(6, np.array([4, 1]), np.array([5, 3]))
+    assert labels.tolist() == [0, 1, 2, 1, 3, 3]
@@ -0,0 +1,160 @@
+"""Tests for the spooled PDF download and cached page-level extraction."""
+
+import hashlib
+
+import pytest
+
+fitz = pytest.importorskip("fitz")
+
+from research_system.extraction import pdf_pages
+from research_system.extraction.pdf_pages import PdfDocument, _runs
+from research_system.net import pdf_fetch
+from research_system.net.pdf_fetch import PdfSpool, download_pdf, download_pdf_path
+from research_system.tools.pdf_extract import extract_pdf_text
+
+
+def _pdf(pages):
+    doc = fitz.open()
+    for text in pages:
+        doc.new_page().insert_text((72, 72), text)
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def _count_parses(monkeypatch):
+    parsed = []
+    original = PdfDocument._parse_pages
+
+    def counting(self, pages):
+        parsed.extend(pages)
+        return original(self, pages)
+
+    monkeypatch.setattr(PdfDocument, "_parse_pages", counting)
+    return parsed
+
+
+def test_spool_streams_to_disk_and_evicts_least_recent(tmp_path):
+    spool = PdfSpool(str(tmp_path), max_mb=25 / (1024 * 1024))
+    h1, p1 = spool.write_stream([b"0123456789", b"abcde"])
+    assert h1 == hashlib.sha256(b"0123456789abcde").hexdigest()
+    assert p1.read_bytes() == b"0123456789abcde" and spool[h1] == b"0123456789abcde"
+
+    h2, _ = spool.write_stream([b"x" * 15])
+    assert h2 in spool and h1 not in spool
+
+    with pytest.raises(ValueError):
+        spool.write_stream([b"y" * 10, b"y" * 10], budget=15)
+    assert not list(tmp_path.glob("*.part"))
+
+
+class _Response:
+    def __init__(self, url, chunks):
+        self.url, self._chunks, self.headers = url, chunks, {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def raise_for_status(self):
+        pass
+
+    def iter_bytes(self, size):
+        return iter(self._chunks)
+
+
+class _Client:
+    def __init__(self, chunks, final_url=None):
+        self.chunks, self.final_url, self.streams = chunks, final_url, 0
+
+    def head(self, url, **kw):
+        return _Response(url, [])
+
+    def stream(self, method, url, **kw):
+        self.streams += 1
+        return _Response(self.final_url or url, self.chunks)
+
+
+def test_download_reuses_spooled_file_for_url_and_redirect(monkeypatch):
+    monkeypatch.setattr(pdf_fetch, "_url_to_hash", {})
+    client = _Client([b"%PDF-1.4 ", b"body"], final_url="https://cdn.example.com/r.pdf")
+    path = download_pdf_path(client, "https://example.com/r.pdf")
+    assert path.parent == pdf_fetch._seen_downloads.root
+    assert download_pdf(client, "https://example.com/r.pdf") == b"%PDF-1.4 body"
+    assert download_pdf_path(client, "https://cdn.example.com/r.pdf") == path
+    assert client.streams == 1
+
+
+def test_page_text_is_cached_and_deeper_reads_parse_only_new_pages(monkeypatch):
+    data = _pdf([f"Page {i} text" for i in range(1, 6)])
+    parsed = _count_parses(monkeypatch)
+
+    first = extract_pdf_text(data, max_pages=2)
+    assert first["pages"] == 5 and first["extracted_pages"] == 2
+    assert "Page 2 text" in first["text"] and "Page 3" not in first["text"]
+    assert parsed == [0, 1]
+
+    deeper = extract_pdf_text(data, max_pages=10)
+    assert "Page 5 text" in deeper["text"]
+    assert parsed == [0, 1, 2, 3, 4]
+
+    with PdfDocument(data) as doc:
+        assert len(doc.page_texts()) == 5
+        assert doc.backend is None  # served from the cache without opening the PDF
+    assert parsed == [0, 1, 2, 3, 4]
+
+
+def test_spooled_file_is_keyed_by_its_name(tmp_path):
+    data = _pdf(["Spooled"])
+    digest = hashlib.sha256(data).hexdigest()
+    path = tmp_path / f"{digest}.pdf"
+    path.write_bytes(data)
+    doc = PdfDocument(path)
+    assert doc.digest == digest
+    assert "Spooled" in doc.page_texts()[0]
+    doc.close()
+
+
+def test_text_cache_can_be_disabled(monkeypatch):
+    monkeypatch.setenv("ENABLE_PDF_TEXT_CACHE", "false")
+    data = _pdf(["One", "Two"])
+    parsed = _count_parses(monkeypatch)
+    extract_pdf_text(data, max_pages=2)
+    extract_pdf_text(data, max_pages=2)
+    assert parsed == [0, 1, 0, 1]
+
+
+def test_page_ranges_split_for_workers():
+    assert _runs([0, 1, 2, 3, 4, 5], 2) == [(0, 3), (3, 6)]
+    assert _runs([0, 1, 5, 6, 7], 2) == [(0, 2), (5, 8)]
+    assert _runs([3], 4) == [(3, 4)]
+
+
+def test_long_documents_are_parsed_in_a_process_pool(monkeypatch):
+    monkeypatch.setattr(pdf_pages, "PDF_WORKERS", 2)
+    monkeypatch.setattr(pdf_pages, "PARALLEL_MIN_PAGES", 4)
+    data = _pdf([f"Section {i}" for i in range(8)])
+    try:
+        with PdfDocument(data) as doc:
+            texts = doc.page_texts()
+        assert pdf_pages._pool is not None
+    finally:
+        pdf_pages.shutdown_pool()
+    assert [t.strip() for t in texts] == [f"Section {i}" for i in range(8)]
+
+
+def test_unreadable_pdf_reports_an_error():
+    result = extract_pdf_text(b"not a pdf", max_pages=2)
+    assert result["text"] == "" and "error" in result
+
+
+def test_pdf_article_searches_deeper_pages_for_quotes(monkeypatch):
+    from research_system.tools.fetch import pdf_article
+
+    monkeypatch.setenv("PDF_MAX_PAGES", "2")
+    monkeypatch.setenv("PDF_QUOTE_MAX_PAGES", "10")
+    pages = ["Contents"] * 7 + ["International tourist arrivals grew by 12% in 2023 to 1.3 billion."]
+    article = pdf_article("https://example.org/report.pdf", _pdf(pages))
+    assert any("12%" in q for q in article["quotes"])
@@ -0,0 +1,112 @@
+"""Tests for the shared provider health registry."""
+
+import multiprocessing as mp
+import time
+
+import pytest
+
+from research_system.net import provider_health
+from research_system.net.circuit import Circuit
+from research_system.net.provider_circuit import ProviderCircuitBreaker
+from research_system.net.provider_health import (
+    Health, HealthRegistry, LocalStore, SqliteStore, get_registry,
+)
+
+
+def _trip_in_child(host):
+    Circuit(fail_thresh=1, cooldown=60).fail(host)
+
+
+def test_records_survive_a_new_store(tmp_path):
+    HealthRegistry(SqliteStore(str(tmp_path))).record_failure("provider:x", threshold=1, cooldown=60)
+
+    health = HealthRegistry(SqliteStore(str(tmp_path))).get("provider:x")
+    assert health.consecutive_failures == 1
+    assert health.is_open()
+
+
+def test_circuit_trip_is_seen_by_other_processes():
+    ctx = mp.get_context("fork")
+    child = ctx.Process(target=_trip_in_child, args=("down.example",))
+    child.start()
+    child.join(30)
+    assert child.exitcode == 0
+
+    circuit = Circuit(fail_thresh=1, cooldown=60)
+    assert circuit.is_open("down.example")
+    assert circuit.allow("up.example")
+
+
+def test_provider_breakers_share_state():
+    first, second = ProviderCircuitBreaker(failure_threshold=2), ProviderCircuitBreaker(failure_threshold=2)
+    first.record_failure("serpapi")
+    second.record_failure("serpapi")
+
+    available, reason = first.is_available("serpapi")
+    assert not available and "Circuit open" in reason
+    first.reset("serpapi")
+    assert second.is_available("serpapi") == (True, None)
+
+
+def test_429_backoff_is_shared():
+    breaker = ProviderCircuitBreaker(failure_threshold=10, initial_backoff_seconds=5)
+    breaker.record_failure("tavily", status_code=429)
+
+    stats = ProviderCircuitBreaker().get_health_stats("tavily")
+    assert stats["in_backoff"] and not stats["circuit_open"]
+    assert get_registry().get("provider:tavily").last_429 > 0
+
+
+def test_latency_ewma():
+    registry = HealthRegistry(LocalStore())
+    registry.record_success("host:a", latency=1.0)
+    registry.observe_latency("host:a", 2.0)
+    assert registry.get("host:a").latency_ewma == pytest.approx(1.0 + provider_health.EWMA_ALPHA)
+
+
+def test_success_closes_and_reset_by_prefix():
+    registry = get_registry()
+    registry.trip("search:tavily", 60, status=429)
+    registry.trip("search:serper", 60)
+    assert not registry.allow("search:tavily")
+
+    registry.record_success("search:tavily")
+    assert registry.allow("search:tavily")
+    registry.reset(prefix="search:")
+    assert registry.snapshot("search:") == {}
+
+
+def test_prune_drops_stale_records(tmp_path):
+    registry = HealthRegistry(SqliteStore(str(tmp_path)))
+    registry.record_success("host:old")
+    assert registry.prune(max_age=-1) == 1
+    assert registry.get("host:old") == Health()
+
+
+def test_redis_backend_without_url_falls_back_to_local(monkeypatch):
+    monkeypatch.setenv("PROVIDER_HEALTH_BACKEND", "redis")
+    monkeypatch.setenv("PROVIDER_HEALTH_REDIS_URL", "")
+    monkeypatch.delenv("REDIS_URL", raising=False)
+    assert isinstance(get_registry().store, LocalStore)
+
+
+def test_broken_store_degrades_to_local():
+    class Broken:
+        def get(self, key):
+            raise OSError("disk gone")
+
+    registry = HealthRegistry(Broken())
+    assert registry.allow("host:x")
+    assert isinstance(registry.store, LocalStore)
+
+
+def test_catalog_circuit_state_view():
+    from research_system.providers import oecd
+
+    oecd.reset_circuit_state()
+    get_registry().record_failure(oecd.CIRCUIT_KEY, oecd.CIRCUIT_THRESHOLD, 60)
+    assert oecd._circuit_state["consecutive_failures"] == 1
+    assert oecd._circuit_state["is_open"] is (oecd.CIRCUIT_THRESHOLD <= 1)
+    oecd.reset_circuit_state()
+    assert dict(oecd._circuit_state) == {"is_open": False, "last_failure": 0.0,
+                                         "consecutive_failures": 0}
@@ -0,0 +1,86 @@
+"""Scaling benchmarks for clustering, dedup and triangulation stages.
+
+Each stage runs on synthetic corpora (``research_system.evidence.synthetic``)
+of every size in ``SCALING_BENCH_SIZES``; the suite is skipped when it is
+unset, since a sweep takes minutes. Wall time is measured by pytest-benchmark,
+and peak traced memory (MB) and microseconds per card go in ``extra_info``.
+
+Save a baseline, then fail on a regression of more than 25%::
+
+    export SCALING_BENCH_SIZES=1000,10000,100000
+    pytest tests/test_scaling_benchmarks.py --benchmark-autosave
+    pytest tests/test_scaling_benchmarks.py --benchmark-compare --benchmark-compare-fail=mean:25%
+
+Comparing ``us_per_card`` across sizes in the saved JSON shows each stage's
+growth rate: constant is linear, rising with size is not.
+"""
+
+import copy
+import os
+import tracemalloc
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from research_system.controversy import ControversyDetector
+from research_system.evidence import features
+from research_system.evidence.synthetic import CorpusSpec, generate_corpus
+from research_system.tools.aggregates import triangulate_claims
+from research_system.tools.dedup import minhash_near_dupes
+from research_system.tools.embed_cluster import hybrid_clusters
+from research_system.triangulation.paraphrase_cluster import cluster_paraphrases
+from research_system.triangulation.source_aware_clustering import source_aware_cluster_paraphrases
+
+pytestmark = [pytest.mark.performance, pytest.mark.slow]
+
+SIZES = [int(n) for n in os.getenv("SCALING_BENCH_SIZES", "").split(",") if n.strip()]
+if not SIZES:
+    pytest.skip("set SCALING_BENCH_SIZES to run scaling benchmarks", allow_module_level=True)
+
+
+def _texts(cards):
+    return [features.best_text(card) for card in cards]
+
+
+# stage -> (callable, mutates its cards, takes texts rather than cards)
+STAGES = {
+    "cluster_paraphrases": (cluster_paraphrases, False, False),
+    "source_aware_cluster_paraphrases": (source_aware_cluster_paraphrases, False, False),
+    "hybrid_clusters": (hybrid_clusters, False, True),
+    "minhash_near_dupes": (minhash_near_dupes, False, True),
+    "controversy": (lambda cards: ControversyDetector().process_evidence(cards), True, False),
+    "triangulate_claims": (triangulate_claims, False, False),
+}
+
+
+@pytest.fixture(scope="module", params=SIZES, ids=lambda n: f"{n}cards")
+def corpus(request):
+    return generate_corpus(CorpusSpec(n_cards=request.param, seed=42))
+
+
+@pytest.mark.parametrize("stage", list(STAGES))
+def test_stage_scaling(benchmark, corpus, stage):
+    fn, mutates, takes_texts = STAGES[stage]
+    n = len(corpus.cards)
+    benchmark.group = stage
+
+    def setup():
+        # Cold caches, so every round pays for feature extraction
+        features.clear_cache()
+        cards = copy.deepcopy(corpus.cards) if mutates else corpus.cards
+        return (_texts(cards) if takes_texts else cards,), {}
+
+    result = benchmark.pedantic(fn, setup=setup, rounds=1 if n > 5000 else 3)
+    assert result is not None
+
+    # Memory is traced in a separate run, since tracing slows the timed ones
+    (arg,), _ = setup()
+    tracemalloc.start()
+    try:
+        fn(arg)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    benchmark.extra_info.update(n_cards=n, peak_mb=round(peak / 1e6, 2),
+                                us_per_card=round(benchmark.stats.stats.mean / n * 1e6, 1))
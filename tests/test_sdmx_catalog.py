@@ -0,0 +1,127 @@
+"""Tests for the shared SDMX dataflow catalog used by OECD and IMF."""
+
+import pickle
+import time
+
+import pytest
+
+from research_system.providers import imf, sdmx_catalog
+from research_system.providers.sdmx_catalog import DataflowCatalog
+
+FLOWS = {
+    "OECD.SDD:PRICES_CPI": {"name": "Consumer price indices", "agency": "OECD.SDD"},
+    "OECD.CFE:TOURISM_TRIPS": {"name": "Tourism trips and travel", "agency": "OECD.CFE"},
+    "OECD.SDD:NAAG": {"name": "National accounts at a glance", "agency": "OECD.SDD"},
+}
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("CATALOG_CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+def _catalog(calls, flows=FLOWS, ttl=3600):
+    def loader():
+        calls.append(time.time())
+        return flows
+    return DataflowCatalog("test", loader, ttl=ttl)
+
+
+def test_new_process_starts_warm_from_disk():
+    calls = []
+    _catalog(calls).dataflows()
+    assert len(calls) == 1
+
+    restarted = _catalog(calls)
+    flows = restarted.dataflows()
+    assert len(calls) == 1
+    assert flows["OECD.SDD:NAAG"]["agency"] == "OECD.SDD"
+    assert restarted.search("tourism travel")[0]["code"] == "OECD.CFE:TOURISM_TRIPS"
+
+
+def test_reset_refetches_but_keeps_the_shared_snapshot():
+    calls = []
+    catalog = _catalog(calls)
+    catalog.dataflows()
+    catalog.reset()
+
+    assert catalog.store.path.exists()
+    catalog.dataflows()
+    assert len(calls) == 2
+
+
+def test_empty_fetch_keeps_the_current_snapshot():
+    calls = []
+    catalog = _catalog(calls, ttl=0)
+    catalog.dataflows()
+    catalog.loader = lambda: {}
+
+    assert catalog.refresh() is None
+    assert set(catalog.dataflows()) == set(FLOWS)
+    assert set(_catalog([], flows={}).dataflows()) == set(FLOWS)  # Disk copy intact
+
+
+def test_oecd_search_falls_back_when_the_catalog_is_empty(monkeypatch):
+    from research_system.providers import oecd
+    monkeypatch.setattr(oecd, "_dataflows", lambda: sdmx_catalog.FrozenDict())
+
+    assert oecd.search_oecd("tourism")[0]["code"] == "OECD.CFE:TOURISM_TRIPS"
+
+
+def test_cached_catalog_is_read_only_and_search_returns_copies():
+    catalog = _catalog([])
+    flows = catalog.dataflows()
+    with pytest.raises(TypeError):
+        flows["X"] = {}
+    with pytest.raises(TypeError):
+        flows["OECD.SDD:NAAG"]["score"] = 1
+
+    hits = catalog.search("consumer price", limit=5)
+    hits[0]["score"] = -1
+    assert "score" not in catalog.dataflows()["OECD.SDD:PRICES_CPI"]
+    assert pickle.loads(pickle.dumps(flows)) == flows
+
+
+def test_stale_catalog_served_while_refreshing_in_background(monkeypatch):
+    monkeypatch.setattr(sdmx_catalog, "BACKGROUND_REFRESH", True)
+    calls = []
+    catalog = _catalog(calls, ttl=0)
+    first = catalog.dataflows()
+    assert len(calls) == 1
+
+    again = catalog.dataflows()  # stale: returns immediately, refreshes in a thread
+    assert again is first
+    deadline = time.time() + 2
+    while len(calls) < 2 and time.time() < deadline:
+        time.sleep(0.01)
+    assert len(calls) == 2
+
+
+def test_failed_refresh_keeps_previous_copy():
+    catalog = _catalog([])
+    catalog.dataflows()
+    catalog.loader = lambda: None
+    assert catalog.refresh() is None
+    assert "OECD.SDD:NAAG" in catalog.dataflows()
+
+
+def test_imf_search_uses_shared_index(monkeypatch):
+    payload = {"Structure": {"Dataflows": {"Dataflow": [
+        {"KeyFamilyRef": {}, "Key": "IFS", "Name": [{"$": "International Financial Statistics"}]},
+        {"Key": "DOT", "Name": [{"$": "Direction of Trade Statistics"}]},
+    ]}}}
+    calls = []
+
+    def fake_http(*args, **kwargs):
+        calls.append(args)
+        return payload
+
+    monkeypatch.setattr(imf, "http_json", fake_http)
+    imf.reset_circuit_state()
+
+    assert imf.search_imf("trade", limit=5)[0]["code"] == "DOT"
+    assert imf.search_imf("financial statistics", limit=5)[0]["code"] == "IFS"
+    assert len(calls) == 1
+    assert {r["code"] for r in imf._dataflows()} == {"IFS", "DOT"}
+    imf.reset_circuit_state()
@@ -0,0 +1,131 @@
+"""Tests for the persistent, coalescing search-result cache."""
+
+import asyncio
+
+import pytest
+
+from research_system.collection import search_cache
+from research_system.collection.scheduler import CollectionScheduler
+from research_system.collection import scheduler as sched
+from research_system.collection.search_cache import cached_search, cache_key, search_cache as disk
+from research_system.tools.search_models import SearchHit, SearchRequest
+
+
+class Upstream:
+    """Async fetch stand-in that counts calls."""
+
+    def __init__(self, hits=1, delay=0.0, error=None):
+        self.calls = 0
+        self.hits, self.delay, self.error = hits, delay, error
+
+    def __call__(self, provider="tavily"):
+        async def fetch():
+            self.calls += 1
+            await asyncio.sleep(self.delay)
+            if self.error:
+                raise self.error
+            return [SearchHit(title=f"hit {i}", url=f"https://{provider}.example/{i}",
+                              provider=provider) for i in range(self.hits)]
+        return fetch
+
+
+def _req(query="EU tourism 2024", **kw):
+    return SearchRequest(query=query, count=kw.pop("count", 5), region=kw.pop("region", "US"), **kw)
+
+
+def test_repeat_query_is_served_from_disk():
+    upstream = Upstream(hits=2)
+    first = asyncio.run(cached_search("tavily", _req(), upstream()))
+    again = asyncio.run(cached_search("tavily", _req("  eu  TOURISM 2024 "), upstream()))
+
+    assert upstream.calls == 1
+    assert again == first
+    assert search_cache.hit_stats()["tavily"]["hits"] >= 1
+
+
+def test_key_covers_count_freshness_region_and_provider():
+    keys = {cache_key("tavily", _req()), cache_key("tavily", _req(count=10)),
+            cache_key("tavily", _req(freshness_window="week")),
+            cache_key("tavily", _req(region="GB")), cache_key("serper", _req())}
+    assert len(keys) == 5
+
+
+def test_concurrent_identical_queries_share_one_call():
+    upstream = Upstream(delay=0.05)
+
+    async def burst():
+        return await asyncio.gather(*(cached_search("brave", _req(), upstream("brave")) for _ in range(5)))
+
+    results = asyncio.run(burst())
+    assert upstream.calls == 1
+    assert all(r == results[0] for r in results)
+
+
+def test_cancelled_follower_leaves_the_flight_intact():
+    upstream = Upstream(delay=0.05)
+
+    async def burst():
+        leader = asyncio.ensure_future(cached_search("brave", _req(), upstream("brave")))
+        await asyncio.sleep(0.01)
+        follower = asyncio.ensure_future(cached_search("brave", _req(), upstream("brave")))
+        await asyncio.sleep(0.01)
+        follower.cancel()
+        hits = await leader
+        with pytest.raises(asyncio.CancelledError):
+            await follower
+        return hits
+
+    hits = asyncio.run(burst())
+    assert len(hits) == 1
+    assert not search_cache._inflight
+    assert asyncio.run(cached_search("brave", _req(), upstream("brave"))) == hits
+    assert upstream.calls == 1
+
+
+def test_errors_and_empty_results_are_not_cached():
+    failing = Upstream(error=RuntimeError("quota"))
+    with pytest.raises(RuntimeError):
+        asyncio.run(cached_search("serper", _req(), failing("serper")))
+
+    empty = Upstream(hits=0)
+    asyncio.run(cached_search("serper", _req(), empty("serper")))
+    asyncio.run(cached_search("serper", _req(), empty("serper")))
+    assert empty.calls == 2
+
+
+def test_expired_entries_are_refetched(monkeypatch):
+    upstream = Upstream()
+    asyncio.run(cached_search("serpapi", _req(), upstream("serpapi")))
+    monkeypatch.setenv("SEARCH_CACHE_TTL_HOURS_SERPAPI", "0")
+    asyncio.run(cached_search("serpapi", _req(), upstream("serpapi")))
+
+    assert upstream.calls == 2
+    assert disk().purge() == 1
+
+
+def test_free_providers_and_disabled_cache_bypass(monkeypatch):
+    upstream = Upstream()
+    for _ in range(2):
+        asyncio.run(cached_search("nps", _req(), upstream("nps")))
+    monkeypatch.setenv("ENABLE_SEARCH_CACHE", "false")
+    for _ in range(2):
+        asyncio.run(cached_search("tavily", _req(), upstream()))
+    assert upstream.calls == 4
+
+
+def test_scheduler_repeats_skip_the_registry(monkeypatch):
+    monkeypatch.setattr(sched, "search_targets", lambda query: [("brave", "search_brave")])
+
+    class Registry:
+        calls = 0
+
+        def execute(self, tool, payload):
+            Registry.calls += 1
+            return [SearchHit(title=payload["query"], url="https://brave.example/1", provider="brave")]
+
+    with CollectionScheduler(Registry()) as scheduler:
+        first = scheduler.search("same query", count=3)
+        second = scheduler.search("Same Query", count=3)
+
+    assert Registry.calls == 1
+    assert second == first
@@ -0,0 +1,52 @@
+"""Tests for the synthetic evidence corpus generator."""
+
+from collections import Counter
+
+import pytest
+
+from research_system.evidence.synthetic import PRIMARY_DOMAINS, CorpusSpec, generate_corpus
+from research_system.models import EvidenceCard
+
+
+def test_same_seed_same_corpus():
+    a = generate_corpus(CorpusSpec(n_cards=300, seed=7))
+    b = generate_corpus(CorpusSpec(n_cards=300, seed=7))
+    c = generate_corpus(CorpusSpec(n_cards=300, seed=8))
+
+    assert [x.claim for x in a.cards] == [x.claim for x in b.cards]
+    assert [x.claim for x in a.cards] != [x.claim for x in c.cards]
+
+
+def test_composition_follows_the_spec():
+    spec = CorpusSpec(n_cards=4000, paraphrase_rate=0.3, syndication_rate=0.15,
+                      conflict_rate=0.1, domain_concentration=0.2)
+    corpus = generate_corpus(spec)
+    kinds = Counter(corpus.kinds)
+    domains = Counter(card.source_domain for card in corpus.cards)
+
+    assert len(corpus.cards) == len(corpus.fact_ids) == len(corpus.kinds) == 4000
+    assert kinds["syndicated"] / 4000 == pytest.approx(0.15, abs=0.03)
+    assert kinds["conflict"] / 4000 == pytest.approx(0.1, abs=0.02)
+    # Syndicating a conflicting card falls back to a paraphrase
+    assert (kinds["paraphrase"] + kinds["syndicated"]) / 4000 == pytest.approx(0.45, abs=0.03)
+    assert domains.most_common(1)[0][1] / 4000 == pytest.approx(0.2, abs=0.02)
+    assert max(Counter(corpus.fact_ids).values()) > 20
+
+
+def test_cards_are_valid_and_ground_truth_is_consistent():
+    corpus = generate_corpus(CorpusSpec(n_cards=500))
+    by_fact = {}
+    for card, fact_id, kind in zip(corpus.cards, corpus.fact_ids, corpus.kinds):
+        EvidenceCard.model_validate(card.model_dump())
+        assert card.is_primary_source == (card.source_domain in PRIMARY_DOMAINS)
+        assert card.url.startswith(f"https://{card.source_domain}/")
+        if kind == "original":
+            assert fact_id not in by_fact
+        by_fact.setdefault(fact_id, []).append(card)
+
+    assert len({card.url for card in corpus.cards}) == 500
+    for i, kind in enumerate(corpus.kinds):
+        if kind == "syndicated":
+            card = corpus.cards[i]
+            assert any(card.claim.startswith(other.claim) and card.source_domain != other.source_domain
+                       for other in by_fact[corpus.fact_ids[i]] if other is not card)
@@ -237,11 +237,11 @@ class TestOECDProvider:
     
     def test_oecd_circuit_breaker(self):
         """Test OECD circuit breaker functionality."""
-        from research_system.providers.oecd import _circuit_state, search_oecd, reset_circuit_state
+        from research_system.providers.oecd import _circuit_state, search_oecd, reset_circuit_state, CATALOG
         
         # Reset circuit state and set up test cache
         reset_circuit_state()
-        _circuit_state["catalog_cache"] = {"TEST": {"name": "Cached Dataset"}}
+        CATALOG.replace({"TEST": {"name": "Cached Dataset"}}, persist=False)
         
         with patch('research_system.providers.oecd.http_json') as mock_http:
             # Simulate failures
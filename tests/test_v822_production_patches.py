@@ -377,19 +377,19 @@ class TestDefaultHTTPHeaders:
         """Test that http_json properly merges default and custom headers."""
         from research_system.providers.http import http_json, DEFAULT_HEADERS
         
-        with patch('research_system.providers.http.httpx.Client') as mock_client:
+        with patch('research_system.providers.http.get_client') as mock_get_client:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.json.return_value = {"test": "data"}
             mock_response.raise_for_status = Mock()
-            mock_client.return_value.__enter__.return_value.request.return_value = mock_response
+            mock_get_client.return_value.request.return_value = mock_response
             
             # Call with custom header
             custom_headers = {"X-Custom": "value"}
             http_json("GET", "http://test.com", headers=custom_headers)
             
-            # Check that Client was called with merged headers
-            call_args = mock_client.call_args
+            # Check that the pooled client was called with merged headers
+            call_args = mock_get_client.return_value.request.call_args
             headers_used = call_args[1]['headers']
             
             # Should have both default and custom headers
@@ -0,0 +1,111 @@
+"""Tests for the persistent World Bank indicator catalog and BM25 search."""
+
+import time
+
+import pytest
+
+from research_system.providers import worldbank as wb
+from research_system.retrieval.catalog import BM25Index, CatalogStore, tokenize
+
+PAGES = {
+    1: [
+        {"id": "NY.GDP.MKTP.KD.ZG", "name": "GDP growth (annual %)",
+         "sourceNote": "Annual percentage growth rate of GDP at market prices.",
+         "source": {"value": "WDI"}, "topics": [{"value": "Economy & Growth"}]},
+        {"id": "SL.UEM.TOTL.ZS", "name": "Unemployment, total (% of total labor force)",
+         "sourceNote": "Share of the labor force without work.", "source": {"value": "WDI"}},
+    ],
+    2: [
+        {"id": "SL.UEM.1524.FE.ZS", "name": "Unemployment, youth female (% of female labor force ages 15-24)",
+         "sourceNote": None, "source": {"value": "WDI"}},
+        {"id": "EN.ATM.CO2E.PC", "name": "CO2 emissions (metric tons per capita)",
+         "sourceNote": "Carbon dioxide emissions from burning fossil fuels.", "source": {"value": "WDI"}},
+    ],
+}
+
+
+@pytest.fixture
+def catalog(tmp_path, monkeypatch):
+    monkeypatch.setenv("CATALOG_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(wb, "_catalog", None)
+    monkeypatch.setattr(wb, "_index", None)
+    monkeypatch.setattr(wb, "_last_failure", 0.0)
+    calls = []
+
+    def fake_fetch(page, etag=None):
+        calls.append((page, etag))
+        if etag == '"v1"':
+            return 304, etag, {}, []
+        return 200, '"v1"', {"pages": len(PAGES)}, list(PAGES[page])
+
+    monkeypatch.setattr(wb, "_fetch_page", fake_fetch)
+    return calls
+
+
+def test_full_catalog_is_paged_and_searched(catalog):
+    rows = wb.search_worldbank("youth unemployment female", limit=5)
+    assert catalog == [(1, None), (2, None)]
+    assert rows[0]["id"] == "SL.UEM.1524.FE.ZS"
+    assert {r["id"] for r in rows} == {"SL.UEM.1524.FE.ZS", "SL.UEM.TOTL.ZS"}
+    assert wb.to_cards(rows)[0]["snippet"] == ""
+
+
+def test_warm_start_uses_disk_without_network(catalog, monkeypatch):
+    wb.load_catalog()
+    monkeypatch.setattr(wb, "_catalog", None)
+    monkeypatch.setattr(wb, "_index", None)
+    catalog.clear()
+
+    rows = wb.search_worldbank("CO2 emissions", limit=1)
+    assert catalog == []
+    assert rows[0]["id"] == "EN.ATM.CO2E.PC"
+
+
+def test_expired_snapshot_revalidates_with_etag(catalog, monkeypatch):
+    wb.load_catalog()
+    monkeypatch.setattr(wb, "CATALOG_TTL", 0)
+    catalog.clear()
+
+    rows, _ = wb.load_catalog()
+    assert catalog == [(1, '"v1"')]
+    assert len(rows) == 4
+
+
+def test_failed_download_serves_stale_snapshot(tmp_path, monkeypatch):
+    monkeypatch.setenv("CATALOG_CACHE_DIR", str(tmp_path))
+    store = CatalogStore("worldbank_indicators")
+    entry = store.save([wb._slim(r) for r in PAGES[1]], etag='"old"')
+    entry["fetched_at"] = 0
+    store._write(entry)
+    monkeypatch.setattr(wb, "_catalog", None)
+    monkeypatch.setattr(wb, "_index", None)
+    monkeypatch.setattr(wb, "_last_failure", 0.0)
+
+    def offline(page, etag=None):
+        raise OSError("offline")
+
+    monkeypatch.setattr(wb, "_fetch_page", offline)
+    assert wb.search_worldbank("gdp growth", limit=1)[0]["id"] == "NY.GDP.MKTP.KD.ZG"
+
+
+def test_bm25_prefers_name_matches_and_round_trips(tmp_path):
+    docs = [{"name": "inflation consumer prices", "note": ""},
+            {"name": "trade balance", "note": "inflation mentioned in passing " * 3}]
+    index = BM25Index(docs, {"name": 3.0, "note": 1.0})
+    assert index.search("inflation")[0][0] == 0
+    assert tokenize("The Rates of GDP") == ["rate", "gdp"]
+
+    path = tmp_path / "idx.npz"
+    index.save(path, stamp="a")
+    assert BM25Index.load(path, stamp="b") is None
+    loaded = BM25Index.load(path, stamp="a")
+    assert loaded.search("trade") == index.search("trade")
+
+
+def test_search_is_sub_millisecond():
+    docs = [{"name": f"indicator {i} series value {i % 97}"} for i in range(30000)]
+    index = BM25Index(docs, {"name": 1.0})
+    start = time.perf_counter()
+    for _ in range(100):
+        index.search("series 42", limit=25)
+    assert (time.perf_counter() - start) / 100 < 0.005